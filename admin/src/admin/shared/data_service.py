@@ -12,7 +12,8 @@ from backend.repositories.sync_profile_repository import (
     FirestoreSyncProfileRepository,
 )
 from backend.services.authorization_service import AuthorizationService
-from backend.services.user_service import FirebaseAuthUserService
+from backend.services.sync_profile_index import SyncProfileIndex
+from backend.services.user_service import FirebaseAuthUserService, UserIndex
 
 
 class AdminDataService:
@@ -21,18 +22,21 @@ class AdminDataService:
     def __init__(self) -> None:
         """Initialize the data service with all required repositories and services."""
         self.user_service = FirebaseAuthUserService()
+        self.user_index = UserIndex(self.user_service)
         self.sync_profile_repo = FirestoreSyncProfileRepository()
         self.backend_auth_repo = FirestoreBackendAuthorizationRepository()
+        self.sync_profile_index = SyncProfileIndex(self.sync_profile_repo)
         self.authorization_service = AuthorizationService(
             backend_auth_repo=self.backend_auth_repo
         )
 
-    @st.cache_data(ttl=60, show_spinner="Fetching users...")
-    def get_all_users(_self) -> dict[str, User]:
-        """Get all users with their data."""
+    def get_all_users(self) -> dict[str, User]:
+        """Get all users with their data, including the owners of the sync profiles
+        loaded so far."""
         print("Getting all users")
-        users, _ = _self.user_service.list_all_users()
-        return {user.uid: user for user in users}
+        owner_ids = {profile.user_id for profile in self.sync_profile_index.profiles()}
+        with st.spinner("Fetching users..."):
+            return self.user_index.refresh(owner_ids)
 
     def get_recent_signups(self, n: int = 10) -> list[User]:
         """Get the n most recent user signups."""
@@ -44,11 +48,12 @@ class AdminDataService:
             reverse=True,
         )[:n]
 
-    @st.cache_data(ttl=60, show_spinner="Fetching sync profiles...")
-    def get_all_sync_profiles(_self) -> list[SyncProfile]:
-        """Get all valid sync profiles."""
+    def get_all_sync_profiles(self) -> list[SyncProfile]:
+        """Get all valid sync profiles, loading only the ones changed since last time."""
         print("Getting all sync profiles")
-        return _self.sync_profile_repo.list_all_sync_profiles()
+        with st.spinner("Fetching sync profiles..."):
+            self.sync_profile_index.refresh()
+        return self.sync_profile_index.profiles()
 
     @st.cache_data(ttl=60, show_spinner="Fetching authorizations...")
     def get_all_authorizations(_self) -> list[BackendAuthorization]:
@@ -56,33 +61,29 @@ class AdminDataService:
         print("Fetching all backend authorizations from Firestore")
         return _self.backend_auth_repo.list_all_authorizations()
 
+    @st.cache_data(ttl=60, show_spinner="Counting sync profiles...")
     def get_sync_profile_stats(_self) -> dict[str, int]:
-        """Get statistics about sync profiles."""
-        profiles = _self.get_all_sync_profiles()
+        """Get statistics about sync profiles, counted by Firestore."""
+        counts = _self.sync_profile_repo.count_sync_profiles_by_status()
         return {
-            "total": len(profiles),
-            "failed": len(
-                [p for p in profiles if p.status.type == SyncProfileStatusType.FAILED]
-            ),
-            "in_progress": len(
-                [
-                    p
-                    for p in profiles
-                    if p.status.type == SyncProfileStatusType.IN_PROGRESS
-                ]
-            ),
+            "total": sum(counts.values()),
+            "failed": counts[SyncProfileStatusType.FAILED],
+            "in_progress": counts[SyncProfileStatusType.IN_PROGRESS],
         }
 
     def clear_all_caches(self) -> None:
         """Clear all cached data."""
-        self.get_all_users.clear()
-        self.get_all_sync_profiles.clear()
+        self.user_index.invalidate()
+        self.sync_profile_index.invalidate()
+        self.get_sync_profile_stats.clear()
         self.get_all_authorizations.clear()
 
     def get_sync_profile(self, sync_profile_id: str) -> SyncProfile | None:
         """Get a sync profile by ID."""
-        all_sync_profiles = self.get_all_sync_profiles()
-        return next((p for p in all_sync_profiles if p.id == sync_profile_id), None)
+        if profile := self.sync_profile_index.get(sync_profile_id):
+            return profile
+        self.get_all_sync_profiles()
+        return self.sync_profile_index.get(sync_profile_id)
 
 
 # Create a singleton instance
@@ -1,9 +1,110 @@
 from backend.shared.event import Event
 from sklearn.feature_extraction.text import TfidfVectorizer
+from scipy import sparse
 import hdbscan
 import numpy as np
 
 
+def _group_by_label(
+    cluster_labels: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray, list[np.ndarray]]:
+    """Group event indices by cluster label in a single pass.
+
+    Returns:
+        The sorted unique labels, the number of events per label, and for each label
+        the indices of its events, in their original order.
+    """
+    order = np.argsort(cluster_labels, kind="stable")
+    labels, first_index, counts = np.unique(
+        cluster_labels[order], return_index=True, return_counts=True
+    )
+    members = np.split(order, first_index[1:])
+    return labels, counts, members
+
+
+def _cluster_centroids(
+    tfidf_matrix: sparse.csr_matrix,
+    label_index: np.ndarray,
+    n_labels: int,
+    weights: np.ndarray,
+) -> sparse.csr_matrix:
+    """Compute the weighted mean TF-IDF vector of each cluster without densifying the matrix.
+
+    Args:
+        tfidf_matrix: One row per unique text.
+        label_index: For each row, the position of its label in the sorted unique labels.
+        n_labels: The number of unique labels.
+        weights: For each row, the number of events sharing that text.
+
+    Returns:
+        A sparse matrix with one row per label.
+    """
+    n_rows = tfidf_matrix.shape[0]
+    assignment = sparse.csr_matrix(
+        (weights.astype(float), (label_index, np.arange(n_rows))),
+        shape=(n_labels, n_rows),
+    )
+    sizes = np.asarray(assignment.sum(axis=1)).ravel()
+    sums = assignment @ tfidf_matrix
+    return sparse.diags(1.0 / sizes) @ sums
+
+
+def _deduplicate_texts(texts: list[str]) -> tuple[list[str], np.ndarray, np.ndarray]:
+    """Collapse identical texts into unique rows.
+
+    Returns:
+        The unique texts in order of first appearance, for each input text the index
+        of its unique row, and the number of occurrences of each unique text.
+    """
+    index_of: dict[str, int] = {}
+    inverse = np.fromiter(
+        (index_of.setdefault(text, len(index_of)) for text in texts),
+        dtype=np.intp,
+        count=len(texts),
+    )
+    counts = np.bincount(inverse, minlength=len(index_of))
+    return list(index_of), inverse, counts
+
+
+def _cluster_unique_rows(
+    tfidf_matrix: sparse.csr_matrix,
+    counts: np.ndarray,
+    min_cluster_size: int,
+) -> np.ndarray:
+    """Run HDBSCAN on unique rows, each weighted by its number of occurrences.
+
+    HDBSCAN has no sample weights, so each unique row is repeated up to
+    `min_cluster_size + 1` times: enough for a text that occurs that often to form a
+    cluster on its own (core distances count the point itself), while keeping the
+    input size proportional to the number of distinct texts rather than the number
+    of events.
+
+    Returns:
+        The cluster label of each unique row.
+    """
+    replicas = np.minimum(counts, min_cluster_size + 1)
+    rows = np.repeat(np.arange(len(counts)), replicas)
+
+    clusterer = hdbscan.HDBSCAN(
+        min_cluster_size=min_cluster_size,
+        metric="euclidean",
+        cluster_selection_method="eom",
+    )
+    row_labels = np.asarray(clusterer.fit_predict(tfidf_matrix[rows]))
+
+    # Replicas are identical points, so they share the label of the first one
+    first_replica = np.cumsum(replicas) - replicas
+    return row_labels[first_replica]
+
+
+def _top_features(
+    centroid: sparse.csr_matrix, feature_names: np.ndarray, n: int
+) -> list[str]:
+    """Return the n highest-weighted terms of a single centroid row."""
+    order = np.argsort(centroid.data, kind="stable")[::-1][:n]
+    return [str(feature_names[idx]) for idx in centroid.indices[order]]
+
+
 class TimeScheduleCompressor:
     def __init__(self):
         """Initialize the TimeScheduleCompressor."""
@@ -19,6 +120,10 @@ class TimeScheduleCompressor:
         """
         Compress the list of events into a summarized string representation.
 
+        Identical events are collapsed, and events sharing the same title and
+        description are vectorized and clustered once, so clustering time and memory
+        scale with the number of distinct courses rather than the number of events.
+
         Args:
             events (List[Event]): The list of events to compress.
 
@@ -26,44 +131,48 @@ class TimeScheduleCompressor:
             str: The compressed string representation of the events.
         """
 
-        # Combine title and description for each event
+        # Exact duplicates carry no extra information for the summary
+        events = list(dict.fromkeys(events))
+
+        # Feeds repeat the same course text hundreds of times: vectorize and
+        # cluster each distinct text once, then expand the labels back to events
         events_text = [(event.title + " " + event.description) for event in events]
+        unique_texts, text_index, text_counts = _deduplicate_texts(events_text)
 
         # Create and fit TF-IDF vectorizer
         vectorizer = TfidfVectorizer()
-        tfidf_matrix = vectorizer.fit_transform(events_text)
+        tfidf_matrix = vectorizer.fit_transform(unique_texts)
 
         # Perform HDBSCAN clustering
-        clusterer = hdbscan.HDBSCAN(
-            min_cluster_size=min_cluster_size,
-            metric="euclidean",
-            cluster_selection_method="eom",
+        text_labels = _cluster_unique_rows(
+            tfidf_matrix,  # type: ignore
+            text_counts,
+            min_cluster_size,
         )
-        cluster_labels = clusterer.fit_predict(tfidf_matrix)
+        cluster_labels = text_labels[text_index]
 
-        # Map events to cluster labels
-        event_clusters = {}
-        for event, label in zip(events, cluster_labels):
-            event_clusters[event] = label
+        labels, counts, members = _group_by_label(cluster_labels)
+        centroids = _cluster_centroids(
+            tfidf_matrix,  # type: ignore
+            label_index=np.searchsorted(labels, text_labels),
+            n_labels=len(labels),
+            weights=text_counts,
+        ).tocsr()
 
         feature_names = vectorizer.get_feature_names_out()
 
         # Prepare output string
         output_lines: list[str] = []
 
-        # Get unique labels and sort clusters by number of events, descending
-        unique_labels = set(cluster_labels)
-        unique_labels = sorted(
-            unique_labels, key=lambda x: sum(cluster_labels == x), reverse=True
+        # Sort clusters by number of events, descending, with the noise cluster (-1) last
+        positions = sorted(
+            range(len(labels)),
+            key=lambda k: (labels[k] == -1, -counts[k], labels[k]),
         )
 
-        # Set the noise cluster (-1) to the last position
-        if -1 in unique_labels:
-            unique_labels.remove(-1)
-            unique_labels.append(-1)
-
-        for i in unique_labels:
-            cluster_events = [event for event in events if event_clusters[event] == i]
+        for k in positions:
+            i = int(labels[k])
+            cluster_events = [events[idx] for idx in members[k]]
 
             n_events = len(cluster_events)
 
@@ -72,15 +181,9 @@ class TimeScheduleCompressor:
             else:
                 output_lines.append(f"\nCluster {i} ({n_events} events):")
 
-            if n_events == 0:
-                continue  # Skip empty clusters
-
             # Compute start and end dates for the cluster
-            start_dates = [event.start for event in cluster_events]
-            end_dates = [event.end for event in cluster_events]
-
-            cluster_start = min(start_dates)
-            cluster_end = max(end_dates)
+            cluster_start = min(event.start for event in cluster_events)
+            cluster_end = max(event.end for event in cluster_events)
 
             number_of_days = (cluster_end - cluster_start).days + 1
 
@@ -95,13 +198,10 @@ class TimeScheduleCompressor:
 
             # Get top features for the cluster
             if i != -1:
-                cluster_indices = np.where(cluster_labels == i)[0]
-                cluster_tfidf = tfidf_matrix[cluster_indices].toarray().mean(axis=0)  # type: ignore
-                top_features_idx = cluster_tfidf.argsort()[-top_n_features:][
-                    ::-1
-                ]  # Get top_n_features
-                top_features = [feature_names[idx] for idx in top_features_idx]
-                output_lines.append(f"\nTop terms: {', '.join(top_features)}")  # type: ignore
+                top_features = _top_features(
+                    centroids.getrow(k), feature_names, top_n_features
+                )
+                output_lines.append(f"\nTop terms: {', '.join(top_features)}")
 
             # Append event titles
             output_lines.append("Events:")
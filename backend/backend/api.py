@@ -6,16 +6,22 @@ import json
 from fastapi.middleware.cors import CORSMiddleware
 import logging
 from typing import Any
+import anyio
 import firebase_admin
+import httpx
 from firebase_admin import credentials, auth, storage
 from fastapi import Depends, FastAPI, HTTPException, Request, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from fastapi.responses import JSONResponse
 
 from backend.ai.ruleset_builder import RulesetBuilder
-from backend.bootstrap import bootstrap_event_bus
+from backend.bootstrap import bootstrap_background_jobs, bootstrap_event_bus
+from backend.infrastructure.blocking_io import BlockingIoRunner
+from backend.infrastructure.http_client import create_async_http_client
+from backend.infrastructure.job_executor import ThreadPoolJobExecutor
 from backend.models import SyncTrigger
 from backend.models.base import CamelCaseModel
+from backend.models.sync_job import SyncJob
 from backend.models.schemas import (
     AuthorizeBackendInput,
     CreateSyncProfileInput,
@@ -24,6 +30,7 @@ from backend.models.schemas import (
     IsAuthorizedOutput,
     ListUserCalendarsInput,
     RequestSyncInput,
+    RequestSyncOutput,
     ValidateIcsUrlInput,
     ValidateIcsUrlOutput,
 )
@@ -34,12 +41,24 @@ from backend.repositories.sync_profile_repository import FirestoreSyncProfileRep
 from backend.repositories.sync_stats_repository import FirestoreSyncStatsRepository
 from backend.services.ai_ruleset_service import AiRulesetService
 from backend.services.authorization_service import AuthorizationService
-from backend.services.dev_notification_service import create_dev_notification_service
+from backend.services.dev_notification_service import (
+    IDevNotificationService,
+    create_dev_notification_service,
+)
 from backend.services.exceptions.base import SyncademicError
 from backend.services.exceptions.mapping import ErrorMapping
+from backend.services.id_token_verifier import (
+    FirebaseIdTokenVerifier,
+    FirebasePublicKeys,
+    VerifiedTokenCache,
+    refresh_public_keys_periodically,
+)
 from backend.services.google_calendar_service import GoogleCalendarService
-from backend.services.ics_service import IcsService
+from backend.services.ics_service import IcsResultCache, IcsService
+from backend.services.sync_job_queue import InMemorySyncJobQueue
+from backend.services.sync_job_worker import SyncJobWorker, SyncJobWorkerPool
 from backend.services.sync_profile_service import SyncProfileService
+from backend.services.sync_profiler import SyncProfiler
 from backend.services.user_service import FirebaseAuthUserService
 from backend.settings import settings
 from backend.logging_config import configure_logging
@@ -90,6 +109,14 @@ class DomainServices:
     authorization_service: AuthorizationService
     google_calendar_service: GoogleCalendarService
     sync_profile_service: SyncProfileService
+    job_executor: ThreadPoolJobExecutor
+    blocking_io: BlockingIoRunner
+    http_client: httpx.AsyncClient
+    firebase_public_keys: FirebasePublicKeys
+    id_token_verifier: FirebaseIdTokenVerifier
+    sync_job_queue: InMemorySyncJobQueue
+    sync_workers: SyncJobWorkerPool
+    dev_notification_service: IDevNotificationService
 
 
 def build_domain_services() -> DomainServices:
@@ -136,6 +163,35 @@ def build_domain_services() -> DomainServices:
         google_calendar_service=google_calendar_service,
         ai_ruleset_service=ai_ruleset_service,
         event_bus=event_bus,
+        profiler=SyncProfiler(ics_file_storage),
+    )
+
+    job_executor = ThreadPoolJobExecutor(
+        max_workers=settings.BACKGROUND_JOB_MAX_WORKERS
+    )
+    bootstrap_background_jobs(
+        event_bus,
+        sync_profile_service=sync_profile_service,
+        job_executor=job_executor,
+    )
+
+    sync_job_queue = InMemorySyncJobQueue()
+    sync_workers = SyncJobWorkerPool(
+        SyncJobWorker(sync_job_queue, sync_profile_service),
+        n_workers=settings.SYNC_WORKERS,
+    )
+
+    project_id = firebase_admin.get_app().project_id
+    if not project_id:
+        raise ValueError("A Firebase project ID is required to verify ID tokens.")
+    firebase_public_keys = FirebasePublicKeys()
+    id_token_verifier = FirebaseIdTokenVerifier(
+        project_id=project_id,
+        public_keys=firebase_public_keys,
+        cache=VerifiedTokenCache(
+            max_size=settings.VERIFIED_TOKEN_CACHE_MAX_SIZE,
+            max_ttl_s=settings.VERIFIED_TOKEN_CACHE_TTL_S,
+        ),
     )
 
     logger.info("Domain services initialized.")
@@ -145,6 +201,14 @@ def build_domain_services() -> DomainServices:
         authorization_service=authorization_service,
         google_calendar_service=google_calendar_service,
         sync_profile_service=sync_profile_service,
+        job_executor=job_executor,
+        blocking_io=BlockingIoRunner(max_threads=settings.BLOCKING_IO_MAX_THREADS),
+        http_client=create_async_http_client(),
+        firebase_public_keys=firebase_public_keys,
+        id_token_verifier=id_token_verifier,
+        sync_job_queue=sync_job_queue,
+        sync_workers=sync_workers,
+        dev_notification_service=dev_notification_service,
     )
 
 
@@ -153,8 +217,21 @@ async def lifespan(app: FastAPI):  # noqa: ANN201
     logger.info("Application startup: Initializing Firebase...")
     initialize_firebase_app()
     app.state.domain_services = build_domain_services()
+    app.state.domain_services.sync_workers.start()
     logger.info("Firebase initialized.")
-    yield
+    async with anyio.create_task_group() as background_tasks:
+        # Rotate the token signing keys before they expire, so that requests
+        # never wait for a certificate download
+        background_tasks.start_soon(
+            refresh_public_keys_periodically,
+            app.state.domain_services.firebase_public_keys,
+        )
+        yield
+        background_tasks.cancel_scope.cancel()
+    await app.state.domain_services.http_client.aclose()
+    app.state.domain_services.sync_workers.stop()
+    app.state.domain_services.job_executor.shutdown(wait=True)
+    app.state.domain_services.dev_notification_service.flush()
     app.state.domain_services = None
     logger.info("Application shutdown.")
 
@@ -167,16 +244,32 @@ class UserInfo(CamelCaseModel):
     email_verified: bool = False
 
 
+def get_domain_services(request: Request) -> DomainServices:
+    services: DomainServices | None = getattr(
+        request.app.state, "domain_services", None
+    )
+    if services is None:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Domain services are not available",
+        )
+    return services
+
+
 async def get_current_user(
     token: HTTPAuthorizationCredentials = Depends(reusable_oauth2),
+    services: DomainServices = Depends(get_domain_services),
 ) -> UserInfo:
     """
     Dependency to get the current user from Firebase ID token.
     Verifies the token and returns user information.
+
+    Verified tokens are cached until they expire, so chatty clients pay for the
+    signature check once; cache misses are verified off the event loop.
     """
 
     try:
-        decoded_token = auth.verify_id_token(token.credentials)
+        decoded_token = await services.id_token_verifier.verify_async(token.credentials)
 
         return UserInfo(
             uid=decoded_token["uid"],
@@ -208,18 +301,6 @@ async def get_current_user(
 app = FastAPI(title="Syncademic API", version="0.1.0", lifespan=lifespan)
 
 
-def get_domain_services(request: Request) -> DomainServices:
-    services: DomainServices | None = getattr(
-        request.app.state, "domain_services", None
-    )
-    if services is None:
-        raise HTTPException(
-            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-            detail="Domain services are not available",
-        )
-    return services
-
-
 def syncademic_error_response(
     error: SyncademicError,
     *,
@@ -295,7 +376,7 @@ async def secure_endpoint(
 
 
 @app.post("/ics/validate", response_model=ValidateIcsUrlOutput)
-def validate_ics_url_endpoint(
+async def validate_ics_url_endpoint(
     payload: ValidateIcsUrlInput,
     current_user: UserInfo = Depends(get_current_user),
     services: DomainServices = Depends(get_domain_services),
@@ -315,16 +396,17 @@ def validate_ics_url_endpoint(
         extra={"user_id": current_user.uid, "url": payload.url},
     )
 
-    result = services.ics_service.validate_ics_url(
+    result = await services.ics_service.validate_ics_url_async(
         ics_source,
         metadata={"user_id": current_user.uid},
+        http_client=services.http_client,
     )
 
     return result
 
 
 @app.post("/calendars/list")
-def list_user_calendars_endpoint(
+async def list_user_calendars_endpoint(
     payload: ListUserCalendarsInput,
     current_user: UserInfo = Depends(get_current_user),
     services: DomainServices = Depends(get_domain_services),
@@ -339,7 +421,8 @@ def list_user_calendars_endpoint(
         },
     )
 
-    calendars = services.google_calendar_service.list_calendars(
+    calendars = await services.blocking_io.run(
+        services.google_calendar_service.list_calendars,
         user_id=current_user.uid,
         provider_account_id=payload.provider_account_id,
     )
@@ -348,7 +431,7 @@ def list_user_calendars_endpoint(
 
 
 @app.post("/authorization/status", response_model=IsAuthorizedOutput)
-def is_authorized_endpoint(
+async def is_authorized_endpoint(
     payload: IsAuthorizedInput,
     current_user: UserInfo = Depends(get_current_user),
     services: DomainServices = Depends(get_domain_services),
@@ -364,7 +447,8 @@ def is_authorized_endpoint(
     )
 
     try:
-        services.authorization_service.test_authorization(
+        await services.blocking_io.run(
+            services.authorization_service.test_authorization,
             current_user.uid,
             payload.provider_account_id,
         )
@@ -383,13 +467,18 @@ def is_authorized_endpoint(
     return IsAuthorizedOutput(authorized=True)
 
 
-@app.post("/sync/request")
-def request_sync_endpoint(
+@app.post("/sync/request", response_model=RequestSyncOutput)
+async def request_sync_endpoint(
     payload: RequestSyncInput,
     current_user: UserInfo = Depends(get_current_user),
     services: DomainServices = Depends(get_domain_services),
-) -> dict[str, bool]:
-    """Trigger synchronization for a user's Syncademic profile."""
+) -> RequestSyncOutput:
+    """
+    Queue a synchronization of a user's Syncademic profile.
+
+    Returns as soon as the request is queued. Repeated requests for a profile merge
+    into its pending job, whose id is returned.
+    """
 
     logger.info(
         "%s sync request received via FastAPI.",
@@ -400,18 +489,41 @@ def request_sync_endpoint(
         },
     )
 
-    services.sync_profile_service.synchronize(
+    await services.blocking_io.run(
+        services.sync_profile_service.check_sync_request,
+        user_id=current_user.uid,
+        sync_profile_id=payload.sync_profile_id,
+    )
+
+    job = services.sync_job_queue.enqueue(
         user_id=current_user.uid,
         sync_profile_id=payload.sync_profile_id,
         sync_trigger=SyncTrigger.MANUAL,
         sync_type=payload.sync_type,
     )
 
-    return {"success": True}
+    return RequestSyncOutput(job_id=job.id)
+
+
+@app.get("/sync/jobs/{job_id}", response_model=SyncJob)
+async def get_sync_job_endpoint(
+    job_id: str,
+    current_user: UserInfo = Depends(get_current_user),
+    services: DomainServices = Depends(get_domain_services),
+) -> SyncJob:
+    """Status of a sync job of the authenticated user."""
+
+    job = services.sync_job_queue.get_job(job_id)
+    if job is None or job.user_id != current_user.uid:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Sync job not found",
+        )
+    return job
 
 
 @app.delete("/sync-profiles/{sync_profile_id}")
-def delete_sync_profile_endpoint(
+async def delete_sync_profile_endpoint(
     sync_profile_id: str,
     current_user: UserInfo = Depends(get_current_user),
     services: DomainServices = Depends(get_domain_services),
@@ -426,7 +538,8 @@ def delete_sync_profile_endpoint(
         },
     )
 
-    services.sync_profile_service.delete_sync_profile(
+    await services.blocking_io.run(
+        services.sync_profile_service.delete_sync_profile,
         user_id=current_user.uid,
         sync_profile_id=sync_profile_id,
     )
@@ -435,7 +548,7 @@ def delete_sync_profile_endpoint(
 
 
 @app.post("/authorization/backend")
-def authorize_backend_endpoint(
+async def authorize_backend_endpoint(
     payload: AuthorizeBackendInput,
     current_user: UserInfo = Depends(get_current_user),
     services: DomainServices = Depends(get_domain_services),
@@ -451,7 +564,8 @@ def authorize_backend_endpoint(
         },
     )
 
-    services.authorization_service.authorize_backend_with_auth_code(
+    await services.blocking_io.run(
+        services.authorization_service.authorize_backend_with_auth_code,
         user_id=current_user.uid,
         auth_code=payload.auth_code,
         redirect_uri=payload.redirect_uri,
@@ -462,7 +576,7 @@ def authorize_backend_endpoint(
 
 
 @app.post("/sync-profiles")
-def create_sync_profile_endpoint(
+async def create_sync_profile_endpoint(
     payload: CreateSyncProfileInput,
     current_user: UserInfo = Depends(get_current_user),
     services: DomainServices = Depends(get_domain_services),
@@ -474,9 +588,21 @@ def create_sync_profile_endpoint(
         extra={"user_id": current_user.uid},
     )
 
-    sync_profile = services.sync_profile_service.create_sync_profile(
+    # Download the ICS without holding a thread; the creation itself reuses it.
+    # Errors are not raised here: the validation in `create_sync_profile` reports them.
+    ics_cache = IcsResultCache()
+    await services.ics_service.try_fetch_and_parse_async(
+        payload.schedule_source.to_ics_source(),
+        metadata={"user_id": current_user.uid, "context": "create_sync_profile"},
+        cache=ics_cache,
+        http_client=services.http_client,
+    )
+
+    sync_profile = await services.blocking_io.run(
+        services.sync_profile_service.create_sync_profile,
         current_user.uid,
         payload,
+        ics_cache=ics_cache,
     )
 
     return sync_profile.model_dump(mode="json")
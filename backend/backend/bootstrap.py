@@ -2,8 +2,10 @@ from functools import partial
 from typing import cast
 from backend import handlers
 from backend.infrastructure.event_bus import LocalEventBus, Handler
+from backend.infrastructure.job_executor import IJobExecutor
 from backend.repositories.sync_stats_repository import ISyncStatsRepository
 from backend.services.dev_notification_service import IDevNotificationService
+from backend.services.sync_profile_service import SyncProfileService
 from backend.shared.domain_events import (
     DomainEvent,
     IcsFetched,
@@ -78,3 +80,27 @@ def bootstrap_event_bus(
             },
         )
     )
+
+
+def bootstrap_background_jobs(
+    event_bus: LocalEventBus,
+    *,
+    sync_profile_service: SyncProfileService,
+    job_executor: IJobExecutor,
+) -> None:
+    """Registers the handlers that hand slow work over to the job executor.
+
+    Kept separate from `bootstrap_event_bus` because the services involved
+    need the event bus to be built first.
+    """
+    event_bus.subscribe(
+        SyncProfileCreated,
+        cast(
+            Handler,
+            partial(
+                handlers.initialize_sync_profile_on_creation,
+                sync_profile_service=sync_profile_service,
+                job_executor=job_executor,
+            ),
+        ),
+    )
@@ -1,5 +1,7 @@
+from backend.infrastructure.job_executor import IJobExecutor
 from backend.repositories.sync_stats_repository import ISyncStatsRepository
 from backend.services.dev_notification_service import IDevNotificationService
+from backend.services.sync_profile_service import SyncProfileService
 from backend.shared.domain_events import (
     IcsFetched,
     RulesetGenerationFailed,
@@ -69,3 +71,15 @@ def notify_developer_on_sync_profile_creation_failure(
     dev_notification_service: IDevNotificationService,
 ) -> None:
     dev_notification_service.on_sync_profile_creation_failed(event)
+
+
+def initialize_sync_profile_on_creation(
+    event: SyncProfileCreated,
+    sync_profile_service: SyncProfileService,
+    job_executor: IJobExecutor,
+) -> None:
+    job_executor.submit(
+        sync_profile_service.initialize_sync_profile,
+        user_id=event.user_id,
+        sync_profile_id=event.sync_profile_id,
+    )
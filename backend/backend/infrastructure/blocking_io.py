@@ -0,0 +1,26 @@
+from functools import partial
+from typing import Any, Callable, TypeVar
+
+import anyio
+
+T = TypeVar("T")
+
+
+class BlockingIoRunner:
+    """
+    Runs blocking calls (Firestore, Google API client) from async code.
+
+    The Google API client has no async transport and the repositories use the
+    synchronous Firestore client, so async endpoints hand these calls to worker
+    threads. They get their own capacity limiter, sized for I/O-bound work,
+    instead of competing with every other sync dependency for the small default
+    thread pool of the server.
+    """
+
+    def __init__(self, max_threads: int) -> None:
+        self._limiter = anyio.CapacityLimiter(max_threads)
+
+    async def run(self, func: Callable[..., T], /, *args: Any, **kwargs: Any) -> T:
+        return await anyio.to_thread.run_sync(
+            partial(func, *args, **kwargs), limiter=self._limiter
+        )
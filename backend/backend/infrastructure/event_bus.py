@@ -21,6 +21,10 @@ class LocalEventBus:
         self.logger = logging.getLogger(self.__class__.__name__)
         self.logger.info("%s initialized", self.__class__.__name__)
 
+    def subscribe(self, event_type: type[DomainEvent], handler: Handler) -> None:
+        """Registers an additional handler, e.g. one that depends on services built after the bus."""
+        self.handlers.setdefault(event_type, []).append(handler)
+
     def publish(self, event: DomainEvent) -> None:
         if event.__class__ not in self.handlers:
             # Note : Crashing here counter the event pattern philosophy, but for now
@@ -0,0 +1,87 @@
+import http.cookiejar
+import importlib.util
+import logging
+import threading
+
+import httpx
+import requests
+from requests.adapters import HTTPAdapter
+
+from backend.settings import settings
+
+logger = logging.getLogger(__name__)
+
+ICS_REQUEST_HEADERS = {"Accept-Encoding": "gzip, deflate"}
+"""Sent with ICS downloads: timetable servers compress feeds about 10x."""
+
+
+_NO_COOKIES_POLICY = http.cookiejar.DefaultCookiePolicy(allowed_domains=[])
+"""
+Rejects every cookie: the clients are shared by the requests made on behalf of all
+users, so a cookie set for one must not be sent for another.
+"""
+
+
+def is_http2_available() -> bool:
+    """HTTP/2 needs the optional `h2` package (`httpx[http2]`)."""
+    return importlib.util.find_spec("h2") is not None
+
+
+def create_http_session(
+    *,
+    pool_connections: int = settings.HTTP_POOL_HOSTS,
+    pool_maxsize: int = settings.HTTP_POOL_CONNECTIONS_PER_HOST,
+) -> requests.Session:
+    """
+    A `requests` session keeping up to `pool_maxsize` connections alive for each of
+    `pool_connections` hosts, so that repeated requests skip the TCP and TLS handshakes.
+    Cookies set by responses are dropped.
+    """
+    session = requests.Session()
+    session.cookies.set_policy(_NO_COOKIES_POLICY)
+    adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def create_async_http_client(
+    *,
+    max_connections: int = settings.HTTP_POOL_HOSTS
+    * settings.HTTP_POOL_CONNECTIONS_PER_HOST,
+    http2: bool = settings.HTTP_CLIENT_HTTP2,
+) -> httpx.AsyncClient:
+    """
+    An `httpx` client keeping up to `max_connections` connections alive, using HTTP/2
+    when enabled and installed. Meant to be shared by the whole process and closed on shutdown.
+    Cookies set by responses are dropped.
+    """
+    if http2 and not is_http2_available():
+        logger.info("HTTP/2 is not available (the h2 package is not installed)")
+        http2 = False
+
+    return httpx.AsyncClient(
+        http2=http2,
+        cookies=http.cookiejar.CookieJar(policy=_NO_COOKIES_POLICY),
+        limits=httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_connections,
+        ),
+    )
+
+
+_http_session: requests.Session | None = None
+_http_session_lock = threading.Lock()
+
+
+def get_http_session() -> requests.Session:
+    """
+    The `requests` session shared by the blocking HTTP calls of the process (ICS
+    downloads, notifications, certificates). Its connection pools are thread-safe.
+    """
+    global _http_session
+    if _http_session is None:
+        with _http_session_lock:
+            if _http_session is None:
+                _http_session = create_http_session()
+    return _http_session
@@ -0,0 +1,55 @@
+import logging
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Protocol
+
+Job = Callable[..., None]
+
+
+class IJobExecutor(Protocol):
+    """Interface for running jobs outside of the request path."""
+
+    def submit(self, job: Job, /, **kwargs: Any) -> None: ...
+
+
+class LocalJobExecutor:
+    """
+    Runs jobs inline, in the caller's thread.
+
+    Used in tests, and in environments where work scheduled after the response
+    is not guaranteed to run (e.g. Cloud Functions throttle the CPU once the
+    function has returned).
+    """
+
+    def __init__(self) -> None:
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+    def submit(self, job: Job, /, **kwargs: Any) -> None:
+        try:
+            job(**kwargs)
+        except Exception as e:
+            self.logger.error("Job %s failed: %s", job, e)
+
+
+class ThreadPoolJobExecutor:
+    """Runs jobs on a pool of background threads of the current process."""
+
+    def __init__(self, max_workers: int) -> None:
+        self._pool = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="background-job"
+        )
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self.logger.info(
+            "%s initialized with %s workers", self.__class__.__name__, max_workers
+        )
+
+    def submit(self, job: Job, /, **kwargs: Any) -> None:
+        future = self._pool.submit(job, **kwargs)
+        future.add_done_callback(lambda f: self._log_failure(job, f))
+
+    def _log_failure(self, job: Job, future: Future) -> None:
+        if (e := future.exception()) is not None:
+            self.logger.error("Job %s failed: %s", job, e)
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop accepting jobs, optionally waiting for the running ones to finish."""
+        self._pool.shutdown(wait=wait)
@@ -16,10 +16,13 @@ from .sync_profile import (
     SyncProfile,
     SyncProfileStatus,
     SyncProfileStatusType,
+    SyncLease,
+    SyncSchedule,
     SyncTrigger,
     SyncType,
     TargetCalendar,
 )
+from .sync_job import SyncJob, SyncJobStatus
 
 from .authorization import BackendAuthorization
 
@@ -36,7 +39,11 @@ __all__ = [
     "ScheduleSource",
     "SyncProfile",
     "SyncProfileStatus",
+    "SyncJob",
+    "SyncJobStatus",
     "SyncProfileStatusType",
+    "SyncLease",
+    "SyncSchedule",
     "SyncTrigger",
     "SyncType",
     "TargetCalendar",
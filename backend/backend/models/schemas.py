@@ -62,6 +62,14 @@ class RequestSyncInput(CamelCaseModel):
     sync_type: SyncType = Field(SyncType.REGULAR, description="Type of sync to perform")
 
 
+class RequestSyncOutput(CamelCaseModel):
+    success: bool = Field(True, description="Whether the sync request was accepted")
+    job_id: str = Field(
+        ...,
+        description="ID of the sync job serving the request, shared by the requests merged into it",
+    )
+
+
 class DeleteSyncProfileInput(CamelCaseModel):
     sync_profile_id: str = Field(
         ..., description="ID of the sync profile to delete", min_length=1
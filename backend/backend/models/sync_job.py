@@ -0,0 +1,70 @@
+from datetime import datetime
+from enum import Enum
+
+from pydantic import Field
+
+from backend.models.base import CamelCaseModel
+from backend.models.sync_profile import SyncTrigger, SyncType, utc_datetime_factory
+
+
+class SyncJobStatus(str, Enum):
+    PENDING = "pending"
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+
+    def is_finished(self) -> bool:
+        return self in (SyncJobStatus.SUCCEEDED, SyncJobStatus.FAILED)
+
+
+def sync_type_scope(sync_type: SyncType) -> int:
+    """Higher updates more events: a FULL sync covers a REGULAR one, which covers a WINDOW one."""
+    match sync_type:
+        case SyncType.WINDOW:
+            return 0
+        case SyncType.REGULAR:
+            return 1
+        case SyncType.FULL:
+            return 2
+
+
+def sync_trigger_priority(sync_trigger: SyncTrigger) -> int:
+    """Lower runs first: syncs a user is waiting for go before scheduled ones."""
+    match sync_trigger:
+        case SyncTrigger.MANUAL | SyncTrigger.ON_CREATE:
+            return 0
+        case SyncTrigger.SCHEDULED:
+            return 1
+
+
+class SyncJob(CamelCaseModel):
+    """
+    A request to synchronize a profile, waiting in or taken from a sync job queue.
+
+    Requests for a profile that already has a pending job are merged into it, so
+    `sync_trigger` and `sync_type` are those of the most demanding merged request.
+    """
+
+    id: str
+    user_id: str
+    sync_profile_id: str
+    sync_trigger: SyncTrigger
+    sync_type: SyncType
+    status: SyncJobStatus = SyncJobStatus.PENDING
+    enqueued_at: datetime = Field(default_factory=utc_datetime_factory)
+    merged_requests: int = Field(
+        default=1, description="Number of sync requests served by this job"
+    )
+    error: str | None = None
+
+    @property
+    def priority(self) -> int:
+        return sync_trigger_priority(self.sync_trigger)
+
+    def merge(self, sync_trigger: SyncTrigger, sync_type: SyncType) -> None:
+        """Fold another request for the same profile into this pending job."""
+        if sync_trigger_priority(sync_trigger) < self.priority:
+            self.sync_trigger = sync_trigger
+        if sync_type_scope(sync_type) > sync_type_scope(self.sync_type):
+            self.sync_type = sync_type
+        self.merged_requests += 1
@@ -71,10 +71,13 @@ class SyncType(str, Enum):
     Enumerates the type of synchronization:
     - regular : only future events are updated
     - full    : all events are refreshed
+    - window  : only events overlapping the next `SYNC_WINDOW_DAYS` days are updated,
+                so frequent syncs touch few events while regular syncs converge the rest
     """
 
     REGULAR = "regular"
     FULL = "full"
+    WINDOW = "window"
 
 
 class ScheduleSource(CamelCaseModel):
@@ -139,6 +142,53 @@ class SyncProfileStatus(CamelCaseModel):
     updated_at: PastDatetime = Field(default_factory=utc_datetime_factory)
 
 
+class SyncLease(CamelCaseModel):
+    """
+    Exclusive right of one synchronization run to sync a profile, until it expires.
+
+    Taken atomically when a sync starts, renewed by a heartbeat while it runs and
+    released when it ends. A lease that expired belongs to a run that crashed or
+    stalled, so another run may reclaim the profile.
+
+    Fields:
+    - owner: random token identifying the synchronization run
+    - acquired_at: when the run took the lease
+    - expires_at: when the lease lapses unless renewed
+    """
+
+    owner: str
+    acquired_at: datetime = Field(default_factory=utc_datetime_factory)
+    expires_at: datetime
+
+    def is_expired(self, now: datetime) -> bool:
+        return self.expires_at <= now
+
+
+class SyncSchedule(CamelCaseModel):
+    """
+    When the next scheduled sync of a profile is due, adapted to how often its feed
+    changes (see `SyncScheduler`).
+
+    Fields:
+    - interval_s: current time between two scheduled syncs
+    - next_sync_at: when the next scheduled sync is due
+    - events_digest: digest of the events seen by the last successful sync
+    - last_change_at: when the events were last seen changing
+    - unchanged_syncs: number of successful syncs since the events last changed
+    - consecutive_failures: number of failed syncs since the last successful one
+    """
+
+    interval_s: float = Field(..., gt=0)
+    next_sync_at: datetime
+    events_digest: str | None = None
+    last_change_at: datetime | None = None
+    unchanged_syncs: int = 0
+    consecutive_failures: int = 0
+
+    def is_due(self, now: datetime) -> bool:
+        return self.next_sync_at <= now
+
+
 def _decode_ruleset_from_str(value: Any) -> Ruleset | dict | None:
     """A helper function to decode a JSON string into a Ruleset object because we
     store the object as a string in Firestore, but want to work with it as a validated object.
@@ -170,6 +220,11 @@ class SyncProfile(CamelCaseModel):
     - ruleset_error: error string if AI ruleset generation fails
     - created_at: timestamp of creation
     - last_successful_sync: timestamp of the last successful sync
+    - lease: lease of the synchronization currently running, if any
+    - last_sync_digest: digest of the events written by the last successful sync
+    - sync_schedule: when the next scheduled sync is due, None until the first sync
+    - updated_at: when the document was last written, set by the repository (None
+      for documents not written since it was introduced)
     """
 
     id: str = Field(
@@ -190,6 +245,11 @@ class SyncProfile(CamelCaseModel):
     created_at: PastDatetime = Field(default_factory=utc_datetime_factory)
     last_successful_sync: PastDatetime | None = None
 
+    lease: SyncLease | None = None
+    last_sync_digest: str | None = None
+    sync_schedule: SyncSchedule | None = None
+    updated_at: datetime | None = None
+
     @field_serializer("ruleset")
     def _serialize_ruleset_as_json_str(self, ruleset: Ruleset | None) -> str | None:
         return ruleset.model_dump_json() if ruleset else None
@@ -205,6 +265,32 @@ class SyncProfile(CamelCaseModel):
             raise ValueError("ruleset and ruleset_error cannot both be set")
         return self
 
+    def has_live_lease(self, now: datetime) -> bool:
+        return self.lease is not None and not self.lease.is_expired(now)
+
+    def is_sync_stale(self, now: datetime) -> bool:
+        """
+        Whether the profile is IN_PROGRESS without a live lease, i.e. the run that
+        started the sync crashed or stalled. Such a profile can be synced again.
+        """
+        return (
+            self.status.type == SyncProfileStatusType.IN_PROGRESS
+            and not self.has_live_lease(now)
+        )
+
+    def can_acquire_sync_lease(
+        self, now: datetime, ignore_status: bool = False
+    ) -> bool:
+        """
+        Whether a new synchronization run may take the lease of this profile.
+
+        A live lease of another run is never taken over. Otherwise the status must
+        allow syncing, unless `ignore_status` is set (forced syncs).
+        """
+        if self.has_live_lease(now):
+            return False
+        return ignore_status or self.status.type.is_active() or self.is_sync_stale(now)
+
     def update_ruleset(
         self, *, ruleset: Ruleset | None = None, error: str | None = None
     ) -> None:
@@ -1,14 +1,20 @@
 import logging
+import threading
+from datetime import datetime, timedelta
 from typing import Protocol
 
 from firebase_admin.firestore import firestore
 from google.cloud.firestore_v1.base_document import DocumentSnapshot
 from google.cloud.firestore_v1.collection import CollectionReference
 from google.cloud.firestore_v1.document import DocumentReference
+from google.cloud.firestore_v1.query import Query
 
 from backend.models.sync_profile import (
+    SyncLease,
     SyncProfile,
+    SyncProfileStatus,
     SyncProfileStatusType,
+    utc_datetime_factory,
 )
 
 logger = logging.getLogger(__name__)
@@ -43,13 +49,68 @@ class ISyncProfileRepository(Protocol):
 
     def list_all_active_sync_profiles(self) -> list[SyncProfile]:
         """
-        Lists all active SyncProfiles for all users.
+        Lists all active SyncProfiles for all users, including IN_PROGRESS ones
+        whose sync lease expired (their synchronization crashed or stalled).
+        """
+        ...
+
+    def list_sync_profiles_updated_since(self, since: datetime) -> list[SyncProfile]:
+        """
+        Lists the SyncProfiles of all users written after `since` (see
+        `SyncProfile.updated_at`). Deleted profiles are not reported.
+        """
+        ...
+
+    def count_sync_profiles_by_status(self) -> dict[SyncProfileStatusType, int]:
+        """
+        Counts the SyncProfiles of all users per status type, without loading them.
         """
         ...
 
     def save_sync_profile(self, profile: SyncProfile) -> None:
         """
-        Saves (creates or updates) a SyncProfile by overwriting.
+        Saves (creates or updates) a SyncProfile by overwriting, setting its
+        `updated_at`.
+        """
+        ...
+
+    def try_acquire_sync_lease(
+        self,
+        user_id: str,
+        sync_profile_id: str,
+        *,
+        owner: str,
+        ttl_s: float,
+        status: SyncProfileStatus,
+        ignore_status: bool = False,
+    ) -> SyncProfile | None:
+        """
+        Atomically checks that the profile can be synchronized (see
+        `SyncProfile.can_acquire_sync_lease`) and gives `owner` its lease for `ttl_s`
+        seconds, setting its status to `status`.
+
+        Returns the updated profile, or None if the profile does not exist or
+        cannot be synchronized now.
+        """
+        ...
+
+    def renew_sync_lease(
+        self, user_id: str, sync_profile_id: str, *, owner: str, ttl_s: float
+    ) -> bool:
+        """
+        Extends the lease of `owner` to `ttl_s` seconds from now.
+        Returns False if `owner` no longer holds the lease.
+        """
+        ...
+
+    def release_sync_lease(self, profile: SyncProfile, *, owner: str) -> bool:
+        """
+        Saves `profile`, typically with the final status of its synchronization,
+        and removes the lease of `owner`, in one atomic step.
+
+        Nothing is written if `owner` no longer holds the lease, so that a run whose
+        lease was reclaimed does not overwrite the state of the run that reclaimed it.
+        Returns whether the profile was saved.
         """
         ...
 
@@ -122,6 +183,7 @@ class FirestoreSyncProfileRepository(ISyncProfileRepository):
         )
         doc_ref = self._get_doc_ref(profile.user_id, profile.id)
 
+        profile.updated_at = utc_datetime_factory()
         data_to_save = profile.model_dump()
 
         doc_ref.set(data_to_save)
@@ -178,12 +240,47 @@ class FirestoreSyncProfileRepository(ISyncProfileRepository):
         """
         logger.info("Listing active sync profiles")
 
-        query = self._db.collection_group("syncProfiles").where(
+        active_query = self._db.collection_group("syncProfiles").where(
             "status.type",
             "in",
             [status.value for status in SyncProfileStatusType if status.is_active()],
         )
+        in_progress_query = self._db.collection_group("syncProfiles").where(
+            "status.type", "==", SyncProfileStatusType.IN_PROGRESS.value
+        )
+
+        now = utc_datetime_factory()
+        return self._stream_group_profiles(active_query) + [
+            profile
+            for profile in self._stream_group_profiles(in_progress_query)
+            if profile.is_sync_stale(now)
+        ]
 
+    def list_sync_profiles_updated_since(self, since: datetime) -> list[SyncProfile]:
+        """
+        Lists the SyncProfiles of all users written after `since`.
+        Needs the collection group index on `updatedAt` (firestore.indexes.json).
+        """
+        logger.info("Listing sync profiles updated since %s", since.isoformat())
+        query = self._db.collection_group("syncProfiles").where("updatedAt", ">", since)
+        return self._stream_group_profiles(query)
+
+    def count_sync_profiles_by_status(self) -> dict[SyncProfileStatusType, int]:
+        """
+        Firestore has no grouped aggregation: one `count()` query per status type,
+        each billed one read per 1000 profiles counted.
+        """
+        counts: dict[SyncProfileStatusType, int] = {}
+        for status_type in SyncProfileStatusType:
+            query = self._db.collection_group("syncProfiles").where(
+                "status.type", "==", status_type.value
+            )
+            [[result]] = query.count(alias="count").get()
+            counts[status_type] = int(result.value)
+        return counts
+
+    @staticmethod
+    def _stream_group_profiles(query: Query) -> list[SyncProfile]:
         profiles: list[SyncProfile] = []
 
         for doc in query.stream():
@@ -196,6 +293,105 @@ class FirestoreSyncProfileRepository(ISyncProfileRepository):
 
         return profiles
 
+    @staticmethod
+    def _get_in_transaction(
+        transaction: firestore.Transaction,
+        doc_ref: DocumentReference,
+        user_id: str,
+    ) -> SyncProfile | None:
+        snapshot = next(iter(transaction.get(doc_ref)), None)
+        data = snapshot.to_dict() if snapshot is not None else None
+        if not data:
+            return None
+
+        data["id"] = doc_ref.id
+        data["user_id"] = user_id
+        return SyncProfile.model_validate(data)
+
+    def try_acquire_sync_lease(
+        self,
+        user_id: str,
+        sync_profile_id: str,
+        *,
+        owner: str,
+        ttl_s: float,
+        status: SyncProfileStatus,
+        ignore_status: bool = False,
+    ) -> SyncProfile | None:
+        doc_ref = self._get_doc_ref(user_id, sync_profile_id)
+
+        @firestore.transactional
+        def acquire(transaction: firestore.Transaction) -> SyncProfile | None:
+            profile = self._get_in_transaction(transaction, doc_ref, user_id)
+            now = utc_datetime_factory()
+            if profile is None or not profile.can_acquire_sync_lease(
+                now, ignore_status
+            ):
+                return None
+
+            profile.status = status
+            profile.lease = SyncLease(
+                owner=owner, acquired_at=now, expires_at=now + timedelta(seconds=ttl_s)
+            )
+            profile.updated_at = now
+            transaction.set(doc_ref, profile.model_dump())
+            return profile
+
+        profile = acquire(self._db.transaction())
+        logger.info(
+            "Sync lease %s",
+            "acquired" if profile else "not acquired",
+            extra={"user_id": user_id, "sync_profile_id": sync_profile_id},
+        )
+        return profile
+
+    def renew_sync_lease(
+        self, user_id: str, sync_profile_id: str, *, owner: str, ttl_s: float
+    ) -> bool:
+        doc_ref = self._get_doc_ref(user_id, sync_profile_id)
+
+        @firestore.transactional
+        def renew(transaction: firestore.Transaction) -> bool:
+            profile = self._get_in_transaction(transaction, doc_ref, user_id)
+            if profile is None or profile.lease is None or profile.lease.owner != owner:
+                return False
+
+            lease = profile.lease.model_copy(
+                update={"expires_at": utc_datetime_factory() + timedelta(seconds=ttl_s)}
+            )
+            transaction.update(doc_ref, {"lease": lease.model_dump()})
+            return True
+
+        return renew(self._db.transaction())
+
+    def release_sync_lease(self, profile: SyncProfile, *, owner: str) -> bool:
+        doc_ref = self._get_doc_ref(profile.user_id, profile.id)
+
+        @firestore.transactional
+        def release(transaction: firestore.Transaction) -> bool:
+            current = self._get_in_transaction(transaction, doc_ref, profile.user_id)
+            if current is None or current.lease is None or current.lease.owner != owner:
+                return False
+
+            profile.updated_at = utc_datetime_factory()
+            transaction.set(
+                doc_ref, profile.model_copy(update={"lease": None}).model_dump()
+            )
+            return True
+
+        released = release(self._db.transaction())
+        if released:
+            logger.info(
+                "Sync lease released",
+                extra={"user_id": profile.user_id, "sync_profile_id": profile.id},
+            )
+        else:
+            logger.warning(
+                "Sync lease lost before release, profile not saved",
+                extra={"user_id": profile.user_id, "sync_profile_id": profile.id},
+            )
+        return released
+
     def delete_sync_profile(self, user_id: str, sync_profile_id: str) -> None:
         """
         Deletes a SyncProfile document.
@@ -225,6 +421,8 @@ class MockSyncProfileRepository(ISyncProfileRepository):
     def __init__(self) -> None:
         # Structure: { user_id: { sync_profile_id: SyncProfile } }
         self._storage: dict[str, dict[str, SyncProfile]] = {}
+        # Makes the lease operations atomic, like Firestore transactions
+        self._lease_lock = threading.Lock()
 
     def get_sync_profile(
         self, user_id: str, sync_profile_id: str
@@ -233,6 +431,7 @@ class MockSyncProfileRepository(ISyncProfileRepository):
         return user_profiles.get(sync_profile_id, None)
 
     def save_sync_profile(self, profile: SyncProfile) -> None:
+        profile.updated_at = utc_datetime_factory()
         user_profiles = self._storage.setdefault(profile.user_id, {})
         user_profiles[profile.id] = profile
 
@@ -248,16 +447,87 @@ class MockSyncProfileRepository(ISyncProfileRepository):
             all_profiles.extend(user_profiles.values())
         return all_profiles
 
+    def list_sync_profiles_updated_since(self, since: datetime) -> list[SyncProfile]:
+        return [
+            profile
+            for profile in self.list_all_sync_profiles()
+            if profile.updated_at is not None and profile.updated_at > since
+        ]
+
+    def count_sync_profiles_by_status(self) -> dict[SyncProfileStatusType, int]:
+        counts = dict.fromkeys(SyncProfileStatusType, 0)
+        for profile in self.list_all_sync_profiles():
+            counts[profile.status.type] += 1
+        return counts
+
     def list_all_active_sync_profiles(self) -> list[SyncProfile]:
         # A profile is active if sync_profile.status.type.is_active() is True
-        # (meaning status is NOT in [IN_PROGRESS, DELETING, DELETION_FAILED]).
+        # (meaning status is NOT in [IN_PROGRESS, DELETING, DELETION_FAILED]),
+        # or if it is IN_PROGRESS with an expired lease.
+        now = utc_datetime_factory()
         active_profiles = []
         for user_profiles in self._storage.values():
             for profile in user_profiles.values():
-                if profile.status.type.is_active():
+                if profile.status.type.is_active() or profile.is_sync_stale(now):
                     active_profiles.append(profile)
         return active_profiles
 
+    def try_acquire_sync_lease(
+        self,
+        user_id: str,
+        sync_profile_id: str,
+        *,
+        owner: str,
+        ttl_s: float,
+        status: SyncProfileStatus,
+        ignore_status: bool = False,
+    ) -> SyncProfile | None:
+        with self._lease_lock:
+            profile = self.get_sync_profile(user_id, sync_profile_id)
+            now = utc_datetime_factory()
+            if profile is None or not profile.can_acquire_sync_lease(
+                now, ignore_status
+            ):
+                return None
+
+            profile = profile.model_copy(
+                update={
+                    "status": status,
+                    "lease": SyncLease(
+                        owner=owner,
+                        acquired_at=now,
+                        expires_at=now + timedelta(seconds=ttl_s),
+                    ),
+                },
+                deep=True,
+            )
+            self.save_sync_profile(profile)
+            return profile.model_copy(deep=True)
+
+    def renew_sync_lease(
+        self, user_id: str, sync_profile_id: str, *, owner: str, ttl_s: float
+    ) -> bool:
+        with self._lease_lock:
+            profile = self.get_sync_profile(user_id, sync_profile_id)
+            if profile is None or profile.lease is None or profile.lease.owner != owner:
+                return False
+
+            profile.lease = profile.lease.model_copy(
+                update={"expires_at": utc_datetime_factory() + timedelta(seconds=ttl_s)}
+            )
+            return True
+
+    def release_sync_lease(self, profile: SyncProfile, *, owner: str) -> bool:
+        with self._lease_lock:
+            current = self.get_sync_profile(profile.user_id, profile.id)
+            if current is None or current.lease is None or current.lease.owner != owner:
+                return False
+
+            self.save_sync_profile(
+                profile.model_copy(update={"lease": None}, deep=True)
+            )
+            return True
+
     def delete_sync_profile(self, user_id: str, sync_profile_id: str) -> None:
         if user_id in self._storage and sync_profile_id in self._storage[user_id]:
             del self._storage[user_id][sync_profile_id]
@@ -8,7 +8,7 @@ from backend.repositories.sync_profile_repository import (
     ISyncProfileRepository,
 )
 from backend.services.exceptions.ics import BaseIcsError
-from backend.services.ics_service import IcsService
+from backend.services.ics_service import IcsResultCache, IcsService
 from backend.shared.domain_events import RulesetGenerationFailed
 
 logger = logging.getLogger(__name__)
@@ -47,6 +47,7 @@ class AiRulesetService:
     def create_ruleset_for_sync_profile(
         self,
         sync_profile: SyncProfile,
+        ics_cache: IcsResultCache | None = None,
     ) -> None:
         """Creates or updates an AI-generated ruleset for a sync profile.
 
@@ -56,6 +57,7 @@ class AiRulesetService:
 
         Args:
             sync_profile: The sync profile containing the schedule source and user information.
+            ics_cache: ICS results of the current operation, reused instead of fetching again.
 
         Raises:
             None: Errors are handled internally and stored in the sync profile repository.
@@ -81,6 +83,7 @@ class AiRulesetService:
                 "source": sync_profile.schedule_source.model_dump(),
                 "purpose": "create_ruleset",
             },
+            cache=ics_cache,
         )
 
         if isinstance(result_or_error, BaseIcsError):
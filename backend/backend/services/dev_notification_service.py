@@ -1,10 +1,13 @@
 import logging
+import threading
 from abc import ABC, abstractmethod
+from collections import defaultdict
 import requests
 import json
 import traceback
 from typing import TypedDict
 
+from backend.infrastructure.http_client import get_http_session
 from backend.models.sync_profile import SyncProfile
 from backend.repositories.sync_profile_repository import ISyncProfileRepository
 from backend.services.user_service import FirebaseAuthUserService
@@ -13,6 +16,9 @@ from backend.shared import domain_events
 
 logger = logging.getLogger(__name__)
 
+_DIGEST_MAX_PROFILE_IDS = 10
+_TELEGRAM_MAX_MESSAGE_LENGTH = 4096
+
 
 class IDevNotificationService(ABC):
     """Interface for developer notification service."""
@@ -61,6 +67,10 @@ class IDevNotificationService(ABC):
         """Notify when a sync profile creation fails."""
         pass
 
+    def flush(self) -> None:
+        """Send the notifications held back for batching, if any."""
+        pass
+
 
 class NoOpDevNotificationService(IDevNotificationService):
     """No-operation implementation of the notification service."""
@@ -113,12 +123,15 @@ class TelegramDevNotificationService(IDevNotificationService):
         *,
         user_service: FirebaseAuthUserService | None,
         sync_profile_repo: ISyncProfileRepository | None,
+        session: requests.Session | None = None,
     ) -> None:
         self.bot_token = bot_token
         self.chat_id = chat_id
         self.api_url = f"https://api.telegram.org/bot{bot_token}/sendMessage"
         self.user_service = user_service
         self.sync_profile_repo = sync_profile_repo
+        # Keeps the connection to the Telegram API alive between notifications
+        self.session = session or get_http_session()
 
     def _get_sync_profile(
         self, user_id: str, sync_profile_id: str
@@ -162,7 +175,7 @@ class TelegramDevNotificationService(IDevNotificationService):
             return ""
         return f"Display Name: <code>{user_info['display_name']}</code>\nEmail: <code>{user_info['email']}</code>"
 
-    def _send_message(self, text: str) -> None:
+    def send_message(self, text: str) -> None:
         """Send a message to the Telegram chat."""
         try:
             payload = {
@@ -171,7 +184,7 @@ class TelegramDevNotificationService(IDevNotificationService):
                 "parse_mode": "HTML",
             }
 
-            response = requests.post(self.api_url, json=payload, timeout=5.0)
+            response = self.session.post(self.api_url, json=payload, timeout=5.0)
 
             if not response.ok:
                 logger.warning(
@@ -188,7 +201,7 @@ class TelegramDevNotificationService(IDevNotificationService):
         if user_info := self._get_user_info(domain_event.user_id):
             message += f"\n{self._format_user_info(user_info)}"
 
-        self._send_message(message)
+        self.send_message(message)
 
     def on_new_sync_profile(
         self, domain_event: domain_events.SyncProfileCreated
@@ -206,7 +219,7 @@ class TelegramDevNotificationService(IDevNotificationService):
         ):
             message += f"\n{self._format_sync_profile(sync_profile)}"
 
-        self._send_message(message)
+        self.send_message(message)
 
     def on_sync_failed(
         self,
@@ -232,7 +245,7 @@ class TelegramDevNotificationService(IDevNotificationService):
                 f"\nTraceback: <code>{domain_event.formatted_traceback[:1000]}</code>"
             )
 
-        self._send_message(message)
+        self.send_message(message)
 
     def on_sync_profile_deletion_failed(
         self,
@@ -258,7 +271,7 @@ class TelegramDevNotificationService(IDevNotificationService):
                 f"\nTraceback: <code>{domain_event.formatted_traceback[:1000]}</code>"
             )
 
-        self._send_message(message)
+        self.send_message(message)
 
     def on_ruleset_generation_failed(
         self,
@@ -277,7 +290,7 @@ class TelegramDevNotificationService(IDevNotificationService):
         ):
             message += f"\n{self._format_sync_profile(sync_profile)}"
 
-        self._send_message(message)
+        self.send_message(message)
 
     def on_sync_profile_creation_failed(
         self,
@@ -295,7 +308,115 @@ class TelegramDevNotificationService(IDevNotificationService):
             message += (
                 f"\nTraceback: <code>{domain_event.formatted_traceback[:1000]}</code>"
             )
-        self._send_message(message)
+        self.send_message(message)
+
+
+class BatchingDevNotificationService(IDevNotificationService):
+    """
+    Aggregates the sync failures sent to a Telegram notification service.
+
+    When the server of a feed fails, every profile using it fails in the same
+    scheduled run. Instead of sending one message per failure, blocking the sync for
+    each, the failures are buffered and sent as one digest grouped by error type and
+    ICS host, `window_s` after the first one. A window holding a single failure is
+    sent with its full details, as before.
+
+    The other notifications are sent right away.
+
+    Cloud Functions throttle the CPU once a function has returned, so the functions
+    that may fail syncs call `flush` before returning.
+    """
+
+    def __init__(
+        self,
+        notifier: TelegramDevNotificationService,
+        *,
+        window_s: float = settings.TELEGRAM_BATCH_WINDOW_S,
+    ) -> None:
+        self._notifier = notifier
+        self._window_s = window_s
+        self._pending: list[domain_events.SyncFailed] = []
+        self._timer: threading.Timer | None = None
+        self._lock = threading.Lock()
+
+    def on_new_user(self, domain_event: domain_events.UserCreated) -> None:
+        self._notifier.on_new_user(domain_event)
+
+    def on_new_sync_profile(
+        self, domain_event: domain_events.SyncProfileCreated
+    ) -> None:
+        self._notifier.on_new_sync_profile(domain_event)
+
+    def on_sync_failed(
+        self,
+        domain_event: domain_events.SyncFailed,
+    ) -> None:
+        with self._lock:
+            self._pending.append(domain_event)
+            if self._timer is None:
+                self._timer = threading.Timer(self._window_s, self.flush)
+                self._timer.daemon = True
+                self._timer.start()
+
+    def on_sync_profile_deletion_failed(
+        self,
+        domain_event: domain_events.SyncProfileDeletionFailed,
+    ) -> None:
+        self._notifier.on_sync_profile_deletion_failed(domain_event)
+
+    def on_ruleset_generation_failed(
+        self,
+        domain_event: domain_events.RulesetGenerationFailed,
+    ) -> None:
+        self._notifier.on_ruleset_generation_failed(domain_event)
+
+    def on_sync_profile_creation_failed(
+        self,
+        domain_event: domain_events.SyncProfileCreationFailed,
+    ) -> None:
+        self._notifier.on_sync_profile_creation_failed(domain_event)
+
+    def flush(self) -> None:
+        """Sends the buffered sync failures now."""
+        with self._lock:
+            pending, self._pending = self._pending, []
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+
+        if len(pending) == 1:
+            self._notifier.on_sync_failed(pending[0])
+        elif pending:
+            self._notifier.send_message(self._format_digest(pending))
+
+    @staticmethod
+    def _format_digest(failures: list[domain_events.SyncFailed]) -> str:
+        groups: defaultdict[tuple[str, str | None], list[domain_events.SyncFailed]] = (
+            defaultdict(list)
+        )
+        for failure in failures:
+            groups[(failure.error_type, failure.ics_host)].append(failure)
+
+        message = f"❌ <b>{len(failures)} Syncs Failed</b>\n"
+        for (error_type, ics_host), group in sorted(
+            groups.items(), key=lambda item: -len(item[1])
+        ):
+            profile_ids = [failure.sync_profile_id for failure in group]
+            message += (
+                f"\n<b>{len(group)}×</b> <code>{error_type}</code>"
+                f" on <code>{ics_host or 'unknown host'}</code>\n"
+                f"Error Message: <code>{group[0].error_message[:200]}</code>\n"
+                f"Profile IDs: <code>{', '.join(profile_ids[:_DIGEST_MAX_PROFILE_IDS])}</code>"
+            )
+            if len(profile_ids) > _DIGEST_MAX_PROFILE_IDS:
+                message += f" (+{len(profile_ids) - _DIGEST_MAX_PROFILE_IDS} more)"
+            message += "\n"
+
+        if len(message) > _TELEGRAM_MAX_MESSAGE_LENGTH:
+            # Cut outside of the HTML tags, Telegram rejects unbalanced ones
+            message = message[: message.rfind("\n\n", 0, _TELEGRAM_MAX_MESSAGE_LENGTH)]
+            message += "\n\n…"
+        return message
 
 
 def create_dev_notification_service(
@@ -307,9 +428,11 @@ def create_dev_notification_service(
         logger.warning("Telegram credentials not configured")
         return NoOpDevNotificationService()
 
-    return TelegramDevNotificationService(
-        bot_token=settings.TELEGRAM_BOT_TOKEN.get_secret_value(),
-        chat_id=settings.TELEGRAM_CHAT_ID,
-        user_service=user_service,
-        sync_profile_repo=sync_profile_repo,
+    return BatchingDevNotificationService(
+        TelegramDevNotificationService(
+            bot_token=settings.TELEGRAM_BOT_TOKEN.get_secret_value(),
+            chat_id=settings.TELEGRAM_CHAT_ID,
+            user_service=user_service,
+            sync_profile_repo=sync_profile_repo,
+        )
     )
@@ -18,6 +18,7 @@ from .sync import (
 from .ics import (
     BaseIcsError,
     IcsSourceError,
+    IcsHostUnavailableError,
     IcsParsingError,
 )
 from .ruleset import (
@@ -40,6 +41,7 @@ __all__ = [
     "SyncInProgressError",
     "BaseIcsError",
     "IcsSourceError",
+    "IcsHostUnavailableError",
     "IcsParsingError",
     "BaseRulesetError",
     "RulesetGenerationError",
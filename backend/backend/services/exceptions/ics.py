@@ -13,6 +13,12 @@ class IcsSourceError(BaseIcsError):
     pass
 
 
+class IcsHostUnavailableError(IcsSourceError):
+    """Raised without sending the request when the server of the ICS source is known to be failing or overloaded."""
+
+    pass
+
+
 class IcsParsingError(BaseIcsError):
     """Raised when the ICS content cannot be parsed"""
 
@@ -20,6 +26,6 @@ class IcsParsingError(BaseIcsError):
 
 
 class RecurringEventError(IcsParsingError):
-    """Raised when a recurring event is detected because we don't support them yet."""
+    """Raised when the recurrence of an event (RRULE, RDATE, EXDATE, RECURRENCE-ID) cannot be parsed."""
 
     pass
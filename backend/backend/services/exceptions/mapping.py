@@ -3,7 +3,7 @@ from firebase_functions import https_fn
 
 from .auth import BaseAuthorizationError, ProviderUserIdMismatchError, UnauthorizedError
 from .base import SyncademicError
-from .ics import IcsSourceError
+from .ics import IcsHostUnavailableError, IcsSourceError
 from .ruleset import RulesetGenerationError, RulesetValidationError
 from .sync import (
     DailySyncLimitExceededError,
@@ -24,6 +24,7 @@ FIREBASE_TO_FASTAPI_STATUS: dict[https_fn.FunctionsErrorCode, int] = {
     https_fn.FunctionsErrorCode.RESOURCE_EXHAUSTED: fastapi_status.HTTP_429_TOO_MANY_REQUESTS,
     https_fn.FunctionsErrorCode.FAILED_PRECONDITION: fastapi_status.HTTP_412_PRECONDITION_FAILED,
     https_fn.FunctionsErrorCode.INTERNAL: fastapi_status.HTTP_500_INTERNAL_SERVER_ERROR,
+    https_fn.FunctionsErrorCode.UNAVAILABLE: fastapi_status.HTTP_503_SERVICE_UNAVAILABLE,
 }
 
 
@@ -60,6 +61,9 @@ class ErrorMapping:
             case DailySyncLimitExceededError():
                 return (https_fn.FunctionsErrorCode.RESOURCE_EXHAUSTED, str(error))
 
+            case IcsHostUnavailableError():
+                return (https_fn.FunctionsErrorCode.UNAVAILABLE, str(error))
+
             case IcsSourceError():
                 return (https_fn.FunctionsErrorCode.INVALID_ARGUMENT, str(error))
 
@@ -1,7 +1,11 @@
 import logging
 from dataclasses import dataclass
+from functools import partial
 from typing import Any
 
+import anyio
+import httpx
+
 from backend.infrastructure.event_bus import IEventBus, LocalEventBus
 from backend.models.schemas import ValidateIcsUrlOutput
 from backend.services.exceptions.ics import (
@@ -9,6 +13,7 @@ from backend.services.exceptions.ics import (
     IcsParsingError,
     IcsSourceError,
 )
+from backend.services.sync_telemetry import SyncStage, SyncTelemetry, sync_stage
 from backend.shared import domain_events
 from backend.shared.event import Event
 from backend.synchronizer.ics_cache import IcsFileStorage
@@ -24,6 +29,30 @@ class IcsFetchAndParseResult:
     raw_ics: str
 
 
+class IcsResultCache:
+    """
+    Request-scoped cache of successful fetch-and-parse results, keyed by ICS source.
+
+    Created for one operation (e.g. the creation of a sync profile) and passed to
+    every `IcsService.try_fetch_and_parse` call of that operation, so that a source
+    is downloaded, parsed and archived only once. It is never shared between
+    operations: a later sync must see the current content of the source.
+    """
+
+    def __init__(self) -> None:
+        self._results: dict[str, IcsFetchAndParseResult] = {}
+
+    @staticmethod
+    def _key(ics_source: IcsSource) -> str:
+        return f"{type(ics_source).__name__}:{ics_source.model_dump_json()}"
+
+    def get(self, ics_source: IcsSource) -> IcsFetchAndParseResult | None:
+        return self._results.get(self._key(ics_source))
+
+    def put(self, ics_source: IcsSource, result: IcsFetchAndParseResult) -> None:
+        self._results[self._key(ics_source)] = result
+
+
 class IcsService:
     """
     Service for handling ICS (iCalendar) file operations including fetching, parsing, and validation.
@@ -88,6 +117,8 @@ class IcsService:
         self,
         ics_source: IcsSource,
         metadata: dict[str, Any] | None = None,
+        cache: IcsResultCache | None = None,
+        telemetry: SyncTelemetry | None = None,
     ) -> IcsFetchAndParseResult | IcsSourceError | IcsParsingError:
         """
         Tries to fetch the ICS file and parse it.
@@ -95,6 +126,10 @@ class IcsService:
         Args:
             ics_source: The source to fetch the ICS file from
             metadata: Additional metadata to pass to the event bus (e.g. sync_profile_id, user_id,...)
+            cache: Results already obtained during the current operation. On a hit, the
+                source is neither fetched, parsed nor published again. Successful
+                results are added to it.
+            telemetry: The synchronization to report the fetch and parse durations to.
         Returns:
             IcsFetchAndParseResult (with events and raw_ics) if successful, otherwise a BaseIcsError.
 
@@ -102,31 +137,44 @@ class IcsService:
             Exception: When an error other than BaseIcsError occurs.
         """
 
+        if cache is not None and (cached := cache.get(ics_source)) is not None:
+            logger.info("Reusing ICS already fetched during this operation")
+            return cached
+
         metadata = self._enrich_metadata(metadata, ics_source)
 
         try:
-            ics_str = ics_source.get_ics_string()
-            self.event_bus.publish(
-                domain_events.IcsFetched(
-                    ics_str=ics_str,
-                    metadata=metadata,
+            with sync_stage(telemetry, SyncStage.FETCH):
+                ics_str = ics_source.get_ics_string()
+                self.event_bus.publish(
+                    domain_events.IcsFetched(
+                        ics_str=ics_str,
+                        metadata=metadata,
+                    )
                 )
-            )
         except IcsSourceError as e:
             logger.error("Failed to fetch ICS file from source: %s", e)
             return e
 
-        events_or_error = self.ics_parser.try_parse(ics_str)
+        if telemetry is not None:
+            telemetry.count("ics_bytes", len(ics_str.encode()))
+
+        with sync_stage(telemetry, SyncStage.PARSE):
+            events_or_error = self.ics_parser.try_parse(ics_str)
 
         if isinstance(events_or_error, IcsParsingError):
             return events_or_error
 
-        return IcsFetchAndParseResult(events=events_or_error, raw_ics=ics_str)
+        result = IcsFetchAndParseResult(events=events_or_error, raw_ics=ics_str)
+        if cache is not None:
+            cache.put(ics_source, result)
+        return result
 
     def validate_ics_url_or_raise(
         self,
         ics_source: IcsSource,
         metadata: dict[str, Any] | None = None,
+        cache: IcsResultCache | None = None,
     ) -> IcsFetchAndParseResult:
         """
         Validates an ICS URL by attempting to fetch and parse its contents.
@@ -134,6 +182,7 @@ class IcsService:
         Args:
             ics_source: The source to fetch the ICS file from
             metadata: Additional metadata to pass to the event bus (e.g. sync_profile_id, user_id,...)
+            cache: See `try_fetch_and_parse`.
 
         Returns:
             IcsFetchAndParseResult if successful
@@ -144,6 +193,7 @@ class IcsService:
         result_or_error = self.try_fetch_and_parse(
             ics_source,
             metadata=metadata,
+            cache=cache,
         )
 
         if isinstance(result_or_error, BaseIcsError):
@@ -159,14 +209,84 @@ class IcsService:
         try:
             result = self.validate_ics_url_or_raise(ics_source, metadata)
         except BaseIcsError as e:
+            return self._validation_output(e)
+
+        return self._validation_output(result)
+
+    async def try_fetch_and_parse_async(
+        self,
+        ics_source: IcsSource,
+        metadata: dict[str, Any] | None = None,
+        cache: IcsResultCache | None = None,
+        http_client: httpx.AsyncClient | None = None,
+    ) -> IcsFetchAndParseResult | IcsSourceError | IcsParsingError:
+        """
+        Non-blocking counterpart of `try_fetch_and_parse`, for use in async endpoints.
+
+        The download is awaited on the event loop. Publishing `IcsFetched` (whose
+        handlers archive the file) and parsing are blocking, so they run in a worker
+        thread.
+
+        Args:
+            http_client: The HTTP client used to download URL sources.
+            See `try_fetch_and_parse` for the other arguments.
+        """
+
+        if cache is not None and (cached := cache.get(ics_source)) is not None:
+            logger.info("Reusing ICS already fetched during this operation")
+            return cached
+
+        metadata = self._enrich_metadata(metadata, ics_source)
+
+        try:
+            ics_str = await ics_source.get_ics_string_async(http_client)
+            await anyio.to_thread.run_sync(
+                self.event_bus.publish,
+                domain_events.IcsFetched(ics_str=ics_str, metadata=metadata),
+            )
+        except IcsSourceError as e:
+            logger.error("Failed to fetch ICS file from source: %s", e)
+            return e
+
+        events_or_error = await anyio.to_thread.run_sync(
+            partial(self.ics_parser.try_parse, ics_str)
+        )
+
+        if isinstance(events_or_error, IcsParsingError):
+            return events_or_error
+
+        result = IcsFetchAndParseResult(events=events_or_error, raw_ics=ics_str)
+        if cache is not None:
+            cache.put(ics_source, result)
+        return result
+
+    async def validate_ics_url_async(
+        self,
+        ics_source: IcsSource,
+        metadata: dict[str, Any] | None = None,
+        http_client: httpx.AsyncClient | None = None,
+    ) -> ValidateIcsUrlOutput:
+        """Non-blocking counterpart of `validate_ics_url`."""
+        result_or_error = await self.try_fetch_and_parse_async(
+            ics_source,
+            metadata=metadata,
+            http_client=http_client,
+        )
+        return self._validation_output(result_or_error)
+
+    @staticmethod
+    def _validation_output(
+        result_or_error: IcsFetchAndParseResult | BaseIcsError,
+    ) -> ValidateIcsUrlOutput:
+        if isinstance(result_or_error, BaseIcsError):
             return ValidateIcsUrlOutput(
                 valid=False,
-                error=str(e),
+                error=str(result_or_error),
                 nb_events=None,
             )
 
         return ValidateIcsUrlOutput(
             valid=True,
             error=None,
-            nb_events=len(result.events),
+            nb_events=len(result_or_error.events),
         )
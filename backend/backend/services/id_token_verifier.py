@@ -0,0 +1,268 @@
+import hashlib
+import logging
+import re
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable
+
+import anyio
+import google.auth.exceptions
+import requests
+from firebase_admin import auth
+from google.auth import jwt
+
+from backend.infrastructure.http_client import get_http_session
+
+logger = logging.getLogger(__name__)
+
+FIREBASE_ID_TOKEN_CERTS_URL = (
+    "https://www.googleapis.com/robot/v1/metadata/x509/"
+    "securetoken@system.gserviceaccount.com"
+)
+FIREBASE_ID_TOKEN_ISSUER_PREFIX = "https://securetoken.google.com/"
+
+Claims = dict[str, Any]
+Clock = Callable[[], float]
+CertsFetcher = Callable[[], tuple[dict[str, str], float]]
+"""Returns the certificates by key id, and for how many seconds they may be cached."""
+
+
+class VerifiedTokenCache:
+    """
+    Bounded LRU cache of the claims of already verified ID tokens.
+
+    Entries are keyed by a hash of the token, so raw tokens are never kept in memory,
+    and expire at the token's `exp` or after `max_ttl_s`, whichever comes first.
+    Thread-safe.
+    """
+
+    def __init__(
+        self, *, max_size: int, max_ttl_s: float, clock: Clock = time.time
+    ) -> None:
+        self._max_size = max_size
+        self._max_ttl_s = max_ttl_s
+        self._clock = clock
+        self._entries: OrderedDict[str, tuple[float, Claims]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(token: str) -> str:
+        return hashlib.sha256(token.encode()).hexdigest()
+
+    def get(self, token: str) -> Claims | None:
+        key = self._key(token)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, claims = entry
+            if expires_at <= self._clock():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return claims
+
+    def put(self, token: str, claims: Claims) -> None:
+        now = self._clock()
+        expires_at = min(float(claims["exp"]), now + self._max_ttl_s)
+        if expires_at <= now:
+            return
+
+        key = self._key(token)
+        with self._lock:
+            self._entries[key] = (expires_at, claims)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+def fetch_firebase_certs(timeout_s: float = 10) -> tuple[dict[str, str], float]:
+    """Download the certificates signing Firebase ID tokens, and their max-age."""
+    response = get_http_session().get(FIREBASE_ID_TOKEN_CERTS_URL, timeout=timeout_s)
+    response.raise_for_status()
+    match = re.search(r"max-age=(\d+)", response.headers.get("Cache-Control", ""))
+    return response.json(), float(match.group(1)) if match else 3600.0
+
+
+class FirebasePublicKeys:
+    """
+    Certificates signing Firebase ID tokens, kept in memory and rotated ahead of time.
+
+    `refresh` is meant to be called by a background task (see
+    `refresh_public_keys_periodically`), so requests never wait for a download.
+    A download still happens inline when the keys are missing or expired, or when a
+    token is signed by a key we do not know yet (rate-limited by
+    `min_refresh_interval_s`).
+    """
+
+    def __init__(
+        self,
+        fetch: CertsFetcher = fetch_firebase_certs,
+        *,
+        min_refresh_interval_s: float = 60,
+        clock: Clock = time.time,
+    ) -> None:
+        self._fetch = fetch
+        self._min_refresh_interval_s = min_refresh_interval_s
+        self._clock = clock
+        self._certs: dict[str, str] = {}
+        self._expires_at = 0.0
+        self._fetched_at: float | None = None
+        self._lock = threading.Lock()
+
+    def refresh(self) -> None:
+        """Download the current certificates."""
+        with self._lock:
+            self._refresh_locked()
+
+    def _refresh_locked(self) -> None:
+        certs, max_age_s = self._fetch()
+        now = self._clock()
+        self._certs = certs
+        self._fetched_at = now
+        self._expires_at = now + max_age_s
+        logger.info(
+            "Firebase public keys refreshed",
+            extra={"key_ids": list(certs), "max_age_s": max_age_s},
+        )
+
+    def get(self) -> dict[str, str]:
+        """The certificates by key id, downloaded first if they expired."""
+        if self._expires_at <= self._clock():
+            with self._lock:
+                # Another thread may have refreshed them while we waited
+                if self._expires_at <= self._clock():
+                    self._refresh_locked()
+        return self._certs
+
+    def refresh_for_unknown_key(self) -> bool:
+        """Refresh after seeing an unknown key id. Returns whether keys were refreshed."""
+        if (
+            self._fetched_at is not None
+            and self._clock() - self._fetched_at < self._min_refresh_interval_s
+        ):
+            return False
+        self.refresh()
+        return True
+
+    def seconds_until_expiry(self) -> float:
+        return self._expires_at - self._clock()
+
+
+class FirebaseIdTokenVerifier:
+    """
+    Verifies Firebase ID tokens against in-memory public keys, caching the result.
+
+    Performs the checks documented for third-party JWT libraries, like
+    `firebase_admin.auth.verify_id_token` (revocation is not checked, as with its
+    default `check_revoked=False`), and raises the same exceptions.
+    """
+
+    def __init__(
+        self,
+        *,
+        project_id: str,
+        public_keys: FirebasePublicKeys,
+        cache: VerifiedTokenCache,
+    ) -> None:
+        self._project_id = project_id
+        self._public_keys = public_keys
+        self._cache = cache
+
+    def verify(self, token: str) -> Claims:
+        """
+        Returns the claims of a valid token, with `uid` set to its subject.
+
+        Raises:
+            auth.InvalidIdTokenError: If the token is malformed or not for this project.
+            auth.ExpiredIdTokenError: If the token expired.
+            auth.CertificateFetchError: If the public keys could not be downloaded.
+        """
+        if (claims := self._cache.get(token)) is not None:
+            return claims
+
+        claims = self._verify_uncached(token)
+        self._cache.put(token, claims)
+        return claims
+
+    async def verify_async(self, token: str) -> Claims:
+        """Same as `verify`, but the signature check runs off the event loop."""
+        if (claims := self._cache.get(token)) is not None:
+            return claims
+        return await anyio.to_thread.run_sync(self.verify, token)
+
+    def _verify_uncached(self, token: str) -> Claims:
+        try:
+            header = jwt.decode_header(token)
+        except ValueError as e:
+            raise auth.InvalidIdTokenError(str(e), cause=e)
+
+        key_id = header.get("kid")
+        if not key_id:
+            raise auth.InvalidIdTokenError('Firebase ID token has no "kid" claim.')
+        if header.get("alg") != "RS256":
+            raise auth.InvalidIdTokenError(
+                f'Firebase ID token has incorrect algorithm. Expected "RS256" but got "{header.get("alg")}".'
+            )
+
+        certs = self._certs_for(key_id)
+        try:
+            claims = jwt.decode(token, certs=certs, audience=self._project_id)
+        except ValueError as e:
+            if "Token expired" in str(e):
+                raise auth.ExpiredIdTokenError(str(e), cause=e)
+            raise auth.InvalidIdTokenError(str(e), cause=e)
+
+        expected_issuer = FIREBASE_ID_TOKEN_ISSUER_PREFIX + self._project_id
+        if claims.get("iss") != expected_issuer:
+            raise auth.InvalidIdTokenError(
+                f'Firebase ID token has incorrect "iss" (issuer) claim. Expected "{expected_issuer}" but got "{claims.get("iss")}".'
+            )
+        subject = claims.get("sub")
+        if not isinstance(subject, str) or not subject or len(subject) > 128:
+            raise auth.InvalidIdTokenError(
+                'Firebase ID token has an invalid "sub" (subject) claim.'
+            )
+
+        claims["uid"] = subject
+        return claims
+
+    def _certs_for(self, key_id: str) -> dict[str, str]:
+        try:
+            certs = self._public_keys.get()
+            if key_id not in certs and self._public_keys.refresh_for_unknown_key():
+                certs = self._public_keys.get()
+        except (requests.RequestException, google.auth.exceptions.TransportError) as e:
+            raise auth.CertificateFetchError(str(e), cause=e)
+
+        if key_id not in certs:
+            raise auth.InvalidIdTokenError(
+                f"Firebase ID token signed by an unknown key: {key_id}"
+            )
+        return certs
+
+
+async def refresh_public_keys_periodically(
+    public_keys: FirebasePublicKeys,
+    *,
+    refresh_margin_s: float = 300,
+    retry_interval_s: float = 60,
+) -> None:
+    """
+    Keep `public_keys` fresh until cancelled, rotating them `refresh_margin_s`
+    before they expire.
+    """
+    while True:
+        try:
+            await anyio.to_thread.run_sync(public_keys.refresh)
+            delay = max(
+                public_keys.seconds_until_expiry() - refresh_margin_s, retry_interval_s
+            )
+        except Exception as e:
+            logger.warning("Failed to refresh Firebase public keys: %s", e)
+            delay = retry_interval_s
+        await anyio.sleep(delay)
@@ -0,0 +1,171 @@
+import heapq
+import itertools
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Protocol
+from uuid import uuid4
+
+from backend.models.sync_job import SyncJob, SyncJobStatus
+from backend.models.sync_profile import SyncTrigger, SyncType
+
+logger = logging.getLogger(__name__)
+
+ProfileKey = tuple[str, str]
+"""(user_id, sync_profile_id)"""
+
+
+class ISyncJobQueue(Protocol):
+    """
+    Queue of sync jobs with at most one pending job per profile.
+
+    Jobs are handed out by priority (see `sync_trigger_priority`), then in arrival
+    order, and never while another job of the same profile is running.
+    """
+
+    def enqueue(
+        self,
+        user_id: str,
+        sync_profile_id: str,
+        sync_trigger: SyncTrigger,
+        sync_type: SyncType = SyncType.REGULAR,
+    ) -> SyncJob:
+        """
+        Add a sync request and return its job immediately.
+
+        If the profile already has a pending job, the request is merged into it:
+        FULL upgrades REGULAR, which upgrades WINDOW, and a MANUAL trigger takes
+        precedence over SCHEDULED.
+        """
+        ...
+
+    def dequeue(self, timeout_s: float = 0) -> SyncJob | None:
+        """Take the next runnable job, waiting up to `timeout_s` for one, and mark it RUNNING."""
+        ...
+
+    def complete(self, job_id: str, error: str | None = None) -> None:
+        """Mark a running job as SUCCEEDED, or FAILED if `error` is given."""
+        ...
+
+    def get_job(self, job_id: str) -> SyncJob | None: ...
+
+
+class InMemorySyncJobQueue:
+    """
+    Thread-safe sync job queue kept in the memory of the current process.
+
+    Used by the API server, whose workers are threads of the same process, and in
+    tests. Finished jobs are kept for `max_finished_jobs` lookups by id.
+    """
+
+    def __init__(self, max_finished_jobs: int = 1000) -> None:
+        self._max_finished_jobs = max_finished_jobs
+        self._jobs: dict[str, SyncJob] = {}
+        self._finished: OrderedDict[str, SyncJob] = OrderedDict()
+        self._pending_by_profile: dict[ProfileKey, str] = {}
+        self._running_profiles: set[ProfileKey] = set()
+        # Entries are (priority, sequence, job_id). A merge that raises the priority
+        # of a job pushes a new entry; outdated ones are skipped when popped.
+        self._heap: list[tuple[int, int, str]] = []
+        self._sequence = itertools.count()
+        self._condition = threading.Condition()
+
+    def enqueue(
+        self,
+        user_id: str,
+        sync_profile_id: str,
+        sync_trigger: SyncTrigger,
+        sync_type: SyncType = SyncType.REGULAR,
+    ) -> SyncJob:
+        key = (user_id, sync_profile_id)
+        with self._condition:
+            if (job_id := self._pending_by_profile.get(key)) is not None:
+                job = self._jobs[job_id]
+                priority_before = job.priority
+                job.merge(sync_trigger, sync_type)
+                if job.priority != priority_before:
+                    self._push(job)
+                logger.info(
+                    "Sync request merged into pending job",
+                    extra={
+                        "job_id": job.id,
+                        "sync_profile_id": sync_profile_id,
+                        "sync_type": job.sync_type,
+                        "merged_requests": job.merged_requests,
+                    },
+                )
+                return job.model_copy()
+
+            job = SyncJob(
+                id=str(uuid4()),
+                user_id=user_id,
+                sync_profile_id=sync_profile_id,
+                sync_trigger=sync_trigger,
+                sync_type=sync_type,
+            )
+            self._jobs[job.id] = job
+            self._pending_by_profile[key] = job.id
+            self._push(job)
+            self._condition.notify()
+            return job.model_copy()
+
+    def _push(self, job: SyncJob) -> None:
+        heapq.heappush(self._heap, (job.priority, next(self._sequence), job.id))
+
+    def dequeue(self, timeout_s: float = 0) -> SyncJob | None:
+        deadline = time.monotonic() + timeout_s
+        with self._condition:
+            while (job := self._pop_runnable()) is None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return None
+                self._condition.wait(remaining)
+
+            key = (job.user_id, job.sync_profile_id)
+            del self._pending_by_profile[key]
+            self._running_profiles.add(key)
+            job.status = SyncJobStatus.RUNNING
+            return job.model_copy()
+
+    def _pop_runnable(self) -> SyncJob | None:
+        blocked: list[tuple[int, int, str]] = []
+        found = None
+        while self._heap:
+            entry = heapq.heappop(self._heap)
+            priority, _, job_id = entry
+            job = self._jobs.get(job_id)
+            if (
+                job is None
+                or job.status != SyncJobStatus.PENDING
+                or job.priority != priority
+            ):
+                continue  # Outdated entry
+            if (job.user_id, job.sync_profile_id) in self._running_profiles:
+                blocked.append(entry)
+                continue
+            found = job
+            break
+
+        for entry in blocked:
+            heapq.heappush(self._heap, entry)
+        return found
+
+    def complete(self, job_id: str, error: str | None = None) -> None:
+        with self._condition:
+            job = self._jobs.pop(job_id)
+            job.status = SyncJobStatus.FAILED if error else SyncJobStatus.SUCCEEDED
+            job.error = error
+            self._running_profiles.discard((job.user_id, job.sync_profile_id))
+
+            self._finished[job_id] = job
+            while len(self._finished) > self._max_finished_jobs:
+                self._finished.popitem(last=False)
+
+            # A pending job of the same profile may have become runnable
+            self._condition.notify_all()
+
+    def get_job(self, job_id: str) -> SyncJob | None:
+        with self._condition:
+            job = self._jobs.get(job_id) or self._finished.get(job_id)
+            return job.model_copy() if job is not None else None
@@ -0,0 +1,99 @@
+import logging
+import threading
+
+from backend.models.sync_job import SyncJob
+from backend.services.sync_job_queue import ISyncJobQueue
+from backend.services.sync_profile_service import SyncProfileService
+
+logger = logging.getLogger(__name__)
+
+
+class SyncJobWorker:
+    """Takes jobs from a sync job queue and runs them with `SyncProfileService.synchronize`."""
+
+    def __init__(
+        self,
+        queue: ISyncJobQueue,
+        sync_profile_service: SyncProfileService,
+    ) -> None:
+        self._queue = queue
+        self._sync_profile_service = sync_profile_service
+
+    def run_next(self, timeout_s: float = 0) -> SyncJob | None:
+        """Run the next job, waiting up to `timeout_s` for one. Returns the job run, if any."""
+        job = self._queue.dequeue(timeout_s=timeout_s)
+        if job is None:
+            return None
+
+        logger.info(
+            "Running sync job",
+            extra={
+                "job_id": job.id,
+                "user_id": job.user_id,
+                "sync_profile_id": job.sync_profile_id,
+                "sync_trigger": job.sync_trigger,
+                "sync_type": job.sync_type,
+                "merged_requests": job.merged_requests,
+            },
+        )
+        try:
+            self._sync_profile_service.synchronize(
+                user_id=job.user_id,
+                sync_profile_id=job.sync_profile_id,
+                sync_trigger=job.sync_trigger,
+                sync_type=job.sync_type,
+            )
+        except Exception as e:
+            logger.error(
+                "Sync job failed: %s",
+                e,
+                extra={
+                    "job_id": job.id,
+                    "user_id": job.user_id,
+                    "sync_profile_id": job.sync_profile_id,
+                    "error_type": type(e).__name__,
+                },
+            )
+            self._queue.complete(job.id, error=str(e))
+        else:
+            self._queue.complete(job.id)
+        return job
+
+    def run_pending(self) -> int:
+        """Run jobs until the queue has no runnable job left. Returns how many ran."""
+        count = 0
+        while self.run_next() is not None:
+            count += 1
+        return count
+
+    def run_until_stopped(self, stop: threading.Event, poll_s: float = 1) -> None:
+        while not stop.is_set():
+            self.run_next(timeout_s=poll_s)
+
+
+class SyncJobWorkerPool:
+    """Background threads of the current process, each running a `SyncJobWorker`."""
+
+    def __init__(self, worker: SyncJobWorker, n_workers: int) -> None:
+        self._worker = worker
+        self._stop = threading.Event()
+        self._threads = [
+            threading.Thread(
+                target=worker.run_until_stopped,
+                args=(self._stop,),
+                name=f"sync-worker-{i}",
+                daemon=True,
+            )
+            for i in range(n_workers)
+        ]
+
+    def start(self) -> None:
+        for thread in self._threads:
+            thread.start()
+        logger.info("Started %s sync workers", len(self._threads))
+
+    def stop(self, timeout_s: float | None = None) -> None:
+        """Let the running jobs finish, then stop the workers."""
+        self._stop.set()
+        for thread in self._threads:
+            thread.join(timeout_s)
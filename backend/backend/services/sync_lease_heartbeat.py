@@ -0,0 +1,110 @@
+import logging
+import threading
+from types import TracebackType
+
+from backend.repositories.sync_profile_repository import ISyncProfileRepository
+from backend.services.exceptions.sync import SyncInProgressError
+
+logger = logging.getLogger(__name__)
+
+
+class SyncLeaseHeartbeat:
+    """
+    Renews the sync lease of a profile in a background thread while a
+    synchronization runs, so the lease only expires if the run crashes or stalls.
+
+    Usage:
+        with SyncLeaseHeartbeat(repo, ...) as heartbeat:
+            ...
+            heartbeat.ensure_held()  # Before writing to the target calendar
+    """
+
+    def __init__(
+        self,
+        sync_profile_repo: ISyncProfileRepository,
+        *,
+        user_id: str,
+        sync_profile_id: str,
+        owner: str,
+        ttl_s: float,
+        interval_s: float | None = None,
+    ) -> None:
+        self._sync_profile_repo = sync_profile_repo
+        self._user_id = user_id
+        self._sync_profile_id = sync_profile_id
+        self._owner = owner
+        self._ttl_s = ttl_s
+        # Renewing at a third of the TTL tolerates one failed renewal
+        self._interval_s = interval_s if interval_s is not None else ttl_s / 3
+        self._stop = threading.Event()
+        self._lost = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run, name=f"sync-lease-{sync_profile_id}", daemon=True
+        )
+
+    @property
+    def lost(self) -> bool:
+        """Whether another run took over the profile since the lease was acquired."""
+        return self._lost.is_set()
+
+    def ensure_held(self) -> None:
+        """
+        Renews the lease right away, so it is held for a full TTL from now.
+
+        Raises:
+            SyncInProgressError: If another run took over the profile.
+        """
+        if self.lost or not self._renew():
+            raise SyncInProgressError(
+                "The sync lease expired and another synchronization took over the profile"
+            )
+
+    def _renew(self) -> bool:
+        renewed = self._sync_profile_repo.renew_sync_lease(
+            self._user_id,
+            self._sync_profile_id,
+            owner=self._owner,
+            ttl_s=self._ttl_s,
+        )
+        if not renewed:
+            logger.warning(
+                "Sync lease lost",
+                extra={
+                    "user_id": self._user_id,
+                    "sync_profile_id": self._sync_profile_id,
+                },
+            )
+            self._lost.set()
+        return renewed
+
+    def _run(self) -> None:
+        while not self._stop.wait(self._interval_s):
+            try:
+                renewed = self._renew()
+            except Exception as e:
+                # The lease is still valid for a while, try again at the next beat
+                logger.warning(
+                    "Failed to renew sync lease: %s",
+                    e,
+                    extra={
+                        "user_id": self._user_id,
+                        "sync_profile_id": self._sync_profile_id,
+                    },
+                )
+                continue
+
+            if not renewed:
+                return
+
+    def __enter__(self) -> "SyncLeaseHeartbeat":
+        self._thread.start()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        self._stop.set()
+        self._thread.join()
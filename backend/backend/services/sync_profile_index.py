@@ -0,0 +1,92 @@
+import logging
+import threading
+import time
+from datetime import datetime, timedelta
+from typing import Callable
+
+from backend.models.sync_profile import SyncProfile
+from backend.repositories.sync_profile_repository import ISyncProfileRepository
+from backend.settings import settings
+
+logger = logging.getLogger(__name__)
+
+_WATERMARK_OVERLAP = timedelta(minutes=1)
+"""Profiles written this long before the watermark are loaded again, in case the
+clocks of the writers are behind."""
+
+
+class SyncProfileIndex:
+    """
+    All the sync profiles by ID, for the admin pages, refreshed incrementally.
+
+    The first refresh loads every profile. The next ones only load the profiles
+    written since the latest `updated_at` seen (the watermark), until
+    `full_refresh_interval_s` has elapsed. Deleted profiles are not reported by
+    incremental refreshes, so they stay in the index until the next full load.
+
+    Thread-safe.
+
+    Usage:
+        index = SyncProfileIndex(sync_profile_repo)
+        index.refresh()
+        profile = index.get(sync_profile_id)
+    """
+
+    def __init__(
+        self,
+        sync_profile_repo: ISyncProfileRepository,
+        *,
+        full_refresh_interval_s: float = settings.SYNC_PROFILE_INDEX_FULL_REFRESH_S,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._sync_profile_repo = sync_profile_repo
+        self._full_refresh_interval_s = full_refresh_interval_s
+        self._clock = clock
+        self._profiles: dict[str, SyncProfile] = {}
+        self._watermark: datetime | None = None
+        self._loaded_at: float | None = None
+        self._lock = threading.Lock()
+
+    def refresh(self) -> None:
+        with self._lock:
+            now = self._clock()
+            if (
+                self._loaded_at is None
+                or self._watermark is None
+                or now - self._loaded_at >= self._full_refresh_interval_s
+            ):
+                profiles = self._sync_profile_repo.list_all_sync_profiles()
+                self._profiles = {profile.id: profile for profile in profiles}
+                self._loaded_at = now
+                self._watermark = None
+                logger.info("Sync profile index loaded %s profiles", len(profiles))
+            else:
+                profiles = self._sync_profile_repo.list_sync_profiles_updated_since(
+                    self._watermark - _WATERMARK_OVERLAP
+                )
+                self._profiles.update((profile.id, profile) for profile in profiles)
+                logger.info("Sync profile index updated %s profiles", len(profiles))
+
+            # Profiles not written since `updated_at` was introduced have no write
+            # time, and are only loaded by full refreshes
+            self._watermark = max(
+                (
+                    profile.updated_at
+                    for profile in profiles
+                    if profile.updated_at is not None
+                ),
+                default=self._watermark,
+            )
+
+    def profiles(self) -> list[SyncProfile]:
+        with self._lock:
+            return list(self._profiles.values())
+
+    def get(self, sync_profile_id: str) -> SyncProfile | None:
+        with self._lock:
+            return self._profiles.get(sync_profile_id)
+
+    def invalidate(self) -> None:
+        """Makes the next refresh load all the profiles again."""
+        with self._lock:
+            self._loaded_at = None
@@ -1,8 +1,12 @@
 import logging
-from dataclasses import replace
-from datetime import datetime, timezone
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from dataclasses import dataclass, replace
+from datetime import datetime, timedelta, timezone
 import traceback
-from typing import Callable
+from typing import Callable, Iterator
 from uuid import uuid4
 
 from backend.infrastructure.event_bus import IEventBus
@@ -19,22 +23,52 @@ from backend.repositories.sync_profile_repository import ISyncProfileRepository
 from backend.repositories.sync_stats_repository import ISyncStatsRepository
 from backend.services.ai_ruleset_service import AiRulesetService
 from backend.services.authorization_service import AuthorizationService
-from backend.services.exceptions.ics import BaseIcsError, IcsParsingError
+from backend.services.exceptions.ics import (
+    BaseIcsError,
+    IcsHostUnavailableError,
+    IcsParsingError,
+)
 from backend.services.exceptions.sync import (
     DailySyncLimitExceededError,
     SyncProfileNotFoundError,
 )
 from backend.services.exceptions.target_calendar import TargetCalendarNotFoundError
 from backend.services.google_calendar_service import GoogleCalendarService
-from backend.services.ics_service import IcsService
+from backend.services.ics_service import IcsResultCache, IcsService
+from backend.services.sync_lease_heartbeat import SyncLeaseHeartbeat
+from backend.services.sync_profiler import SyncProfiler
+from backend.services.sync_scheduler import SyncScheduler
+from backend.services.sync_telemetry import (
+    IMetricsSink,
+    LoggingMetricsSink,
+    SyncOutcome,
+    SyncStage,
+    SyncTelemetry,
+)
 from backend.settings import settings
 from backend.shared import domain_events
+from backend.shared.event_batch import EventBatch
 from backend.shared.google_calendar_colors import GoogleEventColor
+from backend.synchronizer.events_digest import compute_events_digest
 from backend.synchronizer.google_calendar_manager import GoogleCalendarManager
 from backend.synchronizer.ics_source import UrlIcsSource
 
 logger = logging.getLogger(__name__)
 
+SYNC_SKIPPED_UNCHANGED_MESSAGE = "Skipped: unchanged"
+
+MAX_CREATION_ICS_CACHES = 32
+"""ICS fetched while creating profiles kept for their initialization jobs. Older ones
+are dropped, e.g. when jobs never ran, their initialization fetching the ICS again."""
+
+
+@dataclass(frozen=True)
+class SynchronizationResult:
+    events_digest: str
+    skipped_unchanged: bool = False
+    partial: bool = False
+    """Only part of the events were written, e.g. by a WINDOW sync."""
+
 
 class SyncProfileService:
     """
@@ -52,6 +86,9 @@ class SyncProfileService:
         google_calendar_service: GoogleCalendarService,
         ai_ruleset_service: AiRulesetService,
         event_bus: IEventBus,
+        sync_scheduler: SyncScheduler | None = None,
+        metrics_sink: IMetricsSink | None = None,
+        profiler: SyncProfiler | None = None,
     ) -> None:
         self._sync_profile_repo = sync_profile_repo
         self._authorization_service = authorization_service
@@ -60,25 +97,13 @@ class SyncProfileService:
         self._ics_service = ics_service
         self._ai_ruleset_service = ai_ruleset_service
         self._event_bus = event_bus
+        self._sync_scheduler = sync_scheduler or SyncScheduler()
+        self._metrics_sink = metrics_sink or LoggingMetricsSink()
+        self._profiler = profiler or SyncProfiler()
 
-    @staticmethod
-    def _can_sync(status_type: SyncProfileStatusType) -> bool:
-        match status_type:
-            case (
-                SyncProfileStatusType.IN_PROGRESS
-                | SyncProfileStatusType.DELETING
-                | SyncProfileStatusType.DELETION_FAILED
-                #  Even if it's not actually deleted, we don't want to sync
-                #  because the user intent was to delete the profile
-            ):
-                return False
-            case (
-                SyncProfileStatusType.NOT_STARTED
-                | SyncProfileStatusType.FAILED  # Allow re-trying
-                | SyncProfileStatusType.SUCCESS  # Allow re-syncing
-            ):
-                return True  # We allow trying again
-            # case _: # Don't use a catch-all case ! we want to get warning if we forgot to add a case
+        # ICS fetched while creating a profile, kept until its initialization job runs
+        self._creation_ics_caches: OrderedDict[str, IcsResultCache] = OrderedDict()
+        self._creation_ics_caches_lock = threading.Lock()
 
     def synchronize(
         self,
@@ -87,29 +112,45 @@ class SyncProfileService:
         sync_trigger: SyncTrigger,
         sync_type: SyncType = SyncType.REGULAR,
         force: bool = False,
+        ics_cache: IcsResultCache | None = None,
     ) -> None:
         """
         Synchronizes a user's schedule with their target calendar.
 
         This method:
         1. Verifies the SyncProfile status to ensure it can be synchronized. Skip this step if `force` is True,
-        2. Sets the profile status to IN_PROGRESS if allowable.
-        3. Enforces the user's daily synchronization limit.
+        2. Enforces the user's daily synchronization limit.
+        3. Atomically takes the sync lease of the profile and sets its status to IN_PROGRESS.
+            The lease is renewed by a heartbeat during the sync, so that concurrent runs
+            skip the profile, while a crashed run's profile can be reclaimed once it expires.
         4. Obtains an authorized Google Calendar manager for the target calendar.
         5. Fetches and parses the ICS data from the user's specified schedule source.
         6. Applies any defined customization rules (AI ruleset) to the events.
         7. Deletes or replaces relevant events on the target calendar based on the sync type:
             - REGULAR: Only future events are updated, leaving past events untouched.
             - FULL: All events previously created by this profile are removed and replaced.
+            - WINDOW: Only events overlapping the next `SYNC_WINDOW_DAYS` days are updated,
+              the time bounds being passed down to the calendar query.
             Note: This parameter is irrelevant for the first sync, which is always a full sync.
-        8. Updates the SyncProfile status, marks a successful sync time,
+            A REGULAR or WINDOW sync whose events, ruleset and target calendar are the same as for
+            the last successful sync leaves the calendar untouched ("Skipped: unchanged" status).
+        8. Updates the SyncProfile status and releases the lease, marks a successful sync time,
+            schedules the next sync from whether the events changed (see `SyncScheduler`),
             and increments the daily usage count on success.
+            The time spent in each stage and the work done are exported to the metrics
+            sink (see `SyncTelemetry`), whatever the outcome. Selected syncs are also
+            profiled (see `SyncProfiler`).
+            A failed REGULAR or FULL sync backs off the next scheduled one instead.
+            When the server of the ICS feed is failing (see `IcsHostGuard`), the sync is
+            deferred: nothing is written and no `SyncFailed` is published.
 
         Args:
             user_id: The Firebase Auth user ID.
             sync_profile_id: The ID of the SyncProfile to synchronize.
             sync_trigger: Describes what triggered this sync (e.g., MANUAL, SCHEDULED).
-            sync_type: Specifies whether to do a REGULAR or FULL synchronization.
+            sync_type: Specifies whether to do a REGULAR, FULL or WINDOW synchronization.
+            force: Skip the status check and the daily limit. A live lease of another run is still respected.
+            ics_cache: ICS results of the current operation, reused instead of fetching again.
 
         Raises:
             SyncProfileNotFoundError: If the SyncProfile does not exist.
@@ -132,73 +173,192 @@ class SyncProfileService:
         if force:
             logger.info("Force sync triggered")
         else:
-            # If status is incompatible, skip
-            if not self._can_sync(profile.status.type):
+            # If status is incompatible, skip. Checked again atomically when taking the lease.
+            if not profile.can_acquire_sync_lease(datetime.now(timezone.utc)):
                 logger.info("Synchronization is %s, skipping", profile.status.type)
                 return
 
             # If sync count is exceeded, raise DailySyncLimitExceededError
             self._enforce_daily_sync_limit(user_id)
 
-        # Mark as IN_PROGRESS
-        profile.status = _new_status(SyncProfileStatusType.IN_PROGRESS)
-        self._sync_profile_repo.save_sync_profile(profile)
-
-        try:
-            calendar_manager = (
-                self._authorization_service.get_authenticated_google_calendar_manager(
-                    user_id=user_id,
-                    provider_account_id=profile.target_calendar.provider_account_id,
-                    calendar_id=profile.target_calendar.id,
-                )
-            )
-        except Exception as e:
-            logger.error("Failed to get calendar service: %s", e)
-            profile.status = _new_status(SyncProfileStatusType.FAILED, str(e))
-            self._sync_profile_repo.save_sync_profile(profile)
+        # Take the lease and mark as IN_PROGRESS
+        lease_owner = str(uuid4())
+        leased_profile = self._sync_profile_repo.try_acquire_sync_lease(
+            user_id,
+            sync_profile_id,
+            owner=lease_owner,
+            ttl_s=settings.SYNC_LEASE_TTL_S,
+            status=_new_status(SyncProfileStatusType.IN_PROGRESS),
+            ignore_status=force,
+        )
+        if leased_profile is None:
+            logger.info("Another synchronization holds the profile, skipping")
             return
+        profile = leased_profile
+
+        def _release(status: SyncProfileStatus) -> None:
+            profile.status = status
+            with telemetry.stage(SyncStage.PERSIST):
+                self._sync_profile_repo.release_sync_lease(profile, owner=lease_owner)
+
+        def _release_failed(error_message: str) -> None:
+            # Like a success, a WINDOW sync leaves the schedule to the REGULAR syncs
+            if sync_type in (SyncType.REGULAR, SyncType.FULL):
+                profile.sync_schedule = self._sync_scheduler.back_off(
+                    profile.sync_schedule, now=datetime.now(timezone.utc)
+                )
+            _release(_new_status(SyncProfileStatusType.FAILED, error_message))
 
-        # Actually do the synchronization steps
-        try:
-            self._run_synchronization(
-                profile=profile,
+        with (
+            self._sync_telemetry(
                 user_id=user_id,
+                sync_profile_id=sync_profile_id,
                 sync_trigger=sync_trigger,
                 sync_type=sync_type,
-                calendar_manager=calendar_manager,
-            )
+            ) as telemetry,
+            SyncLeaseHeartbeat(
+                self._sync_profile_repo,
+                user_id=user_id,
+                sync_profile_id=sync_profile_id,
+                owner=lease_owner,
+                ttl_s=settings.SYNC_LEASE_TTL_S,
+            ) as heartbeat,
+        ):
+            try:
+                with telemetry.stage(SyncStage.AUTH):
+                    calendar_manager = self._authorization_service.get_authenticated_google_calendar_manager(
+                        user_id=user_id,
+                        provider_account_id=profile.target_calendar.provider_account_id,
+                        calendar_id=profile.target_calendar.id,
+                    )
+            except Exception as e:
+                logger.error("Failed to get calendar service: %s", e)
+                _release_failed(str(e))
+                return
 
-        except Exception as e:
-            logger.error("Failed to sync: %s", e)
-            profile.status = _new_status(SyncProfileStatusType.FAILED, str(e))
-            self._sync_profile_repo.save_sync_profile(profile)
+            # Actually do the synchronization steps
+            try:
+                with self._profiler.profile(
+                    user_id=user_id, sync_profile_id=sync_profile_id
+                ):
+                    result = self._run_synchronization(
+                        profile=profile,
+                        user_id=user_id,
+                        sync_trigger=sync_trigger,
+                        sync_type=sync_type,
+                        calendar_manager=calendar_manager,
+                        lease_heartbeat=heartbeat,
+                        ics_cache=ics_cache,
+                        telemetry=telemetry,
+                    )
 
-            self._event_bus.publish(
-                domain_events.SyncFailed(
-                    user_id=user_id,
-                    sync_profile_id=sync_profile_id,
-                    error_type=type(e).__name__,
-                    error_message=str(e),
-                    formatted_traceback=traceback.format_exc(),
+            except IcsHostUnavailableError as e:
+                # The server of the feed is down for every profile using it and nothing
+                # was written: a later scheduled run retries, without notifying a failure
+                logger.warning(
+                    "Synchronization deferred: %s",
+                    e,
+                    extra={
+                        "user_id": user_id,
+                        "sync_profile_id": sync_profile_id,
+                        "host": e.details.get("host"),
+                    },
                 )
-            )
+                telemetry.outcome = SyncOutcome.DEFERRED
+                _release_failed(str(e))
+                return
 
-            return
+            except Exception as e:
+                logger.error("Failed to sync: %s", e)
+                # The calendar may have been partially written
+                profile.last_sync_digest = None
+                _release_failed(str(e))
+
+                self._event_bus.publish(
+                    domain_events.SyncFailed(
+                        user_id=user_id,
+                        sync_profile_id=sync_profile_id,
+                        error_type=type(e).__name__,
+                        error_message=str(e),
+                        formatted_traceback=traceback.format_exc(),
+                        ics_host=profile.schedule_source.url.host,
+                    )
+                )
 
-        # On success
-        profile.status = _new_status(SyncProfileStatusType.SUCCESS)
-        profile.last_successful_sync = datetime.now(timezone.utc)
+                return
 
-        self._sync_profile_repo.save_sync_profile(profile)
+            finally:
+                telemetry.count("api_calls", calendar_manager.api_calls)
+
+            # On success
+            telemetry.outcome = (
+                SyncOutcome.SKIPPED_UNCHANGED
+                if result.skipped_unchanged
+                else SyncOutcome.SUCCESS
+            )
+            profile.last_successful_sync = datetime.now(timezone.utc)
+            # After a partial sync, the calendar may still hold events of an older feed
+            profile.last_sync_digest = None if result.partial else result.events_digest
+            # Only syncs of the whole feed move the next scheduled sync: a WINDOW sync
+            # leaves the events after the next days to it
+            if sync_type in (SyncType.REGULAR, SyncType.FULL):
+                profile.sync_schedule = self._sync_scheduler.reschedule(
+                    profile.sync_schedule,
+                    events_digest=result.events_digest,
+                    now=profile.last_successful_sync,
+                )
+            _release(
+                _new_status(
+                    SyncProfileStatusType.SUCCESS,
+                    SYNC_SKIPPED_UNCHANGED_MESSAGE
+                    if result.skipped_unchanged
+                    else None,
+                )
+            )
 
         self._event_bus.publish(
             domain_events.SyncSucceeded(
                 user_id=user_id,
                 sync_profile_id=sync_profile_id,
+                skipped_unchanged=result.skipped_unchanged,
             )
         )
 
-        logger.info("Synchronization successful")
+        logger.info(
+            "Synchronization successful",
+            extra={
+                "user_id": user_id,
+                "sync_profile_id": sync_profile_id,
+                "skipped_unchanged": result.skipped_unchanged,
+            },
+        )
+
+    @contextmanager
+    def _sync_telemetry(
+        self,
+        *,
+        user_id: str,
+        sync_profile_id: str,
+        sync_trigger: SyncTrigger,
+        sync_type: SyncType,
+    ) -> Iterator[SyncTelemetry]:
+        """The telemetry of one synchronization, exported when the block exits."""
+        telemetry = SyncTelemetry(
+            user_id=user_id,
+            sync_profile_id=sync_profile_id,
+            sync_trigger=sync_trigger,
+            sync_type=sync_type,
+        )
+        start = time.perf_counter()
+        try:
+            yield telemetry
+        finally:
+            telemetry.total_s = time.perf_counter() - start
+            try:
+                self._metrics_sink.export(telemetry)
+            except Exception:
+                # Metrics must never fail a sync
+                logger.exception("Failed to export sync telemetry")
 
     def _run_synchronization(
         self,
@@ -208,7 +368,10 @@ class SyncProfileService:
         sync_type: SyncType,
         user_id: str,
         calendar_manager: GoogleCalendarManager,
-    ) -> None:
+        lease_heartbeat: SyncLeaseHeartbeat,
+        telemetry: SyncTelemetry,
+        ics_cache: IcsResultCache | None = None,
+    ) -> SynchronizationResult:
         logger.info("Running synchronization for profile %s", profile.id)
 
         result_or_error = self._ics_service.try_fetch_and_parse(
@@ -220,13 +383,17 @@ class SyncProfileService:
                 "sync_type": sync_type,
                 "source": profile.schedule_source.model_dump(),
             },
+            cache=ics_cache,
+            telemetry=telemetry,
         )
         if isinstance(result_or_error, BaseIcsError):
             raise result_or_error
 
-        assert isinstance(events := result_or_error.events, list)
+        assert isinstance(result_or_error.events, list)
+        events = EventBatch.from_events(result_or_error.events)
 
         logger.info("Found %s events in ics", len(events))
+        telemetry.count("events_parsed", len(events))
 
         # Apply ruleset if any
         if profile.ruleset:
@@ -234,63 +401,122 @@ class SyncProfileService:
                 logger.info(
                     "Temporary : since a ruleset is provided that will probably change colors, we will first manually set all the events to grey color"
                 )
-                events = [
-                    replace(event, color=GoogleEventColor.GRAPHITE) for event in events
-                ]
                 logger.info(
                     "Applying %s rules",
                     len(profile.ruleset.rules),
                 )
-                events = profile.ruleset.apply(events)
+                with telemetry.stage(SyncStage.RULES):
+                    events = events.with_color(GoogleEventColor.GRAPHITE)
+                    events = profile.ruleset.apply_batch(events)
                 logger.info("%s events after applying rules", len(events))
             except Exception as e:
                 logger.error("Failed to apply rules: %s", e)
                 raise e
 
+        result = SynchronizationResult(
+            events_digest=compute_events_digest(
+                events,
+                ruleset=profile.ruleset,
+                target_calendar_id=profile.target_calendar.id,
+            )
+        )
+        if (
+            sync_trigger != SyncTrigger.ON_CREATE
+            and sync_type in (SyncType.REGULAR, SyncType.WINDOW)
+            and result.events_digest == profile.last_sync_digest
+        ):
+            # The calendar already holds exactly these events
+            logger.info("Events unchanged since the last sync, skipping")
+            return replace(result, skipped_unchanged=True)
+
         if not events:
             logger.warning("No events to synchronize")
-            return
+            return result
+
+        # Another run may have reclaimed the profile while we were fetching the ICS,
+        # in which case writing to the calendar would duplicate its events
+        lease_heartbeat.ensure_held()
 
         # When it's the first sync, we create all the events on the target calendar
         # and that's all we need to do
         if sync_trigger == SyncTrigger.ON_CREATE:
-            return calendar_manager.create_events(
-                events,
-                sync_profile_id=profile.id,
-            )
-
-        match sync_type:
-            case SyncType.REGULAR:
-                # When it's a regular sync, we only update future events, and let past events untouched
-                separation_dt = datetime.now(timezone.utc)
-                to_create = [event for event in events if event.end > separation_dt]
-                to_delete = calendar_manager.get_events_ids_from_sync_profile(
-                    sync_profile_id=profile.id,
-                    min_dt=separation_dt,
-                )
-            case SyncType.FULL:
-                # When it's a full sync, we delete all the events on the target calendar linked
-                # to this sync profile and then create all the events again
-                to_delete = calendar_manager.get_events_ids_from_sync_profile(
+            with telemetry.stage(SyncStage.CREATE):
+                calendar_manager.create_events(
+                    events,
                     sync_profile_id=profile.id,
-                    min_dt=None,
                 )
-                to_create = events
+            telemetry.count("events_created", len(events))
+            return result
+
+        with telemetry.stage(SyncStage.LIST):
+            match sync_type:
+                case SyncType.REGULAR:
+                    # When it's a regular sync, we only update future events, and let past events untouched
+                    separation_dt = datetime.now(timezone.utc)
+                    to_create = events.in_window(ending_after=separation_dt)
+                    to_delete = calendar_manager.get_events_ids_from_sync_profile(
+                        sync_profile_id=profile.id,
+                        min_dt=separation_dt,
+                    )
+                case SyncType.FULL:
+                    # When it's a full sync, we delete all the events on the target calendar linked
+                    # to this sync profile and then create all the events again
+                    to_delete = calendar_manager.get_events_ids_from_sync_profile(
+                        sync_profile_id=profile.id,
+                        min_dt=None,
+                    )
+                    to_create = events
+                case SyncType.WINDOW:
+                    # When it's a window sync, we only update the events of the next days, the
+                    # calendar query returning those ending after now and starting before the end
+                    separation_dt = datetime.now(timezone.utc)
+                    window_end_dt = separation_dt + timedelta(
+                        days=settings.SYNC_WINDOW_DAYS
+                    )
+                    to_create = events.in_window(
+                        ending_after=separation_dt, starting_before=window_end_dt
+                    )
+                    to_delete = calendar_manager.get_events_ids_from_sync_profile(
+                        sync_profile_id=profile.id,
+                        min_dt=separation_dt,
+                        max_dt=window_end_dt,
+                    )
+                    result = replace(result, partial=True)
 
         if to_delete:
             logger.info("Found %s events to delete", len(to_delete))
-            calendar_manager.delete_events(
-                ids=to_delete,
-            )
+            with telemetry.stage(SyncStage.DELETE):
+                calendar_manager.delete_events(
+                    ids=to_delete,
+                )
+            telemetry.count("events_deleted", len(to_delete))
         else:
             logger.info("No events to delete")
 
         if to_create:
             logger.info("Found %s events to create", len(to_create))
-            calendar_manager.create_events(to_create, sync_profile_id=profile.id)
+            with telemetry.stage(SyncStage.CREATE):
+                calendar_manager.create_events(to_create, sync_profile_id=profile.id)
+            telemetry.count("events_created", len(to_create))
         else:
             logger.info("No new events to create")
 
+        return result
+
+    def check_sync_request(self, user_id: str, sync_profile_id: str) -> None:
+        """
+        Rejects a sync request up front, before it is queued, so the user gets the
+        error instead of a job that will fail.
+
+        `synchronize` performs the same checks again when the job runs.
+
+        Raises:
+            SyncProfileNotFoundError: If the SyncProfile does not exist.
+            DailySyncLimitExceededError: If the user has reached their daily sync limit.
+        """
+        self._get_profile_or_raise(user_id, sync_profile_id)
+        self._enforce_daily_sync_limit(user_id)
+
     def _get_profile_or_raise(self, user_id: str, sync_profile_id: str) -> SyncProfile:
         profile = self._sync_profile_repo.get_sync_profile(user_id, sync_profile_id)
         if profile is None:
@@ -430,14 +656,21 @@ class SyncProfileService:
         user_id: str,
         request: CreateSyncProfileInput,
         uuid_factory: Callable[[], str] | None = None,
+        ics_cache: IcsResultCache | None = None,
     ) -> SyncProfile:
         """
         Creates a new SyncProfile based on user input, performing necessary
         validations and resource creation (like a new Google Calendar).
 
+        The ruleset generation and the initial synchronization are not performed here,
+        but by `initialize_sync_profile`, in reaction to the published SyncProfileCreated.
+
         Args:
             user_id: The Firebase Auth ID of the user.
             request: Validated input data containing profile details.
+            ics_cache: ICS results already fetched for this request (e.g. by an async
+                endpoint). The validation, the ruleset generation and the initial sync
+                reuse them.
 
         Returns:
             The newly created SyncProfile object.
@@ -474,9 +707,14 @@ class SyncProfileService:
             # Validate ICS URL
             ics_source = request.schedule_source.to_ics_source()
 
+            # Shared with the ruleset generation and the initial sync, so that the
+            # creation downloads, parses and archives the ICS only once
+            if ics_cache is None:
+                ics_cache = IcsResultCache()
             self._ics_service.validate_ics_url_or_raise(
                 ics_source,
                 metadata={"user_id": user_id, "context": "create_sync_profile"},
+                cache=ics_cache,
             )
             logger.info(
                 "ICS URL validated successfully.",
@@ -583,24 +821,64 @@ class SyncProfileService:
             )
             raise
 
-        # 7. Generate initial ruleset
-        # It does not raise any error so that even if it fails, the sync profile is still created
-        self._ai_ruleset_service.create_ruleset_for_sync_profile(sync_profile)
+        # Ruleset generation and the initial sync are slow (LLM call, Calendar writes),
+        # so they run in a background job reacting to SyncProfileCreated.
+        # See `initialize_sync_profile`.
+        with self._creation_ics_caches_lock:
+            self._creation_ics_caches[sync_profile_id] = ics_cache
+            while len(self._creation_ics_caches) > MAX_CREATION_ICS_CACHES:
+                self._creation_ics_caches.popitem(last=False)
 
-        # 8. Publish Event
-        self._event_bus.publish(
-            domain_events.SyncProfileCreated(
-                user_id=user_id,
-                sync_profile_id=sync_profile_id,
+        try:
+            self._event_bus.publish(
+                domain_events.SyncProfileCreated(
+                    user_id=user_id,
+                    sync_profile_id=sync_profile_id,
+                )
+            )
+        except Exception:
+            # The initialization job may never run
+            self._pop_creation_ics_cache(sync_profile_id)
+            raise
+
+        return sync_profile
+
+    def _pop_creation_ics_cache(self, sync_profile_id: str) -> IcsResultCache | None:
+        with self._creation_ics_caches_lock:
+            return self._creation_ics_caches.pop(sync_profile_id, None)
+
+    def initialize_sync_profile(self, user_id: str, sync_profile_id: str) -> None:
+        """
+        Generates the initial ruleset of a newly created SyncProfile, then runs its
+        first synchronization.
+
+        Meant to run off the request path, in a background job reacting to
+        SyncProfileCreated. The ICS fetched while validating the profile is reused
+        when it is still available in this process.
+
+        Doesn't raise: failures are recorded on the sync profile and published as events.
+        """
+        ics_cache = self._pop_creation_ics_cache(sync_profile_id)
+
+        profile = self._sync_profile_repo.get_sync_profile(user_id, sync_profile_id)
+        if profile is None:
+            logger.warning(
+                "Sync profile deleted before its initialization.",
+                extra={"user_id": user_id, "sync_profile_id": sync_profile_id},
             )
+            return
+
+        # It does not raise any error so that even if it fails, the initial sync still runs
+        self._ai_ruleset_service.create_ruleset_for_sync_profile(
+            profile, ics_cache=ics_cache
         )
 
-        # 9. Launch initial sync
         try:
             self.synchronize(
                 user_id=user_id,
                 sync_profile_id=sync_profile_id,
                 sync_trigger=SyncTrigger.ON_CREATE,
+                ics_cache=ics_cache,
             )
         except Exception as e:
             logger.error(
@@ -612,9 +890,3 @@ class SyncProfileService:
                     "error_message": str(e),
                 },
             )
-            # Let the normal flow continue, i.e returning the created sync profile.
-            # Ideally, we shouldn't trigger the initial sync here, as it
-            # violates the single responsibility principle.
-            # TODO : react to the SyncProfileCreated event to initiate the first sync
-
-        return sync_profile
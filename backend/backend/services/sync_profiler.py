@@ -0,0 +1,138 @@
+import cProfile
+import io
+import logging
+import marshal
+import pstats
+import random
+import threading
+import tracemalloc
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any, Callable, Collection, Iterator, Protocol
+
+from backend.settings import settings
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class SyncProfileReport:
+    stats: bytes
+    """The `pstats` data of the sync, readable with `pstats.Stats(path)`."""
+    summary: str
+    """The top functions by cumulative time and the top allocation sites."""
+
+
+class ISyncProfileReportStorage(Protocol):
+    def save_sync_profile_report(
+        self, report: SyncProfileReport, *, metadata: dict[str, Any]
+    ) -> None: ...
+
+
+class SyncProfiler:
+    """
+    Opt-in profiling of single syncs, to find out why a given profile is slow.
+
+    A sync is profiled when its profile is in `profile_ids`, or otherwise with the
+    probability `sample_rate`. It then runs under `cProfile` and `tracemalloc`, and
+    a `SyncProfileReport` is saved to `storage`, next to the archived ICS files.
+
+    When no profile id is listed and the sample rate is 0, `profile` costs a set
+    lookup and a comparison.
+
+    `tracemalloc` traces every thread, so a single sync is profiled at a time: the
+    others run normally meanwhile.
+
+    Usage:
+        with sync_profiler.profile(user_id=..., sync_profile_id=...):
+            ...  # Run the sync
+    """
+
+    def __init__(
+        self,
+        storage: ISyncProfileReportStorage | None = None,
+        *,
+        sample_rate: float = settings.SYNC_PROFILING_SAMPLE_RATE,
+        profile_ids: Collection[str] = settings.SYNC_PROFILING_PROFILE_IDS,
+        top_n: int = settings.SYNC_PROFILING_TOP_N,
+        random_draw: Callable[[], float] = random.random,
+    ) -> None:
+        self._storage = storage
+        self._sample_rate = sample_rate if storage is not None else 0.0
+        self._profile_ids = (
+            frozenset(profile_ids) if storage is not None else frozenset()
+        )
+        self._top_n = top_n
+        self._random_draw = random_draw
+        self._lock = threading.Lock()
+
+    def should_profile(self, sync_profile_id: str) -> bool:
+        return sync_profile_id in self._profile_ids or (
+            self._sample_rate > 0 and self._random_draw() < self._sample_rate
+        )
+
+    @contextmanager
+    def profile(self, *, user_id: str, sync_profile_id: str) -> Iterator[None]:
+        if not self.should_profile(sync_profile_id):
+            yield
+            return
+
+        if not self._lock.acquire(blocking=False):
+            logger.info(
+                "Another sync is being profiled, not profiling",
+                extra={"sync_profile_id": sync_profile_id},
+            )
+            yield
+            return
+
+        try:
+            owns_tracemalloc = not tracemalloc.is_tracing()
+            if owns_tracemalloc:
+                tracemalloc.start()
+            profiler = cProfile.Profile()
+            profiler.enable()
+            try:
+                yield
+            finally:
+                profiler.disable()
+                snapshot = tracemalloc.take_snapshot()
+                _, peak_b = tracemalloc.get_traced_memory()
+                if owns_tracemalloc:
+                    tracemalloc.stop()
+                self._save(
+                    self._report(profiler, snapshot, peak_b),
+                    metadata={"user_id": user_id, "sync_profile_id": sync_profile_id},
+                )
+        finally:
+            self._lock.release()
+
+    def _report(
+        self,
+        profiler: cProfile.Profile,
+        snapshot: tracemalloc.Snapshot,
+        peak_b: int,
+    ) -> SyncProfileReport:
+        summary = io.StringIO()
+        stats = pstats.Stats(profiler, stream=summary)
+        stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(self._top_n)
+
+        summary.write(f"Peak traced memory: {peak_b / 1024:.0f} KiB\n")
+        summary.write(f"Top {self._top_n} allocation sites still alive:\n")
+        snapshot = snapshot.filter_traces(
+            [tracemalloc.Filter(False, tracemalloc.__file__)]
+        )
+        for statistic in snapshot.statistics("lineno")[: self._top_n]:
+            summary.write(f"  {statistic}\n")
+
+        return SyncProfileReport(
+            stats=marshal.dumps(stats.stats),  # type: ignore[attr-defined]
+            summary=summary.getvalue(),
+        )
+
+    def _save(self, report: SyncProfileReport, *, metadata: dict[str, Any]) -> None:
+        assert self._storage is not None
+        try:
+            self._storage.save_sync_profile_report(report, metadata=metadata)
+        except Exception:
+            # Profiling must never fail a sync
+            logger.exception("Failed to save the sync profile report", extra=metadata)
@@ -0,0 +1,153 @@
+import logging
+import random
+from datetime import datetime, timedelta
+from zlib import crc32
+
+from backend.models.sync_profile import SyncProfile, SyncSchedule
+from backend.settings import settings
+
+logger = logging.getLogger(__name__)
+
+_DAY = timedelta(days=1)
+
+
+class SyncScheduler:
+    """
+    Decides when each profile's next scheduled sync is due, from how often its
+    events changed in the past.
+
+    After every successful REGULAR or FULL sync the interval adapts to the feed: it
+    is halved when the events changed and grows by half when they did not, within
+    [`min_interval_s`, `max_interval_s`]. Volatile feeds are thus synced several times
+    a day and static ones every few days, WINDOW syncs keeping the next days of all
+    feeds fresh in between without moving the schedule.
+
+    After a failed REGULAR or FULL sync the next one is backed off instead: it is
+    retried after the interval, doubled for each failure since the last successful
+    sync and capped at `max_interval_s`, so that a broken profile is not retried on
+    every run of the cron.
+
+    The due times are spread over the day rather than aligned on the cron: each
+    interval is randomly stretched by up to `jitter`, and profiles never synced yet
+    are due at a time of day derived from their id.
+
+    Usage:
+        due = [profile for profile in profiles if scheduler.is_due(profile, now)]
+        ...
+        profile.sync_schedule = scheduler.reschedule(
+            profile.sync_schedule, events_digest=digest, now=now
+        )
+        # or, when the sync failed
+        profile.sync_schedule = scheduler.back_off(profile.sync_schedule, now=now)
+    """
+
+    def __init__(
+        self,
+        *,
+        initial_interval_s: float = settings.SYNC_INITIAL_INTERVAL_S,
+        min_interval_s: float = settings.SYNC_MIN_INTERVAL_S,
+        max_interval_s: float = settings.SYNC_MAX_INTERVAL_S,
+        jitter: float = settings.SYNC_SCHEDULE_JITTER,
+        rng: random.Random | None = None,
+    ) -> None:
+        if not 0 < min_interval_s <= initial_interval_s <= max_interval_s:
+            raise ValueError(
+                f"Invalid sync intervals: {min_interval_s=}, {initial_interval_s=}, {max_interval_s=}"
+            )
+        if not 0 <= jitter < 1:
+            raise ValueError(f"Invalid sync schedule jitter: {jitter=}")
+
+        self._initial_interval_s = initial_interval_s
+        self._min_interval_s = min_interval_s
+        self._max_interval_s = max_interval_s
+        self._jitter = jitter
+        self._rng = rng or random.Random()
+
+    def is_due(self, profile: SyncProfile, now: datetime) -> bool:
+        """Whether the scheduled sync of `profile` should run at `now`."""
+        if profile.sync_schedule is not None:
+            return profile.sync_schedule.is_due(now)
+
+        # Not synced since scheduling was introduced: due once past its time of day
+        midnight = now.replace(hour=0, minute=0, second=0, microsecond=0)
+        return now >= midnight + self._time_of_day(profile.id)
+
+    @staticmethod
+    def _time_of_day(sync_profile_id: str) -> timedelta:
+        return _DAY * (crc32(sync_profile_id.encode()) / 2**32)
+
+    def reschedule(
+        self,
+        schedule: SyncSchedule | None,
+        *,
+        events_digest: str,
+        now: datetime,
+    ) -> SyncSchedule:
+        """The schedule after a successful sync at `now` that saw `events_digest`."""
+        if schedule is None or schedule.events_digest is None:
+            # First successful sync: nothing to compare the events with
+            interval_s = self._initial_interval_s
+            changed = False
+            last_change_at = None
+            unchanged_syncs = 0
+        else:
+            changed = events_digest != schedule.events_digest
+            if changed:
+                interval_s = max(self._min_interval_s, schedule.interval_s / 2)
+                last_change_at = now
+                unchanged_syncs = 0
+            else:
+                interval_s = min(self._max_interval_s, schedule.interval_s * 1.5)
+                last_change_at = schedule.last_change_at
+                unchanged_syncs = schedule.unchanged_syncs + 1
+
+        next_schedule = SyncSchedule(
+            interval_s=interval_s,
+            next_sync_at=now + self._jittered(interval_s),
+            events_digest=events_digest,
+            last_change_at=last_change_at,
+            unchanged_syncs=unchanged_syncs,
+        )
+
+        logger.info(
+            "Next scheduled sync in %.1f hours",
+            interval_s / 3600,
+            extra={
+                "events_changed": changed,
+                "unchanged_syncs": unchanged_syncs,
+                "next_sync_at": next_schedule.next_sync_at.isoformat(),
+            },
+        )
+        return next_schedule
+
+    def back_off(self, schedule: SyncSchedule | None, *, now: datetime) -> SyncSchedule:
+        """The schedule after a failed sync at `now`, which leaves the interval as is."""
+        if schedule is None:
+            schedule = SyncSchedule(
+                interval_s=self._initial_interval_s, next_sync_at=now
+            )
+
+        retry_s = min(
+            self._max_interval_s,
+            schedule.interval_s * 2**schedule.consecutive_failures,
+        )
+        next_schedule = schedule.model_copy(
+            update={
+                "next_sync_at": now + self._jittered(retry_s),
+                "consecutive_failures": schedule.consecutive_failures + 1,
+            }
+        )
+
+        logger.info(
+            "Next scheduled sync retried in %.1f hours",
+            retry_s / 3600,
+            extra={
+                "consecutive_failures": next_schedule.consecutive_failures,
+                "next_sync_at": next_schedule.next_sync_at.isoformat(),
+            },
+        )
+        return next_schedule
+
+    def _jittered(self, interval_s: float) -> timedelta:
+        stretch = 1 + self._rng.uniform(-self._jitter, self._jitter)
+        return timedelta(seconds=interval_s * stretch)
@@ -0,0 +1,178 @@
+import logging
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Callable, Iterator, Protocol
+
+from backend.models import SyncTrigger, SyncType
+
+logger = logging.getLogger(__name__)
+
+
+class SyncStage(str, Enum):
+    AUTH = "auth"
+    FETCH = "fetch"
+    PARSE = "parse"
+    RULES = "rules"
+    LIST = "list"
+    DELETE = "delete"
+    CREATE = "create"
+    PERSIST = "persist"
+
+
+class SyncOutcome(str, Enum):
+    SUCCESS = "success"
+    SKIPPED_UNCHANGED = "skipped_unchanged"
+    DEFERRED = "deferred"
+    FAILED = "failed"
+
+
+@dataclass
+class SyncTelemetry:
+    """
+    Where one synchronization spent its time, and how much work it did.
+
+    Counters:
+    - events_parsed: events found in the ICS feed
+    - events_deleted / events_created: events written to the target calendar
+    - ics_bytes: size of the ICS feed, decoded
+    - api_calls: HTTP requests sent to the Google Calendar API
+    """
+
+    user_id: str
+    sync_profile_id: str
+    sync_trigger: SyncTrigger
+    sync_type: SyncType
+    outcome: SyncOutcome = SyncOutcome.FAILED
+    stage_durations_s: dict[SyncStage, float] = field(default_factory=dict)
+    counters: Counter[str] = field(default_factory=Counter)
+    total_s: float = 0.0
+    clock: Callable[[], float] = field(default=time.perf_counter, repr=False)
+
+    @contextmanager
+    def stage(self, stage: SyncStage) -> Iterator[None]:
+        """Adds the time spent in the block to `stage`, even if it raises."""
+        start = self.clock()
+        try:
+            yield
+        finally:
+            self.stage_durations_s[stage] = (
+                self.stage_durations_s.get(stage, 0.0) + self.clock() - start
+            )
+
+    def count(self, name: str, n: int = 1) -> None:
+        self.counters[name] += n
+
+
+@contextmanager
+def sync_stage(telemetry: SyncTelemetry | None, stage: SyncStage) -> Iterator[None]:
+    """`SyncTelemetry.stage`, for code that is not always instrumented."""
+    if telemetry is None:
+        yield
+        return
+    with telemetry.stage(stage):
+        yield
+
+
+class IMetricsSink(Protocol):
+    """Where the telemetry of every synchronization is exported."""
+
+    def export(self, telemetry: SyncTelemetry) -> None: ...
+
+
+class LoggingMetricsSink:
+    """
+    Exports the telemetry as one structured log entry per synchronization, from
+    which Cloud Logging derives the metrics.
+    """
+
+    def export(self, telemetry: SyncTelemetry) -> None:
+        logger.info(
+            "Sync telemetry",
+            extra={
+                "user_id": telemetry.user_id,
+                "sync_profile_id": telemetry.sync_profile_id,
+                "sync_trigger": telemetry.sync_trigger.value,
+                "sync_type": telemetry.sync_type.value,
+                "outcome": telemetry.outcome.value,
+                "total_s": round(telemetry.total_s, 4),
+                **{
+                    f"{stage.value}_s": round(duration_s, 4)
+                    for stage, duration_s in telemetry.stage_durations_s.items()
+                },
+                **telemetry.counters,
+            },
+        )
+
+
+class InMemoryMetricsSink:
+    """Keeps the exported telemetry, for tests."""
+
+    def __init__(self) -> None:
+        self.exported: list[SyncTelemetry] = []
+
+    def export(self, telemetry: SyncTelemetry) -> None:
+        self.exported.append(telemetry)
+
+
+@dataclass
+class SyncRunSummary:
+    """Totals of the synchronizations of one scheduled run."""
+
+    syncs: int = 0
+    outcomes: Counter[SyncOutcome] = field(default_factory=Counter)
+    stage_durations_s: Counter[SyncStage] = field(default_factory=Counter)
+    counters: Counter[str] = field(default_factory=Counter)
+    total_s: float = 0.0
+
+    def add(self, telemetry: SyncTelemetry) -> None:
+        self.syncs += 1
+        self.outcomes[telemetry.outcome] += 1
+        self.stage_durations_s.update(telemetry.stage_durations_s)
+        self.counters.update(telemetry.counters)
+        self.total_s += telemetry.total_s
+
+
+class AggregatingMetricsSink:
+    """
+    Forwards the telemetry to `sink`, and sums it up until `drain` is called, e.g.
+    at the end of a scheduled run. Thread-safe.
+    """
+
+    def __init__(self, sink: IMetricsSink) -> None:
+        self._sink = sink
+        self._summary = SyncRunSummary()
+        self._lock = threading.Lock()
+
+    def export(self, telemetry: SyncTelemetry) -> None:
+        self._sink.export(telemetry)
+        with self._lock:
+            self._summary.add(telemetry)
+
+    def drain(self) -> SyncRunSummary:
+        """The totals since the last call."""
+        with self._lock:
+            summary, self._summary = self._summary, SyncRunSummary()
+        return summary
+
+
+def log_sync_run_summary(summary: SyncRunSummary, *, run: str) -> None:
+    logger.info(
+        "Sync run telemetry: %s syncs in %.1f s",
+        summary.syncs,
+        summary.total_s,
+        extra={
+            "run": run,
+            "syncs": summary.syncs,
+            "total_s": round(summary.total_s, 4),
+            **{f"{outcome.value}_syncs": n for outcome, n in summary.outcomes.items()},
+            **{
+                f"{stage.value}_s": round(duration_s, 4)
+                for stage, duration_s in summary.stage_durations_s.items()
+            },
+            **summary.counters,
+        },
+    )
@@ -1,18 +1,79 @@
+import logging
+import threading
+import time
 from datetime import datetime
-from typing import Callable
+from typing import Callable, Iterable
 
 from firebase_admin import auth
 from firebase_admin.auth import UserRecord, UserInfo
 
 from ..models.user import User, UserMetadata, UserProviderData
+from ..settings import settings
+
+logger = logging.getLogger(__name__)
+
+_GET_USERS_MAX_IDENTIFIERS = 100
+"""Firebase Auth limit of a batched user lookup."""
+
+
+class _UserCache:
+    """
+    User records by id, including the ids that do not exist (cached as None, for a
+    shorter time so that a user signing up soon after a lookup is found).
+
+    Thread-safe.
+    """
+
+    def __init__(
+        self,
+        *,
+        ttl_s: float,
+        negative_ttl_s: float,
+        clock: Callable[[], float],
+    ) -> None:
+        self._ttl_s = ttl_s
+        self._negative_ttl_s = negative_ttl_s
+        self._clock = clock
+        self._entries: dict[str, tuple[float, User | None]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, user_id: str) -> tuple[bool, User | None]:
+        """Whether `user_id` is cached, and its user."""
+        with self._lock:
+            entry = self._entries.get(user_id)
+            if entry is None:
+                return False, None
+            expires_at, user = entry
+            if self._clock() >= expires_at:
+                del self._entries[user_id]
+                return False, None
+            return True, user
+
+    def put(self, user_id: str, user: User | None) -> None:
+        ttl_s = self._ttl_s if user is not None else self._negative_ttl_s
+        with self._lock:
+            self._entries[user_id] = (self._clock() + ttl_s, user)
 
 
 class FirebaseAuthUserService:
-    """Service for managing Firebase users, mostly for admin purposes."""
+    """
+    Service for managing Firebase users, mostly for admin purposes.
 
-    def __init__(self) -> None:
+    User lookups are read through a cache: notifications and admin pages look up
+    the same few users over and over.
+    """
+
+    def __init__(
+        self,
+        *,
+        cache_ttl_s: float = settings.USER_CACHE_TTL_S,
+        negative_cache_ttl_s: float = settings.USER_NEGATIVE_CACHE_TTL_S,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
         """Initialize the UserService."""
-        pass
+        self._cache = _UserCache(
+            ttl_s=cache_ttl_s, negative_ttl_s=negative_cache_ttl_s, clock=clock
+        )
 
     def _convert_provider_data(self, provider: UserInfo) -> UserProviderData:
         """Convert Firebase UserInfo to UserProviderData.
@@ -85,6 +146,8 @@ class FirebaseAuthUserService:
         """
         page = auth.list_users(max_results=max_results, page_token=page_token)
         users = [self._convert_user_record(user) for user in page.users]
+        for user in users:
+            self._cache.put(user.uid, user)
 
         if progress_callback:
             progress_callback(users, page.next_page_token)
@@ -109,9 +172,108 @@ class FirebaseAuthUserService:
             None if the user ID doesn't exist
 
         """
+        found, user = self._cache.get(user_id)
+        if found:
+            return user
+
         try:
-            user_record = auth.get_user(user_id)
+            user = self._convert_user_record(auth.get_user(user_id))
         except auth.UserNotFoundError:
-            return None
+            user = None
+
+        self._cache.put(user_id, user)
+        return user
+
+    def get_users(self, user_ids: Iterable[str]) -> dict[str, User]:
+        """Get several users by their Firebase user IDs, in batches.
+
+        Args:
+            user_ids: The Firebase user IDs to look up
+
+        Returns:
+            The users found, by user ID. The IDs that don't exist are left out.
+        """
+        users: dict[str, User] = {}
+        missing: list[str] = []
+        for user_id in dict.fromkeys(user_ids):
+            found, user = self._cache.get(user_id)
+            if not found:
+                missing.append(user_id)
+            elif user is not None:
+                users[user_id] = user
+
+        for i in range(0, len(missing), _GET_USERS_MAX_IDENTIFIERS):
+            batch = missing[i : i + _GET_USERS_MAX_IDENTIFIERS]
+            result = auth.get_users([auth.UidIdentifier(uid) for uid in batch])
+            for user_record in result.users:
+                user = self._convert_user_record(user_record)
+                self._cache.put(user.uid, user)
+                users[user.uid] = user
+            for user_id in set(batch) - users.keys():
+                self._cache.put(user_id, None)
+
+        return users
+
+
+class UserIndex:
+    """
+    All the users of the project by ID, for the admin pages, refreshed
+    incrementally.
+
+    Firebase Auth cannot list the users created or changed since a given time, so
+    listing them all is only done every `full_refresh_interval_s`. In between, a
+    refresh only fetches the users it is asked about and does not know yet (e.g.
+    the owners of new sync profiles), in batches.
+
+    Usage:
+        index = UserIndex(user_service)
+        users = index.refresh(profile.user_id for profile in profiles)
+    """
+
+    def __init__(
+        self,
+        user_service: FirebaseAuthUserService,
+        *,
+        full_refresh_interval_s: float = settings.USER_INDEX_FULL_REFRESH_S,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._user_service = user_service
+        self._full_refresh_interval_s = full_refresh_interval_s
+        self._clock = clock
+        self._users: dict[str, User] = {}
+        self._listed_at: float | None = None
+        self._lock = threading.Lock()
+
+    def refresh(self, user_ids: Iterable[str] = ()) -> dict[str, User]:
+        """
+        Brings the index up to date, including the given user IDs when they exist.
+
+        Returns:
+            A snapshot of the index, by user ID.
+        """
+        with self._lock:
+            now = self._clock()
+            if (
+                self._listed_at is None
+                or now - self._listed_at >= self._full_refresh_interval_s
+            ):
+                users, _ = self._user_service.list_all_users()
+                self._users = {user.uid: user for user in users}
+                self._listed_at = now
+                logger.info("User index listed %s users", len(self._users))
+
+            if unknown := [uid for uid in user_ids if uid not in self._users]:
+                new_users = self._user_service.get_users(unknown)
+                self._users.update(new_users)
+                logger.info(
+                    "User index added %s of %s unknown users",
+                    len(new_users),
+                    len(set(unknown)),
+                )
+
+            return dict(self._users)
 
-        return self._convert_user_record(user_record)
+    def invalidate(self) -> None:
+        """Makes the next refresh list all the users again."""
+        with self._lock:
+            self._listed_at = None
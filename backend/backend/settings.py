@@ -51,7 +51,43 @@ class Settings(BaseSettings):
     PRODUCTION_FRONTEND_URL: str = Field(default="https://app.syncademic.io")
 
     MAX_ICS_SIZE_BYTES: int = Field(default=1 * 1024 * 1024)  # 1 MB
+    MAX_ICS_WIRE_SIZE_BYTES: int = Field(
+        default=1 * 1024 * 1024,
+        description="Maximum size of an ICS response body as received, before decompression",
+    )
     URL_ICS_SOURCE_TIMEOUT_S: int = Field(default=10)
+    ICS_HOST_MAX_CONCURRENT_REQUESTS: int = Field(
+        default=4,
+        description="Maximum number of ICS requests in flight to the same host, per process",
+    )
+    ICS_HOST_BREAKER_WINDOW: int = Field(
+        default=20,
+        description="Number of last requests to a host whose failure rate may open its circuit",
+    )
+    ICS_HOST_BREAKER_MIN_REQUESTS: int = Field(
+        default=5,
+        description="Minimum number of requests to a host before its circuit may open",
+    )
+    ICS_HOST_BREAKER_FAILURE_RATE: float = Field(
+        default=0.5,
+        description="Failure rate (connection errors, timeouts, 5xx, 429) that opens the circuit of a host",
+    )
+    ICS_HOST_BREAKER_COOLDOWN_S: int = Field(
+        default=300,
+        description="How long requests to a host fail fast once its circuit opened, before a probe request",
+    )
+    ICS_RECURRENCE_PAST_DAYS: int = Field(
+        default=180,
+        description="Minimum number of days before now within which the occurrences of recurring events are synchronized (rounded out to whole months)",
+    )
+    ICS_RECURRENCE_FUTURE_DAYS: int = Field(
+        default=365,
+        description="Minimum number of days after now within which the occurrences of recurring events are synchronized (rounded out to whole months)",
+    )
+    ICS_RECURRENCE_MAX_INSTANCES: int = Field(
+        default=10_000,
+        description="Maximum number of instances of a recurring event computed from its start, before the series is cut",
+    )
 
     MAX_SYNCHRONIZATIONS_PER_DAY: int = Field(
         default=24 * 5  # 24 syncs per day for 5 profiles
@@ -61,18 +97,116 @@ class Settings(BaseSettings):
 
     # Scheduled sync configuration
     SCHEDULED_SYNC_CRON_SCHEDULE: str = Field(
-        default="0 5 * * *",  # Every day at 5:00 AM UTC
+        default="0 * * * *",  # Every hour, each run syncing only the profiles that are due
         description="Cron schedule for automatic synchronization",
     )
     SCHEDULED_SYNC_TIMEOUT_SEC: int = Field(
         default=3600,
         description="Timeout in seconds before scheduled synchronization of all profiles is cancelled",
     )
+    SCHEDULED_WINDOW_SYNC_CRON_SCHEDULE: str = Field(
+        default="0 8-20/4 * * *",  # Every 4 hours during the day, UTC
+        description="Cron schedule for automatic WINDOW synchronization of the next days",
+    )
+    SYNC_INITIAL_INTERVAL_S: int = Field(
+        default=24 * 3600,
+        description="Time between two scheduled syncs of a profile before its feed's volatility is known",
+    )
+    SYNC_MIN_INTERVAL_S: int = Field(
+        default=6 * 3600,
+        description="Shortest time between two scheduled syncs of a profile whose feed changes often",
+    )
+    SYNC_MAX_INTERVAL_S: int = Field(
+        default=4 * 24 * 3600,
+        description="Longest time between two scheduled syncs of a profile whose feed never changes",
+    )
+    SYNC_SCHEDULE_JITTER: float = Field(
+        default=0.1,
+        description="Random fraction of the interval added or removed to spread scheduled syncs over the day",
+    )
+    SYNC_WINDOW_DAYS: int = Field(
+        default=14,
+        description="Number of days from now updated by a WINDOW synchronization",
+    )
+
+    VERIFIED_TOKEN_CACHE_MAX_SIZE: int = Field(
+        default=10_000,
+        description="Maximum number of verified Firebase ID tokens kept in memory by the API",
+    )
+    VERIFIED_TOKEN_CACHE_TTL_S: int = Field(
+        default=300,
+        description="How long a verified Firebase ID token is trusted without checking its signature again (never past its expiration)",
+    )
+    BLOCKING_IO_MAX_THREADS: int = Field(
+        default=64,
+        description="Number of threads the async API endpoints use for blocking calls (Firestore, Google API client)",
+    )
+    SYNC_WORKERS: int = Field(
+        default=4,
+        description="Number of threads running queued sync jobs in the API process",
+    )
+    SYNC_LEASE_TTL_S: int = Field(
+        default=600,
+        description="How long a synchronization keeps its profile locked without a heartbeat, before another run may reclaim it",
+    )
+    BACKGROUND_JOB_MAX_WORKERS: int = Field(
+        default=4,
+        description="Number of threads running background jobs (e.g. new sync profile initialization) in the API process",
+    )
+
+    HTTP_POOL_HOSTS: int = Field(
+        default=32,
+        description="Number of hosts whose connections are kept alive by the process-wide HTTP clients",
+    )
+    HTTP_POOL_CONNECTIONS_PER_HOST: int = Field(
+        default=10,
+        description="Number of connections kept alive per host by the process-wide HTTP clients",
+    )
+    HTTP_CLIENT_HTTP2: bool = Field(
+        default=True,
+        description="Use HTTP/2 in the async HTTP client of the API, when the h2 package is installed",
+    )
+
+    USER_CACHE_TTL_S: float = Field(
+        default=3600,
+        description="How long Firebase Auth user records are cached",
+    )
+    USER_NEGATIVE_CACHE_TTL_S: float = Field(
+        default=300,
+        description="How long the ids of users that do not exist are cached",
+    )
+    SYNC_PROFILE_INDEX_FULL_REFRESH_S: float = Field(
+        default=3600,
+        description="Interval between two full loads of the sync profiles of the admin index",
+    )
+    USER_INDEX_FULL_REFRESH_S: float = Field(
+        default=3600,
+        description="Interval between two full listings of the users of the admin index",
+    )
+
+    SYNC_PROFILING_SAMPLE_RATE: float = Field(
+        default=0.0,
+        ge=0.0,
+        le=1.0,
+        description="Fraction of the syncs run under the CPU profiler and allocation tracking",
+    )
+    SYNC_PROFILING_PROFILE_IDS: list[str] = Field(
+        default=[],
+        description="Sync profiles whose syncs are always profiled, as a JSON list",
+    )
+    SYNC_PROFILING_TOP_N: int = Field(
+        default=30,
+        description="Number of functions and allocation sites in the summary of a profiled sync",
+    )
 
     # Telegram notification settings
     TELEGRAM_BOT_TOKEN: SecretStr | None = Field(default=None)
     TELEGRAM_CHAT_ID: str | None = Field(default=None)
     TELEGRAM_MAX_TRACEBACK_LENGTH: int = Field(default=1000)
+    TELEGRAM_BATCH_WINDOW_S: float = Field(
+        default=60,
+        description="Sync failures received within this window are sent as a single digest",
+    )
 
     # A size of 50 caused "The read operation timed out" errors,
     # so we're using a size of 25 for now.
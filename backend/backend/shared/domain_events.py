@@ -45,6 +45,9 @@ class SyncFailed(DomainEvent):
     formatted_traceback: str | None = Field(
         None, description="The full error traceback if available."
     )
+    ics_host: str | None = Field(
+        None, description="The host serving the ICS feed of the sync profile."
+    )
 
 
 class IcsFetched(DomainEvent):
@@ -63,6 +66,10 @@ class SyncSucceeded(DomainEvent):
 
     user_id: str = Field(..., description="The ID of the user.")
     sync_profile_id: str = Field(..., description="The ID of the sync profile.")
+    skipped_unchanged: bool = Field(
+        False,
+        description="Whether the calendar was left untouched because the events did not change since the last sync.",
+    )
 
 
 class SyncProfileCreationFailed(DomainEvent):
@@ -1,25 +1,226 @@
-from dataclasses import dataclass
+from dataclasses import FrozenInstanceError
+from datetime import datetime, timedelta, timezone, tzinfo
+from typing import Any, TypeAlias
 
 import arrow
 
 from backend.shared.google_calendar_colors import GoogleEventColor
 
+TzInfo: TypeAlias = tzinfo
+"""`datetime.tzinfo`, which the `tzinfo` field of `Event` shadows in its body."""
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_ONE_MICROSECOND = timedelta(microseconds=1)
+_FIELDS_COPIED_WITHOUT_VALIDATION = frozenset(
+    {"title", "description", "location", "color", "is_all_day"}
+)
+
+
+def to_epoch_us(dt: datetime | arrow.Arrow) -> int:
+    """Microseconds since the Unix epoch of an aware datetime or an Arrow."""
+    if isinstance(dt, arrow.Arrow):
+        dt = dt.datetime
+    return (dt - _EPOCH) // _ONE_MICROSECOND
+
+
+def datetime_from_epoch_us(epoch_us: int, tz: tzinfo) -> datetime:
+    """The aware datetime of `epoch_us` microseconds since the Unix epoch, in `tz`."""
+    return (_EPOCH + timedelta(microseconds=epoch_us)).astimezone(tz)
+
+
+def from_epoch_us(epoch_us: int, tz: tzinfo) -> arrow.Arrow:
+    """The Arrow of `epoch_us` microseconds since the Unix epoch, in `tz`."""
+    return arrow.Arrow.fromdatetime(datetime_from_epoch_us(epoch_us, tz))
+
 
-@dataclass(frozen=True)
 class Event:
-    start: arrow.Arrow
-    end: arrow.Arrow
-    title: str = ""
-    description: str = ""
-    location: str = ""
-    color: GoogleEventColor | None = None
-    is_all_day: bool = False
-
-    def __post_init__(self):
-        if self.start is None or self.end is None:
+    """
+    An immutable calendar event.
+
+    Events are created by the thousands for each feed and copied by every rule
+    action, so they are kept compact: start and end are stored as integer
+    microseconds since the epoch (`start_us`, `end_us`) plus the timezone they were
+    given in, and turned back into Arrow objects only when `start` or `end` is read,
+    at the boundaries of the sync (Google Calendar payloads, AI prompts).
+
+    Equality and hashing compare instants, like Arrow does.
+    """
+
+    __slots__ = (
+        "start_us",
+        "end_us",
+        "tzinfo",
+        "_end_tzinfo",
+        "title",
+        "description",
+        "location",
+        "color",
+        "is_all_day",
+    )
+
+    start_us: int
+    end_us: int
+    tzinfo: TzInfo
+    _end_tzinfo: TzInfo | None
+    title: str
+    description: str
+    location: str
+    color: GoogleEventColor | None
+    is_all_day: bool
+
+    def __init__(
+        self,
+        start: arrow.Arrow,
+        end: arrow.Arrow,
+        title: str = "",
+        description: str = "",
+        location: str = "",
+        color: GoogleEventColor | None = None,
+        is_all_day: bool = False,
+    ) -> None:
+        if start is None or end is None:
             raise ValueError("Both start and end dates must be provided")
-        if self.start >= self.end:
+
+        start_us = to_epoch_us(start)
+        end_us = to_epoch_us(end)
+        if start_us >= end_us:
             raise ValueError("Start date must be before end date")
 
-        if self.title is None:
+        if title is None:
             raise ValueError("Title must be provided")
+
+        setattr_ = object.__setattr__
+        setattr_(self, "start_us", start_us)
+        setattr_(self, "end_us", end_us)
+        setattr_(self, "tzinfo", start.tzinfo)
+        setattr_(
+            self, "_end_tzinfo", end.tzinfo if end.tzinfo != start.tzinfo else None
+        )
+        setattr_(self, "title", title)
+        setattr_(self, "description", description)
+        setattr_(self, "location", location)
+        setattr_(self, "color", color)
+        setattr_(self, "is_all_day", is_all_day)
+
+    @classmethod
+    def _from_trusted(
+        cls,
+        start_us: int,
+        end_us: int,
+        tzinfo: TzInfo,
+        end_tzinfo: TzInfo | None,
+        title: str,
+        description: str,
+        location: str,
+        color: GoogleEventColor | None,
+        is_all_day: bool,
+    ) -> "Event":
+        """Builds an event from fields of already validated events, without checks."""
+        event = object.__new__(cls)
+        setattr_ = object.__setattr__
+        setattr_(event, "start_us", start_us)
+        setattr_(event, "end_us", end_us)
+        setattr_(event, "tzinfo", tzinfo)
+        setattr_(event, "_end_tzinfo", end_tzinfo if end_tzinfo != tzinfo else None)
+        setattr_(event, "title", title)
+        setattr_(event, "description", description)
+        setattr_(event, "location", location)
+        setattr_(event, "color", color)
+        setattr_(event, "is_all_day", is_all_day)
+        return event
+
+    @property
+    def start(self) -> arrow.Arrow:
+        return from_epoch_us(self.start_us, self.tzinfo)
+
+    @property
+    def end(self) -> arrow.Arrow:
+        return from_epoch_us(self.end_us, self.end_tzinfo)
+
+    @property
+    def end_tzinfo(self) -> TzInfo:
+        """The timezone of `end`, which is usually the one of `start` (`tzinfo`)."""
+        return self._end_tzinfo or self.tzinfo
+
+    def replace(self, **changes: Any) -> "Event":
+        """
+        A copy of the event with `changes` applied, like `dataclasses.replace`.
+
+        Copies changing only text fields, the color or `is_all_day` skip the date
+        validation.
+        """
+        if not changes.keys() <= _FIELDS_COPIED_WITHOUT_VALIDATION:
+            fields = {
+                "start": self.start,
+                "end": self.end,
+                "title": self.title,
+                "description": self.description,
+                "location": self.location,
+                "color": self.color,
+                "is_all_day": self.is_all_day,
+            }
+            if not changes.keys() <= fields.keys():
+                raise TypeError(f"Event has no fields {changes.keys() - fields.keys()}")
+            return Event(**(fields | changes))
+
+        title = changes.get("title", self.title)
+        if title is None:
+            raise ValueError("Title must be provided")
+
+        return Event._from_trusted(
+            self.start_us,
+            self.end_us,
+            self.tzinfo,
+            self._end_tzinfo,
+            title,
+            changes.get("description", self.description),
+            changes.get("location", self.location),
+            changes.get("color", self.color),
+            changes.get("is_all_day", self.is_all_day),
+        )
+
+    def _key(self) -> tuple:
+        return (
+            self.start_us,
+            self.end_us,
+            self.title,
+            self.description,
+            self.location,
+            self.color,
+            self.is_all_day,
+        )
+
+    def __eq__(self, other: object) -> bool:
+        if other.__class__ is not Event:
+            return NotImplemented
+        return self._key() == other._key()  # type: ignore[attr-defined]
+
+    def __hash__(self) -> int:
+        return hash(self._key())
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise FrozenInstanceError(f"cannot assign to field {name!r}")
+
+    def __delattr__(self, name: str) -> None:
+        raise FrozenInstanceError(f"cannot delete field {name!r}")
+
+    def __reduce__(self) -> tuple:
+        return (
+            Event,
+            (
+                self.start,
+                self.end,
+                self.title,
+                self.description,
+                self.location,
+                self.color,
+                self.is_all_day,
+            ),
+        )
+
+    def __repr__(self) -> str:
+        return (
+            f"Event(start={self.start!r}, end={self.end!r}, title={self.title!r}, "
+            f"description={self.description!r}, location={self.location!r}, "
+            f"color={self.color!r}, is_all_day={self.is_all_day!r})"
+        )
@@ -0,0 +1,283 @@
+from datetime import datetime, tzinfo
+from typing import Callable, Iterable, Iterator, Literal, Sequence, overload
+
+import arrow
+import numpy as np
+from numpy.typing import NDArray
+
+from backend.shared.event import Event, to_epoch_us
+from backend.shared.google_calendar_colors import GoogleEventColor
+
+_COLORS = list(GoogleEventColor)
+_COLOR_CODES = {color: code for code, color in enumerate(_COLORS)}
+NO_COLOR = -1
+
+EventTextColumn = Literal["title", "description", "location"]
+Mask = NDArray[np.bool_]
+
+
+class StringColumn:
+    """
+    A column of interned strings: `values[codes[i]]` is the value of row `i`.
+
+    Feeds repeat the same few dozen titles, descriptions and locations, so
+    predicates and transformations run once per distinct value rather than per row.
+    Columns derived from each other share `values`, which only ever grows.
+    """
+
+    __slots__ = ("codes", "values")
+
+    def __init__(self, codes: NDArray[np.int32], values: list[str]) -> None:
+        self.codes = codes
+        self.values = values
+
+    @classmethod
+    def from_strings(cls, strings: Iterable[str]) -> "StringColumn":
+        index: dict[str, int] = {}
+        codes = [index.setdefault(string, len(index)) for string in strings]
+        return cls(np.array(codes, dtype=np.int32), list(index))
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    def __getitem__(self, row: int) -> str:
+        return self.values[self.codes[row]]
+
+    def take(self, rows: Mask | NDArray[np.intp]) -> "StringColumn":
+        return StringColumn(self.codes[rows], self.values)
+
+    def evaluate(self, predicate: Callable[[str], bool]) -> Mask:
+        """`predicate` of every row, computed once per distinct value."""
+        results = np.fromiter(
+            (predicate(value) for value in self.values),
+            dtype=np.bool_,
+            count=len(self.values),
+        )
+        return results[self.codes]
+
+    def map_where(self, mask: Mask, func: Callable[[str], str]) -> "StringColumn":
+        """A copy where the rows in `mask` are replaced by `func` of their value."""
+        selected = np.unique(self.codes[mask])
+        if not len(selected):
+            return self
+
+        values = self.values
+        index = {value: code for code, value in enumerate(values)}
+        lookup = np.arange(len(values), dtype=np.int32)
+        for code in selected:
+            new_value = func(values[code])
+            new_code = index.get(new_value)
+            if new_code is None:
+                new_code = index[new_value] = len(values)
+                values.append(new_value)
+            lookup[code] = new_code
+
+        codes = self.codes.copy()
+        codes[mask] = lookup[self.codes[mask]]
+        return StringColumn(codes, values)
+
+
+class EventBatch(Sequence[Event]):
+    """
+    The events of a feed, stored by column.
+
+    Start and end are int64 arrays of microseconds since the epoch, the all-day
+    flag a boolean array, colors an int8 array of codes (`NO_COLOR` for none),
+    timezones codes into a shared table, and text fields `StringColumn`s.
+    Whole-feed operations (time windows, masks, sorting, rules) are vectorized,
+    and return new batches sharing the unchanged columns.
+
+    It is a `Sequence[Event]`: indexing or iterating builds `Event` objects on the
+    fly, so code written for `list[Event]` keeps working.
+    """
+
+    __slots__ = (
+        "start_us",
+        "end_us",
+        "is_all_day",
+        "color_codes",
+        "tz_codes",
+        "end_tz_codes",
+        "tzinfos",
+        "title",
+        "description",
+        "location",
+    )
+
+    def __init__(
+        self,
+        *,
+        start_us: NDArray[np.int64],
+        end_us: NDArray[np.int64],
+        is_all_day: Mask,
+        color_codes: NDArray[np.int8],
+        tz_codes: NDArray[np.int32],
+        end_tz_codes: NDArray[np.int32],
+        tzinfos: list[tzinfo],
+        title: StringColumn,
+        description: StringColumn,
+        location: StringColumn,
+    ) -> None:
+        self.start_us = start_us
+        self.end_us = end_us
+        self.is_all_day = is_all_day
+        self.color_codes = color_codes
+        self.tz_codes = tz_codes
+        self.end_tz_codes = end_tz_codes
+        self.tzinfos = tzinfos
+        self.title = title
+        self.description = description
+        self.location = location
+
+    @classmethod
+    def from_events(cls, events: Iterable[Event]) -> "EventBatch":
+        if isinstance(events, EventBatch):
+            return events
+        events = list(events)
+
+        # The dateutil timezones returned by the ICS parser for a TZID are not
+        # hashable: they are indexed by identity, `tzinfos` keeping them alive
+        tzinfos: list[tzinfo] = []
+        tz_index: dict[int, int] = {}
+
+        def tz_code(tz: tzinfo) -> int:
+            code = tz_index.get(id(tz))
+            if code is None:
+                code = tz_index[id(tz)] = len(tzinfos)
+                tzinfos.append(tz)
+            return code
+
+        return cls(
+            start_us=np.fromiter(
+                (event.start_us for event in events), dtype=np.int64, count=len(events)
+            ),
+            end_us=np.fromiter(
+                (event.end_us for event in events), dtype=np.int64, count=len(events)
+            ),
+            is_all_day=np.fromiter(
+                (event.is_all_day for event in events),
+                dtype=np.bool_,
+                count=len(events),
+            ),
+            color_codes=np.fromiter(
+                (
+                    _COLOR_CODES[event.color] if event.color is not None else NO_COLOR
+                    for event in events
+                ),
+                dtype=np.int8,
+                count=len(events),
+            ),
+            tz_codes=np.fromiter(
+                (tz_code(event.tzinfo) for event in events),
+                dtype=np.int32,
+                count=len(events),
+            ),
+            end_tz_codes=np.fromiter(
+                (tz_code(event.end_tzinfo) for event in events),
+                dtype=np.int32,
+                count=len(events),
+            ),
+            tzinfos=tzinfos,
+            title=StringColumn.from_strings(event.title for event in events),
+            description=StringColumn.from_strings(
+                event.description for event in events
+            ),
+            location=StringColumn.from_strings(event.location for event in events),
+        )
+
+    def _replace_columns(self, **columns: object) -> "EventBatch":
+        fields = {name: getattr(self, name) for name in EventBatch.__slots__}
+        return EventBatch(**(fields | columns))  # type: ignore[arg-type]
+
+    def __len__(self) -> int:
+        return len(self.start_us)
+
+    @overload
+    def __getitem__(self, index: int) -> Event: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> "EventBatch": ...
+
+    def __getitem__(self, index: int | slice) -> "Event | EventBatch":
+        if isinstance(index, slice):
+            return self.take(np.arange(len(self))[index])
+
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("EventBatch index out of range")
+
+        color_code = self.color_codes[index]
+        return Event._from_trusted(
+            int(self.start_us[index]),
+            int(self.end_us[index]),
+            self.tzinfos[self.tz_codes[index]],
+            self.tzinfos[self.end_tz_codes[index]],
+            self.title[index],
+            self.description[index],
+            self.location[index],
+            _COLORS[color_code] if color_code != NO_COLOR else None,
+            bool(self.is_all_day[index]),
+        )
+
+    def __iter__(self) -> Iterator[Event]:
+        for index in range(len(self)):
+            yield self[index]
+
+    def to_events(self) -> list[Event]:
+        return list(self)
+
+    def take(self, rows: Mask | NDArray[np.intp]) -> "EventBatch":
+        """The rows selected by a boolean mask or an array of indices, in that order."""
+        return EventBatch(
+            start_us=self.start_us[rows],
+            end_us=self.end_us[rows],
+            is_all_day=self.is_all_day[rows],
+            color_codes=self.color_codes[rows],
+            tz_codes=self.tz_codes[rows],
+            end_tz_codes=self.end_tz_codes[rows],
+            tzinfos=self.tzinfos,
+            title=self.title.take(rows),
+            description=self.description.take(rows),
+            location=self.location.take(rows),
+        )
+
+    def in_window(
+        self,
+        *,
+        ending_after: datetime | arrow.Arrow | None = None,
+        starting_before: datetime | arrow.Arrow | None = None,
+    ) -> "EventBatch":
+        """The events ending strictly after `ending_after` and starting strictly
+        before `starting_before` (each bound is optional)."""
+        mask = np.ones(len(self), dtype=np.bool_)
+        if ending_after is not None:
+            mask &= self.end_us > to_epoch_us(ending_after)
+        if starting_before is not None:
+            mask &= self.start_us < to_epoch_us(starting_before)
+        return self.take(mask)
+
+    def sorted_by_start(self) -> "EventBatch":
+        """Sorted by start, then end. Stable for events with the same bounds."""
+        return self.take(np.lexsort((self.end_us, self.start_us)))
+
+    def text_column(self, field: EventTextColumn) -> StringColumn:
+        return getattr(self, field)
+
+    def with_text_where(
+        self, mask: Mask, field: EventTextColumn, func: Callable[[str], str]
+    ) -> "EventBatch":
+        """A copy where `field` of the rows in `mask` is replaced by `func` of it."""
+        return self._replace_columns(
+            **{field: self.text_column(field).map_where(mask, func)}
+        )
+
+    def with_color_where(
+        self, mask: Mask, color: GoogleEventColor | None
+    ) -> "EventBatch":
+        color_codes = self.color_codes.copy()
+        color_codes[mask] = _COLOR_CODES[color] if color is not None else NO_COLOR
+        return self._replace_columns(color_codes=color_codes)
+
+    def with_color(self, color: GoogleEventColor | None) -> "EventBatch":
+        return self.with_color_where(np.ones(len(self), dtype=np.bool_), color)
@@ -0,0 +1,42 @@
+import hashlib
+import json
+from typing import Iterable
+
+from backend.models.rules import Ruleset
+from backend.shared.event import Event
+
+
+def _event_fingerprint(event: Event) -> str:
+    return json.dumps(
+        [
+            event.start_us,
+            event.end_us,
+            event.title,
+            event.description,
+            event.location,
+            event.color.value if event.color is not None else None,
+            event.is_all_day,
+        ]
+    )
+
+
+def compute_events_digest(
+    events: Iterable[Event],
+    *,
+    ruleset: Ruleset | None,
+    target_calendar_id: str,
+) -> str:
+    """
+    SHA-256 digest of the events a sync writes to the target calendar.
+
+    It does not depend on the order of the events, and covers the ruleset and the
+    target calendar, so that equal digests mean the sync would write the same
+    calendar as the one that produced the stored digest.
+    """
+    payload = {
+        "targetCalendarId": target_calendar_id,
+        "ruleset": ruleset.model_dump(mode="json") if ruleset is not None else None,
+        "events": sorted(_event_fingerprint(event) for event in events),
+    }
+    encoded = json.dumps(payload, separators=(",", ":"), sort_keys=True)
+    return hashlib.sha256(encoded.encode()).hexdigest()
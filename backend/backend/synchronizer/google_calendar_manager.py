@@ -1,7 +1,8 @@
 import logging
-from datetime import datetime
+from datetime import datetime, tzinfo
+from functools import lru_cache
 from itertools import islice
-from typing import Any, Iterable, TypeAlias
+from typing import Any, Iterable, Sequence, TypeAlias
 
 import arrow
 
@@ -9,7 +10,7 @@ import pytz
 from googleapiclient.errors import HttpError
 
 from backend.settings import settings
-from backend.shared.event import Event
+from backend.shared.event import Event, datetime_from_epoch_us
 
 logger = logging.getLogger(__name__)
 
@@ -28,6 +29,38 @@ def batched(iterable: Iterable, batch_size: int) -> Iterable[list]:
         yield batch
 
 
+class _TzKey:
+    """
+    A timezone as a key of the formatting caches, compared by identity: the dateutil
+    timezones returned by the ICS parser for a TZID are not hashable.
+    """
+
+    __slots__ = ("tz",)
+
+    def __init__(self, tz: tzinfo) -> None:
+        self.tz = tz
+
+    def __hash__(self) -> int:
+        return id(self.tz)
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, _TzKey) and other.tz is self.tz
+
+
+@lru_cache(maxsize=8192)
+def _format_date_time(epoch_us: int, tz: _TzKey) -> str:
+    """RFC 3339 date-time, to the second, as `arrow.format("YYYY-MM-DDTHH:mm:ssZZ")`.
+
+    Timetables reuse the same few slots, so most instants are formatted once.
+    """
+    return datetime_from_epoch_us(epoch_us, tz.tz).isoformat(timespec="seconds")
+
+
+@lru_cache(maxsize=8192)
+def _format_date(epoch_us: int, tz: _TzKey) -> str:
+    return datetime_from_epoch_us(epoch_us, tz.tz).date().isoformat()
+
+
 class GoogleCalendarManager:
     """Create, retrieve, and delete events in Google Calendar,
     with support for batch operations and extended properties for sync tracking.
@@ -40,26 +73,27 @@ class GoogleCalendarManager:
 
     All methods that interact with the Google Calendar API require a service object
     (googleapiclient.discovery.Resource) and a calendar_id.
+
+    `api_calls` counts the HTTP requests sent to the API, a batch counting as one.
     """
 
     def __init__(self, service: Any, calendar_id: str) -> None:
         self._service = service
         self._calendar_id = calendar_id
+        self.api_calls = 0
 
     @staticmethod
     def _event_to_google_event(
         event: Event, extended_properties: ExtendedProperties
     ) -> dict:
+        # Formatted from the epoch timestamps, without building Arrow objects
+        start_tz, end_tz = _TzKey(event.tzinfo), _TzKey(event.end_tzinfo)
         if event.is_all_day:
-            start = {"date": event.start.strftime("%Y-%m-%d")}
-            end = {"date": event.end.strftime("%Y-%m-%d")}
+            start = {"date": _format_date(event.start_us, start_tz)}
+            end = {"date": _format_date(event.end_us, end_tz)}
         else:
-            # Format the start and end times to RFC 3339
-            start_time_rfc3339 = event.start.format("YYYY-MM-DDTHH:mm:ssZZ")
-            end_time_rfc3339 = event.end.format("YYYY-MM-DDTHH:mm:ssZZ")
-
-            start = {"dateTime": start_time_rfc3339}
-            end = {"dateTime": end_time_rfc3339}
+            start = {"dateTime": _format_date_time(event.start_us, start_tz)}
+            end = {"dateTime": _format_date_time(event.end_us, end_tz)}
 
         body = {
             "summary": event.title,
@@ -81,9 +115,22 @@ class GoogleCalendarManager:
             raise ValueError(f"{sync_profile_id=} is not valid")
         return {"private": {"syncademic": sync_profile_id}}
 
+    @classmethod
+    def serialize_events(
+        cls, events: Iterable[Event], *, sync_profile_id: str
+    ) -> list[dict]:
+        """Convert events to Google Calendar API bodies tagged with `sync_profile_id`.
+
+        All bodies share the same extended properties object, which must not be mutated.
+        """
+        extended_properties = cls._create_extended_properties(sync_profile_id)
+        return [
+            cls._event_to_google_event(event, extended_properties) for event in events
+        ]
+
     def create_events(
         self,
-        events: list[Event],
+        events: Sequence[Event],
         *,
         sync_profile_id: str,
         batch_size: int = settings.GOOGLE_API_BATCH_SIZE,
@@ -94,7 +141,7 @@ class GoogleCalendarManager:
         with a sync profile ID in its extended properties for tracking purposes.
 
         Args:
-            events: List of Event objects to create in Google Calendar.
+            events: Event objects to create in Google Calendar (a list or an EventBatch).
             sync_profile_id: Identifier used to tag and track synced events to their sync profile.
             batch_size: Number of events to process in each batch request. Defaults to 50.
         """
@@ -103,24 +150,25 @@ class GoogleCalendarManager:
 
         logger.info("Creating %s events.", len(events))
 
+        # Serialize everything before the first request, so that an invalid event
+        # fails the sync before anything is written
+        google_events = self.serialize_events(events, sync_profile_id=sync_profile_id)
+        # Each call to events() builds the whole resource again
+        events_resource = self._service.events()
+
         for i, sublist in enumerate(
-            batched(events, batch_size)
+            batched(google_events, batch_size)
         ):  # TODO : check maximum batch size
             batch = self._service.new_batch_http_request()
-            for event in sublist:
-                google_event = self._event_to_google_event(
-                    event,
-                    extended_properties=self._create_extended_properties(
-                        sync_profile_id
-                    ),
-                )
+            for google_event in sublist:
                 batch.add(
-                    self._service.events().insert(
+                    events_resource.insert(
                         calendarId=self._calendar_id,
                         body=google_event,
                     )
                 )
             batch.execute()
+            self.api_calls += 1
             logger.info(
                 "Inserted %s/%s events.",
                 i * 50 + len(sublist),
@@ -132,6 +180,7 @@ class GoogleCalendarManager:
         *,
         sync_profile_id: str,
         min_dt: datetime | None = None,
+        max_dt: datetime | None = None,
         limit: int | None = 1000,
     ) -> list[str]:
         """Get the ids of the events associated with the sync_profile_id.
@@ -141,6 +190,7 @@ class GoogleCalendarManager:
         Args:
             sync_profile_id (str): The sync_profile_id to filter the events
             min_dt (datetime | None): The lower bound (exclusive) for an event's end time to filter by. Defaults to None.
+            max_dt (datetime | None): The upper bound (exclusive) for an event's start time to filter by. Defaults to None.
             limit (int | None): The maximum number of events to return. Defaults to 1000.
         """
         if not sync_profile_id:
@@ -148,7 +198,8 @@ class GoogleCalendarManager:
 
         events_as_dict = []
 
-        request = self._service.events().list(
+        events_resource = self._service.events()
+        request = events_resource.list(
             calendarId=self._calendar_id,
             privateExtendedProperty=f"syncademic={sync_profile_id}",
             singleEvents=True,
@@ -160,12 +211,15 @@ class GoogleCalendarManager:
             #  2011-06-03T10:00:00Z. Milliseconds may be provided but are ignored.
             # If timeMax is set, timeMin must be smaller than timeMax.
             timeMin=min_dt.astimezone(pytz.utc).isoformat() if min_dt else None,
+            # Upper bound (exclusive) for an event's start time to filter by. Optional.
+            timeMax=max_dt.astimezone(pytz.utc).isoformat() if max_dt else None,
         )
 
         while request:
             response = request.execute()
+            self.api_calls += 1
             events_as_dict.extend(response.get("items", []))
-            request = self._service.events().list_next(request, response)
+            request = events_resource.list_next(request, response)
 
         # TODO : assert here that the API respected timeMin
 
@@ -181,6 +235,7 @@ class GoogleCalendarManager:
         Delete events from the calendar by their ids.
         """
         logger.info("Will delete %s events.", len(ids))
+        events_resource = self._service.events()
 
         for i, sublist in enumerate(batched(ids, batch_size)):
             logger.info(
@@ -192,12 +247,13 @@ class GoogleCalendarManager:
             batch = self._service.new_batch_http_request()
             for id in sublist:
                 batch.add(
-                    self._service.events().delete(
+                    events_resource.delete(
                         calendarId=self._calendar_id,
                         eventId=id,
                     )
                 )
             batch.execute()
+            self.api_calls += 1
             logger.info(
                 "Deleted %s/%s events.",
                 i * batch_size + len(sublist),
@@ -216,6 +272,7 @@ class GoogleCalendarManager:
         """
 
         try:
+            self.api_calls += 1
             self._service.calendars().get(calendarId=self._calendar_id).execute()
             return True
         except HttpError as e:
@@ -246,21 +303,19 @@ class MockGoogleCalendarManager(GoogleCalendarManager):
 
     def create_events(
         self,
-        events: list[Event],
+        events: Sequence[Event],
         *,
         sync_profile_id: str,
         batch_size: int = settings.GOOGLE_API_BATCH_SIZE,
     ) -> None:
         """Store events in memory with generated IDs."""
-        for event in events:
+        self.api_calls += -(-len(events) // batch_size)
+        for google_event in self.serialize_events(
+            events, sync_profile_id=sync_profile_id
+        ):
             event_id = str(self._next_event_id)
             self._next_event_id += 1
 
-            google_event = self._event_to_google_event(
-                event,
-                extended_properties=self._create_extended_properties(sync_profile_id),
-            )
-
             self._events[event_id] = (google_event, sync_profile_id)
 
     def get_events_ids_from_sync_profile(
@@ -268,9 +323,13 @@ class MockGoogleCalendarManager(GoogleCalendarManager):
         *,
         sync_profile_id: str,
         min_dt: datetime | None = None,
+        max_dt: datetime | None = None,
         limit: int | None = 1000,
     ) -> list[str]:
-        """Retrieve event IDs filtered by sync profile and optional minimum datetime."""
+        """Retrieve event IDs filtered by sync profile and optional time bounds.
+
+        Like the API, `limit` is the size of a page, all the pages being fetched.
+        """
         matching_ids = []
 
         for event_id, (event_dict, stored_profile_id) in self._events.items():
@@ -278,26 +337,29 @@ class MockGoogleCalendarManager(GoogleCalendarManager):
                 continue
 
             if min_dt is not None:
-                event_end = event_dict["end"].get("dateTime") or event_dict["end"].get(
-                    "date"
-                )
-                if event_end is not None:
-                    event_end_dt = (
-                        arrow.get(event_end)
-                        .replace(tzinfo=arrow.now().tzinfo)
-                        .to("UTC")
-                        .datetime
-                    )
-                    if event_end_dt <= min_dt:
-                        continue
+                event_end_dt = self._get_event_datetime(event_dict["end"])
+                if event_end_dt is not None and event_end_dt <= min_dt:
+                    continue
+
+            if max_dt is not None:
+                event_start_dt = self._get_event_datetime(event_dict["start"])
+                if event_start_dt is not None and event_start_dt >= max_dt:
+                    continue
 
             matching_ids.append(event_id)
 
-            if limit and len(matching_ids) >= limit:
-                break
+        pages = -(-len(matching_ids) // limit) if limit else 1
+        self.api_calls += max(1, pages)
 
         return matching_ids
 
+    @staticmethod
+    def _get_event_datetime(date_or_date_time: dict[str, str]) -> datetime | None:
+        value = date_or_date_time.get("dateTime") or date_or_date_time.get("date")
+        if value is None:
+            return None
+        return arrow.get(value).replace(tzinfo=arrow.now().tzinfo).to("UTC").datetime
+
     def delete_events(
         self,
         ids: list[str],
@@ -305,6 +367,7 @@ class MockGoogleCalendarManager(GoogleCalendarManager):
         batch_size: int = settings.GOOGLE_API_BATCH_SIZE,
     ) -> None:
         """Remove events from in-memory storage."""
+        self.api_calls += -(-len(ids) // batch_size)
         for event_id in ids:
             self._events.pop(event_id, None)
 
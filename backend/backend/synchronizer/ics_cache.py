@@ -4,6 +4,7 @@ from datetime import datetime, timezone
 from typing import Any
 from google.cloud import storage
 
+from backend.services.sync_profiler import SyncProfileReport
 from backend.synchronizer.ics_source import IcsSource, UrlIcsSource
 
 logger = logging.getLogger(__name__)
@@ -51,8 +52,7 @@ class FirebaseIcsFileStorage(IcsFileStorage):
             for k, v in metadata.items()
         }
 
-        sync_profile_id = metadata.get("sync_profile_id", "unknown-sync-profile")
-        filename = f"{sync_profile_id}_{now.strftime('%Y-%m-%d_%H-%M-%S')}.ics"
+        filename = f"{self._file_prefix(metadata, now)}.ics"
         blob = self.firebase_storage_bucket.blob(filename)
 
         blob.metadata = {
@@ -62,6 +62,31 @@ class FirebaseIcsFileStorage(IcsFileStorage):
         blob.upload_from_string(ics_str, content_type="text/calendar")
         logger.info("Stored ics string in firebase storage: %s", filename)
 
+    @staticmethod
+    def _file_prefix(metadata: dict[str, Any], now: datetime) -> str:
+        sync_profile_id = metadata.get("sync_profile_id", "unknown-sync-profile")
+        return f"{sync_profile_id}_{now.strftime('%Y-%m-%d_%H-%M-%S')}"
+
+    def save_sync_profile_report(
+        self, report: SyncProfileReport, *, metadata: dict[str, Any]
+    ) -> None:
+        """
+        Stores the profile of a sync next to its ICS files: `<prefix>.prof` (pstats
+        data) and `<prefix>.profile.txt` (summary).
+        """
+        now = datetime.now(timezone.utc)
+        prefix = self._file_prefix(metadata, now)
+        blob_metadata = {"blob_created_at": now.isoformat(), **metadata}
+
+        for filename, content, content_type in [
+            (f"{prefix}.prof", report.stats, "application/octet-stream"),
+            (f"{prefix}.profile.txt", report.summary, "text/plain"),
+        ]:
+            blob = self.firebase_storage_bucket.blob(filename)
+            blob.metadata = blob_metadata
+            blob.upload_from_string(content, content_type=content_type)
+        logger.info("Stored sync profile report in firebase storage: %s", prefix)
+
     def list_files(self, prefix: str | None = None) -> list[dict[str, Any]]:
         """Lists files in the bucket, optionally filtering by prefix."""
         blobs = self.firebase_storage_bucket.list_blobs(prefix=prefix)
@@ -0,0 +1,293 @@
+import asyncio
+import logging
+import threading
+import time
+from collections import deque
+from contextlib import asynccontextmanager, contextmanager
+from enum import Enum
+from typing import AsyncIterator, Callable, Iterator
+from urllib.parse import urlsplit
+
+import httpx
+import requests
+
+from backend.services.exceptions.ics import IcsHostUnavailableError
+from backend.settings import settings
+
+logger = logging.getLogger(__name__)
+
+
+class CircuitState(str, Enum):
+    """
+    - closed    : requests go through, their outcomes are recorded
+    - open      : the host failed too often, requests fail fast until the cooldown ends
+    - half_open : the cooldown ended, a single probe request decides whether to close
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+def is_host_failure(error: BaseException) -> bool:
+    """
+    Whether an error fetching a URL means its host is unhealthy: the connection
+    failed or timed out, or the server answered 5xx or 429. Other errors (404, wrong
+    content type, file too large) concern a single URL.
+    """
+    match error:
+        case requests.ConnectionError() | requests.Timeout() | httpx.TransportError():
+            return True
+        case requests.HTTPError() | httpx.HTTPStatusError():
+            response = error.response
+            return response is not None and (
+                response.status_code >= 500 or response.status_code == 429
+            )
+        case _:
+            return False
+
+
+class HostCircuitBreaker:
+    """
+    Circuit breaker of one host, driven by the failure rate of its last requests.
+
+    The circuit opens when at least `failure_rate_threshold` of the last `window`
+    requests (and no fewer than `min_requests`) failed. It then rejects requests for
+    `cooldown_s`, after which one probe request is let through: its success closes
+    the circuit, its failure opens it for another cooldown.
+
+    Thread-safe.
+    """
+
+    def __init__(
+        self,
+        *,
+        window: int,
+        min_requests: int,
+        failure_rate_threshold: float,
+        cooldown_s: float,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._min_requests = min_requests
+        self._failure_rate_threshold = failure_rate_threshold
+        self._cooldown_s = cooldown_s
+        self._clock = clock
+        self._outcomes: deque[bool] = deque(maxlen=window)
+        self._state = CircuitState.CLOSED
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> CircuitState:
+        with self._lock:
+            if (
+                self._state == CircuitState.OPEN
+                and self._clock() - self._opened_at >= self._cooldown_s
+            ):
+                self._state = CircuitState.HALF_OPEN
+            return self._state
+
+    @property
+    def retry_after_s(self) -> float:
+        """Time until the cooldown of an open circuit ends, 0 otherwise."""
+        with self._lock:
+            if self._state != CircuitState.OPEN:
+                return 0.0
+            return max(0.0, self._cooldown_s - (self._clock() - self._opened_at))
+
+    def allow_request(self) -> bool:
+        """Whether a request may be sent now. A True in half-open state is the probe,
+        which must be followed by a `record_*` call."""
+        state = self.state
+        with self._lock:
+            match state:
+                case CircuitState.CLOSED:
+                    return True
+                case CircuitState.OPEN:
+                    return False
+                case CircuitState.HALF_OPEN:
+                    if self._probe_in_flight:
+                        return False
+                    self._probe_in_flight = True
+                    return True
+
+    def record_success(self) -> None:
+        with self._lock:
+            if self._state != CircuitState.CLOSED:
+                self._state = CircuitState.CLOSED
+                self._outcomes.clear()
+            self._probe_in_flight = False
+            self._outcomes.append(True)
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._probe_in_flight = False
+            if self._state != CircuitState.CLOSED:
+                self._open()
+                return
+
+            self._outcomes.append(False)
+            failures = self._outcomes.count(False)
+            if (
+                len(self._outcomes) >= self._min_requests
+                and failures / len(self._outcomes) >= self._failure_rate_threshold
+            ):
+                self._open()
+
+    def record_cancelled(self) -> None:
+        """The allowed request was not sent, so it tells nothing about the host."""
+        with self._lock:
+            self._probe_in_flight = False
+
+    def _open(self) -> None:
+        self._state = CircuitState.OPEN
+        self._opened_at = self._clock()
+        self._outcomes.clear()
+
+
+class IcsHostGuard:
+    """
+    Politeness towards the hosts serving ICS feeds: at most
+    `max_concurrent_requests` requests in flight per host, and a circuit breaker
+    per host (see `HostCircuitBreaker`).
+
+    Thousands of profiles point at a few university timetable servers. When one is
+    down, its requests fail fast with `IcsHostUnavailableError` instead of each
+    waiting out the timeout.
+
+    Usage:
+        with ics_host_guard.request(url, timeout_s=...):
+            ...  # Send the request, letting its exceptions propagate
+    """
+
+    def __init__(
+        self,
+        *,
+        max_concurrent_requests: int = settings.ICS_HOST_MAX_CONCURRENT_REQUESTS,
+        window: int = settings.ICS_HOST_BREAKER_WINDOW,
+        min_requests: int = settings.ICS_HOST_BREAKER_MIN_REQUESTS,
+        failure_rate_threshold: float = settings.ICS_HOST_BREAKER_FAILURE_RATE,
+        cooldown_s: float = settings.ICS_HOST_BREAKER_COOLDOWN_S,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._max_concurrent_requests = max_concurrent_requests
+        self._new_breaker = lambda: HostCircuitBreaker(
+            window=window,
+            min_requests=min_requests,
+            failure_rate_threshold=failure_rate_threshold,
+            cooldown_s=cooldown_s,
+            clock=clock,
+        )
+        self._breakers: dict[str, HostCircuitBreaker] = {}
+        self._semaphores: dict[str, threading.BoundedSemaphore] = {}
+        self._async_semaphores: dict[str, asyncio.Semaphore] = {}
+        self._lock = threading.Lock()
+
+    def breaker(self, host: str) -> HostCircuitBreaker:
+        with self._lock:
+            if (breaker := self._breakers.get(host)) is None:
+                breaker = self._breakers[host] = self._new_breaker()
+            return breaker
+
+    def _semaphore(self, host: str) -> threading.BoundedSemaphore:
+        with self._lock:
+            if (semaphore := self._semaphores.get(host)) is None:
+                semaphore = self._semaphores[host] = threading.BoundedSemaphore(
+                    self._max_concurrent_requests
+                )
+            return semaphore
+
+    def _async_semaphore(self, host: str) -> asyncio.Semaphore:
+        with self._lock:
+            if (semaphore := self._async_semaphores.get(host)) is None:
+                semaphore = self._async_semaphores[host] = asyncio.Semaphore(
+                    self._max_concurrent_requests
+                )
+            return semaphore
+
+    def _allow_or_raise(self, host: str) -> HostCircuitBreaker:
+        breaker = self.breaker(host)
+        if not breaker.allow_request():
+            logger.warning(
+                "ICS host unavailable, failing fast",
+                extra={"host": host, "retry_after_s": breaker.retry_after_s},
+            )
+            raise IcsHostUnavailableError(
+                f"The calendar server {host} is currently unavailable.",
+                details={"host": host, "retry_after_s": breaker.retry_after_s},
+            )
+        return breaker
+
+    @staticmethod
+    def _record(
+        breaker: HostCircuitBreaker, host: str, error: BaseException | None
+    ) -> None:
+        if error is not None and is_host_failure(error):
+            breaker.record_failure()
+            if breaker.state == CircuitState.OPEN:
+                logger.warning("ICS host circuit opened", extra={"host": host})
+        else:
+            breaker.record_success()
+
+    @contextmanager
+    def request(self, url: str, *, timeout_s: float) -> Iterator[None]:
+        """
+        Guards one request to `url`, waiting up to `timeout_s` for a free slot of
+        its host. The outcome is recorded from the exception raised in the block.
+
+        Raises:
+            IcsHostUnavailableError: If the circuit of the host is open, or its slots
+                stay busy for `timeout_s`.
+        """
+        host = urlsplit(url).hostname or ""
+        breaker = self._allow_or_raise(host)
+
+        semaphore = self._semaphore(host)
+        if not semaphore.acquire(timeout=timeout_s):
+            breaker.record_cancelled()
+            raise IcsHostUnavailableError(
+                f"Too many requests in flight to the calendar server {host}.",
+                details={"host": host},
+            )
+        try:
+            yield
+        except BaseException as e:
+            self._record(breaker, host, e)
+            raise
+        else:
+            self._record(breaker, host, None)
+        finally:
+            semaphore.release()
+
+    @asynccontextmanager
+    async def request_async(self, url: str, *, timeout_s: float) -> AsyncIterator[None]:
+        """Non-blocking counterpart of `request`, for use on the event loop."""
+        host = urlsplit(url).hostname or ""
+        breaker = self._allow_or_raise(host)
+
+        semaphore = self._async_semaphore(host)
+        try:
+            await asyncio.wait_for(semaphore.acquire(), timeout=timeout_s)
+        except asyncio.TimeoutError:
+            breaker.record_cancelled()
+            raise IcsHostUnavailableError(
+                f"Too many requests in flight to the calendar server {host}.",
+                details={"host": host},
+            )
+        except asyncio.CancelledError:
+            breaker.record_cancelled()
+            raise
+        try:
+            yield
+        except BaseException as e:
+            self._record(breaker, host, e)
+            raise
+        else:
+            self._record(breaker, host, None)
+        finally:
+            semaphore.release()
+
+
+ics_host_guard = IcsHostGuard()
+"""Shared by all the ICS requests of the process."""
@@ -1,35 +1,30 @@
 import logging
-from typing import List
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Callable
+
+import arrow
 
 from backend.services.exceptions.ics import (
     IcsParsingError,
     RecurringEventError,
 )
+from backend.settings import settings
 from backend.shared.event import Event
+from backend.synchronizer.ics_recurrence import (
+    RecurrenceWindow,
+    expand_occurrences,
+    get_recurrence_id,
+    is_recurring,
+)
 import ics
 
 logger = logging.getLogger(__name__)
 
-
-def _is_recurring_event(event: ics.Event) -> bool:
-    """Check if an event defines recurrence properties.
-
-    Args:
-        event: The ICS event to inspect.
-
-    Returns:
-        ``True`` if the event contains any recurrence-related properties,
-        otherwise ``False``.
-    """
-    extra_names: list[str] = [extra.name for extra in event.extra]
-    assert all(isinstance(name, str) for name in extra_names)
-
-    recurring_props = ["RRULE", "RDATE", "EXDATE", "RECURRENCE-ID"]
-    return any(
-        extra_name.startswith(prop)
-        for extra_name in extra_names
-        for prop in recurring_props
-    )
+# The `ics` library parses content lines with a grammar object shared by the whole
+# process, which fails ("pop from empty list") when two threads parse at once.
+_ICS_LIBRARY_LOCK = threading.Lock()
 
 
 class IcsParser:
@@ -52,8 +47,46 @@ class IcsParser:
         ```
     """
 
-    def __init__(self):
-        pass
+    def __init__(
+        self,
+        *,
+        recurrence_past_days: int = settings.ICS_RECURRENCE_PAST_DAYS,
+        recurrence_future_days: int = settings.ICS_RECURRENCE_FUTURE_DAYS,
+        max_recurrence_instances: int = settings.ICS_RECURRENCE_MAX_INSTANCES,
+        clock: Callable[[], float] = time.time,
+    ):
+        """
+        Args:
+            recurrence_past_days, recurrence_future_days: Recurring events are
+                expanded into the occurrences overlapping at least this many days
+                before and after now (see `_recurrence_window`)
+            max_recurrence_instances: Number of instances of a recurring event
+                computed from its start, after which the series is cut
+            clock: Current time, in seconds since the epoch
+        """
+        self._recurrence_past = timedelta(days=recurrence_past_days)
+        self._recurrence_future = timedelta(days=recurrence_future_days)
+        self._max_recurrence_instances = max_recurrence_instances
+        self._clock = clock
+
+    def _recurrence_window(self) -> RecurrenceWindow:
+        """
+        The bounds are rounded out to the start of a month (UTC), so that they only
+        move once a month: a window sliding with now would add and remove
+        occurrences every day, and the events digest of an unchanged feed would
+        change with them (no "unchanged" skip, shortest sync interval).
+        """
+        now = datetime.fromtimestamp(self._clock(), timezone.utc)
+        # Bounds derived from the month alone, covering the days around any `now` of it
+        this_month = _start_of_month(now)
+        next_month = _start_of_month(this_month + _MONTH)
+        return RecurrenceWindow(
+            start=_start_of_month(this_month - self._recurrence_past),
+            end=_start_of_month(
+                _start_of_month(next_month + self._recurrence_future) + _MONTH
+            ),
+            max_instances=self._max_recurrence_instances,
+        )
 
     def try_parse(self, ics_str: str) -> list[Event] | IcsParsingError:
         """
@@ -62,8 +95,10 @@ class IcsParser:
         This method performs several steps:
         1. Validates the input string is not empty
         2. Parses the ICS string into a calendar object
-        3. Checks each event for unsupported recurring event properties
-        4. Converts valid events into the internal Event model
+        3. Converts single events into the internal Event model
+        4. Expands recurring events (RRULE, RDATE, EXDATE) into one Event per
+           occurrence within the recurrence window, the occurrences replaced by
+           another event (RECURRENCE-ID) excepted
 
         Args:
             ics_str: Raw ICS format string to parse
@@ -74,37 +109,85 @@ class IcsParser:
 
         Raises:
             IcsParsingError: If the input string is empty
-            RecurringEventError: If any event contains recurrence rules (the exception is itself an IcsParsingError)
+            RecurringEventError: If the recurrence of an event cannot be parsed (the exception is itself an IcsParsingError)
         """
         if not ics_str.strip():
             return IcsParsingError("Empty ICS string")
 
         try:
-            calendar = ics.Calendar(ics_str)
+            with _ICS_LIBRARY_LOCK:
+                calendar = ics.Calendar(ics_str)
         except Exception as e:
             logger.error("Failed to parse ICS file: %s", e)
             return IcsParsingError(f"Failed to parse ICS file: {e}")
 
-        events = []
+        # The VTIMEZONE definitions of the feed, for the TZID without an IANA name
+        timezones = getattr(calendar, "_timezones", {})
+
+        single_events: list[ics.Event] = []
+        recurring_events: list[ics.Event] = []
+        overridden: dict[str, set[datetime]] = {}
         for event in calendar.events:
-            if _is_recurring_event(event):
+            try:
+                recurrence_id = get_recurrence_id(event, timezones)
+            except Exception as e:
+                logger.error("Failed to parse event: %s", e)
                 return RecurringEventError(
-                    f"Recurring event detected: {event.name=}, {event.extra=}. We do not support recurring events yet."
+                    f"Invalid RECURRENCE-ID: {event.name=}, {event.extra=}: {e}"
                 )
 
+            if recurrence_id is not None:
+                overridden.setdefault(event.uid, set()).add(recurrence_id.datetime)
+                # A cancelled override only removes its occurrence
+                if event.status == "CANCELLED":
+                    continue
+                single_events.append(event)
+            elif is_recurring(event):
+                recurring_events.append(event)
+            else:
+                single_events.append(event)
+
+        events = []
+        for event in single_events:
             try:
-                # Append non-recurring events to the list
-                events.append(
-                    Event(
-                        title=event.name or "",
-                        description=event.description or "",
-                        start=event.begin,
-                        end=event.end,
-                        location=event.location or "",
-                        is_all_day=event.all_day,
-                    )
-                )
+                events.append(_to_event(event, event.begin, event.end))
             except Exception as e:
                 logger.error("Failed to parse event: %s", e)
                 return IcsParsingError(f"Failed to parse event: {e}")
+
+        window = self._recurrence_window()
+        for event in recurring_events:
+            try:
+                events.extend(
+                    _to_event(event, start, end)
+                    for start, end in expand_occurrences(
+                        event,
+                        timezones=timezones,
+                        window=window,
+                        overridden=overridden.get(event.uid, frozenset()),
+                    )
+                )
+            except Exception as e:
+                logger.error("Failed to expand recurring event: %s", e)
+                return RecurringEventError(
+                    f"Invalid recurring event: {event.name=}, {event.extra=}: {e}"
+                )
         return events
+
+
+_MONTH = timedelta(days=31)
+
+
+def _start_of_month(dt: datetime) -> datetime:
+    return dt.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+
+
+def _to_event(event: ics.Event, start: arrow.Arrow, end: arrow.Arrow) -> Event:
+    return Event(
+        title=event.name or "",
+        description=event.description or "",
+        start=start,
+        end=end,
+        location=event.location or "",
+        is_all_day=event.all_day,
+    )
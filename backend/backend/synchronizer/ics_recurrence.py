@@ -0,0 +1,125 @@
+import itertools
+import logging
+import re
+from dataclasses import dataclass
+from datetime import datetime, timezone, tzinfo
+from typing import Collection, Iterator
+
+import arrow
+import ics
+from dateutil import rrule
+from ics.utils import ContentLine, iso_to_arrow
+
+logger = logging.getLogger(__name__)
+
+RECURRENCE_PROPERTIES = frozenset({"RRULE", "RDATE", "EXDATE"})
+
+_UTC_UNTIL_RE = re.compile(r"UNTIL=(\d{8}T\d{6})Z", re.IGNORECASE)
+
+
+@dataclass(frozen=True)
+class RecurrenceWindow:
+    """
+    Bounds the expansion of recurring events: only the occurrences overlapping
+    [start, end) are kept, and at most `max_instances` instances of a series are
+    computed from its first one.
+    """
+
+    start: datetime
+    end: datetime
+    max_instances: int
+
+
+def is_recurring(event: ics.Event) -> bool:
+    """Whether the event defines a recurrence set (RRULE, RDATE or EXDATE)."""
+    return any(line.name in RECURRENCE_PROPERTIES for line in event.extra)
+
+
+def get_recurrence_id(
+    event: ics.Event, timezones: dict[str, tzinfo]
+) -> arrow.Arrow | None:
+    """The start of the occurrence the event replaces, if it is an override."""
+    for line in event.extra:
+        if line.name == "RECURRENCE-ID":
+            return iso_to_arrow(line, timezones)
+    return None
+
+
+def _localize_until(rule: str, tz: tzinfo) -> str:
+    """
+    Turns an UNTIL given in UTC into the wall-clock time of `tz`, since the rule is
+    expanded on naive wall-clock times (dateutil rejects mixing naive and aware).
+    """
+
+    def to_local(match: re.Match) -> str:
+        until = datetime.strptime(match.group(1), "%Y%m%dT%H%M%S")
+        local = until.replace(tzinfo=timezone.utc).astimezone(tz)
+        return f"UNTIL={local:%Y%m%dT%H%M%S}"
+
+    return _UTC_UNTIL_RE.sub(to_local, rule)
+
+
+def expand_occurrences(
+    event: ics.Event,
+    *,
+    timezones: dict[str, tzinfo],
+    window: RecurrenceWindow,
+    overridden: Collection[datetime] = frozenset(),
+) -> Iterator[tuple[arrow.Arrow, arrow.Arrow]]:
+    """
+    Lazily yields the (start, end) of the occurrences of a recurring event that
+    overlap the window, in chronological order.
+
+    The recurrence set is DTSTART, the RRULE and RDATE instances, minus the EXDATE
+    ones and the `overridden` starts (the RECURRENCE-ID of the events replacing an
+    occurrence). Rules are expanded in the wall-clock time of DTSTART, so that a
+    weekly 9:00 event stays at 9:00 across daylight saving time changes.
+
+    Raises:
+        ValueError: If a recurrence property cannot be parsed.
+    """
+    tz = event.begin.tzinfo
+    duration = event.end - event.begin
+
+    def local(dt: arrow.Arrow | datetime) -> datetime:
+        return dt.astimezone(tz).replace(tzinfo=None)
+
+    dtstart = local(event.begin)
+    recurrence_set = rrule.rruleset()
+    recurrence_set.rdate(dtstart)
+    for line in event.extra:
+        if line.name == "RRULE":
+            recurrence_set.rrule(
+                rrule.rrulestr(_localize_until(line.value, tz), dtstart=dtstart)
+            )
+        elif line.name in ("RDATE", "EXDATE"):
+            for value in line.value.split(","):
+                # A PERIOD value ("start/end" or "start/duration") occurs at its start
+                content_line = ContentLine(line.name, line.params, value.split("/")[0])
+                dt = local(iso_to_arrow(content_line, timezones))
+                if line.name == "RDATE":
+                    recurrence_set.rdate(dt)
+                else:
+                    recurrence_set.exdate(dt)
+
+    # Occurrences starting at or before `after` end before the window
+    after = local(window.start - duration)
+    before = local(window.end)
+    instances = 0
+    for start in itertools.islice(recurrence_set, window.max_instances):
+        instances += 1
+        if start >= before:
+            return
+        if start <= after:
+            continue
+        occurrence_start = arrow.Arrow.fromdatetime(start, tzinfo=tz)
+        if occurrence_start.datetime in overridden:
+            continue
+        yield occurrence_start, occurrence_start + duration
+
+    if instances == window.max_instances:
+        logger.warning(
+            "Recurring event cut after %s instances",
+            instances,
+            extra={"event_uid": event.uid, "event_name": event.name},
+        )
@@ -1,13 +1,18 @@
-import io
 import logging
 from abc import ABC, abstractmethod
+from collections.abc import Mapping
 from pathlib import Path
 
+import httpx
 import requests
 from pydantic import BaseModel, HttpUrl
 
+from backend.infrastructure.http_client import ICS_REQUEST_HEADERS, get_http_session
 from backend.settings import settings
 from backend.services.exceptions.ics import IcsSourceError
+from backend.synchronizer import ics_host_guard as _ics_host_guard
+from backend.synchronizer.ics_host_guard import IcsHostGuard
+from backend.synchronizer.ics_transfer import IcsBodyDecoder, ics_transfer_stats
 
 logger = logging.getLogger(__name__)
 
@@ -30,6 +35,48 @@ class IcsSource(BaseModel, ABC):
         """
         pass
 
+    async def get_ics_string_async(
+        self, client: httpx.AsyncClient | None = None
+    ) -> str:
+        """
+        Retrieves the ICS calendar data without blocking the event loop.
+
+        Sources that do no network I/O return their data directly; sources that do
+        override this method.
+
+        Args:
+            client: The HTTP client to use for network sources.
+
+        Raises:
+            IcsSourceError: If there is an error retrieving the ICS data.
+        """
+        return self.get_ics_string()
+
+
+def _check_response_headers(
+    headers: Mapping[str, str],
+    max_wire_size_b: int,
+) -> None:
+    """Reject responses whose headers announce a non-text or oversized body."""
+    content_type = headers.get("Content-Type")
+    if content_type is not None and "text" not in content_type:
+        logger.info("Content-Type is not text : %s", content_type)
+        raise IcsSourceError(f"Content-Type is not text : {content_type}")
+
+    content_length = headers.get("Content-Length")
+    if content_length is not None:
+        content_length = int(content_length)
+        if content_length > max_wire_size_b:
+            requested_size_mb = content_length / 1_048_576
+            max_size_mb = max_wire_size_b / 1_048_576
+            logger.info(
+                "Content-Length is too large (%0.2fMB > %0.2fMB) (%s)",
+                requested_size_mb,
+                max_size_mb,
+                headers,
+            )
+            raise IcsSourceError("ICS file is too large.")
+
 
 class UrlIcsSource(IcsSource):
     """
@@ -38,9 +85,14 @@ class UrlIcsSource(IcsSource):
     This class handles the safe retrieval of ICS data from remote URLs,
     implementing various safety checks including:
     - Content-Type validation to ensure text-based responses
-    - Content size limits to prevent memory issues
+    - Content size limits to prevent memory issues, on both the bytes received and
+      the decompressed ones
     - Timeout controls for network requests
+    - Keep-alive connections shared by the whole process, and gzip/deflate
+      compressed transfers (see `IcsBodyDecoder`)
     - Proper UTF-8 decoding of the response
+    - A limit of concurrent requests per host, and failing fast while the host is
+      down (see `IcsHostGuard`)
 
     Attributes:
         url (HttpUrl): The URL from which to fetch the ICS calendar data.
@@ -84,14 +136,18 @@ class UrlIcsSource(IcsSource):
         *,
         timeout_s: int = settings.URL_ICS_SOURCE_TIMEOUT_S,
         max_content_size_b: int = settings.MAX_ICS_SIZE_BYTES,
+        max_wire_size_b: int = settings.MAX_ICS_WIRE_SIZE_BYTES,
+        host_guard: IcsHostGuard | None = None,
     ) -> str:
         """
         Safely fetch and return ICS calendar data from a URL.
 
         Args:
             timeout_s: Request timeout in seconds.
-            max_content_size_b: Maximum allowed size of ICS file in bytes. Preventing
-                large files from being fetched and processed.
+            max_content_size_b: Maximum allowed size of ICS file in bytes, once
+                decompressed. Preventing large files from being fetched and processed.
+            max_wire_size_b: Maximum allowed size of the response body as received.
+            host_guard: Limits and circuit breakers of the hosts, the process-wide one by default.
 
         Returns:
             str: The ICS calendar data as a string.
@@ -99,55 +155,111 @@ class UrlIcsSource(IcsSource):
         Raises:
             IcsSourceError: If there is an error fetching or processing the ICS file,
                 including timeout, size limits, or invalid content type.
+            IcsHostUnavailableError: If the host is failing or overloaded.
         """
+        host_guard = host_guard or _ics_host_guard.ics_host_guard
         logger.info("Fetching ICS file from %s", self.url)
         try:
-            with requests.get(
-                str(self.url), stream=True, timeout=timeout_s
-            ) as response:
+            with (
+                host_guard.request(str(self.url), timeout_s=timeout_s),
+                get_http_session().get(
+                    str(self.url),
+                    headers=ICS_REQUEST_HEADERS,
+                    stream=True,
+                    timeout=timeout_s,
+                ) as response,
+            ):
                 response.raise_for_status()
+                _check_response_headers(response.headers, max_wire_size_b)
+
+                decoder = IcsBodyDecoder(
+                    response.headers.get("Content-Encoding"),
+                    max_wire_size_b=max_wire_size_b,
+                    max_decoded_size_b=max_content_size_b,
+                )
+                # Wire bytes, decompressed by the decoder within its limits
+                for chunk in response.raw.stream(8192, decode_content=False):
+                    decoder.feed(chunk)
 
-                # Check the Content-Type header
-                content_type = response.headers.get("Content-Type")
-                if content_type is not None and "text" not in content_type:
-                    logger.info("Content-Type is not text : %s", content_type)
-                    raise IcsSourceError(f"Content-Type is not text : {content_type}")
-
-                # Check the Content-Length header if available
-                content_length = response.headers.get("Content-Length")
-                if content_length is not None:
-                    content_length = int(content_length)
-                    if content_length > max_content_size_b:
-                        requested_size_mb = content_length / 1_048_576
-                        max_size_mb = max_content_size_b / 1_048_576
-                        logger.info(
-                            "Content-Length is too large (%0.2fMB > %0.2fMB) (%s)",
-                            requested_size_mb,
-                            max_size_mb,
-                            response.headers,
-                        )
-                        raise IcsSourceError("ICS file is too large.")
-
-                # Use BytesIO to accumulate chunks
-                chunks = io.BytesIO()
-                total_bytes = 0
-
-                # Collect raw bytes first
-                for chunk in response.iter_content(chunk_size=8192):
-                    total_bytes += len(chunk)
-                    if total_bytes > max_content_size_b:
-                        raise IcsSourceError("ICS file is too large.")
-                    chunks.write(chunk)
-
-                # Decode all bytes at once
-                s = chunks.getvalue().decode("utf-8", errors="ignore")
-                logger.info("ICS string size: %s KB", len(s) / 1024)
-                return s
+                return self._decode_body(decoder)
 
         except requests.RequestException as e:
             logger.error("Could not fetch ICS file : %s", e)
             raise IcsSourceError(f"Could not fetch ICS file. ", original_exception=e)
 
+    def _decode_body(self, decoder: IcsBodyDecoder) -> str:
+        body = decoder.finish()
+        ics_transfer_stats.record(self.url.host or "", decoder)
+
+        s = body.decode("utf-8", errors="ignore")
+        logger.info("ICS string size: %s KB", len(s) / 1024)
+        return s
+
+    async def get_ics_string_async(
+        self,
+        client: httpx.AsyncClient | None = None,
+        *,
+        timeout_s: int = settings.URL_ICS_SOURCE_TIMEOUT_S,
+        max_content_size_b: int = settings.MAX_ICS_SIZE_BYTES,
+        max_wire_size_b: int = settings.MAX_ICS_WIRE_SIZE_BYTES,
+        host_guard: IcsHostGuard | None = None,
+    ) -> str:
+        """
+        Non-blocking counterpart of `get_ics_string`, with the same safety checks.
+
+        Args:
+            client: The HTTP client to use. Its connection pool is shared by all the
+                requests of the process; when omitted, a short-lived client is created.
+            timeout_s: Request timeout in seconds.
+            max_content_size_b: Maximum allowed size of ICS file in bytes, once
+                decompressed.
+            max_wire_size_b: Maximum allowed size of the response body as received.
+            host_guard: See `get_ics_string`.
+
+        Raises:
+            IcsSourceError: If there is an error fetching or processing the ICS file.
+            IcsHostUnavailableError: If the host is failing or overloaded.
+        """
+        if client is None:
+            async with httpx.AsyncClient() as owned_client:
+                return await self.get_ics_string_async(
+                    owned_client,
+                    timeout_s=timeout_s,
+                    max_content_size_b=max_content_size_b,
+                    max_wire_size_b=max_wire_size_b,
+                    host_guard=host_guard,
+                )
+
+        host_guard = host_guard or _ics_host_guard.ics_host_guard
+        logger.info("Fetching ICS file from %s", self.url)
+        try:
+            async with (
+                host_guard.request_async(str(self.url), timeout_s=timeout_s),
+                client.stream(
+                    "GET",
+                    str(self.url),
+                    headers=ICS_REQUEST_HEADERS,
+                    timeout=timeout_s,
+                    follow_redirects=True,
+                ) as response,
+            ):
+                response.raise_for_status()
+                _check_response_headers(response.headers, max_wire_size_b)
+
+                decoder = IcsBodyDecoder(
+                    response.headers.get("Content-Encoding"),
+                    max_wire_size_b=max_wire_size_b,
+                    max_decoded_size_b=max_content_size_b,
+                )
+                async for chunk in response.aiter_raw(chunk_size=8192):
+                    decoder.feed(chunk)
+
+                return self._decode_body(decoder)
+
+        except httpx.HTTPError as e:
+            logger.error("Could not fetch ICS file : %s", e)
+            raise IcsSourceError(f"Could not fetch ICS file. ", original_exception=e)
+
 
 class FileIcsSource(IcsSource):
     """
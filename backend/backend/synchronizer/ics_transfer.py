@@ -0,0 +1,180 @@
+import logging
+import threading
+import zlib
+from dataclasses import dataclass
+
+from backend.services.exceptions.ics import IcsSourceError
+
+logger = logging.getLogger(__name__)
+
+_GZIP_WBITS = 16 + zlib.MAX_WBITS
+_RAW_DEFLATE_WBITS = -zlib.MAX_WBITS
+
+
+class IcsBodyDecoder:
+    """
+    Decodes an ICS response body from the bytes received on the wire, enforcing a
+    limit on both the wire and the decoded size.
+
+    The body is decompressed chunk by chunk, never producing more than the remaining
+    decoded budget at once: a small compressed body expanding to gigabytes is
+    rejected after `max_decoded_size_b` bytes, instead of being inflated in memory.
+
+    Supports the encodings advertised in `ICS_REQUEST_HEADERS`: gzip and deflate,
+    the latter with or without its zlib wrapper (servers disagree on it).
+
+    Usage:
+        decoder = IcsBodyDecoder(response.headers.get("Content-Encoding"), ...)
+        for chunk in wire_chunks:
+            decoder.feed(chunk)
+        body = decoder.finish()
+    """
+
+    def __init__(
+        self,
+        content_encoding: str | None,
+        *,
+        max_wire_size_b: int,
+        max_decoded_size_b: int,
+    ) -> None:
+        self.content_encoding = (content_encoding or "identity").strip().lower()
+        self.wire_bytes = 0
+        self.decoded_bytes = 0
+        self._max_wire_size_b = max_wire_size_b
+        self._max_decoded_size_b = max_decoded_size_b
+        self._chunks: list[bytes] = []
+
+        match self.content_encoding:
+            case "identity" | "":
+                self._decompressor = None
+            case "gzip" | "x-gzip":
+                self._decompressor = zlib.decompressobj(_GZIP_WBITS)
+            case "deflate":
+                self._decompressor = zlib.decompressobj(zlib.MAX_WBITS)
+            case _:
+                raise IcsSourceError(
+                    f"Unsupported Content-Encoding : {self.content_encoding}"
+                )
+
+    @property
+    def is_compressed(self) -> bool:
+        return self._decompressor is not None
+
+    def feed(self, chunk: bytes) -> None:
+        """
+        Raises:
+            IcsSourceError: If a size limit is exceeded or the body is corrupted.
+        """
+        self.wire_bytes += len(chunk)
+        if self.wire_bytes > self._max_wire_size_b:
+            raise IcsSourceError("ICS file is too large.")
+
+        if self._decompressor is None:
+            self._write(chunk)
+            return
+
+        try:
+            self._decompress(chunk)
+        except zlib.error as e:
+            raise IcsSourceError("Could not decompress ICS file.", original_exception=e)
+
+    def _decompress(self, chunk: bytes) -> None:
+        decompressor = self._decompressor
+        assert decompressor is not None  # Only called for encoded bodies
+        while chunk:
+            # One byte over the budget is enough to detect an oversized body
+            max_length = self._max_decoded_size_b - self.decoded_bytes + 1
+            try:
+                data = decompressor.decompress(chunk, max_length)
+            except zlib.error:
+                if self.content_encoding != "deflate" or self.decoded_bytes:
+                    raise
+                # Raw deflate stream, without the zlib wrapper
+                self.content_encoding = "deflate-raw"
+                decompressor = self._decompressor = zlib.decompressobj(
+                    _RAW_DEFLATE_WBITS
+                )
+                continue
+            self._write(data)
+            chunk = decompressor.unconsumed_tail
+
+    def _write(self, data: bytes) -> None:
+        self.decoded_bytes += len(data)
+        if self.decoded_bytes > self._max_decoded_size_b:
+            raise IcsSourceError("ICS file is too large.")
+        self._chunks.append(data)
+
+    def finish(self) -> bytes:
+        """
+        The decoded body, once all the wire chunks were fed.
+
+        Raises:
+            IcsSourceError: If the compressed body is truncated.
+        """
+        if self._decompressor is not None:
+            if not self._decompressor.eof:
+                raise IcsSourceError("Could not decompress ICS file: it is truncated.")
+            self._write(self._decompressor.flush())
+        return b"".join(self._chunks)
+
+
+@dataclass
+class HostTransferStats:
+    downloads: int = 0
+    compressed_downloads: int = 0
+    wire_bytes: int = 0
+    decoded_bytes: int = 0
+
+    @property
+    def compression_ratio(self) -> float:
+        """Decoded bytes per byte received, 1.0 for a host that never compresses."""
+        return self.decoded_bytes / self.wire_bytes if self.wire_bytes else 1.0
+
+
+class IcsTransferStats:
+    """
+    Bytes received and decoded per host, to follow which timetable servers compress
+    their feeds and by how much. Each download is also logged with its own ratio.
+
+    Thread-safe.
+    """
+
+    def __init__(self) -> None:
+        self._hosts: dict[str, HostTransferStats] = {}
+        self._lock = threading.Lock()
+
+    def record(self, host: str, decoder: IcsBodyDecoder) -> None:
+        with self._lock:
+            stats = self._hosts.setdefault(host, HostTransferStats())
+            stats.downloads += 1
+            stats.compressed_downloads += decoder.is_compressed
+            stats.wire_bytes += decoder.wire_bytes
+            stats.decoded_bytes += decoder.decoded_bytes
+            host_ratio = stats.compression_ratio
+
+        logger.info(
+            "ICS file downloaded",
+            extra={
+                "host": host,
+                "content_encoding": decoder.content_encoding,
+                "wire_bytes": decoder.wire_bytes,
+                "decoded_bytes": decoder.decoded_bytes,
+                "compression_ratio": (
+                    decoder.decoded_bytes / decoder.wire_bytes
+                    if decoder.wire_bytes
+                    else 1.0
+                ),
+                "host_compression_ratio": host_ratio,
+            },
+        )
+
+    def snapshot(self) -> dict[str, HostTransferStats]:
+        with self._lock:
+            return {
+                host: HostTransferStats(**vars(stats))
+                for host, stats in self._hosts.items()
+            }
+
+
+ics_transfer_stats = IcsTransferStats()
+"""Shared by all the ICS downloads of the process."""
@@ -0,0 +1,460 @@
+import bisect
+import json
+import logging
+import random
+import re
+import threading
+import time
+import uuid
+from collections import Counter, deque
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Iterable, Mapping
+from urllib.parse import parse_qs, unquote, urlsplit
+
+import httplib2
+from googleapiclient.discovery import Resource, build_from_document
+from googleapiclient.discovery_cache import get_static_doc
+
+from backend.shared.event import to_epoch_us
+
+logger = logging.getLogger(__name__)
+
+_SERVICE_PATH = "/calendar/v3/"
+_BATCH_PATH = "/batch/calendar/v3"
+_SYNCADEMIC_PROPERTY = "syncademic"
+_BOUNDARY_RE = re.compile(r'boundary="?([^";]+)"?')
+_CONTENT_ID_RE = re.compile(rb"^content-id:\s*<(.*)>\s*$", re.IGNORECASE | re.MULTILINE)
+_BLANK_LINE_RE = re.compile(rb"\r?\n\r?\n")
+
+_ERROR_REASONS = {
+    403: ("rateLimitExceeded", "Rate Limit Exceeded"),
+    404: ("notFound", "Not Found"),
+    429: ("rateLimitExceeded", "Rate Limit Exceeded"),
+    500: ("backendError", "Backend Error"),
+    503: ("backendError", "Backend Error"),
+}
+
+
+def _parse_event_time(value: Mapping[str, str]) -> int:
+    """Epoch microseconds of the `start`/`end` of an event body, all-day dates in UTC."""
+    if date_time := value.get("dateTime"):
+        return to_epoch_us(datetime.fromisoformat(date_time))
+    date = datetime.fromisoformat(value["date"])
+    return to_epoch_us(date.replace(tzinfo=timezone.utc))
+
+
+def _error_body(status: int) -> dict[str, Any]:
+    reason, message = _ERROR_REASONS.get(status, ("backendError", "Error"))
+    return {
+        "error": {
+            "code": status,
+            "message": message,
+            "errors": [{"domain": "global", "reason": reason, "message": message}],
+        }
+    }
+
+
+class LocalCalendarStore:
+    """
+    The calendars and events of the stand-in, in memory.
+
+    Events are indexed by calendar, then by the sync profile of their `syncademic`
+    private extended property, sorted by end time: listing the events of a profile
+    ending after a date is a binary search, whatever the number of events stored.
+
+    Thread-safe.
+    """
+
+    def __init__(self) -> None:
+        self._calendars: set[str] = set()
+        # calendar_id -> event_id -> (event, start_us, end_us)
+        self._events: dict[str, dict[str, tuple[dict[str, Any], int, int]]] = {}
+        # (calendar_id, sync_profile_id) -> sorted [(end_us, event_id)]
+        self._by_profile: dict[tuple[str, str | None], list[tuple[int, str]]] = {}
+        self._lock = threading.Lock()
+
+    def add_calendar(self, calendar_id: str) -> None:
+        with self._lock:
+            self._calendars.add(calendar_id)
+            self._events.setdefault(calendar_id, {})
+
+    def has_calendar(self, calendar_id: str) -> bool:
+        with self._lock:
+            return calendar_id in self._calendars
+
+    @staticmethod
+    def _profile_of(event: Mapping[str, Any]) -> str | None:
+        private = event.get("extendedProperties", {}).get("private", {})
+        return private.get(_SYNCADEMIC_PROPERTY)
+
+    def insert(self, calendar_id: str, body: dict[str, Any]) -> dict[str, Any] | None:
+        """The created event, or None if the calendar does not exist."""
+        event = {**body, "id": uuid.uuid4().hex, "status": "confirmed"}
+        start_us = _parse_event_time(event["start"])
+        end_us = _parse_event_time(event["end"])
+        with self._lock:
+            if calendar_id not in self._calendars:
+                return None
+            self._events[calendar_id][event["id"]] = (event, start_us, end_us)
+            bisect.insort(
+                self._by_profile.setdefault((calendar_id, self._profile_of(event)), []),
+                (end_us, event["id"]),
+            )
+        return event
+
+    def delete(self, calendar_id: str, event_id: str) -> bool:
+        """Whether the event existed."""
+        with self._lock:
+            stored = self._events.get(calendar_id, {}).pop(event_id, None)
+            if stored is None:
+                return False
+            event, _, end_us = stored
+            index = self._by_profile[(calendar_id, self._profile_of(event))]
+            del index[bisect.bisect_left(index, (end_us, event_id))]
+            return True
+
+    def list(
+        self,
+        calendar_id: str,
+        *,
+        sync_profile_id: str | None = None,
+        min_us: int | None = None,
+        max_us: int | None = None,
+    ) -> list[dict[str, Any]] | None:
+        """
+        The events ending after `min_us` and starting before `max_us` (both exclusive),
+        sorted by start time. None if the calendar does not exist.
+        """
+        with self._lock:
+            if calendar_id not in self._calendars:
+                return None
+            events = self._events[calendar_id]
+            if sync_profile_id is None:
+                indexes: Iterable[list[tuple[int, str]]] = [
+                    index
+                    for (index_calendar_id, _), index in self._by_profile.items()
+                    if index_calendar_id == calendar_id
+                ]
+            else:
+                indexes = [self._by_profile.get((calendar_id, sync_profile_id), [])]
+
+            matches = []
+            for index in indexes:
+                first = (
+                    0
+                    if min_us is None
+                    else bisect.bisect_right(index, min_us, key=lambda e: e[0])
+                )
+                for _, event_id in index[first:]:
+                    event, start_us, _ = events[event_id]
+                    if max_us is None or start_us < max_us:
+                        matches.append((start_us, event))
+
+        matches.sort(key=lambda match: match[0])
+        return [event for _, event in matches]
+
+    def count(self, calendar_id: str) -> int:
+        with self._lock:
+            return len(self._events.get(calendar_id, {}))
+
+
+class FaultInjector:
+    """
+    Errors answered in place of the API. Each request of a batch is drawn
+    separately, as the API fails them independently.
+
+    Errors are drawn at random with the probability of each status in `rates`, from a
+    seeded generator so that a load test fails the same requests on every run, or
+    taken in order from the statuses scripted with `fail_next`.
+
+    Thread-safe.
+    """
+
+    def __init__(self, rates: Mapping[int, float] | None = None, seed: int = 0) -> None:
+        self._rates = dict(rates or {})
+        self._random = random.Random(seed)
+        self._scripted: deque[int] = deque()
+        self._lock = threading.Lock()
+
+    def fail_next(self, *statuses: int) -> None:
+        """Answer the next requests with these statuses, before any random error."""
+        with self._lock:
+            self._scripted.extend(statuses)
+
+    def next_error(self) -> int | None:
+        with self._lock:
+            if self._scripted:
+                return self._scripted.popleft()
+            draw = self._random.random()
+            for status, rate in self._rates.items():
+                if draw < rate:
+                    return status
+                draw -= rate
+            return None
+
+
+@dataclass
+class LocalCalendarStats:
+    http_requests: int = 0
+    operations: Counter[str] = field(default_factory=Counter)
+    errors: Counter[int] = field(default_factory=Counter)
+
+
+class LocalGoogleCalendarServer:
+    """
+    A local HTTP stand-in for the Google Calendar v3 API, to run the real
+    `GoogleCalendarManager` (batches, `list_next` paging, error handling of the
+    client library) against thousands of events without a Google account.
+
+    Supports:
+    - `calendars.get`, and `events.insert`/`events.delete`/`events.list` of the
+      calendars added with `store.add_calendar`,
+    - batch requests, answered part by part,
+    - `privateExtendedProperty=syncademic=<id>`, `timeMin`/`timeMax`, `maxResults`
+      and `pageToken` in `events.list`,
+    - a `latency_s` delay before answering every HTTP request,
+    - errors injected by `faults` (see `FaultInjector`), with the bodies of the API.
+
+    `stats` counts the HTTP requests, operations and errors answered: with no batch
+    callback, the client library drops the errors of batched requests silently.
+
+    Usage:
+        with LocalGoogleCalendarServer(latency_s=0.05) as server:
+            server.store.add_calendar("calendar-id")
+            manager = GoogleCalendarManager(server.build_service(), "calendar-id")
+            ...
+    """
+
+    def __init__(
+        self,
+        *,
+        latency_s: float = 0.0,
+        faults: FaultInjector | None = None,
+        store: LocalCalendarStore | None = None,
+    ) -> None:
+        self.latency_s = latency_s
+        self.faults = faults or FaultInjector()
+        self.store = store or LocalCalendarStore()
+        self.stats = LocalCalendarStats()
+        self._stats_lock = threading.Lock()
+        self._server: ThreadingHTTPServer | None = None
+
+    @property
+    def url(self) -> str:
+        assert self._server is not None, "The server is not started"
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/"
+
+    def start(self) -> None:
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._handler_class())
+        self._server.daemon_threads = True
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+        logger.info("Local Google Calendar API listening on %s", self.url)
+
+    def stop(self) -> None:
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def __enter__(self) -> "LocalGoogleCalendarServer":
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.stop()
+
+    def build_service(self) -> Resource:
+        """A Calendar API client of the client library, sending its requests here."""
+        document = json.loads(get_static_doc("calendar", "v3"))
+        # The batch endpoint is derived from rootUrl, which `api_endpoint` ignores
+        document["rootUrl"] = self.url
+        document["baseUrl"] = self.url + _SERVICE_PATH.lstrip("/")
+        return build_from_document(document, http=httplib2.Http())
+
+    def _record(self, operation: str, status: int) -> None:
+        with self._stats_lock:
+            self.stats.operations[operation] += 1
+            if status >= 400:
+                self.stats.errors[status] += 1
+
+    def handle(
+        self, method: str, target: str, body: bytes
+    ) -> tuple[int, dict[str, Any] | None]:
+        """Answers one (non-batch) request: its status and JSON body."""
+        url = urlsplit(target)
+        if not url.path.startswith(_SERVICE_PATH):
+            return 404, _error_body(404)
+        parts = [unquote(part) for part in url.path[len(_SERVICE_PATH) :].split("/")]
+        query = {key: values[0] for key, values in parse_qs(url.query).items()}
+
+        match method, parts:
+            case "GET", ["calendars", calendar_id]:
+                operation = "calendars.get"
+            case "POST", ["calendars", calendar_id, "events"]:
+                operation = "events.insert"
+            case "GET", ["calendars", calendar_id, "events"]:
+                operation = "events.list"
+            case "DELETE", ["calendars", calendar_id, "events", event_id]:
+                operation = "events.delete"
+            case _:
+                return 404, _error_body(404)
+
+        if (status := self.faults.next_error()) is not None:
+            self._record(operation, status)
+            return status, _error_body(status)
+
+        status, response = self._dispatch(operation, calendar_id, parts, query, body)
+        self._record(operation, status)
+        return status, response
+
+    def _dispatch(
+        self,
+        operation: str,
+        calendar_id: str,
+        parts: list[str],
+        query: dict[str, str],
+        body: bytes,
+    ) -> tuple[int, dict[str, Any] | None]:
+        match operation:
+            case "calendars.get":
+                if not self.store.has_calendar(calendar_id):
+                    return 404, _error_body(404)
+                return 200, {"kind": "calendar#calendar", "id": calendar_id}
+
+            case "events.insert":
+                event = self.store.insert(calendar_id, json.loads(body))
+                if event is None:
+                    return 404, _error_body(404)
+                return 200, event
+
+            case "events.delete":
+                if not self.store.delete(calendar_id, parts[3]):
+                    return 404, _error_body(404)
+                return 204, None
+
+            case "events.list":
+                return self._list_events(calendar_id, query)
+
+        raise AssertionError(operation)
+
+    def _list_events(
+        self, calendar_id: str, query: dict[str, str]
+    ) -> tuple[int, dict[str, Any] | None]:
+        sync_profile_id = None
+        if private_property := query.get("privateExtendedProperty"):
+            name, _, sync_profile_id = private_property.partition("=")
+            if name != _SYNCADEMIC_PROPERTY:
+                return 200, {"kind": "calendar#events", "items": []}
+
+        events = self.store.list(
+            calendar_id,
+            sync_profile_id=sync_profile_id,
+            min_us=to_epoch_us(datetime.fromisoformat(query["timeMin"]))
+            if "timeMin" in query
+            else None,
+            max_us=to_epoch_us(datetime.fromisoformat(query["timeMax"]))
+            if "timeMax" in query
+            else None,
+        )
+        if events is None:
+            return 404, _error_body(404)
+
+        # The API caps pages at 2500 events
+        page_size = min(int(query.get("maxResults", 250)), 2500)
+        offset = int(query.get("pageToken", 0))
+        response: dict[str, Any] = {
+            "kind": "calendar#events",
+            "items": events[offset : offset + page_size],
+        }
+        if offset + page_size < len(events):
+            response["nextPageToken"] = str(offset + page_size)
+        return 200, response
+
+    @staticmethod
+    def _split_batch(content_type: str, body: bytes) -> Iterable[tuple[str, bytes]]:
+        """
+        The Content-ID and embedded HTTP request of each part of a batch. Split
+        directly rather than with the `email` package, many times slower on
+        batches of hundreds of parts.
+        """
+        match = _BOUNDARY_RE.search(content_type)
+        if match is None:
+            raise ValueError(f"No boundary in {content_type!r}")
+        delimiter = b"--" + match.group(1).encode()
+        for part in body.split(delimiter)[1:]:
+            if part.startswith(b"--"):
+                break
+            headers, request = _BLANK_LINE_RE.split(part, maxsplit=1)
+            content_id = _CONTENT_ID_RE.search(headers)
+            if content_id is None:
+                raise ValueError("Batch part without Content-ID")
+            yield content_id.group(1).decode(), request
+
+    def handle_batch(self, content_type: str, body: bytes) -> tuple[str, bytes]:
+        """Answers a multipart/mixed batch: the content type and body of the response."""
+        boundary = f"batch_{uuid.uuid4().hex}"
+        chunks = []
+        for content_id, request in self._split_batch(content_type, body):
+            head, request_body = (_BLANK_LINE_RE.split(request, maxsplit=1) + [b""])[:2]
+            method, target, _ = head.split(b"\n", 1)[0].decode().split(" ", 2)
+            status, response = self.handle(method, target, request_body.rstrip())
+
+            response_body = json.dumps(response) if response is not None else ""
+            chunks.append(
+                f"--{boundary}\r\n"
+                "Content-Type: application/http\r\n"
+                f"Content-ID: <response-{content_id}>\r\n\r\n"
+                f"HTTP/1.1 {status} {'OK' if status < 400 else 'Error'}\r\n"
+                "Content-Type: application/json; charset=UTF-8\r\n\r\n"
+                f"{response_body}\r\n"
+            )
+        chunks.append(f"--{boundary}--\r\n")
+        return f"multipart/mixed; boundary={boundary}", "".join(chunks).encode()
+
+    def _handler_class(self) -> type[BaseHTTPRequestHandler]:
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            # Headers and body are written separately: without this, each response
+            # of a keep-alive connection waits for the delayed ACK of the client
+            disable_nagle_algorithm = True
+
+            def _respond(self, status: int, content_type: str, body: bytes) -> None:
+                self.send_response(status)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def _serve(self) -> None:
+                length = int(self.headers.get("Content-Length", 0))
+                body = self.rfile.read(length) if length else b""
+                with server._stats_lock:
+                    server.stats.http_requests += 1
+                if server.latency_s:
+                    time.sleep(server.latency_s)
+
+                if self.command == "POST" and self.path == _BATCH_PATH:
+                    content_type, response = server.handle_batch(
+                        self.headers["Content-Type"], body
+                    )
+                    self._respond(200, content_type, response)
+                    return
+
+                status, response = server.handle(self.command, self.path, body)
+                self._respond(
+                    status,
+                    "application/json; charset=UTF-8",
+                    json.dumps(response).encode() if response is not None else b"",
+                )
+
+            do_GET = do_POST = do_DELETE = _serve  # noqa: N815
+
+            def log_message(self, format: str, *args: Any) -> None:
+                pass
+
+        return Handler
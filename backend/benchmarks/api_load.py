@@ -0,0 +1,204 @@
+"""Load test `POST /ics/validate` with concurrent requests.
+
+Compares the previous implementation of the endpoint (a sync `def` that blocks a
+server thread while it downloads the ICS file with `requests`) with the async one
+of `backend.api`, both driven in-process through an ASGI transport. The ICS file is
+served by a local HTTP server that waits `--upstream-latency-ms` before answering,
+like a slow university timetable export.
+
+No Firebase or Google service is contacted, but `backend.settings` still needs its
+required environment variables (any value works):
+
+    CLIENT_SECRET=x OPENAI_API_KEY=x FIREBASE_STORAGE_BUCKET=x \\
+        uv run python -m benchmarks.api_load --concurrency 10 50 200
+"""
+
+import argparse
+import json
+import logging
+import statistics
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, cast
+
+import anyio
+import httpx
+from fastapi import Depends, FastAPI
+
+from backend.api import (
+    DomainServices,
+    UserInfo,
+    app as async_app,
+    get_current_user,
+    get_domain_services,
+)
+from backend.infrastructure.blocking_io import BlockingIoRunner
+from backend.infrastructure.event_bus import LocalEventBus
+from backend.models.schemas import ValidateIcsUrlInput, ValidateIcsUrlOutput
+from backend.services.ics_service import IcsService
+from backend.shared import domain_events
+from backend.synchronizer.ics_source import UrlIcsSource
+from benchmarks.synthetic import generate_ics
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CONCURRENCY = [10, 50, 200]
+
+
+def _start_ics_server(ics: str, latency_s: float) -> ThreadingHTTPServer:
+    body = ics.encode()
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self) -> None:  # noqa: N802
+            time.sleep(latency_s)
+            self.send_response(200)
+            self.send_header("Content-Type", "text/calendar")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format: str, *args: Any) -> None:
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    server.daemon_threads = True
+    server.request_queue_size = 1024
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def _build_sync_app() -> FastAPI:
+    """The endpoint as it was before it became async."""
+    sync_app = FastAPI()
+
+    @sync_app.post("/ics/validate", response_model=ValidateIcsUrlOutput)
+    def validate_ics_url_endpoint(
+        payload: ValidateIcsUrlInput,
+        current_user: UserInfo = Depends(get_current_user),
+        services: DomainServices = Depends(get_domain_services),
+    ) -> ValidateIcsUrlOutput:
+        return services.ics_service.validate_ics_url(
+            UrlIcsSource.from_str(payload.url),
+            metadata={"user_id": current_user.uid},
+        )
+
+    return sync_app
+
+
+def _install_services(target: FastAPI, http_client: httpx.AsyncClient) -> None:
+    """Only the ICS service is used by the endpoint; the rest stays unset."""
+    target.state.domain_services = DomainServices(
+        ics_service=IcsService(
+            event_bus=LocalEventBus(handlers={domain_events.IcsFetched: []})
+        ),
+        authorization_service=cast(Any, None),
+        google_calendar_service=cast(Any, None),
+        sync_profile_service=cast(Any, None),
+        job_executor=cast(Any, None),
+        blocking_io=BlockingIoRunner(max_threads=1),
+        http_client=http_client,
+        firebase_public_keys=cast(Any, None),
+        id_token_verifier=cast(Any, None),
+        sync_job_queue=cast(Any, None),
+        sync_workers=cast(Any, None),
+        dev_notification_service=cast(Any, None),
+    )
+    target.dependency_overrides[get_current_user] = lambda: UserInfo(uid="load-test")
+
+
+async def _load(
+    target: FastAPI, ics_url: str, concurrency: int, n_requests: int
+) -> dict[str, float]:
+    latencies: list[float] = []
+    semaphore = anyio.Semaphore(concurrency)
+    transport = httpx.ASGITransport(app=target)
+
+    async with (
+        httpx.AsyncClient(limits=httpx.Limits(max_connections=None)) as upstream,
+        httpx.AsyncClient(transport=transport, base_url="http://api") as client,
+    ):
+        _install_services(target, upstream)
+
+        async def one_request() -> None:
+            async with semaphore:
+                t0 = time.perf_counter()
+                response = await client.post("/ics/validate", json={"url": ics_url})
+                response.raise_for_status()
+                assert response.json()["valid"], response.text
+                latencies.append(time.perf_counter() - t0)
+
+        t0 = time.perf_counter()
+        async with anyio.create_task_group() as tg:
+            for _ in range(n_requests):
+                tg.start_soon(one_request)
+        elapsed = time.perf_counter() - t0
+
+    latencies.sort()
+    return {
+        "requests_per_s": n_requests / elapsed,
+        "p50_ms": statistics.median(latencies) * 1000,
+        "p95_ms": latencies[int(0.95 * (len(latencies) - 1))] * 1000,
+    }
+
+
+def run(
+    concurrency_levels: list[int],
+    *,
+    n_requests: int,
+    n_events: int,
+    upstream_latency_ms: int,
+) -> dict[str, dict[int, dict[str, float]]]:
+    """Return throughput and latency of each implementation per concurrency level."""
+    server = _start_ics_server(generate_ics(n_events), upstream_latency_ms / 1000)
+    ics_url = f"http://127.0.0.1:{server.server_address[1]}/calendar.ics"
+
+    results: dict[str, dict[int, dict[str, float]]] = {}
+    try:
+        for name, target in [("sync", _build_sync_app()), ("async", async_app)]:
+            results[name] = {}
+            for concurrency in concurrency_levels:
+                stats = anyio.run(_load, target, ics_url, concurrency, n_requests)
+                results[name][concurrency] = stats
+                logger.info(
+                    "%-5s concurrency=%-4s %7.1f req/s  p50=%6.0fms  p95=%6.0fms",
+                    name,
+                    concurrency,
+                    stats["requests_per_s"],
+                    stats["p50_ms"],
+                    stats["p95_ms"],
+                )
+    finally:
+        server.shutdown()
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument(
+        "--concurrency", type=int, nargs="+", default=DEFAULT_CONCURRENCY
+    )
+    parser.add_argument("--requests", type=int, default=300)
+    parser.add_argument("--events", type=int, default=1)
+    parser.add_argument("--upstream-latency-ms", type=int, default=500)
+    parser.add_argument("--output", help="Write the results to this JSON file")
+    args = parser.parse_args()
+
+    # Importing `backend.api` configured the root logger; keep only the results
+    logging.getLogger().setLevel(logging.WARNING)
+    logger.setLevel(logging.INFO)
+    results = run(
+        args.concurrency,
+        n_requests=args.requests,
+        n_events=args.events,
+        upstream_latency_ms=args.upstream_latency_ms,
+    )
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,150 @@
+"""Benchmark the allocation and throughput of `Event` on the sync hot path.
+
+Measures, for a synthetic feed of each size:
+- build: creating the events from freshly parsed Arrow start/end, as the ICS
+  parser does,
+- rules: applying a ruleset of `--rules` rules (each event matches about a third of
+  them, every matching rule changing a field and the color),
+- filter: the REGULAR sync filter of events ending after now,
+- batch rules / batch filter: the same on an `EventBatch` of the feed, as the sync
+  runs them.
+
+Memory is the size retained by the built events (including whatever they keep of
+their start/end), measured with tracemalloc.
+
+Usage (from the `backend` directory):
+
+    uv run python -m benchmarks.event_model --sizes 1000 10000 --rules 30
+"""
+
+import argparse
+import logging
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from typing import Any, Callable
+
+import arrow
+
+from backend.models.rules import (
+    ChangeColorAction,
+    ChangeFieldAction,
+    Rule,
+    Ruleset,
+    TextFieldCondition,
+)
+from backend.shared.event import Event, to_epoch_us
+from backend.shared.event_batch import EventBatch
+from backend.shared.google_calendar_colors import GoogleEventColor
+from benchmarks.synthetic import _SUBJECTS, generate_events
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SIZES = [1_000, 10_000]
+
+
+def build_ruleset(n_rules: int) -> Ruleset:
+    colors = list(GoogleEventColor)
+    kinds = ["CM", "TD", "TP"]
+    return Ruleset(
+        rules=[
+            Rule(
+                condition=TextFieldCondition(
+                    field="title",
+                    operator="contains",
+                    value=kinds[i % len(kinds)]
+                    if i % 2
+                    else _SUBJECTS[i % len(_SUBJECTS)],
+                ),
+                actions=[
+                    ChangeFieldAction(field="title", method="prepend", value="[R] "),
+                    ChangeColorAction(value=colors[i % len(colors)]),
+                ],
+            )
+            for i in range(n_rules)
+        ]
+    )
+
+
+def _best_time(func: Callable[[], Any], repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - t0)
+    return min(timings)
+
+
+def run(sizes: list[int], n_rules: int = 30, repeat: int = 3) -> dict[int, dict]:
+    ruleset = build_ruleset(n_rules)
+    now = datetime.now(timezone.utc)
+    now_us = to_epoch_us(now)
+    results: dict[int, dict] = {}
+    for size in sizes:
+        template = generate_events(size)
+        bounds = [
+            (event.start.datetime, event.end.datetime, event.title)
+            for event in template
+        ]
+
+        def build() -> list[Event]:
+            return [
+                Event(
+                    start=arrow.Arrow.fromdatetime(start),
+                    end=arrow.Arrow.fromdatetime(end),
+                    title=title,
+                )
+                for start, end, title in bounds
+            ]
+
+        tracemalloc.start()
+        before, _ = tracemalloc.get_traced_memory()
+        events = build()
+        after, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        batch = EventBatch.from_events(template)
+        result = {
+            "bytes_per_event": (after - before) / size,
+            "build_s": _best_time(build, repeat),
+            "rules_s": _best_time(lambda: ruleset.apply(template), repeat),
+            "filter_s": _best_time(
+                lambda: [event for event in template if event.end_us > now_us], repeat
+            ),
+            "batch_rules_s": _best_time(lambda: ruleset.apply_batch(batch), repeat),
+            "batch_filter_s": _best_time(
+                lambda: batch.in_window(ending_after=now), repeat
+            ),
+        }
+        del events
+        results[size] = result
+        logger.info(
+            "%6s events: %5.0f B/event, build %.3fs, %s rules %.3fs, filter %.4fs"
+            " | batch: rules %.4fs, filter %.5fs",
+            size,
+            result["bytes_per_event"],
+            result["build_s"],
+            n_rules,
+            result["rules_s"],
+            result["filter_s"],
+            result["batch_rules_s"],
+            result["batch_filter_s"],
+        )
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES)
+    parser.add_argument("--rules", type=int, default=30)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    run(args.sizes, n_rules=args.rules, repeat=args.repeat)
+
+
+if __name__ == "__main__":
+    main()
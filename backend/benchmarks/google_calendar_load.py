@@ -0,0 +1,117 @@
+"""Load test `GoogleCalendarManager` against a local stand-in of the Calendar API.
+
+For a synthetic feed of each size, creates every event, lists them back and deletes
+them through the client library, against a `LocalGoogleCalendarServer` answering
+after `--latency-ms` and failing `--error-rate` of the requests with 429 or 503.
+
+Reports the time of each step, the HTTP requests sent, and the events lost to the
+injected errors (the manager sends batches without a callback, so the errors of
+batched requests are not raised).
+
+Usage (from the `backend` directory):
+
+    CLIENT_SECRET=x OPENAI_API_KEY=x FIREBASE_STORAGE_BUCKET=x \\
+        uv run python -m benchmarks.google_calendar_load --sizes 1000 10000 \\
+        --latency-ms 50 --error-rate 0.01
+"""
+
+import argparse
+import json
+import logging
+import time
+
+from googleapiclient.errors import HttpError
+
+from backend.synchronizer.google_calendar_manager import GoogleCalendarManager
+from backend.synchronizer.local_google_calendar import (
+    FaultInjector,
+    LocalGoogleCalendarServer,
+)
+from benchmarks.synthetic import generate_events
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SIZES = [1_000, 10_000]
+CALENDAR_ID = "benchmark-calendar"
+SYNC_PROFILE_ID = "benchmark-sync-profile"
+
+
+def _list_ids(manager: GoogleCalendarManager, attempts: int = 5) -> list[str]:
+    """Listing raises on an injected error: try again, to delete the events anyway."""
+    for attempt in range(attempts):
+        try:
+            return manager.get_events_ids_from_sync_profile(
+                sync_profile_id=SYNC_PROFILE_ID
+            )
+        except HttpError:
+            if attempt == attempts - 1:
+                raise
+    raise AssertionError("unreachable")
+
+
+def run(
+    sizes: list[int], *, latency_ms: int, error_rate: float
+) -> dict[int, dict[str, float]]:
+    results: dict[int, dict[str, float]] = {}
+    for size in sizes:
+        events = generate_events(size)
+        faults = FaultInjector({429: error_rate / 2, 503: error_rate / 2})
+        with LocalGoogleCalendarServer(
+            latency_s=latency_ms / 1000, faults=faults
+        ) as server:
+            server.store.add_calendar(CALENDAR_ID)
+            manager = GoogleCalendarManager(server.build_service(), CALENDAR_ID)
+
+            t0 = time.perf_counter()
+            manager.create_events(events, sync_profile_id=SYNC_PROFILE_ID)
+            t1 = time.perf_counter()
+            ids = _list_ids(manager)
+            t2 = time.perf_counter()
+            manager.delete_events(ids)
+            t3 = time.perf_counter()
+
+            result = {
+                "create_s": t1 - t0,
+                "list_s": t2 - t1,
+                "delete_s": t3 - t2,
+                "http_requests": server.stats.http_requests,
+                "errors": sum(server.stats.errors.values()),
+                "events_lost": size - len(ids),
+                "events_left": server.store.count(CALENDAR_ID),
+            }
+        results[size] = result
+        logger.info(
+            "%6s events: create %.2fs, list %.2fs, delete %.2fs, %s HTTP requests,"
+            " %s errors, %s events not created, %s not deleted",
+            size,
+            result["create_s"],
+            result["list_s"],
+            result["delete_s"],
+            result["http_requests"],
+            result["errors"],
+            result["events_lost"],
+            result["events_left"],
+        )
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES)
+    parser.add_argument("--latency-ms", type=int, default=0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--output", help="Write the results to this JSON file")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    logging.getLogger("backend").setLevel(logging.WARNING)
+    results = run(args.sizes, latency_ms=args.latency_ms, error_rate=args.error_rate)
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+"""Benchmark turning events into Google Calendar API bodies.
+
+Compares, for a synthetic feed of each size:
+- arrow: the former serialization, formatting start/end with
+  `arrow.format("YYYY-MM-DDTHH:mm:ssZZ")` and building the extended properties for
+  every event,
+- serialize: `GoogleCalendarManager.serialize_events`, as `create_events` runs it
+  before dispatching the batches, starting each run with empty formatting caches.
+
+Usage (from the `backend` directory):
+
+    uv run python -m benchmarks.google_payloads --sizes 1000 10000
+"""
+
+import argparse
+import logging
+import time
+from typing import Any, Callable
+
+from backend.shared.event import Event
+from backend.synchronizer import google_calendar_manager
+from backend.synchronizer.google_calendar_manager import GoogleCalendarManager
+from benchmarks.synthetic import generate_events
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SIZES = [1_000, 10_000]
+SYNC_PROFILE_ID = "benchmark-sync-profile"
+
+
+def arrow_serialize(events: list[Event]) -> list[dict]:
+    bodies = []
+    for event in events:
+        if event.is_all_day:
+            start = {"date": event.start.strftime("%Y-%m-%d")}
+            end = {"date": event.end.strftime("%Y-%m-%d")}
+        else:
+            start = {"dateTime": event.start.format("YYYY-MM-DDTHH:mm:ssZZ")}
+            end = {"dateTime": event.end.format("YYYY-MM-DDTHH:mm:ssZZ")}
+        body = {
+            "summary": event.title,
+            "description": event.description,
+            "start": start,
+            "end": end,
+            "location": event.location,
+            "extendedProperties": {"private": {"syncademic": SYNC_PROFILE_ID}},
+        }
+        if event.color:
+            body["colorId"] = event.color.to_color_id()
+        bodies.append(body)
+    return bodies
+
+
+def serialize(events: list[Event]) -> list[dict]:
+    google_calendar_manager._format_date_time.cache_clear()
+    google_calendar_manager._format_date.cache_clear()
+    return GoogleCalendarManager.serialize_events(
+        events, sync_profile_id=SYNC_PROFILE_ID
+    )
+
+
+def _best_time(func: Callable[[], Any], repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - t0)
+    return min(timings)
+
+
+def run(sizes: list[int], repeat: int = 3) -> dict[int, dict[str, float]]:
+    results: dict[int, dict[str, float]] = {}
+    for size in sizes:
+        events = generate_events(size)
+        assert arrow_serialize(events) == serialize(events)
+
+        result = {
+            "arrow_s": _best_time(lambda: arrow_serialize(events), repeat),
+            "serialize_s": _best_time(lambda: serialize(events), repeat),
+        }
+        results[size] = result
+        logger.info(
+            "%6s events: arrow %.4fs, serialize %.4fs (x%.1f)",
+            size,
+            result["arrow_s"],
+            result["serialize_s"],
+            result["arrow_s"] / result["serialize_s"],
+        )
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    run(args.sizes, repeat=args.repeat)
+
+
+if __name__ == "__main__":
+    main()
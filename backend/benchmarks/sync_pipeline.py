@@ -0,0 +1,314 @@
+"""Benchmark every stage of the sync pipeline on synthetic feeds.
+
+Measures, for a synthetic ICS feed of each size:
+- parse: `IcsParser.try_parse` of the feed,
+- rules: `Ruleset.apply` of a ruleset of `--rules` rules (the maximum allowed by
+  default), as built by `benchmarks.event_model`,
+- compress: `TimeScheduleCompressor.compress`, which builds the prompt of the AI
+  ruleset builder,
+- google_payload: `GoogleCalendarManager._event_to_google_event` for every event,
+  starting with empty formatting caches,
+- sync_on_create / sync_full: `SyncProfileService.synchronize` of a profile with
+  the ruleset, writing to a `MockGoogleCalendarManager` with the mock repositories.
+  The first sync creates every event, the FULL sync then deletes and creates them
+  all again. The feed is read from memory: downloads are left out, their time
+  depending on the network rather than on the code.
+
+Each timing is the best of `--repeat` runs. The results are written as JSON with
+the commit they were measured on, and compared with an earlier run by `--baseline`:
+
+    CLIENT_SECRET=x OPENAI_API_KEY=x FIREBASE_STORAGE_BUCKET=x \\
+        uv run python -m benchmarks.sync_pipeline --output before.json
+    # ... change the code ...
+    CLIENT_SECRET=x OPENAI_API_KEY=x FIREBASE_STORAGE_BUCKET=x \\
+        uv run python -m benchmarks.sync_pipeline --baseline before.json
+
+The exit status is 1 when a timing regressed by more than `--threshold`.
+"""
+
+import argparse
+import json
+import logging
+import platform
+import subprocess
+import sys
+import time
+from datetime import datetime, timezone
+from typing import Any, Callable, cast
+
+from pydantic import HttpUrl
+
+from backend.ai.time_schedule_compressor import TimeScheduleCompressor
+from backend.infrastructure.event_bus import LocalEventBus
+from backend.models import (
+    SyncProfile,
+    SyncProfileStatus,
+    SyncProfileStatusType,
+    SyncTrigger,
+    SyncType,
+)
+from backend.models.rules import Ruleset
+from backend.models.rules import settings as rules_settings
+from backend.models.sync_profile import ScheduleSource, TargetCalendar
+from backend.repositories.sync_profile_repository import MockSyncProfileRepository
+from backend.repositories.sync_stats_repository import MockSyncStatsRepository
+from backend.services.exceptions.ics import IcsParsingError, IcsSourceError
+from backend.services.ics_service import IcsFetchAndParseResult, IcsService
+from backend.services.sync_profile_service import SyncProfileService
+from backend.services.sync_telemetry import InMemoryMetricsSink, SyncOutcome
+from backend.shared import domain_events
+from backend.synchronizer import google_calendar_manager
+from backend.synchronizer.google_calendar_manager import (
+    GoogleCalendarManager,
+    MockGoogleCalendarManager,
+)
+from backend.synchronizer.ics_parser import IcsParser
+from backend.synchronizer.ics_source import IcsSource, StringIcsSource
+from benchmarks.event_model import build_ruleset
+from benchmarks.synthetic import generate_events, generate_ics
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SIZES = [100, 1_000, 5_000, 20_000]
+SYNC_PROFILE_ID = "benchmark-sync-profile"
+USER_ID = "benchmark-user"
+
+
+def _best_time(func: Callable[[], Any], repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - t0)
+    return min(timings)
+
+
+def _event_bus() -> LocalEventBus:
+    """Drops the events published by a sync, which trigger no work here."""
+    return LocalEventBus(
+        handlers={
+            domain_events.IcsFetched: [],
+            domain_events.SyncSucceeded: [],
+            domain_events.SyncFailed: [],
+        }
+    )
+
+
+def google_payloads(events: list) -> list[dict]:
+    google_calendar_manager._format_date_time.cache_clear()
+    google_calendar_manager._format_date.cache_clear()
+    extended_properties = GoogleCalendarManager._create_extended_properties(
+        SYNC_PROFILE_ID
+    )
+    return [
+        GoogleCalendarManager._event_to_google_event(event, extended_properties)
+        for event in events
+    ]
+
+
+class _InMemoryIcsService(IcsService):
+    """Reads the feed of every profile from memory instead of its URL."""
+
+    def __init__(self, ics: str) -> None:
+        super().__init__(event_bus=_event_bus())
+        self._ics = ics
+
+    def try_fetch_and_parse(
+        self, ics_source: IcsSource, *args: Any, **kwargs: Any
+    ) -> IcsFetchAndParseResult | IcsSourceError | IcsParsingError:
+        return super().try_fetch_and_parse(
+            StringIcsSource(ics_string=self._ics), *args, **kwargs
+        )
+
+
+class _LocalAuthorizationService:
+    def __init__(self, manager: MockGoogleCalendarManager) -> None:
+        self.manager = manager
+
+    def get_authenticated_google_calendar_manager(
+        self, **kwargs: Any
+    ) -> MockGoogleCalendarManager:
+        return self.manager
+
+
+def _sync_profile(ruleset: Ruleset) -> SyncProfile:
+    return SyncProfile(
+        id=SYNC_PROFILE_ID,
+        user_id=USER_ID,
+        title="Benchmark",
+        schedule_source=ScheduleSource(
+            url=HttpUrl("https://example.com/benchmark.ics")
+        ),
+        target_calendar=TargetCalendar(
+            id="benchmark-calendar",
+            title="Benchmark",
+            description="",
+            provider_account_id="benchmark-account",
+            provider_account_email="benchmark@example.com",
+        ),
+        status=SyncProfileStatus(type=SyncProfileStatusType.NOT_STARTED),
+        ruleset=ruleset,
+    )
+
+
+def time_synchronize(ics: str, ruleset: Ruleset, repeat: int) -> dict[str, float]:
+    """Best times of the first sync of a profile, then of a FULL sync of it."""
+    on_create: list[float] = []
+    full: list[float] = []
+    for _ in range(repeat):
+        manager = MockGoogleCalendarManager()
+        sync_profile_repo = MockSyncProfileRepository()
+        sync_profile_repo.save_sync_profile(_sync_profile(ruleset))
+        metrics_sink = InMemoryMetricsSink()
+        service = SyncProfileService(
+            sync_profile_repo=sync_profile_repo,
+            sync_stats_repo=MockSyncStatsRepository(),
+            authorization_service=cast(Any, _LocalAuthorizationService(manager)),
+            ics_service=_InMemoryIcsService(ics),
+            google_calendar_service=cast(Any, None),
+            ai_ruleset_service=cast(Any, None),
+            event_bus=_event_bus(),
+            metrics_sink=metrics_sink,
+        )
+
+        for sync_trigger, sync_type, timings in [
+            (SyncTrigger.ON_CREATE, SyncType.REGULAR, on_create),
+            (SyncTrigger.MANUAL, SyncType.FULL, full),
+        ]:
+            t0 = time.perf_counter()
+            service.synchronize(
+                user_id=USER_ID,
+                sync_profile_id=SYNC_PROFILE_ID,
+                sync_trigger=sync_trigger,
+                sync_type=sync_type,
+                force=True,
+            )
+            timings.append(time.perf_counter() - t0)
+
+        for telemetry in metrics_sink.exported:
+            assert telemetry.outcome == SyncOutcome.SUCCESS, telemetry
+
+    return {"sync_on_create_s": min(on_create), "sync_full_s": min(full)}
+
+
+def run(sizes: list[int], n_rules: int, repeat: int = 3) -> dict[int, dict]:
+    parser = IcsParser()
+    ruleset = build_ruleset(n_rules)
+    compressor = TimeScheduleCompressor()
+    results: dict[int, dict] = {}
+    for size in sizes:
+        ics = generate_ics(size)
+        events = generate_events(size)
+        parsed = parser.try_parse(ics)
+        assert isinstance(parsed, list) and len(parsed) == size, parsed
+
+        result = {
+            "parse_s": _best_time(lambda: parser.try_parse(ics), repeat),
+            "rules_s": _best_time(lambda: ruleset.apply(events), repeat),
+            "compress_s": _best_time(lambda: compressor.compress(events), repeat),
+            "google_payload_s": _best_time(lambda: google_payloads(events), repeat),
+            **time_synchronize(ics, ruleset, repeat),
+        }
+        results[size] = result
+        logger.info(
+            "%6s events: %s",
+            size,
+            ", ".join(f"{name} {value:.4f}s" for name, value in result.items()),
+        )
+    return results
+
+
+def _git_commit() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(
+    baseline: dict[str, dict[str, float]],
+    results: dict[str, dict[str, float]],
+    threshold: float,
+) -> list[str]:
+    """Log the ratio of every timing to the baseline, returning the regressions."""
+    regressions = []
+    for size, timings in results.items():
+        for name, value in timings.items():
+            before = baseline.get(size, {}).get(name)
+            if not before:
+                continue
+            ratio = value / before
+            regressed = ratio > 1 + threshold
+            logger.info(
+                "%6s events: %-18s %.4fs -> %.4fs (x%.2f)%s",
+                size,
+                name,
+                before,
+                value,
+                ratio,
+                "  REGRESSION" if regressed else "",
+            )
+            if regressed:
+                regressions.append(f"{size}/{name}")
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES)
+    parser.add_argument("--rules", type=int, default=rules_settings.MAX_RULES)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--output", help="Write the results to this JSON file")
+    parser.add_argument("--baseline", help="Compare with the results of this file")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.1,
+        help="Slowdown above which a timing counts as a regression (0.1 = 10%%)",
+    )
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    # Keep the log entries of each sync out of the results
+    logging.getLogger("backend").setLevel(logging.WARNING)
+
+    results = run(args.sizes, n_rules=args.rules, repeat=args.repeat)
+    # JSON object keys are strings
+    results_json = {str(size): timings for size, timings in results.items()}
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(
+                {
+                    "metadata": {
+                        "commit": _git_commit(),
+                        "date": datetime.now(timezone.utc).isoformat(),
+                        "python": platform.python_version(),
+                        "machine": platform.machine(),
+                        "rules": args.rules,
+                        "repeat": args.repeat,
+                    },
+                    "results": results_json,
+                },
+                f,
+                indent=2,
+            )
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        regressions = compare(baseline["results"], results_json, args.threshold)
+        if regressions:
+            logger.info("Regressions: %s", ", ".join(regressions))
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
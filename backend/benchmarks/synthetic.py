@@ -0,0 +1,118 @@
+"""Synthetic university timetables used by the benchmarks.
+
+Real feeds are dominated by a few dozen courses repeated every week, with the same
+title/description strings appearing hundreds of times. The generator reproduces
+that shape deterministically so results can be compared between commits.
+"""
+
+import random
+from typing import Any
+
+import arrow
+
+from backend.shared.event import Event
+
+_COURSE_KINDS = ["CM", "TD", "TP", "Examen"]
+_SUBJECTS = [
+    "Analyse numérique",
+    "Algèbre linéaire",
+    "Probabilités",
+    "Programmation orientée objet",
+    "Bases de données",
+    "Réseaux",
+    "Systèmes d'exploitation",
+    "Compilation",
+    "Anglais",
+    "Gestion de projet",
+    "Apprentissage automatique",
+    "Sécurité informatique",
+    "Théorie des graphes",
+    "Physique",
+    "Communication",
+    "Droit du numérique",
+]
+_TEACHERS = ["M. Martin", "Mme Bernard", "M. Dubois", "Mme Thomas", "M. Robert"]
+_ROOMS = ["Amphi A", "Amphi B", "Salle 101", "Salle 204", "Salle TP 3"]
+
+
+def generate_events(
+    n_events: int,
+    *,
+    n_courses: int = 40,
+    seed: int = 0,
+    start: arrow.Arrow | None = None,
+) -> list[Event]:
+    """Generate `n_events` events drawn from `n_courses` recurring courses.
+
+    Each course keeps the same title, description and location for every occurrence,
+    and occurrences are spread over consecutive weeks starting from `start`.
+    """
+    rng = random.Random(seed)
+    start = start or arrow.get("2024-09-02T08:00:00+02:00")
+
+    courses = []
+    for i in range(n_courses):
+        subject = _SUBJECTS[i % len(_SUBJECTS)]
+        kind = rng.choice(_COURSE_KINDS)
+        group = f"G{rng.randint(1, 4)}"
+        courses.append(
+            {
+                "title": f"{kind} {subject} - {group}",
+                "description": (
+                    f"Matière : {subject}\nEnseignant : {rng.choice(_TEACHERS)}\n"
+                    f"Groupe : {group}\n(Exporté le 01/09/2024)"
+                ),
+                "location": rng.choice(_ROOMS),
+                "weekday": rng.randrange(5),
+                "hour": rng.choice([8, 10, 13, 15, 17]),
+            }
+        )
+
+    events = []
+    for i in range(n_events):
+        course = courses[i % n_courses]
+        week = i // n_courses
+        begin = start.shift(
+            weeks=week, days=course["weekday"], hours=course["hour"] - 8
+        )
+        events.append(
+            Event(
+                start=begin,
+                end=begin.shift(hours=2),
+                title=course["title"],
+                description=course["description"],
+                location=course["location"],
+            )
+        )
+    return events
+
+
+def _escape_text(value: str) -> str:
+    return (
+        value.replace("\\", "\\\\")
+        .replace(";", "\\;")
+        .replace(",", "\\,")
+        .replace("\n", "\\n")
+    )
+
+
+def generate_ics(n_events: int, **kwargs: Any) -> str:
+    """Serialize the events of `generate_events` as an ICS feed.
+
+    Keyword arguments are forwarded to `generate_events`.
+    """
+    lines = ["BEGIN:VCALENDAR", "VERSION:2.0", "PRODID:-//Syncademic//Benchmarks//EN"]
+    for i, event in enumerate(generate_events(n_events, **kwargs)):
+        lines += [
+            "BEGIN:VEVENT",
+            f"UID:benchmark-{i}@syncademic",
+            "DTSTAMP:20240901T000000Z",
+            f"DTSTART:{event.start.to('UTC').format('YYYYMMDDTHHmmss')}Z",
+            f"DTEND:{event.end.to('UTC').format('YYYYMMDDTHHmmss')}Z",
+            f"SUMMARY:{_escape_text(event.title)}",
+            f"DESCRIPTION:{_escape_text(event.description)}",
+            f"LOCATION:{_escape_text(event.location)}",
+            "END:VEVENT",
+        ]
+    lines.append("END:VCALENDAR")
+    return "\r\n".join(lines) + "\r\n"
@@ -0,0 +1,47 @@
+"""Benchmark `TimeScheduleCompressor.compress` on large synthetic feeds.
+
+Usage (from the `backend` directory):
+
+    uv run python -m benchmarks.time_schedule_compressor --sizes 5000 10000 20000
+"""
+
+import argparse
+import logging
+import time
+
+from backend.ai.time_schedule_compressor import TimeScheduleCompressor
+from benchmarks.synthetic import generate_events
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SIZES = [5_000, 10_000, 20_000]
+
+
+def run(sizes: list[int], repeat: int = 3) -> dict[int, float]:
+    """Return the best wall time, in seconds, of `compress` for each feed size."""
+    compressor = TimeScheduleCompressor()
+    results: dict[int, float] = {}
+    for size in sizes:
+        events = generate_events(size)
+        timings = []
+        for _ in range(repeat):
+            t0 = time.perf_counter()
+            compressor.compress(events)
+            timings.append(time.perf_counter() - t0)
+        results[size] = min(timings)
+        logger.info("compress(%s events): %.3fs", size, results[size])
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    run(args.sizes, repeat=args.repeat)
+
+
+if __name__ == "__main__":
+    main()
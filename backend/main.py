@@ -1,4 +1,5 @@
 import logging
+from datetime import datetime, timezone
 from functools import wraps
 from typing import Any, Callable, TypeVar
 
@@ -12,10 +13,12 @@ from google.cloud.firestore_v1.base_document import DocumentSnapshot
 from pydantic import BaseModel, ValidationError
 
 from backend.ai.ruleset_builder import RulesetBuilder
-from backend.bootstrap import bootstrap_event_bus
+from backend.bootstrap import bootstrap_background_jobs, bootstrap_event_bus
+from backend.infrastructure.job_executor import LocalJobExecutor
 from backend.logging_config import configure_firebase_functions_logging
 from backend.models import (
     SyncTrigger,
+    SyncType,
 )
 from backend.models.schemas import (
     AuthorizeBackendInput,
@@ -24,6 +27,7 @@ from backend.models.schemas import (
     IsAuthorizedOutput,
     ListUserCalendarsInput,
     RequestSyncInput,
+    RequestSyncOutput,
     ValidateIcsUrlInput,
     CreateSyncProfileInput,
 )
@@ -46,7 +50,16 @@ from backend.services.exceptions.base import SyncademicError
 from backend.services.exceptions.mapping import ErrorMapping
 from backend.services.google_calendar_service import GoogleCalendarService
 from backend.services.ics_service import IcsService
+from backend.services.sync_job_queue import InMemorySyncJobQueue
+from backend.services.sync_job_worker import SyncJobWorker
 from backend.services.sync_profile_service import SyncProfileService
+from backend.services.sync_profiler import SyncProfiler
+from backend.services.sync_scheduler import SyncScheduler
+from backend.services.sync_telemetry import (
+    AggregatingMetricsSink,
+    LoggingMetricsSink,
+    log_sync_run_summary,
+)
 from backend.services.user_service import FirebaseAuthUserService
 from backend.settings import settings
 from backend.shared import domain_events
@@ -96,6 +109,10 @@ ai_ruleset_service = AiRulesetService(
     event_bus=event_bus,
 )
 
+sync_scheduler = SyncScheduler()
+# Totals per scheduled run, on top of the log entry of each sync
+sync_metrics_sink = AggregatingMetricsSink(LoggingMetricsSink())
+
 sync_profile_service = SyncProfileService(
     sync_profile_repo=sync_profile_repo,
     sync_stats_repo=sync_stats_repo,
@@ -104,9 +121,31 @@ sync_profile_service = SyncProfileService(
     google_calendar_service=google_calendar_service,
     ai_ruleset_service=ai_ruleset_service,
     event_bus=event_bus,
+    sync_scheduler=sync_scheduler,
+    metrics_sink=sync_metrics_sink,
+    profiler=SyncProfiler(ics_file_storage),
+)
+
+# Cloud Functions throttle the CPU once a function has returned, so background
+# jobs run inline here. The API server (backend/api.py) runs them on a thread pool.
+bootstrap_background_jobs(
+    event_bus,
+    sync_profile_service=sync_profile_service,
+    job_executor=LocalJobExecutor(),
 )
 
 
+def _sync_job_worker() -> tuple[InMemorySyncJobQueue, SyncJobWorker]:
+    """
+    The queue and worker of one function invocation. For the same reason as above,
+    an invocation runs the syncs it queued before returning, from a queue of its
+    own, so that concurrent invocations of an instance never run each other's jobs.
+    The queue still merges the duplicate requests of a scheduled run.
+    """
+    queue = InMemorySyncJobQueue()
+    return queue, SyncJobWorker(queue, sync_profile_service)
+
+
 def get_user_id_or_raise(req: https_fn.CallableRequest) -> str:
     """
     Get the user ID from the request, or raise an error if the request is not authenticated.
@@ -259,12 +298,7 @@ def request_sync(user_id: str, request: RequestSyncInput) -> Any:
     )
 
     try:
-        sync_profile_service.synchronize(
-            user_id=user_id,
-            sync_profile_id=sync_profile_id,
-            sync_trigger=SyncTrigger.MANUAL,
-            sync_type=sync_type,
-        )
+        sync_profile_service.check_sync_request(user_id, sync_profile_id)
     except SyncademicError as e:
         logger.error(
             "Failed to synchronize.",
@@ -276,6 +310,18 @@ def request_sync(user_id: str, request: RequestSyncInput) -> Any:
         )
         raise error_mapping.to_http_error(e)
 
+    sync_job_queue, sync_job_worker = _sync_job_worker()
+    job = sync_job_queue.enqueue(
+        user_id=user_id,
+        sync_profile_id=sync_profile_id,
+        sync_trigger=SyncTrigger.MANUAL,
+        sync_type=sync_type,
+    )
+    sync_job_worker.run_pending()
+    dev_notification_service.flush()
+
+    return RequestSyncOutput(job_id=job.id).model_dump()
+
 
 @scheduler_fn.on_schedule(
     schedule=settings.SCHEDULED_SYNC_CRON_SCHEDULE,
@@ -285,35 +331,56 @@ def request_sync(user_id: str, request: RequestSyncInput) -> Any:
     region="europe-west3",  # Frankfurt, Germany, because Cloud Scheduler is not available in Paris/europe-west9
 )
 def scheduled_sync(event: Any) -> None:
-    logger.info("Scheduled synchronization started.")
+    """Syncs the profiles whose adaptive schedule is due (see `SyncScheduler`)."""
+    _run_scheduled_sync(SyncType.REGULAR, only_due=True)
 
+
+@scheduler_fn.on_schedule(
+    schedule=settings.SCHEDULED_WINDOW_SYNC_CRON_SCHEDULE,
+    memory=options.MemoryOption.MB_512,
+    timeout_sec=settings.SCHEDULED_SYNC_TIMEOUT_SEC,
+    max_instances=settings.MAX_CLOUD_FUNCTIONS_INSTANCES,
+    region="europe-west3",  # Frankfurt, Germany, because Cloud Scheduler is not available in Paris/europe-west9
+)
+def scheduled_window_sync(event: Any) -> None:
+    """Keeps the next days up to date between the daily REGULAR syncs."""
+    _run_scheduled_sync(SyncType.WINDOW, only_due=False)
+
+
+def _run_scheduled_sync(sync_type: SyncType, *, only_due: bool) -> None:
+    logger.info("Scheduled %s synchronization started.", sync_type.value)
+    # Leave out the syncs run by other functions of this instance since the last run
+    sync_metrics_sink.drain()
+
+    sync_job_queue, sync_job_worker = _sync_job_worker()
+    now = datetime.now(timezone.utc)
     for sync_profile in sync_profile_repo.list_all_active_sync_profiles():
-        sync_profile_id, user_id = sync_profile.id, sync_profile.user_id
+        if only_due and not sync_scheduler.is_due(sync_profile, now):
+            continue
 
         logger.info(
-            "Synchronizing.",
+            "Queueing synchronization.",
             extra={
-                "user_id": user_id,
-                "sync_profile_id": sync_profile_id,
+                "user_id": sync_profile.user_id,
+                "sync_profile_id": sync_profile.id,
                 "sync_profile_title": sync_profile.title,
             },
         )
-        try:
-            sync_profile_service.synchronize(
-                user_id=user_id,
-                sync_profile_id=sync_profile_id,
-                sync_trigger=SyncTrigger.SCHEDULED,
-            )
-        except Exception as e:
-            logger.error(
-                "Failed to synchronize. %s",
-                e,
-                extra={
-                    "user_id": user_id,
-                    "sync_profile_id": sync_profile_id,
-                    "error_type": type(e).__name__,
-                },
-            )
+        sync_job_queue.enqueue(
+            user_id=sync_profile.user_id,
+            sync_profile_id=sync_profile.id,
+            sync_trigger=SyncTrigger.SCHEDULED,
+            sync_type=sync_type,
+        )
+
+    # Failures are logged by the worker and do not stop the other jobs
+    n_jobs = sync_job_worker.run_pending()
+    # A single digest for the failures of the run, sent before the CPU is throttled
+    dev_notification_service.flush()
+    log_sync_run_summary(sync_metrics_sink.drain(), run=sync_type.value)
+    logger.info(
+        "Scheduled %s synchronization finished, %s jobs run.", sync_type.value, n_jobs
+    )
 
 
 @https_fn.on_call(
@@ -461,4 +528,6 @@ def create_sync_profile(user_id: str, request: CreateSyncProfileInput) -> dict:
         )
         raise error_mapping.to_http_error(e)
 
+    # The first sync runs inline and may have failed
+    dev_notification_service.flush()
     return sync_profile.model_dump(mode="json")
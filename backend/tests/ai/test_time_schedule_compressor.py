@@ -0,0 +1,94 @@
+import arrow
+import hdbscan
+import pytest
+
+from backend.ai.time_schedule_compressor import TimeScheduleCompressor
+from backend.shared.event import Event
+
+
+def _weekly(title: str, description: str, n: int, hour: int = 8) -> list[Event]:
+    start = arrow.get("2024-09-02T00:00:00+00:00").shift(hours=hour)
+    return [
+        Event(
+            start=start.shift(weeks=i),
+            end=start.shift(weeks=i, hours=2),
+            title=title,
+            description=description,
+        )
+        for i in range(n)
+    ]
+
+
+@pytest.fixture
+def compressor() -> TimeScheduleCompressor:
+    return TimeScheduleCompressor()
+
+
+@pytest.fixture
+def events() -> list[Event]:
+    return (
+        _weekly("CM Algebra", "Linear algebra lecture, room A", 12)
+        + _weekly("TP Networks", "Networks lab with routers, room B", 6, hour=13)
+        + _weekly("Exam", "Final exam session", 1, hour=15)
+    )
+
+
+def test_compress_clusters_by_course(compressor, events):
+    output = compressor.compress(events)
+
+    assert "Cluster 0" in output or "Cluster 1" in output
+    assert "(12 events)" in output
+    assert "(6 events)" in output
+    assert "- CM Algebra" in output
+    assert "- TP Networks" in output
+
+
+def test_compress_orders_clusters_by_size_with_noise_last(compressor, events):
+    output = compressor.compress(events)
+
+    assert output.index("(12 events)") < output.index("(6 events)")
+    if "Unclustered" in output:
+        assert output.index("Unclustered") > output.index("(6 events)")
+
+
+def test_compress_reports_cluster_date_range(compressor, events):
+    output = compressor.compress(events)
+
+    assert "From 2024-09-02 to 2024-11-18 (78 days)" in output
+
+
+def test_compress_top_terms_come_from_cluster(compressor, events):
+    output = compressor.compress(events)
+
+    algebra_block = output[output.index("(12 events)") :]
+    top_terms = algebra_block.split("Top terms: ")[1].split("\n")[0].split(", ")
+    assert "algebra" in top_terms
+    assert "routers" not in top_terms
+
+
+def test_compress_ignores_exact_duplicates(compressor, events):
+    output_without_duplicates = compressor.compress(events)
+    output_with_duplicates = compressor.compress(events + events[:5])
+
+    assert output_with_duplicates == output_without_duplicates
+
+
+def test_compress_clusters_distinct_texts_only(compressor, events, mocker):
+    fit_predict = mocker.spy(hdbscan.HDBSCAN, "fit_predict")
+
+    compressor.compress(
+        events + _weekly("CM Algebra", "Linear algebra lecture, room A", 40, hour=10)
+    )
+
+    # 3 distinct texts, each repeated at most min_cluster_size + 1 times
+    (_, matrix), _ = fit_predict.call_args
+    assert matrix.shape[0] == 5 + 5 + 1
+
+
+def test_compress_expands_labels_to_every_event(compressor, events):
+    output = compressor.compress(
+        events + _weekly("CM Algebra", "Linear algebra lecture, room A", 20, hour=10)
+    )
+
+    assert "(32 events)" in output
+    assert "(6 events)" in output
@@ -20,3 +20,17 @@ def _set_firebase_storage_bucket(monkeypatch: pytest.MonkeyPatch) -> None:
     monkeypatch.setenv("FIREBASE_STORAGE_BUCKET", TEST_FIREBASE_STORAGE_BUCKET)
     monkeypatch.setenv("CLIENT_SECRET", CLIENT_SECRET)
     monkeypatch.setenv("OPENAI_API_KEY", OPENAI_API_KEY)
+
+
+@pytest.fixture
+def anyio_backend() -> str:
+    """Run `@pytest.mark.anyio` tests on asyncio only, the loop used by the API."""
+    return "asyncio"
+
+
+@pytest.fixture(autouse=True)
+def _fresh_ics_host_guard(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Failures recorded by a test must not open the circuit of a host for the next ones."""
+    from backend.synchronizer import ics_host_guard
+
+    monkeypatch.setattr(ics_host_guard, "ics_host_guard", ics_host_guard.IcsHostGuard())
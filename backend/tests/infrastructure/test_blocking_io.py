@@ -0,0 +1,54 @@
+import threading
+import time
+
+import anyio
+import pytest
+
+from backend.infrastructure.blocking_io import BlockingIoRunner
+
+
+@pytest.mark.anyio
+async def test_run_returns_result_from_worker_thread() -> None:
+    runner = BlockingIoRunner(max_threads=2)
+
+    def blocking_call(a: int, *, b: int) -> tuple[int, str]:
+        return a + b, threading.current_thread().name
+
+    result, thread_name = await runner.run(blocking_call, 1, b=2)
+
+    assert result == 3
+    assert thread_name != threading.current_thread().name
+
+
+@pytest.mark.anyio
+async def test_run_propagates_exceptions() -> None:
+    runner = BlockingIoRunner(max_threads=1)
+
+    def failing_call() -> None:
+        raise ValueError("boom")
+
+    with pytest.raises(ValueError, match="boom"):
+        await runner.run(failing_call)
+
+
+@pytest.mark.anyio
+async def test_run_limits_concurrent_threads() -> None:
+    runner = BlockingIoRunner(max_threads=2)
+    lock = threading.Lock()
+    running = 0
+    max_running = 0
+
+    def blocking_call() -> None:
+        nonlocal running, max_running
+        with lock:
+            running += 1
+            max_running = max(max_running, running)
+        time.sleep(0.02)
+        with lock:
+            running -= 1
+
+    async with anyio.create_task_group() as tg:
+        for _ in range(6):
+            tg.start_soon(runner.run, blocking_call)
+
+    assert max_running == 2
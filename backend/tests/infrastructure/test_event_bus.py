@@ -94,3 +94,16 @@ def test_mock_event_bus_assertions() -> None:
     bus.assert_event_published_with_data(IcsFetched, ics_str="A", metadata={"x": 1})
     bus.clear_events()
     bus.assert_no_events_published()
+
+
+def test_local_event_bus_subscribe_adds_handler() -> None:
+    calls: list[str] = []
+
+    bus = LocalEventBus(handlers={IcsFetched: [lambda e: calls.append("first")]})
+    bus.subscribe(IcsFetched, lambda e: calls.append("second"))
+    bus.subscribe(SyncFailed, lambda e: calls.append("sync_failed"))
+
+    bus.publish(IcsFetched(ics_str="ICS"))
+
+    assert calls == ["first", "second"]
+    assert len(bus.handlers[SyncFailed]) == 1
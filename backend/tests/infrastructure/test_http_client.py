@@ -0,0 +1,76 @@
+import httpx
+import pytest
+import responses
+
+from backend.infrastructure import http_client
+from backend.infrastructure.http_client import (
+    create_async_http_client,
+    create_http_session,
+    get_http_session,
+)
+
+
+def test_session_pools_connections_per_host() -> None:
+    session = create_http_session(pool_connections=3, pool_maxsize=7)
+
+    adapter = session.get_adapter("https://example.com/calendar.ics")
+
+    assert adapter._pool_connections == 3
+    assert adapter._pool_maxsize == 7
+    assert session.get_adapter("http://example.com/calendar.ics") is adapter
+
+
+def test_session_drops_cookies() -> None:
+    session = create_http_session()
+
+    with responses.RequestsMock() as rsps:
+        rsps.get(
+            "https://example.com/login",
+            headers={"Set-Cookie": "session=user-1; Path=/"},
+        )
+        rsps.get("https://example.com/calendar.ics")
+        session.get("https://example.com/login")
+        session.get("https://example.com/calendar.ics")
+
+        assert "Cookie" not in rsps.calls[1].request.headers
+    assert not session.cookies
+
+
+def test_process_wide_session_is_reused() -> None:
+    assert get_http_session() is get_http_session()
+
+
+@pytest.mark.anyio
+async def test_async_client_without_h2(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(http_client, "is_http2_available", lambda: False)
+
+    client = create_async_http_client(max_connections=5, http2=True)
+
+    async with client:
+        pool = client._transport._pool
+        assert not pool._http2
+        assert pool._max_connections == 5
+        assert pool._max_keepalive_connections == 5
+
+
+@pytest.mark.anyio
+async def test_async_client_http2_disabled() -> None:
+    async with create_async_http_client(http2=False) as client:
+        assert not client._transport._pool._http2
+
+
+@pytest.mark.anyio
+async def test_async_client_drops_cookies() -> None:
+    sent_cookies: list[str | None] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        sent_cookies.append(request.headers.get("Cookie"))
+        return httpx.Response(200, headers={"Set-Cookie": "session=user-1; Path=/"})
+
+    async with create_async_http_client(http2=False) as client:
+        client._transport = httpx.MockTransport(handler)
+        await client.get("https://example.com/login")
+        await client.get("https://example.com/calendar.ics")
+
+        assert sent_cookies == [None, None]
+        assert not client.cookies
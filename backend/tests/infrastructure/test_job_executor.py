@@ -0,0 +1,48 @@
+import threading
+
+from backend.infrastructure.job_executor import LocalJobExecutor, ThreadPoolJobExecutor
+
+
+def test_local_job_executor_runs_job_inline() -> None:
+    calls: list[dict] = []
+
+    LocalJobExecutor().submit(lambda **kwargs: calls.append(kwargs), a=1, b="x")
+
+    assert calls == [{"a": 1, "b": "x"}]
+
+
+def test_local_job_executor_swallows_job_errors() -> None:
+    def failing_job() -> None:
+        raise RuntimeError("boom")
+
+    LocalJobExecutor().submit(failing_job)
+
+
+def test_thread_pool_job_executor_runs_job_in_background() -> None:
+    executor = ThreadPoolJobExecutor(max_workers=2)
+    done = threading.Event()
+    thread_names: list[str] = []
+
+    def job(value: int) -> None:
+        thread_names.append(threading.current_thread().name)
+        done.set()
+
+    executor.submit(job, value=1)
+
+    assert done.wait(timeout=5)
+    executor.shutdown()
+    assert thread_names[0].startswith("background-job")
+
+
+def test_thread_pool_job_executor_survives_failing_job() -> None:
+    executor = ThreadPoolJobExecutor(max_workers=1)
+    done = threading.Event()
+
+    def failing_job() -> None:
+        raise RuntimeError("boom")
+
+    executor.submit(failing_job)
+    executor.submit(lambda: done.set())
+
+    assert done.wait(timeout=5)
+    executor.shutdown()
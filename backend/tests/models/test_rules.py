@@ -16,6 +16,7 @@ from backend.models import (
 )
 from backend.models.rules import settings
 from backend.shared.event import Event
+from backend.shared.event_batch import EventBatch
 from backend.shared.google_calendar_colors import GoogleEventColor
 
 
@@ -1057,3 +1058,87 @@ def test_ruleset_apply():
 
     assert new_event2.title == "Mesure et intégration, Fourier - HAX503X Lecture"
     assert new_event2.color == GoogleEventColor.TOMATO
+
+
+def test_ruleset_apply_batch_matches_apply():
+    events = [
+        Event(
+            title=title,
+            description=description,
+            location="Room 101",
+            start=start.shift(days=day),
+            end=end.shift(days=day),
+        )
+        for day, (title, description) in enumerate(
+            [
+                ("HAI507I Lecture", "Calcul formel"),
+                ("hai507i TD", "Calcul formel - Groupe A"),
+                ("HAX503X Lecture", "Fourier Analysis"),
+                ("HAX504X Seminar", "Combinatorics"),
+                ("HAI507I Lecture", "Calcul formel"),
+            ]
+        )
+    ]
+    ruleset = Ruleset(
+        rules=[
+            Rule(
+                condition=TextFieldCondition(
+                    field="title",
+                    operator="contains",
+                    value="hai507i",
+                    case_sensitive=False,
+                ),
+                actions=[
+                    ChangeFieldAction(
+                        action="change_field",
+                        field="description",
+                        method="cut-after",
+                        value=" - ",
+                    ),
+                    ChangeColorAction(
+                        action="change_color",
+                        value=GoogleEventColor.SAGE,
+                    ),
+                ],
+            ),
+            Rule(
+                condition=CompoundCondition(
+                    logical_operator="AND",
+                    conditions=[
+                        TextFieldCondition(
+                            field="title",
+                            operator="starts_with",
+                            value="HAX",
+                        ),
+                        TextFieldCondition(
+                            field="title",
+                            operator="ends_with",
+                            value="Lecture",
+                            negate=True,
+                        ),
+                    ],
+                ),
+                actions=[DeleteEventAction(action="delete_event")],
+            ),
+            Rule(
+                condition=TextFieldCondition(
+                    field="location",
+                    operator="regex",
+                    value=r"Room \d+",
+                ),
+                actions=[
+                    ChangeFieldAction(
+                        action="change_field",
+                        field="title",
+                        method="append",
+                        value=" (campus)",
+                    )
+                ],
+            ),
+        ]
+    )
+
+    new_events = ruleset.apply_batch(EventBatch.from_events(events)).to_events()
+
+    assert len(new_events) == 4
+    assert new_events == ruleset.apply(events)
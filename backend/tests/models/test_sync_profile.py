@@ -1,13 +1,15 @@
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 
 import pytest
 from pydantic import HttpUrl, ValidationError
 
 from backend.models import (
     ScheduleSource,
+    SyncLease,
     SyncProfile,
     SyncProfileStatus,
     SyncProfileStatusType,
+    SyncSchedule,
     SyncTrigger,
     SyncType,
     TargetCalendar,
@@ -286,3 +288,60 @@ def test_schedule_source_url_is_serialised_as_string():
 
     assert isinstance(data["url"], str)
     assert data["url"] == "https://example.com/test.ics"
+
+
+@pytest.mark.parametrize(
+    "status_type, lease_expires_in, ignore_status, expected",
+    [
+        (SyncProfileStatusType.SUCCESS, None, False, True),
+        (SyncProfileStatusType.DELETING, None, False, False),
+        (SyncProfileStatusType.DELETING, None, True, True),
+        # A live lease is never taken over, even by a forced sync
+        (SyncProfileStatusType.IN_PROGRESS, timedelta(minutes=5), False, False),
+        (SyncProfileStatusType.IN_PROGRESS, timedelta(minutes=5), True, False),
+        # The run holding an expired lease crashed or stalled
+        (SyncProfileStatusType.IN_PROGRESS, timedelta(minutes=-5), False, True),
+        (SyncProfileStatusType.IN_PROGRESS, None, False, True),
+    ],
+)
+def test_sync_profile_can_acquire_sync_lease(
+    status_type: SyncProfileStatusType,
+    lease_expires_in: timedelta | None,
+    ignore_status: bool,
+    expected: bool,
+):
+    now = datetime.now(timezone.utc)
+    profile = SyncProfile(
+        id=SYNC_PROFILE_ID,
+        user_id=USER_ID,
+        title="My New Profile",
+        schedule_source=VALID_SCHEDULE_SOURCE,
+        target_calendar=VALID_TARGET_CALENDAR,
+        status=SyncProfileStatus(type=status_type),
+        lease=SyncLease(owner="worker", expires_at=now + lease_expires_in)
+        if lease_expires_in is not None
+        else None,
+    )
+
+    assert profile.can_acquire_sync_lease(now, ignore_status) is expected
+
+
+def test_sync_profile_sync_schedule_round_trip():
+    now = datetime.now(timezone.utc)
+    profile = SyncProfile(
+        id=SYNC_PROFILE_ID,
+        user_id=USER_ID,
+        title="My New Profile",
+        schedule_source=VALID_SCHEDULE_SOURCE,
+        target_calendar=VALID_TARGET_CALENDAR,
+        status=VALID_SYNC_PROFILE_STATUS,
+        sync_schedule=SyncSchedule(
+            interval_s=3600, next_sync_at=now + timedelta(hours=1), events_digest="a"
+        ),
+    )
+
+    data = profile.model_dump()
+
+    assert data["syncSchedule"]["nextSyncAt"] == now + timedelta(hours=1)
+    assert SyncProfile.model_validate(data) == profile
+    assert not profile.sync_schedule.is_due(now)
@@ -1,4 +1,4 @@
-from datetime import UTC, datetime
+from datetime import UTC, datetime, timedelta
 
 import pytest
 from pydantic import HttpUrl
@@ -6,6 +6,7 @@ from pydantic import HttpUrl
 from backend.models.rules import Ruleset
 from backend.models.sync_profile import (
     ScheduleSource,
+    SyncLease,
     SyncProfile,
     SyncProfileStatus,
     SyncProfileStatusType,
@@ -114,6 +115,19 @@ def test_list_all_active_sync_profiles(
         update={
             "id": "profile2",
             "status": SyncProfileStatus(type=SyncProfileStatusType.IN_PROGRESS),
+            "lease": SyncLease(
+                owner="worker", expires_at=datetime.now(UTC) + timedelta(minutes=5)
+            ),
+        }
+    )
+    stale_profile = sample_sync_profile.model_copy(
+        update={
+            "id": "profile4",
+            "status": SyncProfileStatus(type=SyncProfileStatusType.IN_PROGRESS),
+            "lease": SyncLease(
+                owner="crashed_worker",
+                expires_at=datetime.now(UTC) - timedelta(minutes=5),
+            ),
         }
     )
     deleting_profile = sample_sync_profile.model_copy(
@@ -127,11 +141,73 @@ def test_list_all_active_sync_profiles(
     repo.save_sync_profile(active_profile)
     repo.save_sync_profile(in_progress_profile)
     repo.save_sync_profile(deleting_profile)
+    repo.save_sync_profile(stale_profile)
 
-    # List active profiles
+    # List active profiles, including the one whose sync crashed
     active_profiles = repo.list_all_active_sync_profiles()
-    assert len(active_profiles) == 1
-    assert active_profiles[0].id == "profile1"
+    assert {profile.id for profile in active_profiles} == {"profile1", "profile4"}
+
+
+def test_sync_lease_is_exclusive(
+    repo: MockSyncProfileRepository, sample_sync_profile: SyncProfile
+) -> None:
+    repo.save_sync_profile(sample_sync_profile)
+    in_progress = SyncProfileStatus(type=SyncProfileStatusType.IN_PROGRESS)
+
+    leased = repo.try_acquire_sync_lease(
+        "user1", "profile1", owner="a", ttl_s=60, status=in_progress
+    )
+    assert leased is not None
+    assert leased.lease is not None and leased.lease.owner == "a"
+    assert leased.status.type == SyncProfileStatusType.IN_PROGRESS
+
+    # Even a forced sync does not take over a live lease
+    assert (
+        repo.try_acquire_sync_lease(
+            "user1",
+            "profile1",
+            owner="b",
+            ttl_s=60,
+            status=in_progress,
+            ignore_status=True,
+        )
+        is None
+    )
+    assert repo.renew_sync_lease("user1", "profile1", owner="a", ttl_s=60)
+    assert not repo.renew_sync_lease("user1", "profile1", owner="b", ttl_s=60)
+
+    leased.status = SyncProfileStatus(type=SyncProfileStatusType.SUCCESS)
+    assert repo.release_sync_lease(leased, owner="a")
+
+    stored = repo.get_sync_profile("user1", "profile1")
+    assert stored is not None
+    assert stored.lease is None
+    assert stored.status.type == SyncProfileStatusType.SUCCESS
+
+
+def test_expired_sync_lease_is_reclaimed(
+    repo: MockSyncProfileRepository, sample_sync_profile: SyncProfile
+) -> None:
+    repo.save_sync_profile(sample_sync_profile)
+    in_progress = SyncProfileStatus(type=SyncProfileStatusType.IN_PROGRESS)
+
+    crashed = repo.try_acquire_sync_lease(
+        "user1", "profile1", owner="a", ttl_s=0, status=in_progress
+    )
+    assert crashed is not None
+
+    reclaimed = repo.try_acquire_sync_lease(
+        "user1", "profile1", owner="b", ttl_s=60, status=in_progress
+    )
+    assert reclaimed is not None
+    assert reclaimed.lease is not None and reclaimed.lease.owner == "b"
+
+    # The crashed run cannot overwrite the state of the run that reclaimed the profile
+    crashed.status = SyncProfileStatus(type=SyncProfileStatusType.FAILED)
+    assert not repo.release_sync_lease(crashed, owner="a")
+    stored = repo.get_sync_profile("user1", "profile1")
+    assert stored is not None
+    assert stored.lease is not None and stored.lease.owner == "b"
 
 
 def test_delete_sync_profile(
@@ -219,3 +219,70 @@ def test_update_status(mock_db, sample_sync_profile: SyncProfile):
     profiles = repo.get_sync_profile(user_id, sync_profile_id)
     assert profiles is not None
     assert profiles.status.type == SyncProfileStatusType.IN_PROGRESS
+
+
+def test_sync_lease_lifecycle(mock_db, sample_sync_profile: SyncProfile):
+    """The lease operations run in Firestore transactions."""
+    repo = FirestoreSyncProfileRepository(db=mock_db)
+    user_id = sample_sync_profile.user_id
+    sync_profile_id = sample_sync_profile.id
+    repo.save_sync_profile(sample_sync_profile)
+    in_progress = SyncProfileStatus(type=SyncProfileStatusType.IN_PROGRESS)
+
+    leased = repo.try_acquire_sync_lease(
+        user_id, sync_profile_id, owner="a", ttl_s=60, status=in_progress
+    )
+    assert leased is not None
+    stored = repo.get_sync_profile(user_id, sync_profile_id)
+    assert stored is not None
+    assert stored.lease == leased.lease
+    assert stored.status.type == SyncProfileStatusType.IN_PROGRESS
+
+    assert (
+        repo.try_acquire_sync_lease(
+            user_id, sync_profile_id, owner="b", ttl_s=60, status=in_progress
+        )
+        is None
+    )
+    assert repo.renew_sync_lease(user_id, sync_profile_id, owner="a", ttl_s=120)
+    assert not repo.renew_sync_lease(user_id, sync_profile_id, owner="b", ttl_s=120)
+    renewed = repo.get_sync_profile(user_id, sync_profile_id)
+    assert renewed is not None and renewed.lease is not None
+    assert renewed.lease.expires_at > leased.lease.expires_at
+
+    leased.status = SyncProfileStatus(type=SyncProfileStatusType.SUCCESS)
+    assert not repo.release_sync_lease(leased, owner="b")
+    assert repo.release_sync_lease(leased, owner="a")
+
+    released = repo.get_sync_profile(user_id, sync_profile_id)
+    assert released is not None
+    assert released.lease is None
+    assert released.status.type == SyncProfileStatusType.SUCCESS
+
+
+def test_try_acquire_sync_lease_missing_profile(mock_db):
+    repo = FirestoreSyncProfileRepository(db=mock_db)
+
+    assert (
+        repo.try_acquire_sync_lease(
+            "user",
+            "missing",
+            owner="a",
+            ttl_s=60,
+            status=SyncProfileStatus(type=SyncProfileStatusType.IN_PROGRESS),
+        )
+        is None
+    )
+
+
+def test_save_sets_updated_at(mock_db, sample_sync_profile: SyncProfile):
+    repo = FirestoreSyncProfileRepository(db=mock_db)
+    before = datetime.now(timezone.utc)
+
+    repo.save_sync_profile(sample_sync_profile)
+
+    retrieved = repo.get_sync_profile(
+        sample_sync_profile.user_id, sample_sync_profile.id
+    )
+    assert retrieved is not None
+    assert retrieved.updated_at >= before
@@ -0,0 +1,99 @@
+import threading
+from unittest.mock import Mock
+
+import pytest
+
+from backend.services.dev_notification_service import (
+    BatchingDevNotificationService,
+    TelegramDevNotificationService,
+)
+from backend.shared import domain_events
+
+
+def _sync_failed(
+    sync_profile_id: str,
+    *,
+    error_type: str = "IcsSourceError",
+    ics_host: str | None = "ade.example.com",
+) -> domain_events.SyncFailed:
+    return domain_events.SyncFailed(
+        user_id="user1",
+        sync_profile_id=sync_profile_id,
+        error_type=error_type,
+        error_message="Could not fetch ICS file.",
+        ics_host=ics_host,
+    )
+
+
+@pytest.fixture
+def notifier() -> Mock:
+    return Mock(spec=TelegramDevNotificationService)
+
+
+def test_failures_are_sent_as_one_digest(notifier: Mock) -> None:
+    service = BatchingDevNotificationService(notifier, window_s=3600)
+
+    for i in range(3):
+        service.on_sync_failed(_sync_failed(f"profile{i}"))
+    service.on_sync_failed(_sync_failed("profile3", error_type="ValueError"))
+    notifier.send_message.assert_not_called()
+
+    service.flush()
+
+    notifier.on_sync_failed.assert_not_called()
+    notifier.send_message.assert_called_once()
+    digest = notifier.send_message.call_args.args[0]
+    assert "4 Syncs Failed" in digest
+    assert (
+        "<b>3×</b> <code>IcsSourceError</code> on <code>ade.example.com</code>"
+        in digest
+    )
+    assert "profile0, profile1, profile2" in digest
+    assert "<b>1×</b> <code>ValueError</code>" in digest
+
+    # Nothing left to send
+    service.flush()
+    notifier.send_message.assert_called_once()
+
+
+def test_single_failure_is_sent_with_details(notifier: Mock) -> None:
+    service = BatchingDevNotificationService(notifier, window_s=3600)
+    event = _sync_failed("profile1")
+
+    service.on_sync_failed(event)
+    service.flush()
+
+    notifier.on_sync_failed.assert_called_once_with(event)
+    notifier.send_message.assert_not_called()
+
+
+def test_digest_is_sent_after_window(notifier: Mock) -> None:
+    sent = threading.Event()
+    notifier.send_message.side_effect = lambda _: sent.set()
+    service = BatchingDevNotificationService(notifier, window_s=0.01)
+
+    service.on_sync_failed(_sync_failed("profile1"))
+    service.on_sync_failed(_sync_failed("profile2"))
+
+    assert sent.wait(timeout=5)
+
+
+def test_digest_fits_in_a_telegram_message(notifier: Mock) -> None:
+    service = BatchingDevNotificationService(notifier, window_s=3600)
+    for i in range(500):
+        service.on_sync_failed(_sync_failed(f"profile{i}", ics_host=f"host{i}.com"))
+
+    service.flush()
+
+    digest = notifier.send_message.call_args.args[0]
+    assert len(digest) <= 4096
+    assert digest.count("<code>") == digest.count("</code>")
+
+
+def test_other_notifications_are_sent_right_away(notifier: Mock) -> None:
+    service = BatchingDevNotificationService(notifier, window_s=3600)
+    event = domain_events.UserCreated(user_id="user1")
+
+    service.on_new_user(event)
+
+    notifier.on_new_user.assert_called_once_with(event)
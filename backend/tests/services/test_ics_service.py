@@ -1,17 +1,25 @@
 from unittest.mock import Mock
 
 import arrow
+import httpx
 import pytest
 from pydantic import HttpUrl, parse_obj_as
 
 from backend.infrastructure.event_bus import MockEventBus
 from backend.models.schemas import ValidateIcsUrlOutput
 from backend.services.exceptions.ics import IcsParsingError, IcsSourceError
-from backend.services.ics_service import IcsService, IcsFetchAndParseResult
+from backend.services.ics_service import (
+    IcsFetchAndParseResult,
+    IcsResultCache,
+    IcsService,
+)
+from backend.models import SyncTrigger, SyncType
+from backend.services.sync_telemetry import SyncStage, SyncTelemetry
 from backend.shared import domain_events
 from backend.shared.event import Event
 from backend.synchronizer.ics_parser import IcsParser
-from backend.synchronizer.ics_source import IcsSource, UrlIcsSource
+from backend.synchronizer.ics_source import IcsSource, StringIcsSource, UrlIcsSource
+from tests.util import streamed_response
 
 
 @pytest.fixture
@@ -87,6 +95,26 @@ class TestTryFetchAndParse:
             metadata={"test": "test"},
         )
 
+    def test_reports_to_telemetry(
+        self,
+        service: IcsService,
+        mock_ics_source: Mock,
+        mock_ics_parser: Mock,
+    ) -> None:
+        mock_ics_source.get_ics_string.return_value = "BEGIN:VCALENDAR é"
+        mock_ics_parser.try_parse.return_value = []
+        telemetry = SyncTelemetry(
+            user_id="user123",
+            sync_profile_id="profileABC",
+            sync_trigger=SyncTrigger.MANUAL,
+            sync_type=SyncType.REGULAR,
+        )
+
+        service.try_fetch_and_parse(mock_ics_source, telemetry=telemetry)
+
+        assert set(telemetry.stage_durations_s) == {SyncStage.FETCH, SyncStage.PARSE}
+        assert telemetry.counters == {"ics_bytes": 18}
+
     def test_fetch_error(
         self,
         service: IcsService,
@@ -134,6 +162,150 @@ class TestTryFetchAndParse:
         )
 
 
+class TestIcsResultCache:
+    def test_cache_hit_skips_fetch_parse_and_publish(
+        self,
+        service: IcsService,
+        mock_ics_parser: Mock,
+        mock_event_bus: MockEventBus,
+        mock_events: list[Event],
+    ) -> None:
+        # Arrange
+        mock_ics_parser.try_parse.return_value = mock_events
+        cache = IcsResultCache()
+        source = StringIcsSource(ics_string="BEGIN:VCALENDAR...")
+
+        # Act
+        first = service.try_fetch_and_parse(source, cache=cache)
+        second = service.try_fetch_and_parse(
+            StringIcsSource(ics_string="BEGIN:VCALENDAR..."), cache=cache
+        )
+
+        # Assert
+        assert isinstance(first, IcsFetchAndParseResult)
+        assert second is first
+        mock_ics_parser.try_parse.assert_called_once()
+        mock_event_bus.assert_event_published(domain_events.IcsFetched, count=1)
+
+    def test_cache_is_keyed_by_source(
+        self,
+        service: IcsService,
+        mock_ics_parser: Mock,
+        mock_events: list[Event],
+    ) -> None:
+        mock_ics_parser.try_parse.return_value = mock_events
+        cache = IcsResultCache()
+
+        service.try_fetch_and_parse(StringIcsSource(ics_string="A"), cache=cache)
+        service.try_fetch_and_parse(StringIcsSource(ics_string="B"), cache=cache)
+
+        assert mock_ics_parser.try_parse.call_count == 2
+
+    def test_errors_are_not_cached(
+        self,
+        service: IcsService,
+        mock_ics_parser: Mock,
+        mock_events: list[Event],
+    ) -> None:
+        cache = IcsResultCache()
+        source = StringIcsSource(ics_string="BEGIN:VCALENDAR...")
+
+        mock_ics_parser.try_parse.return_value = IcsParsingError("Invalid format")
+        first = service.try_fetch_and_parse(source, cache=cache)
+        mock_ics_parser.try_parse.return_value = mock_events
+        second = service.try_fetch_and_parse(source, cache=cache)
+
+        assert isinstance(first, IcsParsingError)
+        assert isinstance(second, IcsFetchAndParseResult)
+
+    def test_validate_ics_url_or_raise_fills_cache(
+        self,
+        service: IcsService,
+        mock_ics_parser: Mock,
+        mock_events: list[Event],
+    ) -> None:
+        mock_ics_parser.try_parse.return_value = mock_events
+        cache = IcsResultCache()
+        source = StringIcsSource(ics_string="BEGIN:VCALENDAR...")
+
+        result = service.validate_ics_url_or_raise(source, cache=cache)
+
+        assert cache.get(source) is result
+
+
+class TestTryFetchAndParseAsync:
+    @pytest.mark.anyio
+    async def test_successful_fetch_and_parse(
+        self,
+        service: IcsService,
+        mock_ics_parser: Mock,
+        mock_event_bus: MockEventBus,
+        mock_events: list[Event],
+    ) -> None:
+        # Arrange
+        mock_ics_parser.try_parse.return_value = mock_events
+        ics_content = "BEGIN:VCALENDAR..."
+        transport = httpx.MockTransport(
+            lambda request: streamed_response(
+                200, ics_content, headers={"Content-Type": "text/calendar"}
+            )
+        )
+        source = UrlIcsSource(url=HttpUrl("https://example.com/calendar.ics"))
+        cache = IcsResultCache()
+
+        # Act
+        async with httpx.AsyncClient(transport=transport) as client:
+            result = await service.try_fetch_and_parse_async(
+                source, metadata={"test": "test"}, cache=cache, http_client=client
+            )
+
+        # Assert
+        assert isinstance(result, IcsFetchAndParseResult)
+        assert result.events == mock_events
+        assert result.raw_ics == ics_content
+        assert cache.get(source) is result
+        mock_ics_parser.try_parse.assert_called_once_with(ics_content)
+        mock_event_bus.assert_event_published_with_data(
+            domain_events.IcsFetched,
+            ics_str=ics_content,
+            metadata={"test": "test", "url": "https://example.com/calendar.ics"},
+        )
+
+    @pytest.mark.anyio
+    async def test_fetch_error(
+        self,
+        service: IcsService,
+        mock_ics_parser: Mock,
+        mock_event_bus: MockEventBus,
+    ) -> None:
+        transport = httpx.MockTransport(lambda request: httpx.Response(500))
+        source = UrlIcsSource(url=HttpUrl("https://example.com/calendar.ics"))
+
+        async with httpx.AsyncClient(transport=transport) as client:
+            result = await service.try_fetch_and_parse_async(source, http_client=client)
+
+        assert isinstance(result, IcsSourceError)
+        mock_ics_parser.try_parse.assert_not_called()
+        mock_event_bus.assert_event_published(domain_events.IcsFetched, count=0)
+
+    @pytest.mark.anyio
+    async def test_validate_ics_url_async(
+        self,
+        service: IcsService,
+        mock_ics_parser: Mock,
+        mock_events: list[Event],
+    ) -> None:
+        mock_ics_parser.try_parse.return_value = mock_events
+
+        result = await service.validate_ics_url_async(
+            StringIcsSource(ics_string="BEGIN:VCALENDAR...")
+        )
+
+        assert result == ValidateIcsUrlOutput(
+            valid=True, error=None, nb_events=len(mock_events)
+        )
+
+
 class TestValidateIcsUrl:
     def test_successful_validation(
         self,
@@ -158,7 +330,7 @@ class TestValidateIcsUrl:
         assert result.error is None
         assert result.nb_events == len(mock_events)
         service.try_fetch_and_parse.assert_called_once_with(
-            mock_ics_source, metadata={"test": "test"}
+            mock_ics_source, metadata={"test": "test"}, cache=None
         )
 
     def test_source_error(
@@ -0,0 +1,251 @@
+import time
+from typing import Any
+
+import pytest
+import requests
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+from firebase_admin import auth
+from google.auth import crypt, jwt
+
+from backend.services.id_token_verifier import (
+    FirebaseIdTokenVerifier,
+    FirebasePublicKeys,
+    VerifiedTokenCache,
+)
+from tests.util import FakeClock
+
+PROJECT_ID = "syncademic-test"
+
+
+class KeyPair:
+    def __init__(self, key_id: str) -> None:
+        private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+        self.key_id = key_id
+        self.signer = crypt.RSASigner.from_string(
+            private_key.private_bytes(
+                serialization.Encoding.PEM,
+                serialization.PrivateFormat.PKCS8,
+                serialization.NoEncryption(),
+            ),
+            key_id=key_id,
+        )
+        self.public_pem = (
+            private_key.public_key()
+            .public_bytes(
+                serialization.Encoding.PEM,
+                serialization.PublicFormat.SubjectPublicKeyInfo,
+            )
+            .decode()
+        )
+
+
+@pytest.fixture(scope="module")
+def key() -> KeyPair:
+    return KeyPair("key-1")
+
+
+@pytest.fixture(scope="module")
+def rotated_key() -> KeyPair:
+    return KeyPair("key-2")
+
+
+@pytest.fixture
+def clock() -> FakeClock:
+    return FakeClock(time.time())
+
+
+class FakeCertsEndpoint:
+    def __init__(self, keys: list[KeyPair], max_age_s: float = 3600) -> None:
+        self.keys = keys
+        self.max_age_s = max_age_s
+        self.calls = 0
+
+    def __call__(self) -> tuple[dict[str, str], float]:
+        self.calls += 1
+        return {k.key_id: k.public_pem for k in self.keys}, self.max_age_s
+
+
+def make_token(key: KeyPair, clock: FakeClock, **overrides: Any) -> str:
+    now = int(clock.now)
+    payload = {
+        "iss": f"https://securetoken.google.com/{PROJECT_ID}",
+        "aud": PROJECT_ID,
+        "sub": "user-1",
+        "email": "user@example.com",
+        "iat": now,
+        "exp": now + 3600,
+    }
+    payload.update(overrides)
+    return jwt.encode(key.signer, payload).decode()
+
+
+def make_verifier(
+    certs: FakeCertsEndpoint, clock: FakeClock, max_ttl_s: float = 300
+) -> FirebaseIdTokenVerifier:
+    return FirebaseIdTokenVerifier(
+        project_id=PROJECT_ID,
+        public_keys=FirebasePublicKeys(certs, clock=clock),
+        cache=VerifiedTokenCache(max_size=10, max_ttl_s=max_ttl_s, clock=clock),
+    )
+
+
+class TestVerifiedTokenCache:
+    def test_entries_expire_at_ttl(self, clock: FakeClock) -> None:
+        cache = VerifiedTokenCache(max_size=10, max_ttl_s=60, clock=clock)
+        cache.put("token", {"exp": clock.now + 3600, "uid": "u"})
+
+        clock.now += 59
+        assert cache.get("token") is not None
+        clock.now += 1
+        assert cache.get("token") is None
+
+    def test_entries_never_outlive_the_token(self, clock: FakeClock) -> None:
+        cache = VerifiedTokenCache(max_size=10, max_ttl_s=3600, clock=clock)
+        cache.put("token", {"exp": clock.now + 10})
+
+        clock.now += 10
+        assert cache.get("token") is None
+
+    def test_least_recently_used_entry_is_evicted(self, clock: FakeClock) -> None:
+        cache = VerifiedTokenCache(max_size=2, max_ttl_s=60, clock=clock)
+        claims = {"exp": clock.now + 3600}
+        cache.put("a", claims)
+        cache.put("b", claims)
+        cache.get("a")
+        cache.put("c", claims)
+
+        assert cache.get("a") is not None
+        assert cache.get("b") is None
+        assert cache.get("c") is not None
+        assert len(cache) == 2
+
+
+class TestFirebaseIdTokenVerifier:
+    def test_valid_token(self, key: KeyPair, clock: FakeClock) -> None:
+        verifier = make_verifier(FakeCertsEndpoint([key]), clock)
+
+        claims = verifier.verify(make_token(key, clock))
+
+        assert claims["uid"] == "user-1"
+        assert claims["email"] == "user@example.com"
+
+    def test_verified_tokens_are_cached(
+        self, key: KeyPair, clock: FakeClock, mocker
+    ) -> None:
+        verifier = make_verifier(FakeCertsEndpoint([key]), clock)
+        token = make_token(key, clock)
+        decode = mocker.spy(jwt, "decode")
+
+        verifier.verify(token)
+        verifier.verify(token)
+
+        assert decode.call_count == 1
+
+    def test_expired_token(self, key: KeyPair, clock: FakeClock) -> None:
+        verifier = make_verifier(FakeCertsEndpoint([key]), clock)
+        token = make_token(
+            key, clock, iat=int(clock.now) - 7200, exp=int(clock.now) - 3600
+        )
+
+        with pytest.raises(auth.ExpiredIdTokenError):
+            verifier.verify(token)
+
+    @pytest.mark.parametrize(
+        "overrides",
+        [
+            {"aud": "another-project"},
+            {"iss": "https://securetoken.google.com/another-project"},
+            {"sub": ""},
+            {"sub": "x" * 129},
+        ],
+    )
+    def test_invalid_claims(
+        self, key: KeyPair, clock: FakeClock, overrides: dict[str, Any]
+    ) -> None:
+        verifier = make_verifier(FakeCertsEndpoint([key]), clock)
+
+        with pytest.raises(auth.InvalidIdTokenError):
+            verifier.verify(make_token(key, clock, **overrides))
+
+    def test_invalid_signature(self, key: KeyPair, clock: FakeClock) -> None:
+        # Signed by another private key, but claiming the known key id
+        forged = KeyPair(key.key_id)
+        verifier = make_verifier(FakeCertsEndpoint([key]), clock)
+
+        with pytest.raises(auth.InvalidIdTokenError):
+            verifier.verify(make_token(forged, clock))
+
+    def test_malformed_token(self, key: KeyPair, clock: FakeClock) -> None:
+        verifier = make_verifier(FakeCertsEndpoint([key]), clock)
+
+        with pytest.raises(auth.InvalidIdTokenError):
+            verifier.verify("not-a-jwt")
+
+    def test_unknown_key_triggers_one_refresh(
+        self, key: KeyPair, rotated_key: KeyPair, clock: FakeClock
+    ) -> None:
+        certs = FakeCertsEndpoint([key])
+        verifier = make_verifier(certs, clock)
+        verifier.verify(make_token(key, clock))
+
+        # Google rotates the keys
+        token = make_token(rotated_key, clock, sub="user-2")
+        certs.keys = [key, rotated_key]
+        clock.now += 120
+        claims = verifier.verify(token)
+
+        assert claims["uid"] == "user-2"
+        assert certs.calls == 2
+
+    def test_unknown_key_refreshes_are_rate_limited(
+        self, key: KeyPair, rotated_key: KeyPair, clock: FakeClock
+    ) -> None:
+        certs = FakeCertsEndpoint([key])
+        verifier = make_verifier(certs, clock)
+        verifier.verify(make_token(key, clock))
+
+        for sub in ["a", "b", "c"]:
+            with pytest.raises(auth.InvalidIdTokenError, match="unknown key"):
+                verifier.verify(make_token(rotated_key, clock, sub=sub))
+
+        assert certs.calls == 1
+
+    def test_certificate_fetch_error(self, key: KeyPair, clock: FakeClock) -> None:
+        def failing_fetch() -> tuple[dict[str, str], float]:
+            raise requests.ConnectionError("down")
+
+        verifier = FirebaseIdTokenVerifier(
+            project_id=PROJECT_ID,
+            public_keys=FirebasePublicKeys(failing_fetch, clock=clock),
+            cache=VerifiedTokenCache(max_size=10, max_ttl_s=300, clock=clock),
+        )
+
+        with pytest.raises(auth.CertificateFetchError):
+            verifier.verify(make_token(key, clock))
+
+    @pytest.mark.anyio
+    async def test_verify_async(self, key: KeyPair, clock: FakeClock) -> None:
+        verifier = make_verifier(FakeCertsEndpoint([key]), clock)
+
+        claims = await verifier.verify_async(make_token(key, clock))
+
+        assert claims["uid"] == "user-1"
+
+
+class TestFirebasePublicKeys:
+    def test_keys_are_fetched_once_until_they_expire(
+        self, key: KeyPair, clock: FakeClock
+    ) -> None:
+        certs = FakeCertsEndpoint([key], max_age_s=600)
+        public_keys = FirebasePublicKeys(certs, clock=clock)
+
+        public_keys.get()
+        clock.now += 599
+        public_keys.get()
+        assert certs.calls == 1
+
+        clock.now += 1
+        public_keys.get()
+        assert certs.calls == 2
+        assert public_keys.seconds_until_expiry() == 600
@@ -0,0 +1,129 @@
+import threading
+
+import pytest
+
+from backend.models.sync_job import SyncJobStatus
+from backend.models.sync_profile import SyncTrigger, SyncType
+from backend.services.sync_job_queue import InMemorySyncJobQueue
+
+
+@pytest.fixture
+def queue() -> InMemorySyncJobQueue:
+    return InMemorySyncJobQueue()
+
+
+def test_enqueue_returns_pending_job(queue: InMemorySyncJobQueue) -> None:
+    job = queue.enqueue("user", "profile", SyncTrigger.MANUAL)
+
+    assert job.status == SyncJobStatus.PENDING
+    assert job.sync_type == SyncType.REGULAR
+    assert queue.get_job(job.id) == job
+
+
+def test_requests_for_a_pending_profile_are_merged(
+    queue: InMemorySyncJobQueue,
+) -> None:
+    first = queue.enqueue("user", "profile", SyncTrigger.SCHEDULED)
+    second = queue.enqueue("user", "profile", SyncTrigger.MANUAL)
+    third = queue.enqueue("user", "profile", SyncTrigger.MANUAL, SyncType.FULL)
+    fourth = queue.enqueue("user", "profile", SyncTrigger.SCHEDULED)
+
+    assert first.id == second.id == third.id == fourth.id
+    job = queue.dequeue()
+    assert job is not None
+    assert job.sync_trigger == SyncTrigger.MANUAL
+    assert job.sync_type == SyncType.FULL
+    assert job.merged_requests == 4
+    assert queue.dequeue() is None
+
+
+def test_merged_sync_type_is_the_widest(queue: InMemorySyncJobQueue) -> None:
+    queue.enqueue("user", "profile", SyncTrigger.SCHEDULED, SyncType.WINDOW)
+    assert queue.enqueue("user", "profile", SyncTrigger.SCHEDULED).sync_type == (
+        SyncType.REGULAR
+    )
+    assert (
+        queue.enqueue(
+            "user", "profile", SyncTrigger.SCHEDULED, SyncType.WINDOW
+        ).sync_type
+        == SyncType.REGULAR
+    )
+
+
+def test_manual_jobs_run_before_scheduled_ones(queue: InMemorySyncJobQueue) -> None:
+    queue.enqueue("user", "scheduled-1", SyncTrigger.SCHEDULED)
+    queue.enqueue("user", "scheduled-2", SyncTrigger.SCHEDULED)
+    queue.enqueue("user", "manual", SyncTrigger.MANUAL)
+    # Upgraded by a manual request after it was queued
+    queue.enqueue("user", "scheduled-2", SyncTrigger.MANUAL)
+
+    order = []
+    while (job := queue.dequeue()) is not None:
+        order.append(job.sync_profile_id)
+        queue.complete(job.id)
+
+    assert order == ["manual", "scheduled-2", "scheduled-1"]
+
+
+def test_jobs_of_a_running_profile_wait(queue: InMemorySyncJobQueue) -> None:
+    running = queue.enqueue("user", "profile", SyncTrigger.SCHEDULED)
+    assert queue.dequeue() is not None
+
+    # A new request while the profile syncs is not merged into the running job
+    pending = queue.enqueue("user", "profile", SyncTrigger.MANUAL)
+    other = queue.enqueue("user", "other", SyncTrigger.SCHEDULED)
+    assert pending.id != running.id
+
+    job = queue.dequeue()
+    assert job is not None and job.id == other.id
+    assert queue.dequeue() is None
+
+    queue.complete(running.id)
+    job = queue.dequeue()
+    assert job is not None and job.id == pending.id
+
+
+def test_complete_records_outcome(queue: InMemorySyncJobQueue) -> None:
+    ok = queue.enqueue("user", "ok", SyncTrigger.MANUAL)
+    failed = queue.enqueue("user", "failed", SyncTrigger.MANUAL)
+    queue.dequeue()
+    queue.dequeue()
+
+    queue.complete(ok.id)
+    queue.complete(failed.id, error="boom")
+
+    assert queue.get_job(ok.id).status == SyncJobStatus.SUCCEEDED  # type: ignore
+    failed_job = queue.get_job(failed.id)
+    assert failed_job is not None
+    assert failed_job.status == SyncJobStatus.FAILED
+    assert failed_job.error == "boom"
+
+
+def test_finished_jobs_are_bounded() -> None:
+    queue = InMemorySyncJobQueue(max_finished_jobs=1)
+    first = queue.enqueue("user", "a", SyncTrigger.MANUAL)
+    queue.complete(queue.dequeue().id)  # type: ignore
+    second = queue.enqueue("user", "b", SyncTrigger.MANUAL)
+    queue.complete(queue.dequeue().id)  # type: ignore
+
+    assert queue.get_job(first.id) is None
+    assert queue.get_job(second.id) is not None
+
+
+def test_dequeue_waits_for_a_job(queue: InMemorySyncJobQueue) -> None:
+    timer = threading.Timer(
+        0.05, lambda: queue.enqueue("user", "profile", SyncTrigger.MANUAL)
+    )
+    timer.start()
+
+    job = queue.dequeue(timeout_s=5)
+
+    assert job is not None
+    assert job.status == SyncJobStatus.RUNNING
+
+
+def test_returned_jobs_are_snapshots(queue: InMemorySyncJobQueue) -> None:
+    job = queue.enqueue("user", "profile", SyncTrigger.MANUAL)
+    job.sync_type = SyncType.FULL
+
+    assert queue.get_job(job.id).sync_type == SyncType.REGULAR  # type: ignore
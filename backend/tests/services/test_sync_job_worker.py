@@ -0,0 +1,76 @@
+import threading
+from unittest.mock import Mock, create_autospec
+
+import pytest
+
+from backend.models.sync_job import SyncJobStatus
+from backend.models.sync_profile import SyncTrigger, SyncType
+from backend.services.exceptions.sync import DailySyncLimitExceededError
+from backend.services.sync_job_queue import InMemorySyncJobQueue
+from backend.services.sync_job_worker import SyncJobWorker, SyncJobWorkerPool
+from backend.services.sync_profile_service import SyncProfileService
+
+
+@pytest.fixture
+def queue() -> InMemorySyncJobQueue:
+    return InMemorySyncJobQueue()
+
+
+@pytest.fixture
+def sync_profile_service() -> Mock:
+    return create_autospec(SyncProfileService, instance=True)
+
+
+@pytest.fixture
+def worker(queue: InMemorySyncJobQueue, sync_profile_service: Mock) -> SyncJobWorker:
+    return SyncJobWorker(queue, sync_profile_service)
+
+
+def test_run_pending_synchronizes_each_profile_once(
+    queue: InMemorySyncJobQueue, worker: SyncJobWorker, sync_profile_service: Mock
+) -> None:
+    job = queue.enqueue("user", "profile", SyncTrigger.MANUAL)
+    queue.enqueue("user", "profile", SyncTrigger.MANUAL, SyncType.FULL)
+
+    assert worker.run_pending() == 1
+
+    sync_profile_service.synchronize.assert_called_once_with(
+        user_id="user",
+        sync_profile_id="profile",
+        sync_trigger=SyncTrigger.MANUAL,
+        sync_type=SyncType.FULL,
+    )
+    assert queue.get_job(job.id).status == SyncJobStatus.SUCCEEDED  # type: ignore
+
+
+def test_failed_job_does_not_stop_the_others(
+    queue: InMemorySyncJobQueue, worker: SyncJobWorker, sync_profile_service: Mock
+) -> None:
+    sync_profile_service.synchronize.side_effect = [
+        DailySyncLimitExceededError("limit reached"),
+        None,
+    ]
+    failing = queue.enqueue("user", "a", SyncTrigger.SCHEDULED)
+    succeeding = queue.enqueue("user", "b", SyncTrigger.SCHEDULED)
+
+    assert worker.run_pending() == 2
+
+    failing_job = queue.get_job(failing.id)
+    assert failing_job is not None
+    assert failing_job.status == SyncJobStatus.FAILED
+    assert failing_job.error == "limit reached"
+    assert queue.get_job(succeeding.id).status == SyncJobStatus.SUCCEEDED  # type: ignore
+
+
+def test_worker_pool_runs_queued_jobs(
+    queue: InMemorySyncJobQueue, worker: SyncJobWorker, sync_profile_service: Mock
+) -> None:
+    done = threading.Event()
+    sync_profile_service.synchronize.side_effect = lambda **kwargs: done.set()
+    pool = SyncJobWorkerPool(worker, n_workers=2)
+    pool.start()
+    try:
+        queue.enqueue("user", "profile", SyncTrigger.MANUAL)
+        assert done.wait(timeout=5)
+    finally:
+        pool.stop(timeout_s=5)
@@ -0,0 +1,89 @@
+from datetime import UTC, datetime, timedelta
+
+import pytest
+from pydantic import HttpUrl
+
+from backend.models.sync_profile import (
+    ScheduleSource,
+    SyncProfile,
+    SyncProfileStatus,
+    SyncProfileStatusType,
+    TargetCalendar,
+)
+from backend.repositories.sync_profile_repository import MockSyncProfileRepository
+from backend.services.exceptions.sync import SyncInProgressError
+from backend.services.sync_lease_heartbeat import SyncLeaseHeartbeat
+
+
+@pytest.fixture
+def repo() -> MockSyncProfileRepository:
+    repo = MockSyncProfileRepository()
+    repo.save_sync_profile(
+        SyncProfile(
+            id="profile1",
+            user_id="user1",
+            title="Test Profile",
+            schedule_source=ScheduleSource(
+                url=HttpUrl("https://example.com/calendar.ics")
+            ),
+            target_calendar=TargetCalendar(
+                id="cal1",
+                title="My Calendar",
+                provider_account_id="acc1",
+                provider_account_email="test@example.com",
+            ),
+            status=SyncProfileStatus(type=SyncProfileStatusType.SUCCESS),
+        )
+    )
+    assert repo.try_acquire_sync_lease(
+        "user1",
+        "profile1",
+        owner="run",
+        ttl_s=60,
+        status=SyncProfileStatus(type=SyncProfileStatusType.IN_PROGRESS),
+    )
+    return repo
+
+
+def _heartbeat(repo: MockSyncProfileRepository, **kwargs) -> SyncLeaseHeartbeat:
+    return SyncLeaseHeartbeat(
+        repo,
+        user_id="user1",
+        sync_profile_id="profile1",
+        owner="run",
+        ttl_s=60,
+        **kwargs,
+    )
+
+
+def _lease_expires_at(repo: MockSyncProfileRepository) -> datetime:
+    profile = repo.get_sync_profile("user1", "profile1")
+    assert profile is not None and profile.lease is not None
+    return profile.lease.expires_at
+
+
+def test_heartbeat_renews_lease_in_background(repo: MockSyncProfileRepository):
+    expires_at = _lease_expires_at(repo)
+
+    with _heartbeat(repo, interval_s=0.01) as heartbeat:
+        deadline = datetime.now(UTC) + timedelta(seconds=5)
+        while _lease_expires_at(repo) == expires_at and datetime.now(UTC) < deadline:
+            pass
+
+    assert _lease_expires_at(repo) > expires_at
+    assert not heartbeat.lost
+
+
+def test_ensure_held_raises_once_lease_is_taken_over(
+    repo: MockSyncProfileRepository,
+):
+    with _heartbeat(repo) as heartbeat:
+        heartbeat.ensure_held()
+
+        profile = repo.get_sync_profile("user1", "profile1")
+        assert profile is not None and profile.lease is not None
+        profile.lease.owner = "other_run"
+
+        with pytest.raises(SyncInProgressError):
+            heartbeat.ensure_held()
+        assert heartbeat.lost
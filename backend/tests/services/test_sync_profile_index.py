@@ -0,0 +1,110 @@
+from datetime import UTC, datetime, timedelta
+from unittest.mock import Mock
+
+from pydantic import HttpUrl
+
+from backend.models.sync_profile import (
+    ScheduleSource,
+    SyncProfile,
+    SyncProfileStatus,
+    SyncProfileStatusType,
+    TargetCalendar,
+)
+from backend.repositories.sync_profile_repository import MockSyncProfileRepository
+from backend.services.sync_profile_index import SyncProfileIndex
+from tests.util import FakeClock
+
+
+def _make_profile(
+    sync_profile_id: str,
+    status_type: SyncProfileStatusType = SyncProfileStatusType.SUCCESS,
+) -> SyncProfile:
+    return SyncProfile(
+        id=sync_profile_id,
+        user_id="user1",
+        title="Test Profile",
+        schedule_source=ScheduleSource(url=HttpUrl("https://example.com/calendar.ics")),
+        target_calendar=TargetCalendar(
+            id="cal1",
+            title="My Calendar",
+            provider_account_id="acc1",
+            provider_account_email="test@example.com",
+        ),
+        status=SyncProfileStatus(type=status_type),
+    )
+
+
+def test_refresh_only_loads_updated_profiles() -> None:
+    repo = MockSyncProfileRepository()
+    repo.save_sync_profile(_make_profile("p1"))
+    repo.save_sync_profile(_make_profile("p2"))
+    spy = Mock(wraps=repo)
+    clock = FakeClock()
+    index = SyncProfileIndex(spy, full_refresh_interval_s=600, clock=clock)
+
+    index.refresh()
+    assert {profile.id for profile in index.profiles()} == {"p1", "p2"}
+
+    updated = _make_profile("p2", SyncProfileStatusType.FAILED)
+    repo.save_sync_profile(updated)
+    repo.save_sync_profile(_make_profile("p3"))
+    index.refresh()
+
+    spy.list_all_sync_profiles.assert_called_once()
+    since = spy.list_sync_profiles_updated_since.call_args.args[0]
+    assert since < updated.updated_at
+    assert index.get("p2") == updated
+    assert index.get("p3") is not None
+    assert index.get("unknown") is None
+
+    # Deletions are seen by the next full load
+    repo.delete_sync_profile("user1", "p1")
+    clock.now = 600
+    index.refresh()
+    assert spy.list_all_sync_profiles.call_count == 2
+    assert index.get("p1") is None
+
+
+def test_watermark_ignores_profiles_without_write_time() -> None:
+    """Profiles stored before `updated_at` was introduced read back without one."""
+    written_at = datetime(2024, 12, 24, tzinfo=UTC)
+    legacy = _make_profile("legacy")
+    assert legacy.updated_at is None
+    written = _make_profile("written").model_copy(update={"updated_at": written_at})
+    repo = Mock()
+    repo.list_all_sync_profiles.return_value = [legacy, written]
+    repo.list_sync_profiles_updated_since.return_value = []
+    index = SyncProfileIndex(repo, full_refresh_interval_s=600, clock=FakeClock())
+
+    index.refresh()
+    index.refresh()
+
+    repo.list_all_sync_profiles.assert_called_once()
+    since = repo.list_sync_profiles_updated_since.call_args.args[0]
+    assert written_at - timedelta(minutes=5) < since < written_at
+
+
+def test_invalidate_forces_full_load() -> None:
+    repo = Mock(wraps=MockSyncProfileRepository())
+    repo.save_sync_profile(_make_profile("p1"))
+    index = SyncProfileIndex(repo)
+    index.refresh()
+
+    index.invalidate()
+    index.refresh()
+
+    assert repo.list_all_sync_profiles.call_count == 2
+    repo.list_sync_profiles_updated_since.assert_not_called()
+
+
+def test_count_sync_profiles_by_status() -> None:
+    repo = MockSyncProfileRepository()
+    repo.save_sync_profile(_make_profile("p1"))
+    repo.save_sync_profile(_make_profile("p2", SyncProfileStatusType.FAILED))
+    repo.save_sync_profile(_make_profile("p3", SyncProfileStatusType.FAILED))
+
+    counts = repo.count_sync_profiles_by_status()
+
+    assert counts[SyncProfileStatusType.FAILED] == 2
+    assert counts[SyncProfileStatusType.SUCCESS] == 1
+    assert counts[SyncProfileStatusType.IN_PROGRESS] == 0
@@ -1,10 +1,15 @@
+from datetime import UTC, datetime, timedelta
+
 from pydantic import HttpUrl
 import pytest
 import arrow
-from unittest.mock import Mock
+from unittest.mock import Mock, create_autospec
+
+from backend.ai.ruleset_builder import RulesetBuilder
 
 from backend.infrastructure.event_bus import MockEventBus
 from backend.models.sync_profile import (
+    SyncLease,
     SyncProfile,
     SyncProfileStatus,
     SyncProfileStatusType,
@@ -14,26 +19,46 @@ from backend.models.sync_profile import (
     TargetCalendar,
 )
 from backend.services.ai_ruleset_service import AiRulesetService
-from backend.services.exceptions.sync import DailySyncLimitExceededError
+from backend.services.exceptions.sync import (
+    DailySyncLimitExceededError,
+    SyncProfileNotFoundError,
+)
 from backend.services.google_calendar_service import GoogleCalendarService
+from backend.services.sync_telemetry import (
+    InMemoryMetricsSink,
+    SyncOutcome,
+    SyncStage,
+)
 from backend.shared import domain_events
 from backend.shared.event import Event
 from backend.shared.google_calendar_colors import GoogleEventColor
-from backend.services.sync_profile_service import SyncProfileService
+from backend.services.sync_profile_service import (
+    MAX_CREATION_ICS_CACHES,
+    SYNC_SKIPPED_UNCHANGED_MESSAGE,
+    SyncProfileService,
+)
 from backend.services.exceptions.ics import (
+    IcsHostUnavailableError,
     IcsParsingError,
     IcsSourceError,
 )
-from backend.services.ics_service import IcsFetchAndParseResult
+from backend.services.sync_scheduler import SyncScheduler
+from backend.services.ics_service import (
+    IcsFetchAndParseResult,
+    IcsResultCache,
+    IcsService,
+)
 from backend.repositories.sync_stats_repository import MockSyncStatsRepository
 from backend.repositories.sync_profile_repository import MockSyncProfileRepository
 from backend.synchronizer.google_calendar_manager import MockGoogleCalendarManager
+from backend.synchronizer.ics_source import UrlIcsSource
 from backend.models.schemas import (
     CreateSyncProfileInput,
     CreateNewTargetCalendarInput,
     UseExistingTargetCalendarInput,
 )
 from backend.services.exceptions.target_calendar import TargetCalendarNotFoundError
+from tests.util import VALID_RULESET
 
 
 def _make_sync_profile(
@@ -108,6 +133,11 @@ def ai_ruleset_service() -> AiRulesetService:
     return Mock()
 
 
+@pytest.fixture
+def metrics_sink() -> InMemoryMetricsSink:
+    return InMemoryMetricsSink()
+
+
 @pytest.fixture
 def sync_profile_service(
     sync_profile_repo,
@@ -117,6 +147,7 @@ def sync_profile_service(
     mock_event_bus,
     google_calendar_service,
     ai_ruleset_service,
+    metrics_sink,
 ):
     """Create a SyncProfileService with the real MockSyncProfileRepository."""
     return SyncProfileService(
@@ -127,6 +158,7 @@ def sync_profile_service(
         event_bus=mock_event_bus,
         google_calendar_service=google_calendar_service,
         ai_ruleset_service=ai_ruleset_service,
+        metrics_sink=metrics_sink,
     )
 
 
@@ -513,6 +545,7 @@ def test_fails_on_ics_fetch_error(
         sync_profile_id=prof_id,
         error_type=type(error).__name__,
         error_message=str(error),
+        ics_host="example.com",
     )
 
     assert (
@@ -521,6 +554,46 @@ def test_fails_on_ics_fetch_error(
     )
 
 
+def test_sync_deferred_when_ics_host_unavailable(
+    sync_profile_service,
+    sync_profile_repo,
+    auth_service_mock,
+    ics_service_mock,
+    mock_event_bus,
+):
+    """
+    The ICS server is known to be down => FAILED status, but no SyncFailed
+    notification, the digest is kept and the next scheduled run is backed off.
+    """
+    ics_service_mock.try_fetch_and_parse.return_value = IcsHostUnavailableError(
+        "The calendar server ade.example.com is currently unavailable.",
+        details={"host": "ade.example.com"},
+    )
+    profile = _make_sync_profile(sync_profile_id="profile_deferred")
+    profile.last_sync_digest = "digest of the last successful sync"
+    sync_profile_repo.save_sync_profile(profile)
+    manager = Mock(wraps=MockGoogleCalendarManager(), api_calls=0)
+    auth_service_mock.get_authenticated_google_calendar_manager.return_value = manager
+
+    sync_profile_service.synchronize(
+        user_id="user123",
+        sync_profile_id="profile_deferred",
+        sync_trigger=SyncTrigger.SCHEDULED,
+    )
+
+    stored = sync_profile_repo.get_sync_profile("user123", "profile_deferred")
+    assert stored is not None
+    assert stored.status.type == SyncProfileStatusType.FAILED
+    assert stored.status.message is not None and "unavailable" in stored.status.message
+    assert stored.last_sync_digest == "digest of the last successful sync"
+    assert stored.sync_schedule is not None
+    assert stored.sync_schedule.consecutive_failures == 1
+    assert stored.lease is None
+    manager.delete_events.assert_not_called()
+    manager.create_events.assert_not_called()
+    assert mock_event_bus.find_events(domain_events.SyncFailed) == []
+
+
 def test_fails_on_ics_parse_error(
     sync_profile_service,
     sync_profile_repo,
@@ -976,9 +1049,9 @@ def test_create_sync_profile_success(
     # Mock authorization test
     auth_service_mock.test_authorization.return_value = None
     # Mock ICS URL validation
-    ics_service_mock.validate_ics_url_or_raise.return_value = None
-    # Mock ruleset creation
-    ai_ruleset_service.create_ruleset_for_sync_profile.return_value = None
+    ics_service_mock.validate_ics_url_or_raise.return_value = IcsFetchAndParseResult(
+        events=[], raw_ics="mock irrelevant ics value"
+    )
     # Mock synchronize (don't actually run sync logic)
     sync_profile_service.synchronize = Mock()
 
@@ -1017,15 +1090,98 @@ def test_create_sync_profile_success(
         sync_profile_id=fixed_uuid,
     )
 
-    # Assert ruleset creation called
-    ai_ruleset_service.create_ruleset_for_sync_profile.assert_called_once()
-    # Assert synchronize called for initial sync
-    sync_profile_service.synchronize.assert_called_once_with(
-        user_id=user_id,
-        sync_profile_id=fixed_uuid,
-        sync_trigger=SyncTrigger.ON_CREATE,
+    # Ruleset generation and initial sync are left to the SyncProfileCreated reaction
+    ai_ruleset_service.create_ruleset_for_sync_profile.assert_not_called()
+    sync_profile_service.synchronize.assert_not_called()
+
+
+def test_create_sync_profile_reuses_given_ics_cache(
+    sync_profile_service,
+    auth_service_mock,
+    ics_service_mock,
+    google_calendar_service,
+):
+    """An ICS cache filled by the caller is used for validation and kept for initialization."""
+    google_calendar_service.get_calendar_by_id.return_value = {
+        "id": "existing_cal_id",
+        "summary": "Existing Calendar",
+        "description": "Existing desc",
+    }
+    auth_service_mock.get_provider_account_email.return_value = "user@example.com"
+    ics_cache = IcsResultCache()
+    request = CreateSyncProfileInput(
+        title="My Test Profile",
+        schedule_source=ScheduleSource(url=HttpUrl("https://example.com/test.ics")),
+        target_calendar=UseExistingTargetCalendarInput(
+            type="useExisting",
+            calendar_id="existing_cal_id",
+            provider_account_id="provider123",
+        ),
     )
 
+    sync_profile_service.create_sync_profile(
+        user_id="user_create",
+        request=request,
+        uuid_factory=lambda: "profile_id",
+        ics_cache=ics_cache,
+    )
+
+    validate_call = ics_service_mock.validate_ics_url_or_raise.call_args
+    assert validate_call.kwargs["cache"] is ics_cache
+    assert sync_profile_service._creation_ics_caches["profile_id"] is ics_cache
+
+
+def _create_profile_with_ics_cache(
+    sync_profile_service, sync_profile_id: str
+) -> IcsResultCache:
+    ics_cache = IcsResultCache()
+    sync_profile_service.create_sync_profile(
+        user_id="user_create",
+        request=CreateSyncProfileInput(
+            title="My Test Profile",
+            schedule_source=ScheduleSource(url=HttpUrl("https://example.com/test.ics")),
+            target_calendar=UseExistingTargetCalendarInput(
+                type="useExisting",
+                calendar_id="existing_cal_id",
+                provider_account_id="provider123",
+            ),
+        ),
+        uuid_factory=lambda: sync_profile_id,
+        ics_cache=ics_cache,
+    )
+    return ics_cache
+
+
+def test_creation_ics_caches_are_bounded(
+    sync_profile_service, auth_service_mock, google_calendar_service
+):
+    """The ICS of profiles whose initialization never ran are eventually dropped."""
+    google_calendar_service.get_calendar_by_id.return_value = {"id": "existing_cal_id"}
+    auth_service_mock.get_provider_account_email.return_value = "user@example.com"
+
+    for i in range(MAX_CREATION_ICS_CACHES + 1):
+        _create_profile_with_ics_cache(sync_profile_service, f"profile_{i}")
+
+    assert len(sync_profile_service._creation_ics_caches) == MAX_CREATION_ICS_CACHES
+    assert "profile_0" not in sync_profile_service._creation_ics_caches
+    assert f"profile_{MAX_CREATION_ICS_CACHES}" in (
+        sync_profile_service._creation_ics_caches
+    )
+
+
+def test_creation_ics_cache_dropped_when_publishing_fails(
+    sync_profile_service, auth_service_mock, google_calendar_service, mock_event_bus
+):
+    """No initialization job will pick the ICS up if SyncProfileCreated was not published."""
+    google_calendar_service.get_calendar_by_id.return_value = {"id": "existing_cal_id"}
+    auth_service_mock.get_provider_account_email.return_value = "user@example.com"
+    mock_event_bus.publish = Mock(side_effect=RuntimeError("Event bus down"))
+
+    with pytest.raises(RuntimeError):
+        _create_profile_with_ics_cache(sync_profile_service, "profile_id")
+
+    assert sync_profile_service._creation_ics_caches == {}
+
 
 def test_create_sync_profile_existing_calendar_not_found(
     sync_profile_service,
@@ -1138,3 +1294,593 @@ def test_create_sync_profile_invalid_ics_url(
     with pytest.raises(Exception) as exc_info:
         sync_profile_service.create_sync_profile(user_id, request)
     assert "invalid ics url" in str(exc_info.value)
+
+
+def test_initialize_sync_profile_reuses_validated_ics(
+    sync_profile_repo,
+    sync_stats_repo,
+    auth_service_mock,
+    google_calendar_service,
+    mock_event_bus,
+    mocker,
+):
+    """
+    Creating a profile then initializing it downloads, parses and archives the
+    ICS once: the ruleset generation and the initial sync reuse the ICS fetched
+    while validating the profile.
+    """
+    user_id = "user_create"
+    fixed_uuid = "00000000-0000-4000-8000-000000000000"
+    start = arrow.now().shift(days=1).floor("hour")
+    ics_str = (
+        "BEGIN:VCALENDAR\nVERSION:2.0\nPRODID:test\nBEGIN:VEVENT\n"
+        f"UID:1\nDTSTAMP:20240101T000000Z\nDTSTART:{start.to('UTC').format('YYYYMMDDTHHmmss')}Z\n"
+        f"DTEND:{start.shift(hours=1).to('UTC').format('YYYYMMDDTHHmmss')}Z\n"
+        "SUMMARY:Course\nEND:VEVENT\nEND:VCALENDAR\n"
+    )
+    get_ics_string = mocker.patch.object(
+        UrlIcsSource, "get_ics_string", return_value=ics_str
+    )
+
+    ics_service = IcsService(event_bus=mock_event_bus)
+    ruleset_builder = create_autospec(RulesetBuilder)
+    ruleset_builder.generate_ruleset.return_value = Mock(ruleset=VALID_RULESET)
+    service = SyncProfileService(
+        sync_profile_repo=sync_profile_repo,
+        sync_stats_repo=sync_stats_repo,
+        authorization_service=auth_service_mock,
+        ics_service=ics_service,
+        event_bus=mock_event_bus,
+        google_calendar_service=google_calendar_service,
+        ai_ruleset_service=AiRulesetService(
+            ics_service=ics_service,
+            sync_profile_repo=sync_profile_repo,
+            ruleset_builder=ruleset_builder,
+            event_bus=mock_event_bus,
+        ),
+    )
+
+    auth_service_mock.get_provider_account_email.return_value = "user@example.com"
+    google_calendar_service.create_new_calendar.return_value = {"id": "cal_new_id"}
+    manager = MockGoogleCalendarManager()
+    auth_service_mock.get_authenticated_google_calendar_manager.return_value = manager
+
+    service.create_sync_profile(
+        user_id=user_id,
+        request=CreateSyncProfileInput(
+            title="My Test Profile",
+            schedule_source=ScheduleSource(url=HttpUrl("https://example.com/a.ics")),
+            target_calendar=CreateNewTargetCalendarInput(
+                type="createNew", provider_account_id="provider123"
+            ),
+        ),
+        uuid_factory=lambda: fixed_uuid,
+    )
+
+    # Act
+    service.initialize_sync_profile(user_id, fixed_uuid)
+
+    # One download, one archive
+    get_ics_string.assert_called_once()
+    mock_event_bus.assert_event_published(domain_events.IcsFetched, count=1)
+
+    # The ruleset was generated from the validated ICS, then applied by the sync
+    ruleset_builder.generate_ruleset.assert_called_once()
+    all_events = manager.get_all_events(sync_profile_id=fixed_uuid)
+    assert [event["summary"] for event in all_events] == ["Course"]
+
+    updated_profile = sync_profile_repo.get_sync_profile(user_id, fixed_uuid)
+    assert updated_profile is not None
+    assert updated_profile.ruleset == VALID_RULESET
+    assert updated_profile.status.type == SyncProfileStatusType.SUCCESS
+    assert updated_profile.status.sync_trigger == SyncTrigger.ON_CREATE
+
+
+def test_initialize_sync_profile_skips_deleted_profile(
+    sync_profile_service,
+    ai_ruleset_service,
+):
+    sync_profile_service.synchronize = Mock()
+
+    sync_profile_service.initialize_sync_profile("user123", "missing_profile")
+
+    ai_ruleset_service.create_ruleset_for_sync_profile.assert_not_called()
+    sync_profile_service.synchronize.assert_not_called()
+
+
+def test_check_sync_request(sync_profile_service, sync_profile_repo, sync_stats_repo):
+    """Sync requests for missing profiles or over the daily limit are refused before queueing."""
+    from backend.settings import settings
+
+    with pytest.raises(SyncProfileNotFoundError):
+        sync_profile_service.check_sync_request("user_check", "missing")
+
+    sync_profile_repo.save_sync_profile(
+        _make_sync_profile(user_id="user_check", sync_profile_id="profile_check")
+    )
+    sync_profile_service.check_sync_request("user_check", "profile_check")
+
+    for _ in range(settings.MAX_SYNCHRONIZATIONS_PER_DAY):
+        sync_stats_repo.increment_sync_count("user_check")
+    with pytest.raises(DailySyncLimitExceededError):
+        sync_profile_service.check_sync_request("user_check", "profile_check")
+
+
+def test_sync_skipped_while_another_run_holds_the_lease(
+    sync_profile_service,
+    sync_profile_repo,
+    auth_service_mock,
+    ics_service_mock,
+):
+    """Even with a syncable status, a live lease of another run blocks the sync."""
+    profile = _make_sync_profile(sync_profile_id="profile_leased")
+    profile.lease = SyncLease(
+        owner="other_run", expires_at=datetime.now(UTC) + timedelta(minutes=5)
+    )
+    sync_profile_repo.save_sync_profile(profile)
+
+    for force in (False, True):
+        sync_profile_service.synchronize(
+            user_id="user123",
+            sync_profile_id="profile_leased",
+            sync_trigger=SyncTrigger.MANUAL,
+            force=force,
+        )
+
+    auth_service_mock.get_authenticated_google_calendar_manager.assert_not_called()
+    ics_service_mock.try_fetch_and_parse.assert_not_called()
+    stored = sync_profile_repo.get_sync_profile("user123", "profile_leased")
+    assert stored is not None
+    assert stored.lease is not None and stored.lease.owner == "other_run"
+
+
+def test_sync_reclaims_profile_of_crashed_run(
+    sync_profile_service,
+    sync_profile_repo,
+    auth_service_mock,
+    ics_service_mock,
+    future_event,
+):
+    """A profile left IN_PROGRESS with an expired lease is synchronized again."""
+    profile = _make_sync_profile(
+        sync_profile_id="profile_stale",
+        status_type=SyncProfileStatusType.IN_PROGRESS,
+    )
+    profile.lease = SyncLease(
+        owner="crashed_run", expires_at=datetime.now(UTC) - timedelta(minutes=5)
+    )
+    sync_profile_repo.save_sync_profile(profile)
+    ics_service_mock.try_fetch_and_parse.return_value = IcsFetchAndParseResult(
+        events=[future_event], raw_ics="mock irrelevant ics value"
+    )
+    manager = MockGoogleCalendarManager()
+    auth_service_mock.get_authenticated_google_calendar_manager.return_value = manager
+
+    sync_profile_service.synchronize(
+        user_id="user123",
+        sync_profile_id="profile_stale",
+        sync_trigger=SyncTrigger.SCHEDULED,
+    )
+
+    assert len(manager.get_all_events(sync_profile_id="profile_stale")) == 1
+    stored = sync_profile_repo.get_sync_profile("user123", "profile_stale")
+    assert stored is not None
+    assert stored.status.type == SyncProfileStatusType.SUCCESS
+    assert stored.lease is None
+
+
+def test_sync_stops_before_calendar_writes_when_lease_is_lost(
+    sync_profile_service,
+    sync_profile_repo,
+    auth_service_mock,
+    ics_service_mock,
+    future_event,
+    mock_event_bus,
+):
+    """
+    A run whose lease was reclaimed while it fetched the ICS must neither write
+    events nor overwrite the profile of the run that reclaimed it.
+    """
+    sync_profile_repo.save_sync_profile(
+        _make_sync_profile(sync_profile_id="profile_lost")
+    )
+    manager = MockGoogleCalendarManager()
+    auth_service_mock.get_authenticated_google_calendar_manager.return_value = manager
+
+    def reclaimed_during_fetch(**kwargs) -> IcsFetchAndParseResult:
+        stored = sync_profile_repo.get_sync_profile("user123", "profile_lost")
+        stored.lease = SyncLease(
+            owner="other_run", expires_at=datetime.now(UTC) + timedelta(minutes=5)
+        )
+        return IcsFetchAndParseResult(
+            events=[future_event], raw_ics="mock irrelevant ics value"
+        )
+
+    ics_service_mock.try_fetch_and_parse.side_effect = reclaimed_during_fetch
+
+    sync_profile_service.synchronize(
+        user_id="user123",
+        sync_profile_id="profile_lost",
+        sync_trigger=SyncTrigger.MANUAL,
+    )
+
+    assert manager.get_all_events(sync_profile_id="profile_lost") == []
+    stored = sync_profile_repo.get_sync_profile("user123", "profile_lost")
+    assert stored is not None
+    assert stored.status.type == SyncProfileStatusType.IN_PROGRESS
+    assert stored.lease is not None and stored.lease.owner == "other_run"
+    mock_event_bus.assert_event_published_with_data(
+        domain_events.SyncFailed,
+        user_id="user123",
+        sync_profile_id="profile_lost",
+        error_type="SyncInProgressError",
+    )
+
+
+def test_window_sync_only_updates_next_days(
+    sync_profile_service,
+    sync_profile_repo,
+    auth_service_mock,
+    ics_service_mock,
+    past_event,
+    future_event,
+):
+    """
+    WINDOW sync: only the events of the next SYNC_WINDOW_DAYS days are replaced,
+    past and later events are left untouched.
+    """
+    from backend.settings import settings
+
+    user_id = "user123"
+    prof_id = "profile_window"
+    later_start = arrow.now().shift(days=settings.SYNC_WINDOW_DAYS + 1)
+    later_event = Event(
+        start=later_start, end=later_start.shift(hours=1), title="Later Event"
+    )
+
+    ics_service_mock.try_fetch_and_parse.return_value = IcsFetchAndParseResult(
+        events=[past_event, future_event, later_event],
+        raw_ics="mock irrelevant ics value",
+    )
+
+    profile = _make_sync_profile(user_id=user_id, sync_profile_id=prof_id)
+    profile.last_sync_digest = "digest of the last successful sync"
+    sync_profile_repo.save_sync_profile(profile)
+
+    manager = Mock(wraps=MockGoogleCalendarManager(), api_calls=0)
+    manager.create_events(
+        [
+            Event(start=past_event.start, end=past_event.end, title="Old Past"),
+            Event(start=future_event.start, end=future_event.end, title="Old Future"),
+            Event(start=later_event.start, end=later_event.end, title="Old Later"),
+        ],
+        sync_profile_id=prof_id,
+    )
+    auth_service_mock.get_authenticated_google_calendar_manager.return_value = manager
+
+    sync_profile_service.synchronize(
+        user_id=user_id,
+        sync_profile_id=prof_id,
+        sync_trigger=SyncTrigger.SCHEDULED,
+        sync_type=SyncType.WINDOW,
+    )
+
+    summaries = sorted(
+        event["summary"] for event in manager.get_all_events(sync_profile_id=prof_id)
+    )
+    assert summaries == ["Future Event", "Old Later", "Old Past"]
+
+    # The window is pushed down to the calendar query
+    _, kwargs = manager.get_events_ids_from_sync_profile.call_args
+    assert kwargs["max_dt"] - kwargs["min_dt"] == timedelta(
+        days=settings.SYNC_WINDOW_DAYS
+    )
+
+    updated_profile = sync_profile_repo.get_sync_profile(user_id, prof_id)
+    assert updated_profile is not None
+    assert updated_profile.status.type == SyncProfileStatusType.SUCCESS
+    assert updated_profile.status.sync_type == SyncType.WINDOW
+    # Events after the window are not synced, so the next REGULAR sync must not be skipped
+    assert updated_profile.last_sync_digest is None
+
+
+def test_regular_sync_skips_calendar_when_events_unchanged(
+    sync_profile_service,
+    sync_profile_repo,
+    auth_service_mock,
+    ics_service_mock,
+    future_event,
+    mock_event_bus,
+):
+    """
+    A REGULAR sync producing the same events as the last successful sync does not
+    call Google, while a FULL sync always rewrites the calendar.
+    """
+    sync_profile_repo.save_sync_profile(
+        _make_sync_profile(sync_profile_id="profile_unchanged")
+    )
+    ics_service_mock.try_fetch_and_parse.return_value = IcsFetchAndParseResult(
+        events=[future_event], raw_ics="mock irrelevant ics value"
+    )
+    manager = Mock(wraps=MockGoogleCalendarManager(), api_calls=0)
+    auth_service_mock.get_authenticated_google_calendar_manager.return_value = manager
+
+    def _sync(sync_type: SyncType) -> SyncProfile:
+        sync_profile_service.synchronize(
+            user_id="user123",
+            sync_profile_id="profile_unchanged",
+            sync_trigger=SyncTrigger.SCHEDULED,
+            sync_type=sync_type,
+        )
+        profile = sync_profile_repo.get_sync_profile("user123", "profile_unchanged")
+        assert profile is not None
+        assert profile.status.type == SyncProfileStatusType.SUCCESS
+        return profile
+
+    first = _sync(SyncType.REGULAR)
+    assert first.last_sync_digest is not None
+    assert first.status.message is None
+    manager.create_events.assert_called_once()
+
+    manager.reset_mock()
+    second = _sync(SyncType.REGULAR)
+    assert second.status.message == SYNC_SKIPPED_UNCHANGED_MESSAGE
+    assert second.last_sync_digest == first.last_sync_digest
+    manager.get_events_ids_from_sync_profile.assert_not_called()
+    manager.delete_events.assert_not_called()
+    manager.create_events.assert_not_called()
+    assert [
+        event.skipped_unchanged
+        for event in mock_event_bus.find_events(domain_events.SyncSucceeded)
+    ] == [False, True]
+
+    manager.reset_mock()
+    third = _sync(SyncType.FULL)
+    assert third.status.message is None
+    manager.create_events.assert_called_once()
+    assert len(manager.get_all_events(sync_profile_id="profile_unchanged")) == 1
+
+
+def test_successful_sync_schedules_next_one(
+    sync_profile_service,
+    sync_profile_repo,
+    auth_service_mock,
+    ics_service_mock,
+    future_event,
+):
+    """The next scheduled sync comes later when the events did not change, sooner when they did."""
+    sync_profile_repo.save_sync_profile(
+        _make_sync_profile(sync_profile_id="profile_schedule")
+    )
+    auth_service_mock.get_authenticated_google_calendar_manager.return_value = (
+        MockGoogleCalendarManager()
+    )
+
+    def _sync(events: list[Event]) -> SyncProfile:
+        ics_service_mock.try_fetch_and_parse.return_value = IcsFetchAndParseResult(
+            events=events, raw_ics="mock irrelevant ics value"
+        )
+        sync_profile_service.synchronize(
+            user_id="user123",
+            sync_profile_id="profile_schedule",
+            sync_trigger=SyncTrigger.SCHEDULED,
+        )
+        profile = sync_profile_repo.get_sync_profile("user123", "profile_schedule")
+        assert profile is not None and profile.sync_schedule is not None
+        assert profile.sync_schedule.next_sync_at > datetime.now(UTC)
+        return profile
+
+    first = _sync([future_event])
+    second = _sync([future_event])
+    assert second.sync_schedule.interval_s > first.sync_schedule.interval_s
+    assert second.sync_schedule.unchanged_syncs == 1
+
+    third = _sync([future_event.replace(title="Moved")])
+    assert third.sync_schedule.interval_s < second.sync_schedule.interval_s
+    assert third.sync_schedule.last_change_at is not None
+
+
+def test_window_sync_does_not_move_the_schedule(
+    sync_profile_service,
+    sync_profile_repo,
+    auth_service_mock,
+    ics_service_mock,
+    future_event,
+):
+    """A WINDOW sync leaves the next scheduled sync, and the digest it compares, to the REGULAR syncs."""
+    sync_profile_repo.save_sync_profile(
+        _make_sync_profile(sync_profile_id="profile_window_schedule")
+    )
+    auth_service_mock.get_authenticated_google_calendar_manager.return_value = (
+        MockGoogleCalendarManager()
+    )
+
+    def _sync(events: list[Event], sync_type: SyncType) -> SyncProfile:
+        ics_service_mock.try_fetch_and_parse.return_value = IcsFetchAndParseResult(
+            events=events, raw_ics="mock irrelevant ics value"
+        )
+        sync_profile_service.synchronize(
+            user_id="user123",
+            sync_profile_id="profile_window_schedule",
+            sync_trigger=SyncTrigger.SCHEDULED,
+            sync_type=sync_type,
+        )
+        profile = sync_profile_repo.get_sync_profile(
+            "user123", "profile_window_schedule"
+        )
+        assert profile is not None and profile.sync_schedule is not None
+        return profile
+
+    first = _sync([future_event], SyncType.REGULAR)
+    # The feed changes after the window
+    changed_event = future_event.replace(title="Moved")
+    after_window = _sync([changed_event], SyncType.WINDOW)
+    assert after_window.status.type == SyncProfileStatusType.SUCCESS
+    assert after_window.sync_schedule == first.sync_schedule
+
+    second = _sync([changed_event], SyncType.REGULAR)
+    assert second.sync_schedule.interval_s < first.sync_schedule.interval_s
+    assert second.sync_schedule.last_change_at is not None
+
+
+def test_failed_sync_forgets_events_digest(
+    sync_profile_service,
+    sync_profile_repo,
+    auth_service_mock,
+    ics_service_mock,
+    future_event,
+):
+    """After a failure the calendar may be partially written, so the next sync must not be skipped."""
+    profile = _make_sync_profile(sync_profile_id="profile_digest_failed")
+    profile.last_sync_digest = "digest of the last successful sync"
+    sync_profile_repo.save_sync_profile(profile)
+    ics_service_mock.try_fetch_and_parse.return_value = IcsFetchAndParseResult(
+        events=[future_event], raw_ics="mock irrelevant ics value"
+    )
+    manager = Mock(wraps=MockGoogleCalendarManager(), api_calls=0)
+    manager.create_events.side_effect = RuntimeError("Google API error")
+    auth_service_mock.get_authenticated_google_calendar_manager.return_value = manager
+
+    sync_profile_service.synchronize(
+        user_id="user123",
+        sync_profile_id="profile_digest_failed",
+        sync_trigger=SyncTrigger.SCHEDULED,
+    )
+
+    stored = sync_profile_repo.get_sync_profile("user123", "profile_digest_failed")
+    assert stored is not None
+    assert stored.status.type == SyncProfileStatusType.FAILED
+    assert stored.last_sync_digest is None
+
+
+def test_failed_sync_is_not_due_on_next_hourly_run(
+    sync_profile_service,
+    sync_profile_repo,
+    auth_service_mock,
+    ics_service_mock,
+):
+    """Scheduled syncs of a broken profile are backed off rather than retried by every run of the cron."""
+    sync_profile_repo.save_sync_profile(
+        _make_sync_profile(sync_profile_id="profile_backoff")
+    )
+    ics_service_mock.try_fetch_and_parse.return_value = IcsSourceError("Couldn't fetch")
+    auth_service_mock.get_authenticated_google_calendar_manager.return_value = (
+        MockGoogleCalendarManager()
+    )
+
+    def _failed_sync() -> SyncProfile:
+        sync_profile_service.synchronize(
+            user_id="user123",
+            sync_profile_id="profile_backoff",
+            sync_trigger=SyncTrigger.SCHEDULED,
+        )
+        profile = sync_profile_repo.get_sync_profile("user123", "profile_backoff")
+        assert profile is not None and profile.sync_schedule is not None
+        assert profile.status.type == SyncProfileStatusType.FAILED
+        assert not SyncScheduler().is_due(
+            profile, datetime.now(UTC) + timedelta(hours=1)
+        )
+        return profile
+
+    first = _failed_sync()
+    second = _failed_sync()
+    assert second.sync_schedule.consecutive_failures == 2
+    assert second.sync_schedule.next_sync_at > first.sync_schedule.next_sync_at
+
+
+def test_sync_exports_telemetry(
+    sync_profile_service,
+    sync_profile_repo,
+    auth_service_mock,
+    ics_service_mock,
+    future_event,
+    past_event,
+    metrics_sink,
+):
+    """A REGULAR sync reports its stages and the events written"""
+    ics_service_mock.try_fetch_and_parse.return_value = IcsFetchAndParseResult(
+        events=[past_event, future_event],
+        raw_ics="mock irrelevant ics value",
+    )
+    sync_profile_repo.save_sync_profile(_make_sync_profile())
+    manager = MockGoogleCalendarManager()
+    manager.create_events([future_event], sync_profile_id="profileABC")
+    manager.api_calls = 0
+    auth_service_mock.get_authenticated_google_calendar_manager.return_value = manager
+
+    sync_profile_service.synchronize(
+        user_id="user123",
+        sync_profile_id="profileABC",
+        sync_trigger=SyncTrigger.MANUAL,
+    )
+
+    [telemetry] = metrics_sink.exported
+    assert telemetry.outcome == SyncOutcome.SUCCESS
+    assert telemetry.sync_trigger == SyncTrigger.MANUAL
+    assert set(telemetry.stage_durations_s) == {
+        SyncStage.AUTH,
+        SyncStage.LIST,
+        SyncStage.DELETE,
+        SyncStage.CREATE,
+        SyncStage.PERSIST,
+    }
+    assert telemetry.counters == {
+        "events_parsed": 2,
+        "events_deleted": 1,
+        "events_created": 1,
+        # list, delete batch, create batch
+        "api_calls": 3,
+    }
+    assert telemetry.total_s >= sum(telemetry.stage_durations_s.values())
+
+
+def test_failed_sync_exports_telemetry(
+    sync_profile_service,
+    sync_profile_repo,
+    auth_service_mock,
+    ics_service_mock,
+    metrics_sink,
+):
+    ics_service_mock.try_fetch_and_parse.return_value = IcsSourceError("unreachable")
+    sync_profile_repo.save_sync_profile(_make_sync_profile())
+    auth_service_mock.get_authenticated_google_calendar_manager.return_value = (
+        MockGoogleCalendarManager()
+    )
+
+    sync_profile_service.synchronize(
+        user_id="user123",
+        sync_profile_id="profileABC",
+        sync_trigger=SyncTrigger.SCHEDULED,
+    )
+
+    [telemetry] = metrics_sink.exported
+    assert telemetry.outcome == SyncOutcome.FAILED
+    assert telemetry.counters == {"api_calls": 0}
+
+
+def test_metrics_sink_errors_do_not_fail_sync(
+    sync_profile_service,
+    sync_profile_repo,
+    auth_service_mock,
+    ics_service_mock,
+    future_event,
+    metrics_sink,
+    mock_event_bus,
+):
+    ics_service_mock.try_fetch_and_parse.return_value = IcsFetchAndParseResult(
+        events=[future_event],
+        raw_ics="mock irrelevant ics value",
+    )
+    sync_profile_repo.save_sync_profile(_make_sync_profile())
+    auth_service_mock.get_authenticated_google_calendar_manager.return_value = (
+        MockGoogleCalendarManager()
+    )
+    metrics_sink.export = Mock(side_effect=RuntimeError("Sink down"))
+
+    sync_profile_service.synchronize(
+        user_id="user123",
+        sync_profile_id="profileABC",
+        sync_trigger=SyncTrigger.MANUAL,
+    )
+
+    mock_event_bus.assert_event_published(domain_events.SyncSucceeded)
@@ -0,0 +1,120 @@
+import pstats
+import tempfile
+from typing import Any
+
+import pytest
+
+from backend.services.sync_profiler import SyncProfileReport, SyncProfiler
+
+
+class InMemoryReportStorage:
+    def __init__(self) -> None:
+        self.saved: list[tuple[SyncProfileReport, dict[str, Any]]] = []
+
+    def save_sync_profile_report(
+        self, report: SyncProfileReport, *, metadata: dict[str, Any]
+    ) -> None:
+        self.saved.append((report, metadata))
+
+
+class FailingReportStorage:
+    def save_sync_profile_report(
+        self, report: SyncProfileReport, *, metadata: dict[str, Any]
+    ) -> None:
+        raise RuntimeError("Storage is down")
+
+
+def _profiled_work() -> int:
+    return sum(i * i for i in range(1000))
+
+
+@pytest.fixture
+def storage() -> InMemoryReportStorage:
+    return InMemoryReportStorage()
+
+
+def test_profiles_listed_profile(storage: InMemoryReportStorage) -> None:
+    profiler = SyncProfiler(storage, sample_rate=0.0, profile_ids=["profile-1"])
+
+    with profiler.profile(user_id="user-1", sync_profile_id="profile-1"):
+        _profiled_work()
+
+    [(report, metadata)] = storage.saved
+    assert metadata == {"user_id": "user-1", "sync_profile_id": "profile-1"}
+    assert "_profiled_work" in report.summary
+    assert "Peak traced memory" in report.summary
+
+
+def test_report_stats_are_readable_by_pstats(storage: InMemoryReportStorage) -> None:
+    profiler = SyncProfiler(storage, sample_rate=0.0, profile_ids=["profile-1"])
+
+    with profiler.profile(user_id="user-1", sync_profile_id="profile-1"):
+        _profiled_work()
+
+    [(report, _)] = storage.saved
+    with tempfile.NamedTemporaryFile(suffix=".prof") as f:
+        f.write(report.stats)
+        f.flush()
+        stats = pstats.Stats(f.name)
+    assert any(name == "_profiled_work" for _, _, name in stats.stats)  # type: ignore[attr-defined]
+
+
+def test_does_not_profile_other_profiles(storage: InMemoryReportStorage) -> None:
+    profiler = SyncProfiler(storage, sample_rate=0.0, profile_ids=["profile-1"])
+
+    with profiler.profile(user_id="user-1", sync_profile_id="profile-2"):
+        _profiled_work()
+
+    assert storage.saved == []
+
+
+@pytest.mark.parametrize("draw, profiled", [(0.09, True), (0.1, False)])
+def test_samples_syncs(
+    storage: InMemoryReportStorage, draw: float, profiled: bool
+) -> None:
+    profiler = SyncProfiler(
+        storage, sample_rate=0.1, profile_ids=[], random_draw=lambda: draw
+    )
+
+    assert profiler.should_profile("profile-1") is profiled
+
+
+def test_disabled_without_storage() -> None:
+    profiler = SyncProfiler(None, sample_rate=1.0, profile_ids=["profile-1"])
+
+    assert not profiler.should_profile("profile-1")
+    with profiler.profile(user_id="user-1", sync_profile_id="profile-1"):
+        _profiled_work()
+
+
+def test_profiles_one_sync_at_a_time(storage: InMemoryReportStorage) -> None:
+    profiler = SyncProfiler(storage, sample_rate=1.0, profile_ids=[])
+
+    with profiler.profile(user_id="user-1", sync_profile_id="profile-1"):
+        with profiler.profile(user_id="user-2", sync_profile_id="profile-2"):
+            _profiled_work()
+
+    assert [metadata["sync_profile_id"] for _, metadata in storage.saved] == [
+        "profile-1"
+    ]
+
+
+def test_storage_errors_do_not_fail_the_sync() -> None:
+    profiler = SyncProfiler(
+        FailingReportStorage(), sample_rate=0.0, profile_ids=["profile-1"]
+    )
+
+    with profiler.profile(user_id="user-1", sync_profile_id="profile-1"):
+        result = _profiled_work()
+
+    assert result == 332833500
+
+
+def test_reports_even_when_the_sync_raises(storage: InMemoryReportStorage) -> None:
+    profiler = SyncProfiler(storage, sample_rate=0.0, profile_ids=["profile-1"])
+
+    with pytest.raises(ValueError):
+        with profiler.profile(user_id="user-1", sync_profile_id="profile-1"):
+            raise ValueError("Sync failed")
+
+    assert len(storage.saved) == 1
@@ -0,0 +1,188 @@
+from datetime import UTC, datetime, timedelta
+
+import pytest
+from pydantic import HttpUrl
+
+from backend.models.sync_profile import (
+    ScheduleSource,
+    SyncProfile,
+    SyncProfileStatus,
+    SyncProfileStatusType,
+    SyncSchedule,
+    TargetCalendar,
+)
+from backend.services.sync_scheduler import SyncScheduler
+
+HOUR = 3600
+NOW = datetime(2025, 1, 6, 12, tzinfo=UTC)
+
+
+@pytest.fixture
+def scheduler() -> SyncScheduler:
+    return SyncScheduler(
+        initial_interval_s=24 * HOUR,
+        min_interval_s=6 * HOUR,
+        max_interval_s=96 * HOUR,
+        jitter=0,
+    )
+
+
+def _make_profile(
+    sync_profile_id: str = "profile1", sync_schedule: SyncSchedule | None = None
+) -> SyncProfile:
+    return SyncProfile(
+        id=sync_profile_id,
+        user_id="user1",
+        title="Test Profile",
+        schedule_source=ScheduleSource(url=HttpUrl("https://example.com/calendar.ics")),
+        target_calendar=TargetCalendar(
+            id="cal1",
+            title="My Calendar",
+            provider_account_id="acc1",
+            provider_account_email="test@example.com",
+        ),
+        status=SyncProfileStatus(type=SyncProfileStatusType.SUCCESS),
+        sync_schedule=sync_schedule,
+    )
+
+
+def test_first_sync_uses_initial_interval(scheduler: SyncScheduler) -> None:
+    schedule = scheduler.reschedule(None, events_digest="a", now=NOW)
+
+    assert schedule.interval_s == 24 * HOUR
+    assert schedule.next_sync_at == NOW + timedelta(hours=24)
+    assert schedule.events_digest == "a"
+    assert schedule.last_change_at is None
+
+
+def test_interval_adapts_to_changes(scheduler: SyncScheduler) -> None:
+    schedule = scheduler.reschedule(None, events_digest="a", now=NOW)
+
+    schedule = scheduler.reschedule(schedule, events_digest="a", now=NOW)
+    assert schedule.interval_s == 36 * HOUR
+    assert schedule.unchanged_syncs == 1
+
+    schedule = scheduler.reschedule(schedule, events_digest="b", now=NOW)
+    assert schedule.interval_s == 18 * HOUR
+    assert schedule.unchanged_syncs == 0
+    assert schedule.last_change_at == NOW
+    assert schedule.next_sync_at == NOW + timedelta(hours=18)
+
+
+def test_interval_is_bounded(scheduler: SyncScheduler) -> None:
+    schedule = scheduler.reschedule(None, events_digest="0", now=NOW)
+    for i in range(1, 10):
+        schedule = scheduler.reschedule(schedule, events_digest=str(i), now=NOW)
+    assert schedule.interval_s == 6 * HOUR
+
+    for _ in range(10):
+        schedule = scheduler.reschedule(schedule, events_digest="9", now=NOW)
+    assert schedule.interval_s == 96 * HOUR
+
+
+def test_jitter_spreads_next_sync() -> None:
+    scheduler = SyncScheduler(
+        initial_interval_s=24 * HOUR,
+        min_interval_s=6 * HOUR,
+        max_interval_s=96 * HOUR,
+        jitter=0.1,
+    )
+
+    next_syncs = {
+        scheduler.reschedule(None, events_digest="a", now=NOW).next_sync_at
+        for _ in range(20)
+    }
+
+    assert len(next_syncs) > 1
+    assert all(
+        NOW + timedelta(hours=21.6) <= next_sync <= NOW + timedelta(hours=26.4)
+        for next_sync in next_syncs
+    )
+
+
+def test_failed_syncs_back_off(scheduler: SyncScheduler) -> None:
+    schedule = scheduler.reschedule(None, events_digest="a", now=NOW)
+    schedule = scheduler.reschedule(schedule, events_digest="b", now=NOW)
+    assert schedule.interval_s == 12 * HOUR
+
+    retries = []
+    for _ in range(5):
+        schedule = scheduler.back_off(schedule, now=NOW)
+        retries.append(schedule.next_sync_at - NOW)
+        assert not scheduler.is_due(
+            _make_profile(sync_schedule=schedule), NOW + timedelta(hours=1)
+        )
+
+    assert retries == [timedelta(hours=hours) for hours in (12, 24, 48, 96, 96)]
+    assert schedule.consecutive_failures == 5
+    assert schedule.interval_s == 12 * HOUR
+    assert schedule.events_digest == "b"
+
+    schedule = scheduler.reschedule(schedule, events_digest="b", now=NOW)
+    assert schedule.consecutive_failures == 0
+    assert schedule.interval_s == 18 * HOUR
+
+
+def test_failure_before_first_sync_backs_off(scheduler: SyncScheduler) -> None:
+    schedule = scheduler.back_off(None, now=NOW)
+
+    assert schedule.next_sync_at == NOW + timedelta(hours=24)
+    assert schedule.consecutive_failures == 1
+    assert not scheduler.is_due(
+        _make_profile(sync_schedule=schedule), NOW + timedelta(hours=1)
+    )
+
+    schedule = scheduler.reschedule(schedule, events_digest="a", now=NOW)
+    assert schedule.interval_s == 24 * HOUR
+    assert schedule.consecutive_failures == 0
+
+
+def test_is_due_follows_schedule(scheduler: SyncScheduler) -> None:
+    schedule = SyncSchedule(interval_s=HOUR, next_sync_at=NOW)
+
+    assert scheduler.is_due(_make_profile(sync_schedule=schedule), NOW)
+    assert not scheduler.is_due(
+        _make_profile(sync_schedule=schedule), NOW - timedelta(seconds=1)
+    )
+
+
+def test_unscheduled_profiles_are_spread_over_the_day(
+    scheduler: SyncScheduler,
+) -> None:
+    profiles = [_make_profile(f"profile{i}") for i in range(200)]
+    midnight = NOW.replace(hour=0)
+
+    due_per_hour = [
+        sum(
+            scheduler.is_due(profile, midnight + timedelta(hours=hour, minutes=59))
+            for profile in profiles
+        )
+        for hour in range(24)
+    ]
+
+    # Every profile is due by the end of the day, at different times
+    assert due_per_hour == sorted(due_per_hour)
+    assert due_per_hour[-1] == len(profiles)
+    assert due_per_hour[0] < len(profiles) / 4
+    assert due_per_hour[11] < len(profiles) * 3 / 4
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"min_interval_s": 0},
+        {"initial_interval_s": HOUR, "min_interval_s": 2 * HOUR},
+        {"max_interval_s": HOUR},
+        {"jitter": 1},
+    ],
+)
+def test_invalid_configuration(kwargs: dict) -> None:
+    with pytest.raises(ValueError):
+        SyncScheduler(
+            **{
+                "initial_interval_s": 24 * HOUR,
+                "min_interval_s": 6 * HOUR,
+                "max_interval_s": 96 * HOUR,
+            }
+            | kwargs
+        )
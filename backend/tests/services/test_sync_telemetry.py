@@ -0,0 +1,97 @@
+import logging
+
+import pytest
+
+from backend.models import SyncTrigger, SyncType
+from backend.services.sync_telemetry import (
+    AggregatingMetricsSink,
+    InMemoryMetricsSink,
+    LoggingMetricsSink,
+    SyncOutcome,
+    SyncStage,
+    SyncTelemetry,
+    log_sync_run_summary,
+    sync_stage,
+)
+from tests.util import FakeClock
+
+
+def _telemetry(clock: FakeClock | None = None, **kwargs) -> SyncTelemetry:
+    return SyncTelemetry(
+        user_id="user123",
+        sync_profile_id="profileABC",
+        sync_trigger=SyncTrigger.SCHEDULED,
+        sync_type=SyncType.REGULAR,
+        **({"clock": clock} if clock else {}),
+        **kwargs,
+    )
+
+
+def test_stage_durations_add_up() -> None:
+    clock = FakeClock()
+    telemetry = _telemetry(clock)
+
+    with telemetry.stage(SyncStage.CREATE):
+        clock.now += 2
+    with pytest.raises(RuntimeError):
+        with telemetry.stage(SyncStage.CREATE):
+            clock.now += 1
+            raise RuntimeError()
+    with sync_stage(telemetry, SyncStage.FETCH):
+        clock.now += 0.5
+
+    assert telemetry.stage_durations_s == {SyncStage.CREATE: 3, SyncStage.FETCH: 0.5}
+
+
+def test_sync_stage_without_telemetry() -> None:
+    with sync_stage(None, SyncStage.FETCH):
+        pass
+
+
+def test_logging_sink(caplog: pytest.LogCaptureFixture) -> None:
+    telemetry = _telemetry(outcome=SyncOutcome.SUCCESS, total_s=1.5)
+    telemetry.stage_durations_s[SyncStage.FETCH] = 0.25
+    telemetry.count("events_created", 12)
+
+    with caplog.at_level(logging.INFO):
+        LoggingMetricsSink().export(telemetry)
+
+    [record] = caplog.records
+    assert record.outcome == "success"
+    assert record.fetch_s == 0.25
+    assert record.events_created == 12
+
+
+def test_aggregating_sink_sums_until_drained() -> None:
+    inner = InMemoryMetricsSink()
+    sink = AggregatingMetricsSink(inner)
+    first = _telemetry(outcome=SyncOutcome.SUCCESS, total_s=2.0)
+    first.stage_durations_s[SyncStage.CREATE] = 1.0
+    first.count("api_calls", 3)
+    second = _telemetry(outcome=SyncOutcome.FAILED, total_s=0.5)
+    second.stage_durations_s[SyncStage.CREATE] = 0.25
+    second.count("api_calls", 1)
+
+    sink.export(first)
+    sink.export(second)
+    summary = sink.drain()
+
+    assert inner.exported == [first, second]
+    assert summary.syncs == 2
+    assert summary.outcomes == {SyncOutcome.SUCCESS: 1, SyncOutcome.FAILED: 1}
+    assert summary.stage_durations_s == {SyncStage.CREATE: 1.25}
+    assert summary.counters == {"api_calls": 4}
+    assert summary.total_s == 2.5
+    assert sink.drain().syncs == 0
+
+
+def test_log_sync_run_summary(caplog: pytest.LogCaptureFixture) -> None:
+    sink = AggregatingMetricsSink(InMemoryMetricsSink())
+    sink.export(_telemetry(outcome=SyncOutcome.SKIPPED_UNCHANGED))
+
+    with caplog.at_level(logging.INFO):
+        log_sync_run_summary(sink.drain(), run="regular")
+
+    [record] = caplog.records
+    assert record.run == "regular"
+    assert record.skipped_unchanged_syncs == 1
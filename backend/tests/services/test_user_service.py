@@ -0,0 +1,146 @@
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+import pytest
+from firebase_admin import auth
+
+from backend.services import user_service as user_service_module
+from backend.services.user_service import FirebaseAuthUserService, UserIndex
+from tests.util import FakeClock
+
+
+def _user_record(uid: str) -> SimpleNamespace:
+    return SimpleNamespace(
+        uid=uid,
+        email=f"{uid}@example.com",
+        display_name=uid.title(),
+        disabled=False,
+        email_verified=True,
+        provider_data=[],
+        custom_claims=None,
+        user_metadata=SimpleNamespace(
+            creation_timestamp=None, last_sign_in_timestamp=None
+        ),
+    )
+
+
+class FakeAuth:
+    """Firebase Auth user lookups, counting the calls."""
+
+    def __init__(self, uids: list[str]) -> None:
+        self.uids = uids
+        self.get_user = Mock(side_effect=self._get_user)
+        self.get_users = Mock(side_effect=self._get_users)
+        self.list_users = Mock(side_effect=self._list_users)
+
+    def _get_user(self, uid: str) -> SimpleNamespace:
+        if uid not in self.uids:
+            raise auth.UserNotFoundError("not found")
+        return _user_record(uid)
+
+    def _get_users(self, identifiers: list[auth.UidIdentifier]) -> SimpleNamespace:
+        return SimpleNamespace(
+            users=[_user_record(i.uid) for i in identifiers if i.uid in self.uids],
+            not_found=[i for i in identifiers if i.uid not in self.uids],
+        )
+
+    def _list_users(self, max_results: int, page_token: str | None) -> SimpleNamespace:
+        return SimpleNamespace(
+            users=[_user_record(uid) for uid in self.uids],
+            next_page_token=None,
+            has_next_page=False,
+        )
+
+
+@pytest.fixture
+def fake_auth(monkeypatch: pytest.MonkeyPatch) -> FakeAuth:
+    fake = FakeAuth(["alice", "bob"])
+    for name in ("get_user", "get_users", "list_users"):
+        monkeypatch.setattr(user_service_module.auth, name, getattr(fake, name))
+    return fake
+
+
+@pytest.fixture
+def clock() -> FakeClock:
+    return FakeClock()
+
+
+@pytest.fixture
+def service(clock: FakeClock) -> FirebaseAuthUserService:
+    return FirebaseAuthUserService(
+        cache_ttl_s=3600, negative_cache_ttl_s=60, clock=clock
+    )
+
+
+def test_get_user_is_cached(
+    service: FirebaseAuthUserService, fake_auth: FakeAuth, clock: FakeClock
+) -> None:
+    for _ in range(3):
+        user = service.get_user("alice")
+        assert user is not None and user.email == "alice@example.com"
+    assert fake_auth.get_user.call_count == 1
+
+    clock.now = 3600
+    service.get_user("alice")
+    assert fake_auth.get_user.call_count == 2
+
+
+def test_missing_user_is_cached_for_a_shorter_time(
+    service: FirebaseAuthUserService, fake_auth: FakeAuth, clock: FakeClock
+) -> None:
+    assert service.get_user("carol") is None
+    assert service.get_user("carol") is None
+    assert fake_auth.get_user.call_count == 1
+
+    fake_auth.uids.append("carol")
+    clock.now = 60
+    assert service.get_user("carol") is not None
+
+
+def test_get_users_only_fetches_unknown_users(
+    service: FirebaseAuthUserService, fake_auth: FakeAuth
+) -> None:
+    service.get_user("alice")
+
+    users = service.get_users(["alice", "bob", "carol", "bob"])
+
+    assert users.keys() == {"alice", "bob"}
+    [identifiers] = fake_auth.get_users.call_args.args
+    assert [identifier.uid for identifier in identifiers] == ["bob", "carol"]
+
+    service.get_users(["bob", "carol"])
+    assert fake_auth.get_users.call_count == 1
+
+
+def test_user_index_fetches_only_new_users_between_full_listings(
+    service: FirebaseAuthUserService, fake_auth: FakeAuth, clock: FakeClock
+) -> None:
+    index = UserIndex(service, full_refresh_interval_s=600, clock=clock)
+
+    assert index.refresh().keys() == {"alice", "bob"}
+    assert fake_auth.list_users.call_count == 1
+
+    fake_auth.uids.append("carol")
+    users = index.refresh(["alice", "carol"])
+
+    assert users.keys() == {"alice", "bob", "carol"}
+    assert fake_auth.list_users.call_count == 1
+    [identifiers] = fake_auth.get_users.call_args.args
+    assert [identifier.uid for identifier in identifiers] == ["carol"]
+
+    fake_auth.uids.remove("bob")
+    clock.now = 600
+    assert index.refresh().keys() == {"alice", "carol"}
+    assert fake_auth.list_users.call_count == 2
+
+
+def test_user_index_invalidate(
+    service: FirebaseAuthUserService, fake_auth: FakeAuth
+) -> None:
+    index = UserIndex(service)
+    index.refresh()
+
+    index.invalidate()
+    index.refresh()
+
+    assert fake_auth.list_users.call_count == 2
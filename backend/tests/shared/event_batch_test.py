@@ -0,0 +1,184 @@
+import arrow
+import numpy as np
+import pytest
+
+from backend.models import ChangeColorAction, Rule, Ruleset, TextFieldCondition
+from backend.shared.event import Event
+from backend.shared.event_batch import EventBatch, StringColumn
+from backend.shared.google_calendar_colors import GoogleEventColor
+from backend.synchronizer.ics_parser import IcsParser
+
+start = arrow.get("2024-03-01T10:00:00")
+
+
+def make_event(hours: int, title: str = "Lecture", **kwargs) -> Event:
+    return Event(
+        start=start.shift(hours=hours),
+        end=start.shift(hours=hours + 1),
+        title=title,
+        **kwargs,
+    )
+
+
+@pytest.fixture
+def events() -> list[Event]:
+    return [
+        make_event(2, "Seminar", color=GoogleEventColor.SAGE),
+        make_event(0, "Lecture", description="Room 101"),
+        Event(
+            start=arrow.get("2024-03-01T08:00:00", tzinfo="Europe/Paris"),
+            end=arrow.get("2024-03-01T03:00:00", tzinfo="America/New_York"),
+            title="Lecture",
+            is_all_day=True,
+        ),
+    ]
+
+
+def test_from_events_round_trip(events: list[Event]):
+    batch = EventBatch.from_events(events)
+
+    assert len(batch) == 3
+    assert batch.to_events() == events
+    assert [event.color for event in batch] == [event.color for event in events]
+    assert [event.start.tzinfo for event in batch] == [
+        event.start.tzinfo for event in events
+    ]
+    assert [event.end.tzinfo for event in batch] == [
+        event.end.tzinfo for event in events
+    ]
+    assert batch.title.values == ["Seminar", "Lecture"]
+
+
+def test_from_events_empty():
+    batch = EventBatch.from_events([])
+
+    assert len(batch) == 0
+    assert batch.to_events() == []
+    assert len(batch.in_window(ending_after=start)) == 0
+
+
+def test_indexing(events: list[Event]):
+    batch = EventBatch.from_events(events)
+
+    assert batch[0] == events[0]
+    assert batch[-1] == events[-1]
+    assert batch[1:].to_events() == events[1:]
+    with pytest.raises(IndexError):
+        batch[3]
+
+
+def test_in_window(events: list[Event]):
+    batch = EventBatch.from_events(events)
+
+    assert batch.in_window(ending_after=start.shift(hours=1)).to_events() == [events[0]]
+    assert batch.in_window(starting_before=start).to_events() == [events[2]]
+    assert batch.in_window(
+        ending_after=start.shift(minutes=30), starting_before=start.shift(hours=2)
+    ).to_events() == [events[1]]
+
+
+def test_take(events: list[Event]):
+    batch = EventBatch.from_events(events)
+
+    assert batch.take(np.array([False, True, True])).to_events() == events[1:]
+    assert batch.take(np.array([2, 0])).to_events() == [events[2], events[0]]
+
+
+def test_sorted_by_start(events: list[Event]):
+    batch = EventBatch.from_events(events).sorted_by_start()
+
+    assert batch.to_events() == sorted(events, key=lambda event: event.start_us)
+
+
+def test_with_color(events: list[Event]):
+    batch = EventBatch.from_events(events)
+
+    recolored = batch.with_color_where(
+        np.array([True, False, False]), GoogleEventColor.TOMATO
+    )
+
+    assert [event.color for event in recolored] == [
+        GoogleEventColor.TOMATO,
+        None,
+        None,
+    ]
+    assert [event.color for event in batch] == [GoogleEventColor.SAGE, None, None]
+    assert [event.color for event in batch.with_color(None)] == [None, None, None]
+
+
+def test_with_text_where(events: list[Event]):
+    batch = EventBatch.from_events(events)
+
+    renamed = batch.with_text_where(
+        np.array([False, True, True]), "title", lambda title: f"{title} (A)"
+    )
+
+    assert [event.title for event in renamed] == [
+        "Seminar",
+        "Lecture (A)",
+        "Lecture (A)",
+    ]
+    assert [event.title for event in batch] == ["Seminar", "Lecture", "Lecture"]
+
+
+def test_string_column_evaluates_once_per_distinct_value():
+    column = StringColumn.from_strings(["a", "b", "a", "a"])
+    calls = []
+
+    def predicate(value: str) -> bool:
+        calls.append(value)
+        return value == "a"
+
+    assert column.evaluate(predicate).tolist() == [True, False, True, True]
+    assert calls == ["a", "b"]
+
+
+def test_string_column_map_where():
+    column = StringColumn.from_strings(["a", "b", "a"])
+
+    mapped = column.map_where(np.array([True, True, False]), str.upper)
+
+    assert [mapped[row] for row in range(3)] == ["A", "B", "a"]
+    assert [column[row] for row in range(3)] == ["a", "b", "a"]
+
+
+def test_from_events_of_a_feed_with_tzid():
+    """dateutil timezones, returned by the ICS parser for a TZID, are not hashable."""
+    ics_str = """BEGIN:VCALENDAR
+VERSION:2.0
+PRODID:-//Syncademic Inc//Syncademic//EN
+BEGIN:VEVENT
+SUMMARY:Lecture
+DTSTART;TZID=Europe/Paris:20240301T090000
+DTEND;TZID=America/New_York:20240301T040000
+END:VEVENT
+BEGIN:VEVENT
+SUMMARY:Seminar
+DTSTART;TZID=Europe/Paris:20240304T090000
+DTEND;TZID=Europe/Paris:20240304T100000
+RRULE:FREQ=WEEKLY;COUNT=2
+END:VEVENT
+END:VCALENDAR"""
+    events = IcsParser(clock=lambda: start.timestamp()).try_parse(ics_str)
+    assert isinstance(events, list) and len(events) == 3
+    ruleset = Ruleset(
+        rules=[
+            Rule(
+                condition=TextFieldCondition(
+                    field="title", operator="equals", value="Seminar"
+                ),
+                actions=[
+                    ChangeColorAction(
+                        action="change_color", value=GoogleEventColor.SAGE
+                    )
+                ],
+            )
+        ]
+    )
+
+    batch = ruleset.apply_batch(EventBatch.from_events(events))
+
+    assert len(batch.tzinfos) == 2
+    assert sorted(batch.to_events(), key=lambda event: event.start_us) == sorted(
+        ruleset.apply(events), key=lambda event: event.start_us
+    )
@@ -1,3 +1,6 @@
+import dataclasses
+import pickle
+
 import arrow
 import pytest
 from backend.shared.event import Event
@@ -144,3 +147,66 @@ def test_duplicates_can_be_removed_with_set():
         location=location,
     )
     assert len({event1, event2}) == 1
+
+
+def test_start_and_end_are_kept_in_their_timezone():
+    paris_start = arrow.get("2024-03-01T10:00:00.123456+01:00")
+    utc_end = arrow.get("2024-03-01T12:00:00Z")
+
+    event = Event(start=paris_start, end=utc_end)
+
+    assert event.start_us == paris_start.int_timestamp * 1_000_000 + 123_456
+    assert event.start == paris_start
+    assert event.start.utcoffset() == paris_start.utcoffset()
+    assert event.end == utc_end
+    assert event.end.utcoffset() == utc_end.utcoffset()
+
+
+def test_events_at_the_same_instants_are_equal():
+    event1 = Event(start=start, end=end, title=title)
+    event2 = Event(
+        start=start.to("Europe/Paris"), end=end.to("Asia/Tokyo"), title=title
+    )
+
+    assert event1 == event2
+    assert hash(event1) == hash(event2)
+
+
+def test_event_is_immutable():
+    event = Event(start=start, end=end, title=title)
+
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        event.title = "Changed"  # type: ignore[misc]
+
+
+def test_replace_text_fields():
+    event = Event(start=start, end=end, title=title, location=location)
+
+    changed = event.replace(title="New title", color=GoogleEventColor.BASIL)
+
+    assert changed == Event(
+        start=start,
+        end=end,
+        title="New title",
+        location=location,
+        color=GoogleEventColor.BASIL,
+    )
+    assert event.title == title
+    with pytest.raises(ValueError, match="Title must be provided"):
+        event.replace(title=None)
+    with pytest.raises(TypeError):
+        event.replace(unknown="value")
+
+
+def test_replace_dates_is_validated():
+    event = Event(start=start, end=end, title=title)
+
+    assert event.replace(end=end.shift(hours=1)).end == end.shift(hours=1)
+    with pytest.raises(ValueError, match="Start date must be before end date"):
+        event.replace(start=end)
+
+
+def test_pickle_round_trip():
+    event = Event(start=start, end=end, title=title, color=GoogleEventColor.TOMATO)
+
+    assert pickle.loads(pickle.dumps(event)) == event
@@ -0,0 +1,54 @@
+import arrow
+
+from backend.shared.event import Event
+from backend.shared.google_calendar_colors import GoogleEventColor
+from backend.synchronizer.events_digest import compute_events_digest
+from tests.util import VALID_RULESET
+
+event1 = Event(
+    start=arrow.get("2023-01-01T09:00:00"),
+    end=arrow.get("2023-01-01T10:00:00"),
+    title="Meeting",
+)
+event2 = Event(
+    start=arrow.get("2023-01-02T09:00:00"),
+    end=arrow.get("2023-01-02T10:00:00"),
+    title="Meeting",
+    color=GoogleEventColor.TOMATO,
+)
+
+
+def _digest(events: list[Event], **kwargs) -> str:
+    return compute_events_digest(
+        events,
+        **{"ruleset": None, "target_calendar_id": "calendar", **kwargs},
+    )
+
+
+def test_digest_ignores_event_order():
+    assert _digest([event1, event2]) == _digest([event2, event1])
+
+
+def test_digest_changes_with_events():
+    moved = Event(start=event1.start.shift(hours=1), end=event1.end.shift(hours=1))
+    recolored = Event(
+        start=event2.start,
+        end=event2.end,
+        title=event2.title,
+        color=GoogleEventColor.BANANA,
+    )
+
+    digests = {
+        _digest([event1, event2]),
+        _digest([event1]),
+        _digest([moved, event2]),
+        _digest([event1, recolored]),
+    }
+    assert len(digests) == 4
+
+
+def test_digest_covers_ruleset_and_target_calendar():
+    digest = _digest([event1])
+
+    assert _digest([event1], ruleset=VALID_RULESET) != digest
+    assert _digest([event1], target_calendar_id="other") != digest
@@ -2,6 +2,7 @@ from datetime import datetime, timezone
 from unittest.mock import Mock
 
 import arrow
+from dateutil import tz
 from backend.shared.event import Event
 from backend.shared.google_calendar_colors import GoogleEventColor
 from backend.synchronizer.google_calendar_manager import GoogleCalendarManager
@@ -91,6 +92,91 @@ def test_all_day_event_to_google_event():
     assert google_event["end"] == {"date": "2023-01-02"}
 
 
+def test_event_to_google_event_matches_arrow_formatting():
+    # Arrange
+    manager = GoogleCalendarManager(service=Mock(), calendar_id="test_calendar_id")
+    event = Event(
+        start=arrow.get("2023-03-26T01:30:15.123456", tzinfo="Europe/Paris"),
+        end=arrow.get("2023-03-25T22:00:00", tzinfo="America/New_York"),
+        title="Across a DST change",
+    )
+
+    # Act
+    google_event = manager._event_to_google_event(event, {})
+
+    # Assert
+    assert google_event["start"] == {
+        "dateTime": event.start.format("YYYY-MM-DDTHH:mm:ssZZ")
+    }
+    assert google_event["end"] == {
+        "dateTime": event.end.format("YYYY-MM-DDTHH:mm:ssZZ")
+    }
+    assert google_event["end"] == {"dateTime": "2023-03-25T22:00:00-04:00"}
+
+
+def test_serialize_events_with_dateutil_timezones():
+    # Arrange: the ICS parser returns dateutil timezones for a TZID, which are not hashable
+    paris = tz.gettz("Europe/Paris")
+    events = [
+        Event(
+            start=arrow.Arrow(2023, 3, 25, 9, tzinfo=paris),
+            end=arrow.Arrow(2023, 3, 25, 10, tzinfo=paris),
+            title="Before DST",
+        ),
+        Event(
+            start=arrow.Arrow(2023, 3, 27, tzinfo=paris),
+            end=arrow.Arrow(2023, 3, 28, tzinfo=paris),
+            title="All day",
+            is_all_day=True,
+        ),
+    ]
+
+    # Act
+    google_events = GoogleCalendarManager.serialize_events(
+        events, sync_profile_id="test_sync_profile"
+    )
+
+    # Assert
+    assert [(event["start"], event["end"]) for event in google_events] == [
+        (
+            {"dateTime": "2023-03-25T09:00:00+01:00"},
+            {"dateTime": "2023-03-25T10:00:00+01:00"},
+        ),
+        ({"date": "2023-03-27"}, {"date": "2023-03-28"}),
+    ]
+
+
+def test_serialize_events_shares_extended_properties():
+    # Arrange
+    events = [
+        Event(
+            start=arrow.get(f"2023-01-0{day}T09:00:00+00:00"),
+            end=arrow.get(f"2023-01-0{day}T10:00:00+00:00"),
+            title=f"Event {day}",
+        )
+        for day in range(1, 4)
+    ]
+
+    # Act
+    google_events = GoogleCalendarManager.serialize_events(
+        events, sync_profile_id="test_sync_profile"
+    )
+
+    # Assert
+    assert [google_event["summary"] for google_event in google_events] == [
+        "Event 1",
+        "Event 2",
+        "Event 3",
+    ]
+    assert google_events[0]["extendedProperties"] == {
+        "private": {"syncademic": "test_sync_profile"}
+    }
+    assert all(
+        google_event["extendedProperties"] is google_events[0]["extendedProperties"]
+        for google_event in google_events
+    )
+
+
 def test_get_syncademic_marker():
     # Arrange
     service = Mock()
@@ -217,6 +303,7 @@ def test_get_events_ids_from_sync_profile():
         orderBy="startTime",
         maxResults=1000,
         timeMin=min_dt.isoformat(),
+        timeMax=None,
     )
     assert event_ids == ["event_id_1", "event_id_2"]
 
@@ -5,6 +5,7 @@ import pytest
 from google.cloud import storage
 from pydantic import HttpUrl
 
+from backend.services.sync_profiler import SyncProfileReport
 from backend.synchronizer.ics_cache import (
     FirebaseIcsFileStorage,
     IcsFileStorage,
@@ -106,6 +107,36 @@ def test_save_to_cache_with_metadata(
     assert blob_mock.metadata == expected_metadata
 
 
+@patch("backend.synchronizer.ics_cache.datetime")
+def test_save_sync_profile_report(
+    mock_datetime: MagicMock,
+    firebase_storage: FirebaseIcsFileStorage,
+    bucket_mock: MagicMock,
+    blob_mock: MagicMock,
+) -> None:
+    """Test that a sync profile report is stored next to the ICS files"""
+    # Arrange
+    metadata = {"user_id": "user-1", "sync_profile_id": "test-profile-123"}
+    report = SyncProfileReport(stats=b"stats", summary="summary")
+
+    mock_now = datetime(2023, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
+    mock_datetime.now.return_value = mock_now
+
+    # Act
+    firebase_storage.save_sync_profile_report(report, metadata=metadata)
+
+    # Assert
+    assert [call.args for call in bucket_mock.blob.call_args_list] == [
+        ("test-profile-123_2023-01-01_12-00-00.prof",),
+        ("test-profile-123_2023-01-01_12-00-00.profile.txt",),
+    ]
+    assert [call.args for call in blob_mock.upload_from_string.call_args_list] == [
+        (b"stats",),
+        ("summary",),
+    ]
+    assert blob_mock.metadata == {"blob_created_at": mock_now.isoformat(), **metadata}
+
+
 @patch("backend.synchronizer.ics_cache.datetime")
 def test_save_to_cache_with_no_metadata(
     mock_datetime: MagicMock,
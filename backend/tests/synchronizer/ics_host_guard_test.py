@@ -0,0 +1,182 @@
+import threading
+
+import httpx
+import pytest
+import requests
+
+from backend.services.exceptions.ics import IcsHostUnavailableError
+from backend.synchronizer.ics_host_guard import (
+    CircuitState,
+    HostCircuitBreaker,
+    IcsHostGuard,
+    is_host_failure,
+)
+from tests.util import FakeClock
+
+URL = "https://ade.example.com/calendar.ics"
+
+
+@pytest.fixture
+def clock() -> FakeClock:
+    return FakeClock()
+
+
+@pytest.fixture
+def breaker(clock: FakeClock) -> HostCircuitBreaker:
+    return HostCircuitBreaker(
+        window=10,
+        min_requests=4,
+        failure_rate_threshold=0.5,
+        cooldown_s=60,
+        clock=clock,
+    )
+
+
+def _http_error(status_code: int) -> requests.HTTPError:
+    response = requests.Response()
+    response.status_code = status_code
+    return requests.HTTPError(response=response)
+
+
+@pytest.mark.parametrize(
+    "error, expected",
+    [
+        (requests.ConnectionError(), True),
+        (requests.Timeout(), True),
+        (httpx.ConnectTimeout("timed out"), True),
+        (_http_error(503), True),
+        (_http_error(429), True),
+        (_http_error(404), False),
+        (ValueError(), False),
+    ],
+)
+def test_is_host_failure(error: BaseException, expected: bool) -> None:
+    assert is_host_failure(error) is expected
+
+
+def test_breaker_opens_at_failure_rate(breaker: HostCircuitBreaker) -> None:
+    breaker.record_success()
+    breaker.record_failure()
+    breaker.record_success()
+    assert breaker.state == CircuitState.CLOSED
+
+    breaker.record_failure()
+
+    assert breaker.state == CircuitState.OPEN
+    assert not breaker.allow_request()
+    assert breaker.retry_after_s == 60
+
+
+def test_breaker_needs_min_requests(breaker: HostCircuitBreaker) -> None:
+    for _ in range(3):
+        breaker.record_failure()
+
+    assert breaker.state == CircuitState.CLOSED
+
+
+def test_half_open_probe_closes_circuit(
+    breaker: HostCircuitBreaker, clock: FakeClock
+) -> None:
+    for _ in range(4):
+        breaker.record_failure()
+    clock.now = 60
+
+    assert breaker.state == CircuitState.HALF_OPEN
+    assert breaker.allow_request()
+    # A single probe at a time
+    assert not breaker.allow_request()
+
+    breaker.record_success()
+
+    assert breaker.state == CircuitState.CLOSED
+    assert breaker.allow_request()
+
+
+def test_half_open_probe_failure_reopens_circuit(
+    breaker: HostCircuitBreaker, clock: FakeClock
+) -> None:
+    for _ in range(4):
+        breaker.record_failure()
+    clock.now = 60
+    assert breaker.allow_request()
+
+    breaker.record_failure()
+
+    assert breaker.state == CircuitState.OPEN
+    clock.now = 119
+    assert not breaker.allow_request()
+    clock.now = 120
+    assert breaker.allow_request()
+
+
+def test_guard_fails_fast_once_host_is_down(clock: FakeClock) -> None:
+    guard = IcsHostGuard(
+        max_concurrent_requests=2,
+        window=10,
+        min_requests=2,
+        failure_rate_threshold=0.5,
+        cooldown_s=60,
+        clock=clock,
+    )
+
+    for _ in range(2):
+        with pytest.raises(requests.ConnectionError):
+            with guard.request(URL, timeout_s=1):
+                raise requests.ConnectionError()
+
+    with pytest.raises(IcsHostUnavailableError) as exc_info:
+        with guard.request(URL, timeout_s=1):
+            pytest.fail("The request should not be sent")
+    assert exc_info.value.details["host"] == "ade.example.com"
+
+    # Other hosts are not affected
+    with guard.request("https://other.example.com/calendar.ics", timeout_s=1):
+        pass
+
+
+def test_guard_errors_of_a_single_url_do_not_count() -> None:
+    guard = IcsHostGuard(min_requests=1, failure_rate_threshold=0.5)
+
+    for _ in range(3):
+        with pytest.raises(requests.HTTPError):
+            with guard.request(URL, timeout_s=1):
+                raise _http_error(404)
+
+    assert guard.breaker("ade.example.com").state == CircuitState.CLOSED
+
+
+def test_guard_limits_concurrent_requests_per_host() -> None:
+    guard = IcsHostGuard(max_concurrent_requests=1)
+    in_flight = threading.Event()
+    release = threading.Event()
+
+    def _slow_request() -> None:
+        with guard.request(URL, timeout_s=1):
+            in_flight.set()
+            release.wait(timeout=5)
+
+    thread = threading.Thread(target=_slow_request)
+    thread.start()
+    assert in_flight.wait(timeout=5)
+
+    with pytest.raises(IcsHostUnavailableError, match="Too many requests"):
+        with guard.request(URL, timeout_s=0.01):
+            pass
+
+    release.set()
+    thread.join()
+    with guard.request(URL, timeout_s=1):
+        pass
+
+
+@pytest.mark.anyio
+async def test_guard_async_fails_fast_once_host_is_down() -> None:
+    guard = IcsHostGuard(min_requests=1, failure_rate_threshold=0.5)
+
+    with pytest.raises(httpx.ConnectError):
+        async with guard.request_async(URL, timeout_s=1):
+            raise httpx.ConnectError("refused")
+
+    with pytest.raises(IcsHostUnavailableError):
+        async with guard.request_async(URL, timeout_s=1):
+            pytest.fail("The request should not be sent")
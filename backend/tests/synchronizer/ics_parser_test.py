@@ -1,7 +1,12 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import List
 
 import arrow
+import ics
 import pytest
+from pytest_mock import MockerFixture
 
 from backend.services.exceptions.ics import IcsParsingError
 from backend.shared.event import Event
@@ -196,62 +201,208 @@ END:VEVENT"""
     assert isinstance(error, IcsParsingError)
 
 
-def test_recurring_event_with_rrule_throws(ics_parser: IcsParser):
-    """Test that a recurring event with RRULE raises an error. We do not support recurring events yet."""
+@pytest.fixture
+def recurrence_parser() -> IcsParser:
+    """A parser expanding recurring events from 2022-12-01 to 2023-05-01."""
+    now = arrow.get("2023-01-15T00:00:00Z").timestamp()
+    return IcsParser(
+        recurrence_past_days=30,
+        recurrence_future_days=60,
+        max_recurrence_instances=10_000,
+        clock=lambda: now,
+    )
+
+
+def starts(events: list[Event]) -> list[str]:
+    return sorted(event.start.isoformat() for event in events)
+
+
+def test_recurring_event_with_rrule(recurrence_parser: IcsParser):
+    """Test that an RRULE is expanded into one event per occurrence."""
     ics_str = build_ics_outline(
         """BEGIN:VEVENT
 SUMMARY:Recurring Event
 DTSTART:20230101T090000
 DTEND:20230101T100000
-RRULE:FREQ=DAILY;COUNT=5
+RRULE:FREQ=DAILY;COUNT=3
 END:VEVENT"""
     )
-    # with pytest.raises(RecurringEventError):
-    #     ics_parser.parse(ics_str)
-
-    error = ics_parser.try_parse(ics_str)
-    assert isinstance(error, RecurringEventError)
-
-
-def test_recurring_event_with_rdate_throws(ics_parser: IcsParser):
-    """Test that a recurring event with RDATE raises an error. We do not support recurring events yet."""
+    events = recurrence_parser.try_parse(ics_str)
+    assert isinstance(events, list)
+    assert sorted(events, key=lambda event: event.start_us) == [
+        Event(
+            title="Recurring Event",
+            start=arrow.get(f"2023-01-0{day}T09:00:00"),
+            end=arrow.get(f"2023-01-0{day}T10:00:00"),
+        )
+        for day in (1, 2, 3)
+    ]
+
+
+def test_recurring_event_with_rdate(recurrence_parser: IcsParser):
+    """Test that the RDATE instances are added to DTSTART."""
     ics_str = build_ics_outline(
         """BEGIN:VEVENT
 SUMMARY:Recurring Event
 DTSTART:20230101T090000
 DTEND:20230101T100000
-RDATE:20230102T090000,20230103T090000
+RDATE:20230102T090000,20230105T120000
 END:VEVENT"""
     )
-    error = ics_parser.try_parse(ics_str)
-    assert isinstance(error, RecurringEventError)
+    events = recurrence_parser.try_parse(ics_str)
+    assert isinstance(events, list)
+    assert starts(events) == [
+        "2023-01-01T09:00:00+00:00",
+        "2023-01-02T09:00:00+00:00",
+        "2023-01-05T12:00:00+00:00",
+    ]
 
 
-def test_recurring_event_with_exdate_throws(ics_parser: IcsParser):
-    """Test that a recurring event with EXDATE raises an error. We do not support recurring events yet."""
+def test_recurring_event_with_exdate(recurrence_parser: IcsParser):
+    """Test that the EXDATE instances are removed."""
     ics_str = build_ics_outline(
         """BEGIN:VEVENT
 SUMMARY:Recurring Event
 DTSTART:20230101T090000
 DTEND:20230101T100000
+RRULE:FREQ=DAILY;COUNT=4
 EXDATE:20230102T090000
+EXDATE:20230104T090000
 END:VEVENT"""
     )
-    error = ics_parser.try_parse(ics_str)
-    assert isinstance(error, RecurringEventError)
+    events = recurrence_parser.try_parse(ics_str)
+    assert isinstance(events, list)
+    assert starts(events) == [
+        "2023-01-01T09:00:00+00:00",
+        "2023-01-03T09:00:00+00:00",
+    ]
 
 
-def test_recurring_event_with_recurrence_id_throws(ics_parser: IcsParser):
-    """Test that a recurring event with RECURRENCE-ID raises an error."""
+def test_recurring_event_with_recurrence_id(recurrence_parser: IcsParser):
+    """Test that an event with a RECURRENCE-ID replaces the occurrence it targets."""
     ics_str = build_ics_outline(
         """BEGIN:VEVENT
+UID:series
 SUMMARY:Recurring Event
 DTSTART:20230101T090000
 DTEND:20230101T100000
+RRULE:FREQ=DAILY;COUNT=3
+END:VEVENT
+BEGIN:VEVENT
+UID:series
+SUMMARY:Moved Event
 RECURRENCE-ID:20230102T090000
+DTSTART:20230102T140000
+DTEND:20230102T150000
+END:VEVENT
+BEGIN:VEVENT
+UID:series
+SUMMARY:Recurring Event
+RECURRENCE-ID:20230103T090000
+DTSTART:20230103T090000
+DTEND:20230103T100000
+STATUS:CANCELLED
 END:VEVENT"""
     )
-    error = ics_parser.try_parse(ics_str)
+    events = recurrence_parser.try_parse(ics_str)
+    assert isinstance(events, list)
+    assert sorted((event.start.isoformat(), event.title) for event in events) == [
+        ("2023-01-01T09:00:00+00:00", "Recurring Event"),
+        ("2023-01-02T14:00:00+00:00", "Moved Event"),
+    ]
+
+
+def test_recurring_event_keeps_wall_clock_time_across_dst(
+    recurrence_parser: IcsParser,
+):
+    """Test that a weekly event stays at the same local time after a DST change."""
+    ics_str = build_ics_outline(
+        """BEGIN:VEVENT
+SUMMARY:Recurring Event
+DTSTART;TZID=Europe/Paris:20230320T090000
+DTEND;TZID=Europe/Paris:20230320T100000
+RRULE:FREQ=WEEKLY;UNTIL=20230327T070000Z
+END:VEVENT"""
+    )
+    parser = IcsParser(clock=lambda: arrow.get("2023-03-01T00:00:00Z").timestamp())
+    events = parser.try_parse(ics_str)
+    assert isinstance(events, list)
+    assert starts(events) == [
+        "2023-03-20T09:00:00+01:00",
+        "2023-03-27T09:00:00+02:00",
+    ]
+
+
+def test_recurring_event_is_expanded_within_the_window(
+    recurrence_parser: IcsParser,
+):
+    """Test that an endless series is expanded only from 30 days before now to 60 days after, rounded out to months."""
+    ics_str = build_ics_outline(
+        """BEGIN:VEVENT
+SUMMARY:Recurring Event
+DTSTART:20200101T090000
+DTEND:20200101T100000
+RRULE:FREQ=DAILY
+END:VEVENT"""
+    )
+    events = recurrence_parser.try_parse(ics_str)
+    assert isinstance(events, list)
+    assert len(events) == 151
+    assert starts(events)[0] == "2022-12-01T09:00:00+00:00"
+    assert starts(events)[-1] == "2023-04-30T09:00:00+00:00"
+
+
+def test_recurrence_window_moves_once_a_month():
+    """Test that the occurrences, hence the events digest, only change with the month."""
+    ics_str = build_ics_outline(
+        """BEGIN:VEVENT
+SUMMARY:Recurring Event
+DTSTART:20200101T090000
+DTEND:20200101T100000
+RRULE:FREQ=DAILY
+END:VEVENT"""
+    )
+
+    def parse_at(now: str) -> list[Event]:
+        parser = IcsParser(clock=lambda: arrow.get(now).timestamp())
+        events = parser.try_parse(ics_str)
+        assert isinstance(events, list)
+        return sorted(events, key=lambda event: event.start_us)
+
+    assert parse_at("2023-01-02T00:00:00Z") == parse_at("2023-01-31T23:00:00Z")
+    assert parse_at("2023-01-31T23:00:00Z") != parse_at("2023-02-01T00:00:00Z")
+
+
+def test_recurring_event_is_cut_after_max_instances():
+    """Test that at most `max_recurrence_instances` instances of a series are computed."""
+    ics_str = build_ics_outline(
+        """BEGIN:VEVENT
+SUMMARY:Recurring Event
+DTSTART:20230101T000000
+DTEND:20230101T000001
+RRULE:FREQ=SECONDLY
+END:VEVENT"""
+    )
+    parser = IcsParser(
+        max_recurrence_instances=100,
+        clock=lambda: arrow.get("2023-01-01T00:00:00Z").timestamp(),
+    )
+    events = parser.try_parse(ics_str)
+    assert isinstance(events, list)
+    assert len(events) == 100
+
+
+def test_recurring_event_with_invalid_rrule(recurrence_parser: IcsParser):
+    """Test that an invalid RRULE is reported as a RecurringEventError."""
+    ics_str = build_ics_outline(
+        """BEGIN:VEVENT
+SUMMARY:Recurring Event
+DTSTART:20230101T090000
+DTEND:20230101T100000
+RRULE:FREQ=SOMETIMES
+END:VEVENT"""
+    )
+    error = recurrence_parser.try_parse(ics_str)
     assert isinstance(error, RecurringEventError)
 
 
@@ -281,3 +432,32 @@ END:VEVENT"""
     assert event.start.format("YYYY-MM-DD") == "2025-06-09"
     assert event.end.format("YYYY-MM-DD") == "2025-06-10"
     assert event.is_all_day
+
+
+def test_ics_library_is_never_entered_concurrently(
+    ics_parser: IcsParser, mocker: MockerFixture
+):
+    """The `ics` library's grammar is not thread-safe: parses must be serialized."""
+    lock = threading.Lock()
+    running = 0
+    max_running = 0
+    calendar_cls = ics.Calendar
+
+    def calendar(ics_str: str) -> ics.Calendar:
+        nonlocal running, max_running
+        with lock:
+            running += 1
+            max_running = max(max_running, running)
+        time.sleep(0.01)
+        with lock:
+            running -= 1
+        return calendar_cls(ics_str)
+
+    mocker.patch("backend.synchronizer.ics_parser.ics.Calendar", side_effect=calendar)
+    ics_str = build_ics([event1, event2])
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        results = list(executor.map(ics_parser.try_parse, [ics_str] * 8))
+
+    assert max_running == 1
+    assert all(isinstance(result, list) and len(result) == 2 for result in results)
@@ -1,17 +1,22 @@
+import gzip
 from pathlib import Path
 
+import httpx
 import pytest
 import requests
 import responses
 from pydantic import HttpUrl, ValidationError
 
-from backend.services.exceptions.ics import IcsSourceError
+from backend.services.exceptions.ics import IcsHostUnavailableError, IcsSourceError
 from backend.settings import settings
+from backend.synchronizer.ics_host_guard import IcsHostGuard
 from backend.synchronizer.ics_source import (
     FileIcsSource,
     StringIcsSource,
     UrlIcsSource,
 )
+from backend.synchronizer.ics_transfer import ics_transfer_stats
+from tests.util import streamed_response
 
 # Mock settings
 settings.MAX_ICS_SIZE_BYTES = 1 * 1024 * 1024  # 1 MB
@@ -211,6 +216,79 @@ def test_timeout():
             ics_source.get_ics_string()
 
 
+def test_fails_fast_once_host_is_down():
+    url = HttpUrl("https://example.com/down.ics")
+    host_guard = IcsHostGuard(min_requests=2, failure_rate_threshold=0.5)
+
+    with responses.RequestsMock(assert_all_requests_are_fired=False) as rsps:
+        rsps.add(responses.GET, str(url), status=503, content_type="text/plain")
+
+        ics_source = UrlIcsSource(url=url)
+        for _ in range(2):
+            with pytest.raises(IcsSourceError, match="Could not fetch ICS file"):
+                ics_source.get_ics_string(host_guard=host_guard)
+
+        with pytest.raises(IcsHostUnavailableError):
+            ics_source.get_ics_string(host_guard=host_guard)
+        assert len(rsps.calls) == 2
+
+
+def test_requests_compressed_ics():
+    url = HttpUrl("https://example.com/valid.ics")
+
+    with responses.RequestsMock() as rsps:
+        rsps.add(
+            responses.GET,
+            str(url),
+            body=valid_ics_content,
+            status=200,
+            content_type="text/calendar",
+        )
+
+        UrlIcsSource(url=url).get_ics_string()
+
+        assert "gzip" in rsps.calls[0].request.headers["Accept-Encoding"]
+
+
+def test_gzip_compressed_ics():
+    url = HttpUrl("https://example.com/compressed.ics")
+
+    with responses.RequestsMock() as rsps:
+        rsps.add(
+            responses.GET,
+            str(url),
+            body=gzip.compress(valid_ics_content.encode()),
+            status=200,
+            content_type="text/calendar",
+            headers={"Content-Encoding": "gzip"},
+        )
+
+        ics_string = UrlIcsSource(url=url).get_ics_string()
+
+    assert ics_string == valid_ics_content
+    stats = ics_transfer_stats.snapshot()["example.com"]
+    assert stats.compressed_downloads >= 1
+
+
+def test_compressed_ics_too_large_once_decoded():
+    url = HttpUrl("https://example.com/bomb.ics")
+    wire = gzip.compress(large_ics_content.encode())
+    assert len(wire) < settings.MAX_ICS_WIRE_SIZE_BYTES
+
+    with responses.RequestsMock() as rsps:
+        rsps.add(
+            responses.GET,
+            str(url),
+            body=wire,
+            status=200,
+            content_type="text/calendar",
+            headers={"Content-Encoding": "gzip", "Content-Length": str(len(wire))},
+        )
+
+        with pytest.raises(IcsSourceError, match="ICS file is too large"):
+            UrlIcsSource(url=url).get_ics_string()
+
+
 def test_url_ics_source_equality():
     url = HttpUrl("https://example.com/calendar.ics")
     source1 = UrlIcsSource(url=url)
@@ -262,3 +340,85 @@ def test_webcal_to_http_url_conversion():
         str(converted.url)
         == "http://example.com/calendar.ics?version=2.0&type=personal"
     )
+
+
+def _mock_client(handler) -> httpx.AsyncClient:
+    return httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+
+@pytest.mark.anyio
+async def test_async_valid_ics_url():
+    requested_urls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requested_urls.append(str(request.url))
+        return streamed_response(
+            200, valid_ics_content, headers={"Content-Type": "text/calendar"}
+        )
+
+    url = HttpUrl("https://example.com/valid.ics")
+    async with _mock_client(handler) as client:
+        ics_string = await UrlIcsSource(url=url).get_ics_string_async(client)
+
+    assert ics_string == valid_ics_content
+    assert requested_urls == [str(url)]
+
+
+@pytest.mark.anyio
+async def test_async_gzip_compressed_ics():
+    def handler(request: httpx.Request) -> httpx.Response:
+        assert "gzip" in request.headers["Accept-Encoding"]
+        return streamed_response(
+            200,
+            gzip.compress(valid_ics_content.encode()),
+            headers={"Content-Type": "text/calendar", "Content-Encoding": "gzip"},
+        )
+
+    url = HttpUrl("https://example.com/compressed.ics")
+    async with _mock_client(handler) as client:
+        ics_string = await UrlIcsSource(url=url).get_ics_string_async(client)
+
+    assert ics_string == valid_ics_content
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize(
+    "response, match",
+    [
+        (httpx.Response(404, text="Not Found"), "Could not fetch ICS file"),
+        (
+            streamed_response(
+                200, valid_ics_content, headers={"Content-Type": "application/pdf"}
+            ),
+            "Content-Type is not text",
+        ),
+        (
+            streamed_response(
+                200, large_ics_content, headers={"Content-Type": "text/calendar"}
+            ),
+            "ICS file is too large",
+        ),
+    ],
+)
+async def test_async_rejected_responses(response: httpx.Response, match: str):
+    url = HttpUrl("https://example.com/calendar.ics")
+    async with _mock_client(lambda request: response) as client:
+        with pytest.raises(IcsSourceError, match=match):
+            await UrlIcsSource(url=url).get_ics_string_async(client)
+
+
+@pytest.mark.anyio
+async def test_async_timeout():
+    def handler(request: httpx.Request) -> httpx.Response:
+        raise httpx.ReadTimeout("timed out", request=request)
+
+    url = HttpUrl("https://example.com/timeout.ics")
+    async with _mock_client(handler) as client:
+        with pytest.raises(IcsSourceError, match="Could not fetch ICS file"):
+            await UrlIcsSource(url=url).get_ics_string_async(client)
+
+
+@pytest.mark.anyio
+async def test_async_string_source_needs_no_client():
+    source = StringIcsSource(ics_string=valid_ics_content)
+    assert await source.get_ics_string_async() == valid_ics_content
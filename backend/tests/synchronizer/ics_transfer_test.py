@@ -0,0 +1,93 @@
+import gzip
+import zlib
+
+import pytest
+
+from backend.services.exceptions.ics import IcsSourceError
+from backend.synchronizer.ics_transfer import IcsBodyDecoder, IcsTransferStats
+
+BODY = (
+    b"BEGIN:VCALENDAR\r\n" + b"BEGIN:VEVENT\r\nSUMMARY:Lecture\r\nEND:VEVENT\r\n" * 500
+)
+
+
+def _decode(
+    wire: bytes,
+    content_encoding: str | None,
+    *,
+    max_wire_size_b: int = 1_000_000,
+    max_decoded_size_b: int = 1_000_000,
+) -> IcsBodyDecoder:
+    decoder = IcsBodyDecoder(
+        content_encoding,
+        max_wire_size_b=max_wire_size_b,
+        max_decoded_size_b=max_decoded_size_b,
+    )
+    for i in range(0, len(wire), 1000):
+        decoder.feed(wire[i : i + 1000])
+    return decoder
+
+
+@pytest.mark.parametrize(
+    "wire, content_encoding",
+    [
+        (BODY, None),
+        (BODY, "identity"),
+        (gzip.compress(BODY), "gzip"),
+        (gzip.compress(BODY), "x-gzip"),
+        (zlib.compress(BODY), "deflate"),
+        # Raw deflate, without the zlib wrapper
+        (zlib.compress(BODY, wbits=-zlib.MAX_WBITS), "Deflate"),
+    ],
+)
+def test_decodes_body(wire: bytes, content_encoding: str | None) -> None:
+    decoder = _decode(wire, content_encoding)
+
+    assert decoder.finish() == BODY
+    assert decoder.wire_bytes == len(wire)
+    assert decoder.decoded_bytes == len(BODY)
+
+
+def test_decoded_size_is_limited() -> None:
+    bomb = gzip.compress(b"\0" * 50_000_000)
+    assert len(bomb) < 100_000
+
+    with pytest.raises(IcsSourceError, match="too large"):
+        _decode(bomb, "gzip", max_decoded_size_b=1_000_000)
+
+
+def test_wire_size_is_limited() -> None:
+    with pytest.raises(IcsSourceError, match="too large"):
+        _decode(BODY, None, max_wire_size_b=len(BODY) - 1)
+
+
+def test_truncated_body() -> None:
+    decoder = _decode(gzip.compress(BODY)[:-20], "gzip")
+
+    with pytest.raises(IcsSourceError, match="truncated"):
+        decoder.finish()
+
+
+def test_corrupted_body() -> None:
+    with pytest.raises(IcsSourceError, match="Could not decompress"):
+        _decode(b"not gzip at all", "gzip")
+
+
+def test_unsupported_encoding() -> None:
+    with pytest.raises(IcsSourceError, match="Unsupported Content-Encoding"):
+        IcsBodyDecoder("br", max_wire_size_b=1, max_decoded_size_b=1)
+
+
+def test_stats_compression_ratio_per_host() -> None:
+    stats = IcsTransferStats()
+    compressed = _decode(gzip.compress(BODY), "gzip")
+    compressed.finish()
+
+    stats.record("compressing.example.com", compressed)
+    stats.record("plain.example.com", _decode(BODY, None))
+
+    snapshot = stats.snapshot()
+    assert snapshot["compressing.example.com"].compressed_downloads == 1
+    assert snapshot["compressing.example.com"].compression_ratio > 10
+    assert snapshot["plain.example.com"].compressed_downloads == 0
+    assert snapshot["plain.example.com"].compression_ratio == 1.0
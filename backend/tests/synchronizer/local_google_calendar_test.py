@@ -0,0 +1,139 @@
+from datetime import datetime, timezone
+from typing import Iterator
+
+import arrow
+import pytest
+from googleapiclient.errors import HttpError
+
+from backend.shared.event import Event
+from backend.synchronizer.google_calendar_manager import GoogleCalendarManager
+from backend.synchronizer.local_google_calendar import (
+    FaultInjector,
+    LocalGoogleCalendarServer,
+)
+
+CALENDAR_ID = "calendar-id"
+
+
+def _events(n: int, start: str = "2024-09-02T08:00:00+02:00") -> list[Event]:
+    first = arrow.get(start)
+    return [
+        Event(
+            start=first.shift(days=i),
+            end=first.shift(days=i, hours=2),
+            title=f"Course {i}",
+        )
+        for i in range(n)
+    ]
+
+
+@pytest.fixture
+def server() -> Iterator[LocalGoogleCalendarServer]:
+    with LocalGoogleCalendarServer() as server:
+        server.store.add_calendar(CALENDAR_ID)
+        yield server
+
+
+@pytest.fixture
+def manager(server: LocalGoogleCalendarServer) -> GoogleCalendarManager:
+    return GoogleCalendarManager(server.build_service(), CALENDAR_ID)
+
+
+def test_check_calendar_exists(
+    server: LocalGoogleCalendarServer, manager: GoogleCalendarManager
+) -> None:
+    assert manager.check_calendar_exists()
+    assert not GoogleCalendarManager(
+        server.build_service(), "unknown"
+    ).check_calendar_exists()
+
+
+def test_create_events_in_batches(
+    server: LocalGoogleCalendarServer, manager: GoogleCalendarManager
+) -> None:
+    manager.create_events(_events(120), sync_profile_id="profile", batch_size=50)
+
+    assert server.store.count(CALENDAR_ID) == 120
+    assert server.stats.http_requests == 3
+    assert server.stats.operations == {"events.insert": 120}
+    created = server.store.list(CALENDAR_ID)[0]
+    assert created["summary"] == "Course 0"
+    assert created["extendedProperties"] == {"private": {"syncademic": "profile"}}
+
+
+def test_list_pages_and_filters_by_profile(
+    server: LocalGoogleCalendarServer, manager: GoogleCalendarManager
+) -> None:
+    manager.create_events(_events(25), sync_profile_id="profile")
+    manager.create_events(_events(5), sync_profile_id="other")
+    requests_before = server.stats.http_requests
+
+    ids = manager.get_events_ids_from_sync_profile(sync_profile_id="profile", limit=10)
+
+    assert len(set(ids)) == 25
+    assert server.stats.http_requests - requests_before == 3
+
+
+def test_list_filters_by_time(manager: GoogleCalendarManager) -> None:
+    manager.create_events(_events(10), sync_profile_id="profile")
+
+    ids = manager.get_events_ids_from_sync_profile(
+        sync_profile_id="profile",
+        # Both bounds are exclusive: the 3rd event ends at min_dt, the 6th starts
+        # at max_dt
+        min_dt=datetime(2024, 9, 4, 8, tzinfo=timezone.utc),
+        max_dt=datetime(2024, 9, 7, 6, tzinfo=timezone.utc),
+    )
+
+    assert len(ids) == 2
+
+
+def test_delete_events(
+    server: LocalGoogleCalendarServer, manager: GoogleCalendarManager
+) -> None:
+    manager.create_events(_events(30), sync_profile_id="profile")
+    ids = manager.get_events_ids_from_sync_profile(sync_profile_id="profile")
+
+    manager.delete_events(ids[:20], batch_size=50)
+
+    assert server.store.count(CALENDAR_ID) == 10
+    assert sorted(
+        manager.get_events_ids_from_sync_profile(sync_profile_id="profile")
+    ) == sorted(ids[20:])
+
+
+@pytest.mark.parametrize("status", [403, 429, 503])
+def test_injected_error(
+    server: LocalGoogleCalendarServer, manager: GoogleCalendarManager, status: int
+) -> None:
+    server.faults.fail_next(status)
+
+    with pytest.raises(HttpError) as exc_info:
+        manager.get_events_ids_from_sync_profile(sync_profile_id="profile")
+
+    assert exc_info.value.status_code == status
+    assert exc_info.value.error_details[0]["reason"] in (
+        "rateLimitExceeded",
+        "backendError",
+    )
+    assert server.stats.errors == {status: 1}
+
+
+def test_injected_errors_fail_batched_requests_separately(
+    server: LocalGoogleCalendarServer, manager: GoogleCalendarManager
+) -> None:
+    server.faults.fail_next(429, 503)
+
+    manager.create_events(_events(10), sync_profile_id="profile")
+
+    assert server.store.count(CALENDAR_ID) == 8
+    assert server.stats.errors == {429: 1, 503: 1}
+
+
+def test_random_faults_are_reproducible() -> None:
+    def draws() -> list[int | None]:
+        faults = FaultInjector({429: 0.2, 503: 0.1}, seed=42)
+        return [faults.next_error() for _ in range(100)]
+
+    assert draws() == draws()
+    assert 10 < draws().count(429) < 35
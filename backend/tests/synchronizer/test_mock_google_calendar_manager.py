@@ -106,6 +106,34 @@ def test_get_events_with_min_dt():
     assert stored_events[event_ids[0]]["summary"] == "Future Event"
 
 
+def test_get_events_with_min_dt_and_max_dt():
+    # Arrange
+    manager = MockGoogleCalendarManager()
+    sync_profile_id = "test_profile"
+
+    events = [
+        Event(
+            start=arrow.get(f"2024-{month:02d}-01T09:00:00+00:00"),
+            end=arrow.get(f"2024-{month:02d}-01T10:00:00+00:00"),
+            title=f"Event {month}",
+        )
+        for month in (1, 2, 3)
+    ]
+
+    manager.create_events(events=events, sync_profile_id=sync_profile_id)
+
+    # Act
+    event_ids = manager.get_events_ids_from_sync_profile(
+        sync_profile_id=sync_profile_id,
+        min_dt=datetime(2024, 1, 15, tzinfo=timezone.utc),
+        max_dt=datetime(2024, 3, 1, 9, tzinfo=timezone.utc),
+    )
+
+    # Assert
+    stored_events = manager.get_all_events_with_ids(sync_profile_id=sync_profile_id)
+    assert [stored_events[event_id]["summary"] for event_id in event_ids] == ["Event 2"]
+
+
 def test_get_events_filters_by_sync_profile():
     # Arrange
     manager = MockGoogleCalendarManager()
@@ -2,7 +2,8 @@ from unittest.mock import Mock
 
 import pytest
 
-from backend.bootstrap import bootstrap_event_bus
+from backend.bootstrap import bootstrap_background_jobs, bootstrap_event_bus
+from backend.infrastructure.job_executor import LocalJobExecutor
 from backend.repositories.sync_stats_repository import MockSyncStatsRepository
 from backend.shared.domain_events import (
     IcsFetched,
@@ -201,3 +202,29 @@ def test_dev_notified_when_sync_profile_creation_failed(
     dev_notification_service.on_sync_profile_creation_failed.assert_called_once_with(
         event
     )
+
+
+def test_sync_profile_initialized_when_created(
+    event_bus, dev_notification_service
+) -> None:
+    # Given
+    sync_profile_service = Mock()
+    bootstrap_background_jobs(
+        event_bus,
+        sync_profile_service=sync_profile_service,
+        job_executor=LocalJobExecutor(),
+    )
+    event = SyncProfileCreated(
+        user_id="user123",
+        sync_profile_id="profile123",
+    )
+
+    # When
+    event_bus.publish(event)
+
+    # Then
+    dev_notification_service.on_new_sync_profile.assert_called_once_with(event)
+    sync_profile_service.initialize_sync_profile.assert_called_once_with(
+        user_id="user123",
+        sync_profile_id="profile123",
+    )
@@ -1,3 +1,7 @@
+from collections.abc import AsyncIterator
+
+import httpx
+
 from backend.models.rules import ChangeColorAction, Rule, Ruleset, TextFieldCondition
 from backend.shared.google_calendar_colors import GoogleEventColor
 
@@ -14,3 +18,31 @@ VALID_RULESET = Ruleset(
         )
     ],
 )
+
+
+class _NetworkStream(httpx.AsyncByteStream):
+    def __init__(self, body: bytes) -> None:
+        self._body = body
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        for i in range(0, len(self._body), 4096):
+            yield self._body[i : i + 4096]
+
+
+def streamed_response(
+    status_code: int, body: str | bytes = b"", headers: dict[str, str] | None = None
+) -> httpx.Response:
+    """A mock response whose body is streamed as if received from the network."""
+    if isinstance(body, str):
+        body = body.encode()
+    return httpx.Response(status_code, headers=headers, stream=_NetworkStream(body))
+
+
+class FakeClock:
+    """A clock for the `clock` arguments, moved forward by setting `now`."""
+
+    def __init__(self, now: float = 0.0) -> None:
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now